@@ -0,0 +1,77 @@
+"""Helpers shared by the benchmark scripts."""
+
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB = os.path.join(ROOT, "quarkc", "lib")
+HERE = os.path.join(ROOT, "benchmarks")
+
+
+def use_runtime_sources():
+    """Import the Python runtime straight from quarkc/lib."""
+    if LIB not in sys.path:
+        sys.path.insert(0, LIB)
+
+
+def use_compiler_sources():
+    """Import quarkc from this checkout."""
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+
+def compile_quark(name, target):
+    """Compile benchmarks/<name> to Python in target and make it importable."""
+    package = os.path.splitext(name)[0]
+    with open(os.devnull, "w") as devnull:
+        subprocess.check_call(["quark", "compile", "--python", "--include-stdlib", "-o", target,
+                               os.path.join(HERE, name)], stdout=devnull)
+    sys.path.insert(0, os.path.join(target, "py", package))
+
+
+class ThreadSampler(threading.Thread):
+    """Record the peak number of live threads while running."""
+
+    def __init__(self, interval=0.001):
+        super(ThreadSampler, self).__init__()
+        self.daemon = True
+        self.interval = interval
+        self.peak = threading.active_count()
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.peak = max(self.peak, threading.active_count())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.join()
+
+
+def table(header, rows):
+    widths = [max(len(str(row[i])) for row in [header] + rows)
+              for i in range(len(header))]
+    fmt = "  ".join("%%%ds" % w for w in widths)
+    print(fmt % tuple(header))
+    print(fmt % tuple("-" * w for w in widths))
+    for row in rows:
+        print(fmt % tuple(row))
+
+
+def finish():
+    """Exit without joining the runtime's daemon threads.
+
+    On py2 those threads race interpreter teardown and spew tracebacks.
+    """
+    sys.stdout.flush()
+    os._exit(0)
@@ -0,0 +1,67 @@
+"""
+JSON round trips of nested objects and lists.
+
+Usage: codec.py [--lines=<n>] [--calls=<n>] [--repeat=<n>]
+
+Encodes an order holding a customer with an address, a map of tags and
+a list of <lines> (20 by default) line items with toJSON, and decodes it
+back with fromJSON, reporting:
+
+ - toJSON / fromJSON: orders per second encoded to and decoded from a
+   JSON string.
+ - round trip: orders per second doing both.
+
+Each rate is the best of <repeat> (3 by default) runs of <calls> (500
+by default) orders. Run it on two commits to compare. The benchmark
+compiles codec.q with the quark command first, so it needs an
+interpreter that can import the generated Python code.
+"""
+
+from __future__ import print_function
+
+import shutil
+import tempfile
+import time
+
+from docopt import docopt
+
+import _util
+
+
+def rate(calls, repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        for _ in range(calls):
+            fn()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return calls / best
+
+
+def main():
+    args = docopt(__doc__)
+    lines = int(args["--lines"] or 20)
+    calls = int(args["--calls"] or 500)
+    repeat = int(args["--repeat"] or 3)
+    target = tempfile.mkdtemp(prefix="quark-codec-")
+    try:
+        _util.compile_quark("codec.q", target)
+        import codec
+        order = codec.sample(lines)
+        text = codec.encode(order)
+        assert codec.encode(codec.decode(text)) == text
+        rows = [
+            ["toJSON", "%.0f" % rate(calls, repeat, lambda: codec.encode(order))],
+            ["fromJSON", "%.0f" % rate(calls, repeat, lambda: codec.decode(text))],
+            ["round trip", "%.0f" % rate(calls, repeat, lambda: codec.encode(codec.decode(text)))],
+        ]
+    finally:
+        shutil.rmtree(target)
+    print("%d lines, %d bytes of JSON" % (lines, len(text)))
+    _util.table(["operation", "orders/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
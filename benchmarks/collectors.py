@@ -0,0 +1,62 @@
+"""
+Promise chain throughput versus the number of independent contexts.
+
+Usage: collectors.py [--contexts=<list>] [--links=<n>] [--work=<ms>] [--shards=<n>]
+
+Every context runs a chain of <links> andThen() callbacks; each callback
+sleeps for <work> milliseconds, standing in for a blocking call that
+releases the interpreter lock. The time runs until every chain is done.
+
+ - shared: each context is a plain child of the global context, so all
+   callbacks go through the single global collector.
+ - isolated: each context comes from Context.isolated() and has a
+   parallel collector of its own.
+ - pool: contexts share a CollectorPool of <shards> collectors.
+
+The benchmark compiles chains.q with the quark command first, so it
+needs an interpreter that can import the generated Python code.
+"""
+
+from __future__ import print_function
+
+import shutil
+import tempfile
+import time
+
+from docopt import docopt
+
+import _util
+
+def measure(module, mode, shards, contexts, links, work):
+    chains = module.Chains()
+    start = time.time()
+    chains.start(mode, shards, contexts, links, work)
+    while not chains.done():
+        time.sleep(0.001)
+    elapsed = time.time() - start
+    return contexts * links / elapsed
+
+
+def main():
+    args = docopt(__doc__)
+    levels = [int(n) for n in (args["--contexts"] or "1,2,8,32").split(",")]
+    links = int(args["--links"] or 200)
+    work = float(args["--work"] or 1) / 1000.0
+    shards = int(args["--shards"] or 8)
+    target = tempfile.mkdtemp(prefix="quark-collectors-")
+    try:
+        _util.compile_quark("chains.q", target)
+        import chains
+        rows = []
+        for mode in ("shared", "isolated", "pool"):
+            for contexts in levels:
+                rate = measure(chains, mode, shards, contexts, links, work)
+                rows.append([mode, contexts, contexts * links, "%.0f" % rate])
+    finally:
+        shutil.rmtree(target)
+    _util.table(["collectors", "contexts", "callbacks", "callbacks/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
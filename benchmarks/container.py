@@ -0,0 +1,132 @@
+"""
+Throughput and latency of the ThreadedRuntime HTTP container.
+
+Usage: container.py [--clients=<n>] [--requests=<n>] [--delay=<seconds>]
+
+Each client thread sends its requests one after another. The servlet
+answers either at once or after the given delay, which stands in for a
+slow RPC handler. Keep-alive clients reuse one connection; the serial
+server closes every connection, so its clients reconnect each time.
+"""
+
+from __future__ import print_function
+
+import socket
+import threading
+import time
+
+from docopt import docopt
+
+import _util
+_util.use_runtime_sources()
+
+try:
+    from httplib import HTTPConnection
+except ImportError:
+    from http.client import HTTPConnection
+
+from quark_threaded_runtime import (
+    ThreadedRuntime, _QuarkWSGIServer, _QuarkWSGIRequestHandler
+)
+
+
+class SerialRuntime(ThreadedRuntime):
+    server_class = _QuarkWSGIServer
+    handler_class = _QuarkWSGIRequestHandler
+
+
+class Respond(object):
+
+    def __init__(self, request, response):
+        self.request = request
+        self.response = response
+
+    def onExecute(self, runtime):
+        runtime.respond(self.request, self.response)
+
+
+class Servlet(object):
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.runtime = None
+        self.ready = threading.Event()
+
+    def onServletInit(self, url, runtime):
+        self.runtime = runtime
+        self.ready.set()
+
+    def onServletError(self, url, error):
+        raise SystemExit("cannot serve %s: %s" % (url, error.getMessage()))
+
+    def onServletEnd(self, url):
+        pass
+
+    def onHTTPRequest(self, request, response):
+        response.setCode(200)
+        response.setBody("hello")
+        self.runtime.schedule(Respond(request, response), self.delay)
+
+
+def free_port():
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+
+def client(port, requests, keepalive, latencies):
+    connection = None
+    for i in range(requests):
+        start = time.time()
+        if connection is None:
+            connection = HTTPConnection("127.0.0.1", port)
+        connection.request("GET", "/")
+        response = connection.getresponse()
+        response.read()
+        if not keepalive or response.getheader("connection") == "close":
+            connection.close()
+            connection = None
+        latencies.append(time.time() - start)
+
+
+def measure(factory, keepalive, clients, requests, delay):
+    runtime = factory()
+    servlet = Servlet(delay)
+    port = free_port()
+    runtime.serveHTTP("http://127.0.0.1:%d/" % port, servlet)
+    servlet.ready.wait(5)
+    latencies = []
+    threads = [threading.Thread(target=client, args=(port, requests, keepalive, latencies))
+               for i in range(clients)]
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+    latencies.sort()
+    return (len(latencies) / elapsed,
+            latencies[len(latencies) // 2] * 1000,
+            latencies[int(len(latencies) * 0.99)] * 1000)
+
+
+def main():
+    args = docopt(__doc__)
+    clients = int(args["--clients"] or 16)
+    requests = int(args["--requests"] or 50)
+    delay = float(args["--delay"] or 0.02)
+    rows = []
+    for name, factory, keepalive in (("serial", SerialRuntime, False),
+                                     ("concurrent", ThreadedRuntime, False),
+                                     ("concurrent keep-alive", ThreadedRuntime, True)):
+        for d in (0.0, delay):
+            rps, p50, p99 = measure(factory, keepalive, clients, requests, d)
+            rows.append([name, "%.3f" % d, clients, "%.0f" % rps, "%.1f" % p50, "%.1f" % p99])
+    _util.table(["container", "delay", "clients", "req/s", "p50 ms", "p99 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
@@ -0,0 +1,181 @@
+"""
+Cost of waking the container threads waiting for servlet responses.
+
+Usage: contention.py [--levels=<list>] [--events=<n>]
+
+N request threads call the WSGI application at once and wait for the
+servlet to answer. The servlet only responds after <events> further
+events per request have gone through the event thread, which is what an
+RPC server handler chaining a few promises looks like. Requests bypass
+the sockets so that only the waiting scheme is measured.
+
+The "global condition" rows reproduce the previous scheme: every request
+waited on the runtime-wide condition, which the event thread notified
+after every batch of events.
+"""
+
+from __future__ import print_function
+
+import io
+import threading
+import time
+import traceback
+
+from docopt import docopt
+
+import _util
+_util.use_runtime_sources()
+
+try:
+    from queue import Queue, Empty
+except ImportError:
+    from Queue import Queue, Empty
+
+from wsgiref.util import setup_testing_defaults
+
+from quark_runtime import _HTTPResponse, _default_codec
+from quark_runtime_logging import Logger
+import quark_threaded_runtime as qtr
+
+
+class GlobalConditionEventProcessor(qtr._EventProcessor):
+
+    def run(self):
+        while True:
+            try:
+                event = self.runtime.events.get(block=True, timeout=1)
+            except Empty:
+                continue
+            self.runtime.lock.acquire()
+            try:
+                while self.is_live:
+                    function, args, kwargs = event
+                    try:
+                        function(*args, **kwargs)
+                    except Exception:
+                        print(traceback.format_exc())
+                    event = self.runtime.events.get(block=False)
+            except Empty:
+                pass
+            finally:
+                self.runtime.lock.notify_all()
+                self.runtime.lock.release()
+
+
+class GlobalConditionApp(qtr._QuarkWSGIApp):
+
+    def __call__(self, environ, start_response):
+        request = qtr._HTTPRequest(qtr.util.request_uri(environ))
+        response = _HTTPResponse()
+        servlet = self.servlets[environ["PATH_INFO"]]
+        self.runtime.events.put((self.call_servlet, (servlet, request, response), {}))
+        with self.runtime.lock:
+            while not response._responded:
+                self.runtime.lock.wait(60)
+        for chunk in servlet.respond(environ, start_response, request, response):
+            yield chunk
+
+
+class GlobalConditionRuntime(qtr.ThreadedRuntime):
+
+    def __init__(self):
+        self._codec = _default_codec()
+        self.lock = threading.Condition()
+        self.events = Queue()
+        self.token_counter = 0
+        self.sites = {}
+        self.event_thread = GlobalConditionEventProcessor(self)
+        self.event_thread.daemon = True
+        self.event_thread.start()
+        self.timer = qtr._Timer(self)
+        self.timer.daemon = True
+        self.timer.start()
+        self.log = Logger("quark.runtime")
+
+    def respond(self, request, response):
+        response._responded = True
+
+
+class Step(object):
+
+    def __init__(self, servlet, request, response, remaining):
+        self.servlet = servlet
+        self.request = request
+        self.response = response
+        self.remaining = remaining
+
+    def __call__(self):
+        if self.remaining == 0:
+            self.servlet.runtime.respond(self.request, self.response)
+        else:
+            self.remaining -= 1
+            self.servlet.runtime.events.put((self, (), {}))
+
+
+class Servlet(object):
+
+    def __init__(self, events):
+        self.events = events
+        self.runtime = None
+
+    def onServletInit(self, url, runtime):
+        self.runtime = runtime
+
+    def onHTTPRequest(self, request, response):
+        response.setCode(200)
+        response.setBody("ok")
+        Step(self, request, response, self.events)()
+
+
+def start_response(status, headers):
+    pass
+
+
+def call(app, latencies):
+    environ = {"PATH_INFO": "/", "REQUEST_METHOD": "GET", "CONTENT_TYPE": "",
+               "wsgi.input": io.BytesIO()}
+    setup_testing_defaults(environ)
+    start = time.time()
+    for chunk in app(environ, start_response):
+        pass
+    latencies.append(time.time() - start)
+
+
+def measure(runtime_class, app_class, concurrency, events):
+    runtime = runtime_class()
+    runtime._add_event_source("benchmark")
+    url = qtr.Url("http://127.0.0.1:8080/")
+    app = app_class(runtime, url)
+    servlet = Servlet(events)
+    app.add(qtr.HttpServletAdapter(runtime, qtr.Url(url.url), servlet))
+    while servlet.runtime is None:
+        time.sleep(0.01)
+    latencies = []
+    threads = [threading.Thread(target=call, args=(app, latencies)) for i in range(concurrency)]
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.time() - start
+    latencies.sort()
+    return concurrency / elapsed, latencies[len(latencies) // 2] * 1000, latencies[-1] * 1000
+
+
+def main():
+    args = docopt(__doc__)
+    levels = [int(n) for n in (args["--levels"] or "1,10,100,1000").split(",")]
+    events = int(args["--events"] or 5)
+    rows = []
+    for name, runtime_class, app_class in (
+            ("global condition", GlobalConditionRuntime, GlobalConditionApp),
+            ("per request", qtr.ThreadedRuntime, qtr._QuarkWSGIApp)):
+        for concurrency in levels:
+            rps, p50, worst = measure(runtime_class, app_class, concurrency, events)
+            rows.append([name, concurrency, "%.0f" % rps, "%.1f" % p50, "%.1f" % worst])
+    _util.table(["waiting", "concurrent", "req/s", "p50 ms", "max ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
@@ -0,0 +1,212 @@
+"""
+Overloaded method and function call throughput.
+
+Usage: dispatch.py [--calls=<n>] [--repeat=<n>]
+
+Calls overloads of one and two arguments on a small class hierarchy,
+with the arguments varying so that every call hits the lookup cache.
+The "previous" rows use the dispatcher as it was before dispatch tables:
+a bound dispatcher allocated on every attribute access, a tuple of types
+built for every call and misses enumerating every combination of the
+argument types' __mro__.
+"""
+
+from __future__ import print_function
+
+import inspect
+import time
+
+from docopt import docopt
+
+import _util
+_util.use_compiler_sources()
+
+from quarkc import dispatch
+
+
+def signatures(types):
+    if types:
+        first = types[0]
+        rest = types[1:]
+        for sig in signatures(rest):
+            for t in first.__mro__:
+                yield (t,) + sig
+    else:
+        yield ()
+
+
+class PreviousBound(object):
+
+    def __init__(self, clazz, object, dispatcher):
+        self.clazz = clazz
+        self.object = object
+        self.dispatcher = dispatcher
+
+    def get(self, types):
+        key = (self.clazz, types)
+        if key in self.dispatcher.cache:
+            return self.dispatcher.cache[key]
+        for c in self.clazz.__mro__:
+            if self.dispatcher.name in c.__dict__:
+                method = c.__dict__[self.dispatcher.name].get(types)
+            else:
+                method = None
+            if method is None: continue
+            self.dispatcher.cache[key] = method
+            return method
+        self.dispatcher.error(types)
+
+    def __call__(self, *args, **kwargs):
+        types = tuple([type(arg) for arg in args])
+        method = self.get(types)
+        return method(self.object, *args, **kwargs)
+
+
+class Previous(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.methods = {}
+        self.cache = {}
+
+    def add(self, types, method):
+        self.methods[types] = method
+
+    def get(self, types):
+        for sig in signatures(types):
+            if sig in self.methods:
+                return self.methods[sig]
+        return None
+
+    def __get__(self, object, clazz):
+        return PreviousBound(clazz, object, self)
+
+    def error(self, types):
+        raise TypeError(types)
+
+    def __call__(self, *args, **kwargs):
+        types = tuple([type(arg) for arg in args])
+        if types in self.cache:
+            function = self.cache[types]
+        else:
+            function = self.get(types)
+            self.cache[types] = function
+        return function(*args, **kwargs)
+
+
+class Node(object): pass
+class Expression(Node): pass
+class Call(Expression): pass
+class Name(Expression): pass
+class Statement(Node): pass
+class Return(Statement): pass
+
+NODES = [Call(), Name(), Return(), Expression()]
+
+
+def decorators(engine):
+    """The overload and dispatch decorators, registering on engine."""
+    def decorate(namespace, function, types, offset):
+        name = function.__name__
+        dispatcher = namespace.get(name) or engine(name)
+        argspec = inspect.getargspec(function)
+        nargs = len(argspec.args) - offset
+        defaulted = types + (object,) * (nargs - len(types))
+        for i in range(len(argspec.defaults or ()) + 1):
+            dispatcher.add(defaulted[:nargs - i], function)
+        return dispatcher
+
+    def overload(*types):
+        def decorator(method):
+            namespace = inspect.currentframe().f_back.f_locals
+            return decorate(namespace, method, types, 1)
+        return decorator
+
+    def dispatch(*types):
+        def decorator(function):
+            namespace = inspect.currentframe().f_back.f_locals
+            return decorate(namespace, function, types, 0)
+        return decorator
+
+    return overload, dispatch
+
+
+def visitors(engine):
+    overload, dispatch = decorators(engine)
+
+    class Visitor(object):
+
+        @overload(Node)
+        def visit(self, node, extra=None):
+            return 1
+
+        @overload(Expression)
+        def visit(self, node, extra=None):
+            return 2
+
+        @overload(Call)
+        def visit(self, node, extra=None):
+            return 3
+
+    class Checker(Visitor):
+
+        @overload(Return)
+        def visit(self, node, extra=None):
+            return 4
+
+        @overload(Node, Node)
+        def match(self, a, b):
+            return 1
+
+        @overload(Expression, Statement)
+        def match(self, a, b):
+            return 2
+
+        @overload(Call, Return)
+        def match(self, a, b):
+            return 3
+
+    @dispatch(Node)
+    def kind(node):
+        return 1
+
+    @dispatch(Expression)
+    def kind(node):
+        return 2
+
+    return Checker(), kind
+
+
+def runs(engine, calls):
+    checker, kind = visitors(engine)
+    nodes = [NODES[i % len(NODES)] for i in range(calls)]
+    pairs = list(zip(nodes, reversed(nodes)))
+    return [("method, 1 argument", lambda: [checker.visit(n) for n in nodes]),
+            ("method, 2 arguments", lambda: [checker.match(a, b) for a, b in pairs]),
+            ("function, 1 argument", lambda: [kind(n) for n in nodes])]
+
+
+def timed(run):
+    start = time.time()
+    run()
+    return time.time() - start
+
+
+def main():
+    args = docopt(__doc__)
+    calls = int(args["--calls"] or 200000)
+    repeat = int(args["--repeat"] or 7)
+    rows = []
+    for (label, before), (_, after) in zip(runs(Previous, calls), runs(dispatch._Dispatcher, calls)):
+        # Alternate the two so that they see the same machine noise.
+        b, a = [], []
+        for _ in range(repeat):
+            b.append(timed(before))
+            a.append(timed(after))
+        before, after = calls / min(b), calls / min(a)
+        rows.append([label, "%.0f" % before, "%.0f" % after, "%.2f" % (after / before)])
+    _util.table(["call", "previous calls/s", "tables calls/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+End to end `quark compile --all` time over the examples, by -j level.
+
+Usage: emit.py [--jobs=<list>] [--repeat=<n>]
+
+Every example is compiled once up front so the compile cache is warm
+and the runs measure emission rather than parsing.
+"""
+
+from __future__ import print_function
+
+import glob
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+from docopt import docopt
+
+import _util
+
+
+def examples():
+    paths = glob.glob(os.path.join(_util.ROOT, "examples", "*", "*.q"))
+    return sorted(p for p in paths if "gen-test" not in p)
+
+
+def run(jobs, target, files):
+    start = time.time()
+    with open(os.devnull, "w") as devnull:
+        subprocess.check_call(["quark", "compile", "--all", "-j", str(jobs), "-o", target] + files,
+                              stdout=devnull)
+    return time.time() - start
+
+
+def main():
+    args = docopt(__doc__)
+    levels = [int(n) for n in (args["--jobs"] or "1,2,4").split(",")]
+    repeat = int(args["--repeat"] or 2)
+    files = examples()
+    target = tempfile.mkdtemp(prefix="quark-emit-")
+    try:
+        run(1, target, files)
+        rows = []
+        for jobs in levels:
+            elapsed = min(run(jobs, target, files) for _ in range(repeat))
+            rows.append([jobs, "%.1f" % elapsed])
+    finally:
+        shutil.rmtree(target)
+    print("%d files, %d CPUs" % (len(files), multiprocessing.cpu_count()))
+    _util.table(["jobs", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Raw event throughput of the ThreadedRuntime event thread.
+
+Usage: events.py [--events=<n>] [--producers=<n>]
+
+Producer threads put no-op events on the runtime queue as fast as they
+can; the time runs until the event thread has dispatched the last one.
+The "polling" rows reproduce the previous event thread, which used a
+stdlib Queue with a one-second get() timeout and took the token lock
+for every event it dispatched.
+"""
+
+from __future__ import print_function
+
+import threading
+import time
+import traceback
+
+from docopt import docopt
+
+import _util
+_util.use_runtime_sources()
+
+try:
+    from queue import Queue, Empty
+except ImportError:
+    from Queue import Queue, Empty
+
+import quark_threaded_runtime as qtr
+
+
+class PollingEventProcessor(qtr._EventProcessor):
+
+    def run(self):
+        while True:
+            try:
+                event = self.runtime.events.get(block=True, timeout=1)
+            except Empty:
+                continue
+            try:
+                while self.is_live:
+                    function, args, kwargs = event
+                    try:
+                        function(*args, **kwargs)
+                    except Exception:
+                        print(traceback.format_exc())
+                    event = self.runtime.events.get(block=False)
+            except Empty:
+                pass
+
+
+class PollingRuntime(qtr.ThreadedRuntime):
+
+    def __init__(self):
+        qtr.ThreadedRuntime.__init__(self)
+        # the base event thread is idle on its own queue from here on
+        self.events = Queue()
+        self.event_thread = PollingEventProcessor(self)
+        self.event_thread.daemon = True
+        self.event_thread.start()
+
+
+def noop():
+    pass
+
+
+def produce(runtime, count):
+    event = (noop, (), {})
+    put = runtime.events.put
+    for i in range(count):
+        put(event)
+
+
+def measure(factory, events, producers):
+    runtime = factory()
+    token = runtime._add_event_source("benchmark")
+    done = threading.Event()
+    share = events // producers
+    threads = [threading.Thread(target=produce, args=(runtime, share)) for i in range(producers)]
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    runtime.events.put((done.set, (), {}))
+    done.wait()
+    elapsed = time.time() - start
+    runtime._remove_event_source(token)
+    return share * producers / elapsed, runtime.event_thread.stats.snapshot()
+
+
+def main():
+    args = docopt(__doc__)
+    events = int(args["--events"] or 1000000)
+    producers = int(args["--producers"] or 1)
+    rows = []
+    for name, factory in (("polling", PollingRuntime),
+                          ("batched", qtr.ThreadedRuntime)):
+        for n in sorted(set((1, producers))):
+            rate, stats = measure(factory, events, n)
+            batches = "%d" % stats["batches"] if stats["batches"] else "-"
+            mean = "%.0f" % stats["mean_size"] if stats["batches"] else "-"
+            rows.append([name, n, events, "%.0f" % rate, batches, mean])
+    _util.table(["event thread", "producers", "events", "events/s", "batches", "mean batch"],
+                rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
@@ -0,0 +1,58 @@
+"""
+Promise callback throughput, for chains and for fan-in.
+
+Usage: fanin.py [--rounds=<n>] [--widths=<list>] [--repeat=<n>]
+
+ - chain: a single chain of <rounds> * <width> andThen() callbacks.
+ - manual: <rounds> fan-ins of <width> promises each, written as one
+   andThen() per input counting down to the last one.
+ - all: the same fan-ins using Promise.all().
+
+The rate is input callbacks per second, the best of <repeat> runs. The
+benchmark compiles fanin.q with the quark command first, so it needs an
+interpreter that can import the generated Python code.
+"""
+
+from __future__ import print_function
+
+import shutil
+import tempfile
+import time
+
+from docopt import docopt
+
+import _util
+
+
+def measure(module, mode, rounds, width):
+    fanin = module.FanIn()
+    start = time.time()
+    fanin.start(mode, rounds, width)
+    while not fanin.done():
+        time.sleep(0.0005)
+    elapsed = time.time() - start
+    return rounds * width / elapsed
+
+
+def main():
+    args = docopt(__doc__)
+    rounds = int(args["--rounds"] or 200)
+    widths = [int(n) for n in (args["--widths"] or "2,10,100").split(",")]
+    repeat = int(args["--repeat"] or 3)
+    target = tempfile.mkdtemp(prefix="quark-fanin-")
+    try:
+        _util.compile_quark("fanin.q", target)
+        import fanin
+        rows = []
+        for width in widths:
+            for mode in ("chain", "manual", "all"):
+                rate = max(measure(fanin, mode, rounds, width) for _ in range(repeat))
+                rows.append([mode, width, rounds * width, "%.0f" % rate])
+    finally:
+        shutil.rmtree(target)
+    _util.table(["mode", "width", "callbacks", "callbacks/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
@@ -0,0 +1,64 @@
+"""
+Reflective field access on a class of 50 fields.
+
+Usage: fields.py [--calls=<n>] [--repeat=<n>]
+
+ - getField / setField: calls per second for the first, middle and last
+   field of the class.
+ - toJSON / fromJSON: objects per second encoded to and decoded from a
+   JSON string, each reading or writing every field.
+
+Each rate is the best of <repeat> (3 by default) runs of <calls> (20000
+by default) calls. Run it on two commits to compare how access time
+depends on the position of the field. The benchmark compiles fields.q
+with the quark command first, so it needs an interpreter that can
+import the generated Python code.
+"""
+
+from __future__ import print_function
+
+import shutil
+import tempfile
+import time
+
+from docopt import docopt
+
+import _util
+
+
+def rate(calls, repeat, fn):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        for _ in range(calls):
+            fn()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return calls / best
+
+
+def main():
+    args = docopt(__doc__)
+    calls = int(args["--calls"] or 20000)
+    repeat = int(args["--repeat"] or 3)
+    target = tempfile.mkdtemp(prefix="quark-fields-")
+    try:
+        _util.compile_quark("fields.q", target)
+        import fields
+        wide = fields.filled()
+        rows = []
+        for name in (u"f0", u"f25", u"f49"):
+            rows.append(["getField", name, "%.0f" % rate(calls, repeat, lambda: wide._getField(name))])
+            rows.append(["setField", name, "%.0f" % rate(calls, repeat, lambda: wide._setField(name, u"x"))])
+        text = fields.encode(wide)
+        objects = max(1, calls // 100)
+        rows.append(["toJSON", "all", "%.0f" % rate(objects, repeat, lambda: fields.encode(wide))])
+        rows.append(["fromJSON", "all", "%.0f" % rate(objects, repeat, lambda: fields.decode(text))])
+    finally:
+        shutil.rmtree(target)
+    _util.table(["operation", "field", "calls/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
@@ -0,0 +1,146 @@
+"""
+Reading decoded JSON through the Python runtime's JSONObject.
+
+Usage: jsonaccess.py [--items=<n>] [--repeat=<n>]
+
+Reads an RPC envelope, a list of <items> (1000 by default) numbers and
+an object of <items> keys, reporting reads per second for:
+
+ - envelope: the method name and the first argument of an envelope.
+ - getType: the type of a number.
+ - list: every element of the list.
+ - object: every item of the object.
+
+Each is read with getObjectItem, getListItem and keys as the generated
+code does, with the values, items and getPath bulk accessors, and with
+a cursor. The "wrapper" rows reproduce the JSONObject before it had
+slots and a table of type tags. Each rate is the best of <repeat> (5 by
+default) runs.
+"""
+
+from __future__ import print_function
+
+import time
+
+from docopt import docopt
+
+import _util
+_util.use_runtime_sources()
+
+import quark_runtime as qrt
+
+
+class DictJSONObject(qrt._JSONObject):
+    """The JSONObject that each item used to be wrapped in."""
+
+    @classmethod
+    def _wrap(cls, value):
+        wrapped = cls()
+        wrapped.value = value
+        return wrapped
+
+    def getType(self):
+        return qrt._json_type(self.value)
+
+    @classmethod
+    def parse(cls, value):
+        return cls._wrap(qrt.json.loads(value, object_pairs_hook=cls._dict))
+
+
+def rate(repeat, fn):
+    best = None
+    calls = 1
+    while True:
+        start = time.time()
+        for _ in range(calls):
+            fn()
+        if time.time() - start > 0.05:
+            break
+        calls *= 2
+    for _ in range(repeat):
+        start = time.time()
+        for _ in range(calls):
+            fn()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return calls / best
+
+
+def envelope_items(envelope):
+    method = envelope.getObjectItem("$method")
+    rpc = envelope.getObjectItem("rpc")
+    if method.isUndefined() or rpc.isUndefined():
+        return None
+    return method.getString(), rpc.getListItem(0).getObjectItem("name").getString()
+
+
+def envelope_path(envelope):
+    return (envelope.getPath("$method").getString(),
+            envelope.getPath("rpc", 0, "name").getString())
+
+
+def envelope_cursor(envelope):
+    cursor = envelope.cursor()
+    method = cursor.down("$method").getString()
+    return method, cursor.up().down("rpc", 0, "name").getString()
+
+
+def list_items(json):
+    total = 0
+    idx = 0
+    while idx < json.size():
+        total += json.getListItem(idx).getNumber()
+        idx += 1
+    return total
+
+
+def list_values(json):
+    return sum(item.getNumber() for item in json.values())
+
+
+def list_cursor(json):
+    return sum(item.getNumber() for item in json.cursor().elements())
+
+
+def object_items(json):
+    total = 0
+    for key in json.keys():
+        total += json.getObjectItem(key).getNumber()
+    return total
+
+
+def object_bulk(json):
+    return sum(item.getNumber() for _, item in json.items())
+
+
+def object_cursor(json):
+    return sum(item.getNumber() for _, item in json.cursor().entries())
+
+
+def main():
+    args = docopt(__doc__)
+    items = int(args["--items"] or 1000)
+    repeat = int(args["--repeat"] or 5)
+    envelope = '{"$method": "greet", "rpc": [{"$class": "Request", "name": "world"}]}'
+    numbers = "[%s]" % ",".join(str(i) for i in range(items))
+    mapping = "{%s}" % ",".join('"k%d": %d' % (i, i) for i in range(items))
+
+    rows = []
+    for name, cls in (("wrapper", DictJSONObject), ("slots", qrt._JSONObject)):
+        env, lst, obj, num = [cls.parse(text) for text in (envelope, numbers, mapping, "12")]
+        rows.append(["envelope", name, "getObjectItem", "%.0f" % rate(repeat, lambda: envelope_items(env))])
+        rows.append(["getType", name, "getType", "%.0f" % rate(repeat, num.getType)])
+        rows.append(["list", name, "getListItem", "%.0f" % rate(repeat, lambda: list_items(lst))])
+        rows.append(["object", name, "keys", "%.0f" % rate(repeat, lambda: object_items(obj))])
+    rows.append(["envelope", "slots", "getPath", "%.0f" % rate(repeat, lambda: envelope_path(env))])
+    rows.append(["envelope", "slots", "cursor", "%.0f" % rate(repeat, lambda: envelope_cursor(env))])
+    rows.append(["list", "slots", "values", "%.0f" % rate(repeat, lambda: list_values(lst))])
+    rows.append(["list", "slots", "cursor", "%.0f" % rate(repeat, lambda: list_cursor(lst))])
+    rows.append(["object", "slots", "items", "%.0f" % rate(repeat, lambda: object_bulk(obj))])
+    rows.append(["object", "slots", "cursor", "%.0f" % rate(repeat, lambda: object_cursor(obj))])
+    rows.sort(key=lambda row: row[0])
+    _util.table(["read", "JSONObject", "access", "reads/s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Reading a large JSON list out of an HTTP response body.
+
+Usage: jsonstream.py [--messages=<n>] [--repeat=<n>]
+       jsonstream.py --worker <variant> <messages>
+
+Builds a body like a page of Slack history, an object holding a list of
+<messages> (100000 by default) messages, in the 64KB chunks the threaded
+runtime reads responses in, and reads the text of every message:
+
+ - getBody: decoding the whole body with getBody and parsing it with
+   JSONObject.parse, into OrderedDicts or into dicts.
+ - iterJSON: parsing the chunks a message at a time with iterJSON.
+
+Each variant runs in a fresh process. The table shows the best time and
+the lowest peak memory, over what the chunks themselves take, of
+<repeat> (3 by default) runs.
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+from docopt import docopt
+
+import _util
+_util.use_runtime_sources()
+
+VARIANTS = [
+    ("getBody", "ordered"),
+    ("getBody", "unordered"),
+    ("iterJSON", "ordered"),
+    ("iterJSON", "unordered"),
+]
+
+
+def chunks(messages, size=64 * 1024):
+    # Built a message at a time, so only the chunks raise the peak.
+    result = []
+    pending = ['{"ok": true, "messages": [']
+    length = 0
+    for idx in range(messages):
+        message = ('%s{"type": "message", "user": "U%06d", "text": "message %d with some words in it '
+                   'for the history pull", "ts": "1476130000.%06d", "reactions": '
+                   '[{"name": "+1", "count": 2}]}' % ("," if idx else "", idx, idx, idx))
+        pending.append(message)
+        length += len(message)
+        if length >= size:
+            result.append("".join(pending).encode("utf-8"))
+            pending = []
+            length = 0
+    pending.append('], "has_more": false}')
+    result.append("".join(pending).encode("utf-8"))
+    return result
+
+
+def worker(variant, messages):
+    from quark_runtime import _HTTPResponse, _JSONObject
+
+    method, order = VARIANTS[variant]
+    ordered = order == "ordered"
+    response = _HTTPResponse()
+    response._setBodyChunks(chunks(messages))
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.time()
+    if method == "getBody":
+        body = _JSONObject.parse(response.getBody(), ordered)
+        items = body.getObjectItem("messages").values()
+    else:
+        items = response.iterJSON(["messages"], ordered)
+    total = 0
+    for item in items:
+        total += len(item.getObjectItem("text").getString())
+    elapsed = time.time() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    json.dump(dict(seconds=elapsed, peak_kb=peak - base, total=total), sys.stdout)
+
+
+def measure(variant, messages):
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), "--worker", str(variant), str(messages)])
+    return json.loads(output.decode("utf-8"))
+
+
+def main():
+    args = docopt(__doc__)
+    if args["--worker"]:
+        worker(int(args["<variant>"]), int(args["<messages>"]))
+        return
+    messages = int(args["--messages"] or 100000)
+    repeat = int(args["--repeat"] or 3)
+    size = sum(len(chunk) for chunk in chunks(messages))
+    results = [[] for _ in VARIANTS]
+    for _ in range(repeat):
+        for variant in range(len(VARIANTS)):
+            results[variant].append(measure(variant, messages))
+    totals = set(r["total"] for runs in results for r in runs)
+    assert len(totals) == 1, totals
+    rows = []
+    for (method, order), runs in zip(VARIANTS, results):
+        rows.append([method, order,
+                     "%.3f" % min(r["seconds"] for r in runs),
+                     "%.1f" % (min(r["peak_kb"] for r in runs) / 1024.0)])
+    print("%d messages, %.1fMB of JSON" % (messages, size / 1048576.0))
+    _util.table(["read", "objects", "seconds", "peak MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
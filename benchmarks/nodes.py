@@ -0,0 +1,105 @@
+"""
+Memory per AST node and size and load time of compiled artifacts.
+
+Usage: nodes.py [--classes=<n>] [--repeat=<n>]
+
+Compiles the standard library and a synthetic.py program with <classes>
+classes per namespace (40 by default), then reports for each:
+
+ - nodes: the AST nodes of its roots.
+ - bytes/node: the size of a node and of the dict holding its
+   attributes, if it has one, but not of the attribute values.
+ - artifact: the size of the stdlib snapshot and of the program's cache
+   artifact, which also holds the stdlib roots the program uses.
+ - load: the fastest of <repeat> (5 by default) Compiler.urlparse calls
+   restoring the program from the artifact.
+
+Run it on two commits to compare node representations.
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from docopt import docopt
+
+import _util
+import synthetic
+
+
+def nodes(roots):
+    result = []
+    stack = list(roots)
+    while stack:
+        n = stack.pop()
+        result.append(n)
+        stack.extend(c for c in n.children or () if c is not None)
+    return result
+
+
+def per_node(ns):
+    total = 0
+    for n in ns:
+        total += sys.getsizeof(n)
+        d = getattr(n, "__dict__", None)
+        if d is not None:
+            total += sys.getsizeof(d)
+    return total / float(len(ns))
+
+
+def timed_load(compiler, url, cache, snapshot, repeat):
+    best = None
+    for _ in range(repeat):
+        c = compiler.Compiler()
+        c.CACHE = {}
+        c.cache = cache
+        c.snapshot = snapshot
+        start = time.time()
+        c.urlparse(url)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    args = docopt(__doc__)
+    classes = int(args["--classes"] or 40)
+    repeat = int(args["--repeat"] or 5)
+    _util.use_compiler_sources()
+    sys.setrecursionlimit(10000)
+    from quarkc import compiler
+    from quarkc.cache import CompileCache, Snapshot
+
+    rows = []
+    work = tempfile.mkdtemp(prefix="quark-nodes-")
+    try:
+        snapshot = Snapshot(compiler.build_snapshot(os.path.join(work, "quark.snapshot")))
+        url = os.path.abspath(compiler.join(None, compiler.BUILTIN_FILE))
+        roots = snapshot.load(url)
+        ns = nodes(roots)
+        cache = CompileCache(os.path.join(work, "cache"))
+        rows.append(["stdlib", len(ns), "%.0f" % per_node(ns), os.path.getsize(snapshot.path),
+                     "%.3f" % timed_load(compiler, url, cache, snapshot, repeat)])
+
+        entry = os.path.abspath(synthetic.generate(os.path.join(work, "src"), classes=classes))
+        c = compiler.Compiler()
+        c.CACHE = {}
+        c.cache = cache
+        c.snapshot = snapshot
+        c.urlparse(entry)
+        c.compile()
+        ns = nodes([c.roots[entry]])
+        rows.append(["classes=%d" % classes, len(ns), "%.0f" % per_node(ns),
+                     os.path.getsize(c.roots[entry]._artifact),
+                     "%.3f" % timed_load(compiler, entry, cache, snapshot, repeat)])
+    finally:
+        shutil.rmtree(work)
+    _util.table(["program", "nodes", "bytes/node", "artifact bytes", "load s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Parse time versus source size.
+
+Usage: parse.py [--classes=<list>] [--repeat=<n>]
+
+Parses synthetic files of <classes> classes (about 20 lines each) and
+reports the time per line, which stays flat when parsing scales
+linearly. The "rescan" rows reproduce the previous AST._lineinfo, which
+counted the newlines of the whole file prefix for every node.
+"""
+
+from __future__ import print_function
+
+import time
+
+from docopt import docopt
+
+import _util
+_util.use_compiler_sources()
+
+from quarkc.ast import AST
+from quarkc.parser import Parser
+
+
+CLASS = """
+class Message%(n)d extends Base {
+    String name = "message %(n)d";
+    int count;
+    List<String> tags = [];
+
+    Message%(n)d(int count) {
+        self.count = count;
+    }
+
+    int total(int extra) {
+        int result = self.count + extra * %(n)d;
+        if (result > 100) {
+            return result - 1;
+        }
+        return result;
+    }
+}
+"""
+
+
+def source(classes):
+    return "quark *;\n\nclass Base {}\n" + "".join(CLASS % {"n": n} for n in range(classes))
+
+
+def rescan_lineinfo(self, node):
+    text = node.full_text[:node.start]
+    line = text.count("\n") + 1
+    try:
+        column = len(text) - text.rindex("\n")
+    except ValueError:
+        column = len(text) or 1
+    return line, column
+
+
+def measure(text, repeat):
+    best = None
+    for _ in range(repeat):
+        parser = Parser()
+        parser._filename = "synthetic.q"
+        start = time.time()
+        parser.parse(text)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    args = docopt(__doc__)
+    sizes = [int(n) for n in (args["--classes"] or "50,100,200,400").split(",")]
+    repeat = int(args["--repeat"] or 3)
+    indexed = AST._lineinfo
+    rows = []
+    for name, lineinfo in (("index", indexed), ("rescan", rescan_lineinfo)):
+        AST._lineinfo = lineinfo
+        for classes in sizes:
+            text = source(classes)
+            lines = text.count("\n")
+            elapsed = measure(text, repeat)
+            rows.append([name, lines, "%.3f" % elapsed, "%.1f" % (elapsed / lines * 1e6)])
+    AST._lineinfo = indexed
+    _util.table(["lineinfo", "lines", "seconds", "us/line"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Scheduled tasks per second and peak thread count of ThreadedRuntime.
+
+Usage: schedule.py [--tasks=<n>] [--delay=<seconds>]
+
+Compares the timer thread against the previous implementation, which
+started a sleeping thread for every scheduled task.
+"""
+
+from __future__ import print_function
+
+import threading
+import time
+
+from docopt import docopt
+
+import _util
+_util.use_runtime_sources()
+
+from quark_threaded_runtime import ThreadedRuntime, Tracker
+
+
+class ThreadPerTaskRuntime(ThreadedRuntime):
+
+    """The scheduler as it was before the timer thread."""
+
+    def schedule(self, handler, delayInSeconds):
+        def run_scheduled(runtime, handler, delayInSeconds):
+            time.sleep(delayInSeconds)
+            runtime.events.put((handler.onExecute, [runtime], {}))
+        thread = threading.Thread(target=Tracker(self, "task", run_scheduled),
+                                  args=(self, handler, delayInSeconds))
+        thread.setDaemon(True)
+        thread.start()
+
+
+class Countdown(object):
+
+    def __init__(self, count):
+        self.count = count
+        self.done = threading.Event()
+
+    def onExecute(self, runtime):
+        self.count -= 1
+        if self.count == 0:
+            self.done.set()
+
+
+def measure(factory, tasks, delay):
+    baseline = threading.active_count()
+    runtime = factory()
+    countdown = Countdown(tasks)
+    with _util.ThreadSampler() as sampler:
+        start = time.time()
+        for i in range(tasks):
+            runtime.schedule(countdown, delay)
+        countdown.done.wait(60 + delay)
+        elapsed = time.time() - start
+    return elapsed, sampler.peak - baseline
+
+
+def main():
+    args = docopt(__doc__)
+    tasks = int(args["--tasks"] or 2000)
+    delay = float(args["--delay"] or 0.1)
+    rows = []
+    for name, factory in (("thread-per-task", ThreadPerTaskRuntime),
+                          ("timer", ThreadedRuntime)):
+        for d in (0.0, delay):
+            elapsed, peak = measure(factory, tasks, d)
+            # the fixed delay is not scheduling overhead
+            busy = max(elapsed - d, 1e-6)
+            rows.append([name, "%.3f" % d, tasks, "%.0f" % (tasks / busy), peak])
+    _util.table(["scheduler", "delay", "tasks", "tasks/s", "threads added"], rows)
+
+
+if __name__ == "__main__":
+    main()
+    _util.finish()
@@ -0,0 +1,80 @@
+"""
+Time to compile a hello world program in a fresh compiler process.
+
+Usage: startup.py [--repeat=<n>]
+
+ - parse: no snapshot and an empty cache; the standard library is parsed
+   and checked from scratch.
+ - snapshot: an empty cache, the standard library comes from the
+   snapshot that is built when quarkc is installed.
+ - cache: the compile cache already holds hello.q.
+
+Each run is a new interpreter, so imports are included in the time.
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from docopt import docopt
+
+import _util
+
+HELLO = """quark *;
+
+void main(List<String> args) {
+    print("Hello World");
+}
+"""
+
+SCRIPT = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from quarkc.cache import Snapshot
+from quarkc.compiler import Compiler
+c = Compiler()
+c.snapshot = Snapshot(sys.argv[3]) if sys.argv[3] != "-" else None
+c.urlparse(sys.argv[2])
+c.compile()
+"""
+
+
+def run(source, snapshot, cache):
+    env = dict(os.environ, QUARK_CACHE_DIR=cache)
+    start = time.time()
+    subprocess.check_call([sys.executable, "-c", SCRIPT, _util.ROOT, source, snapshot], env=env)
+    return time.time() - start
+
+
+def main():
+    args = docopt(__doc__)
+    repeat = int(args["--repeat"] or 3)
+    _util.use_compiler_sources()
+    from quarkc.compiler import build_snapshot
+    work = tempfile.mkdtemp(prefix="quark-startup-")
+    try:
+        source = os.path.join(work, "hello.q")
+        with open(source, "w") as fd:
+            fd.write(HELLO)
+        snapshot = build_snapshot(os.path.join(work, "quark.snapshot"))
+        rows = []
+        for mode in ("parse", "snapshot", "cache"):
+            times = []
+            for i in range(repeat):
+                cache = os.path.join(work, "cache-%s-%d" % (mode, i))
+                if mode == "cache":
+                    run(source, "-", cache)
+                times.append(run(source, "-" if mode == "parse" else snapshot, cache))
+            rows.append([mode, "%.2f" % min(times)])
+    finally:
+        shutil.rmtree(work)
+    _util.table(["stdlib", "seconds"], rows)
+
+
+if __name__ == "__main__":
+    main()
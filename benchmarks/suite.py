@@ -0,0 +1,219 @@
+"""
+Compiler benchmark suite over synthetic programs.
+
+Usage:
+  suite.py [options]
+  suite.py --worker <entry> <target> <backends>
+
+Options:
+  --dimensions=<list>  Shape dimensions to scale, from classes, methods, fields,
+                       generics, namespaces and depth. [default: all]
+  --factor=<n>         How much each dimension is scaled. [default: 4]
+  --backends=<list>    Backends to emit with. [default: Java,Python,JavaScript,Ruby]
+  --repeat=<n>         Measurements per program, the fastest is kept. [default: 3]
+  --output=<file>      Write the results as JSON to <file>.
+  --compare=<file>     Compare with results written by an earlier run and exit
+                       with an error when a time grows by more than --threshold.
+  --threshold=<ratio>  Slowdown tolerated by --compare. [default: 1.2]
+
+Compiles the baseline program of synthetic.py, then one program per
+dimension with that dimension scaled by <factor>. Each measurement runs
+in a fresh process, starting from an empty compile cache, and reports
+the time spent parsing (parse, Crosswire and ApplyAnnotators), checking
+(Def, Use, Resolver, Check), reflecting and emitting (traverse,
+leave_Root, write) for each backend, as recorded by quark --profile for
+the synthetic files only, and the peak resident memory of the process.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import shutil
+import platform
+import resource
+import subprocess
+import tempfile
+
+from docopt import docopt
+
+import _util
+import synthetic
+
+PHASES = {
+    "parse": ("parse", "Crosswire+ApplyAnnotators"),
+    "check": ("Def", "Use", "Resolver", "Check"),
+    "reflect": ("reflect",),
+    "emit": ("traverse", "leave_Root", "write"),
+}
+
+
+# Smallest slowdown, in seconds, --compare reports.
+MIN_DELTA = 0.05
+
+
+def category(phase):
+    name = phase.split(".")[-1]
+    for key, names in PHASES.items():
+        if name in names:
+            return key, phase.split(".")[0] if "." in phase else None
+    return None, None
+
+
+def worker(entry, target, backends):
+    """Compile entry once under the profiler and print the measurement."""
+    _util.use_compiler_sources()
+    from quarkc import backend, compiler
+    from quarkc.cache import CompileCache
+    from quarkc.profiler import Profile
+
+    cache = tempfile.mkdtemp(prefix="quark-suite-cache-")
+    try:
+        c = compiler.Compiler()
+        c.cache = CompileCache(cache)
+        p = Profile()
+        p.start()
+        compiler.compile(c, entry, target, *[getattr(backend, b) for b in backends])
+        p.stop()
+    finally:
+        shutil.rmtree(cache)
+
+    base = os.path.dirname(os.path.abspath(entry))
+    result = dict(parse=0.0, check=0.0, reflect={}, emit={})
+    for (phase, where), e in p.entries.items():
+        if not os.path.abspath(where).startswith(base + os.sep):
+            continue
+        key, backend_name = category(phase)
+        if key is None:
+            continue
+        if backend_name:
+            result[key][backend_name] = result[key].get(backend_name, 0.0) + e.seconds
+        else:
+            result[key] += e.seconds
+    result["peak_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    json.dump(result, sys.stdout)
+
+
+def measure(entry, backends):
+    target = tempfile.mkdtemp(prefix="quark-suite-out-")
+    try:
+        with open(os.devnull, "w") as devnull:
+            output = subprocess.check_output(
+                [sys.executable, os.path.abspath(__file__), "--worker", entry, target,
+                 ",".join(backends)], stderr=devnull)
+    finally:
+        shutil.rmtree(target)
+    return json.loads(output)
+
+
+def best(measurements):
+    """The fastest time of every phase and the largest peak."""
+    result = {}
+    for key in ("parse", "check"):
+        result[key] = min(m[key] for m in measurements)
+    for key in ("reflect", "emit"):
+        result[key] = dict((b, min(m[key][b] for m in measurements))
+                           for b in measurements[0][key])
+    result["peak_kb"] = max(m["peak_kb"] for m in measurements)
+    result["total"] = result["parse"] + result["check"] + \
+        sum(result["reflect"].values()) + sum(result["emit"].values())
+    return result
+
+
+def scenarios(dimensions, factor):
+    yield "baseline", synthetic.shape()
+    for d in dimensions:
+        yield "%s x%d" % (d, factor), synthetic.shape(**{d: synthetic.DEFAULTS[d] * factor})
+
+
+def metrics(result):
+    """Flatten a result into (name, seconds) pairs."""
+    yield "parse", result["parse"]
+    yield "check", result["check"]
+    for key in ("reflect", "emit"):
+        for b in sorted(result[key]):
+            yield "%s %s" % (key, b), result[key][b]
+    yield "total", result["total"]
+
+
+def revision():
+    try:
+        with open(os.devnull, "w") as devnull:
+            return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=_util.ROOT,
+                                           stderr=devnull).strip().decode("ascii")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new, threshold):
+    baseline = dict((r["scenario"], r) for r in old["results"])
+    rows = []
+    regressions = []
+    for r in new["results"]:
+        if r["scenario"] not in baseline:
+            continue
+        before = dict(metrics(baseline[r["scenario"]]))
+        for name, seconds in metrics(r):
+            if name not in before or not before[name]:
+                continue
+            ratio = seconds / before[name]
+            rows.append([r["scenario"], name, "%.3f" % before[name], "%.3f" % seconds, "%.2f" % ratio])
+            # Phases of a few milliseconds vary too much to gate on.
+            if ratio > threshold and seconds - before[name] > MIN_DELTA:
+                regressions.append("%s %s" % (r["scenario"], name))
+    print()
+    _util.table(["program", "metric", "before", "after", "ratio"], rows)
+    return regressions
+
+
+def main():
+    args = docopt(__doc__)
+    if args["--worker"]:
+        worker(args["<entry>"], args["<target>"], args["<backends>"].split(","))
+        return 0
+
+    dimensions = args["--dimensions"]
+    dimensions = list(synthetic.DEFAULTS) if dimensions == "all" else dimensions.split(",")
+    factor = int(args["--factor"])
+    backends = args["--backends"].split(",")
+    repeat = int(args["--repeat"])
+
+    results = []
+    rows = []
+    source = tempfile.mkdtemp(prefix="quark-suite-src-")
+    try:
+        for name, shape in scenarios(dimensions, factor):
+            directory = os.path.join(source, name.replace(" ", "-"))
+            entry = synthetic.generate(directory, **shape)
+            lines = 0
+            for f in os.listdir(directory):
+                with open(os.path.join(directory, f)) as fd:
+                    lines += fd.read().count("\n")
+            result = best([measure(entry, backends) for _ in range(repeat)])
+            result.update(scenario=name, shape=shape, lines=lines)
+            results.append(result)
+            rows.append([name, lines] + ["%.3f" % s for _, s in metrics(result)] +
+                        [result["peak_kb"] // 1024])
+    finally:
+        shutil.rmtree(source)
+
+    _util.table(["program", "lines"] + [n for n, _ in metrics(results[0])] + ["peak MB"], rows)
+    report = dict(revision=revision(), python=platform.python_version(),
+                  backends=backends, repeat=repeat, results=results)
+    if args["--output"]:
+        with open(args["--output"], "w") as fd:
+            json.dump(report, fd, indent=2, sort_keys=True)
+            fd.write("\n")
+    if args["--compare"]:
+        with open(args["--compare"]) as fd:
+            old = json.load(fd)
+        regressions = compare(old, report, float(args["--threshold"]))
+        if regressions:
+            print("\nSlower than %s: %s" % (args["--compare"], ", ".join(regressions)))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
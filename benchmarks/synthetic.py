@@ -0,0 +1,171 @@
+"""
+Synthetic Quark programs for the compiler benchmarks.
+
+Usage: synthetic.py [options] <directory>
+
+Options:
+  --classes=<n>     Classes per namespace. [default: 10]
+  --methods=<n>     Methods per class. [default: 4]
+  --fields=<n>      Fields per class. [default: 4]
+  --generics=<n>    Distinct instantiations of the generic class per namespace. [default: 4]
+  --namespaces=<n>  Namespaces per file. [default: 2]
+  --depth=<n>       Length of the chain of files that use the next one. [default: 1]
+
+Writes level0.q ... level<depth-1>.q to <directory>; each level uses the
+next, is a package of its own and calls into it. The program is
+deterministic for a given shape, so timings of two commits compare.
+"""
+
+from __future__ import print_function
+
+import os
+
+from docopt import docopt
+
+
+DEFAULTS = dict(classes=10, methods=4, fields=4, generics=4, namespaces=2, depth=1)
+
+FIELD_TYPES = ["int", "String", "List<String>", "Map<String,int>", "float", "bool"]
+
+
+class Writer(object):
+
+    def __init__(self):
+        self.lines = []
+        self.indent = 0
+
+    def __call__(self, line=""):
+        self.lines.append(("    " * self.indent + line) if line else "")
+
+    def block(self, line):
+        self(line + " {")
+        self.indent += 1
+
+    def end(self):
+        self.indent -= 1
+        self("}")
+
+    def text(self):
+        return "\n".join(self.lines) + "\n"
+
+
+def namespace(level, n):
+    return "l%dn%d" % (level, n)
+
+
+def field(w, shape, i):
+    type = FIELD_TYPES[i % len(FIELD_TYPES)]
+    initial = {"int": " = %d" % i, "String": ' = "field %d"' % i, "List<String>": " = []",
+               "Map<String,int>": " = {}", "float": " = %d.5" % i, "bool": " = true"}[type]
+    w("%s f%d%s;" % (type, i, initial))
+
+
+def method(w, shape, cls, i, callee):
+    w.block("int m%d(int x)" % i)
+    w("int y = x * %d + %d;" % (i + 1, cls))
+    if shape["fields"]:
+        w("y = y + self.f0;")
+    w.block("if (y > %d)" % (100 + i))
+    w("y = y - self.m%d(x - 1);" % (i - 1) if i else "y = y - 1;")
+    w.end()
+    w.block("while (y > 1000)")
+    w("y = y / 2;")
+    w.end()
+    if callee:
+        w('String s = "m%d" + y.toString();' % i)
+        w("y = y + %s.m0(s.size());" % callee)
+    w("return y;")
+    w.end()
+
+
+def klass(w, shape, level, ns, c, last):
+    w.block("class C%d" % c)
+    for i in range(shape["fields"]):
+        field(w, shape, i)
+    callee = None
+    if c == 0 and not last:
+        w("%s.C0 next = new %s.C0();" % (namespace(level + 1, 0), namespace(level + 1, 0)))
+        callee = "self.next"
+    elif c > 0:
+        w("C%d previous = new C%d();" % (c - 1, c - 1))
+        callee = "self.previous"
+    for i in range(shape["methods"]):
+        method(w, shape, c, i, callee if i == 0 else None)
+    w.end()
+    w()
+
+
+def generics(w, shape):
+    w.block("class Box<T>")
+    w("T value;")
+    w("List<T> history = [];")
+    w.block("void set(T value)")
+    w("self.history.add(self.value);")
+    w("self.value = value;")
+    w.end()
+    w.block("T get()")
+    w("return self.value;")
+    w.end()
+    w.end()
+    w()
+    w.block("class Boxes")
+    for g in range(shape["generics"]):
+        # Every argument is a distinct type, nesting boxes once the
+        # classes run out, so each field is an instantiation of its own.
+        nesting, c = divmod(g, shape["classes"])
+        arg = "Box<" * nesting + "C%d" % c + ">" * nesting
+        w("Box<%s> b%d = new Box<%s>();" % (arg, g, arg))
+    w.end()
+    w()
+
+
+def level(shape, n):
+    last = n == shape["depth"] - 1
+    w = Writer()
+    w("quark *;")
+    if not last:
+        w("use level%d.q;" % (n + 1))
+        for ns in range(shape["namespaces"]):
+            w("import %s;" % namespace(n + 1, ns))
+    w()
+    w("package level%d 1.0.0;" % n)
+    w()
+    for ns in range(shape["namespaces"]):
+        w.block("namespace %s" % namespace(n, ns))
+        for c in range(shape["classes"]):
+            klass(w, shape, n, ns, c, last)
+        if shape["generics"] and shape["classes"]:
+            generics(w, shape)
+        w.end()
+        w()
+    return w.text()
+
+
+def shape(**kwargs):
+    result = dict(DEFAULTS)
+    result.update(kwargs)
+    result["classes"] = max(result["classes"], 1)
+    result["depth"] = max(result["depth"], 1)
+    result["namespaces"] = max(result["namespaces"], 1)
+    return result
+
+
+def generate(directory, **kwargs):
+    """Write the program for the given shape and return the path of its entry file."""
+    s = shape(**kwargs)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    for n in range(s["depth"]):
+        with open(os.path.join(directory, "level%d.q" % n), "w") as fd:
+            fd.write(level(s, n))
+    return os.path.join(directory, "level0.q")
+
+
+def main():
+    args = docopt(__doc__)
+    kwargs = dict((k, int(args["--%s" % k])) for k in DEFAULTS)
+    print(generate(args["<directory>"], **kwargs))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 # Test binary example
 
-# Install everything all-at-once. This will generate the .qc files.
+# Install everything all-at-once. This will fill the compile cache.
 
 install_all = helpers.quark_install("binary.q")
 
@@ -1,6 +1,6 @@
 # Test the fallback example
 
-# Install everything all-at-once. This will generate the .qc files.
+# Install everything all-at-once. This will fill the compile cache.
 
 install_all = helpers.quark_install("fallback.q")
 
@@ -11,7 +11,7 @@ targets = (
     ("ruby", "ruby rbserver.rb", "ruby rbclient.rb", "Ruby", False)
 )
 
-# Install everything all-at-once. This will generate the .qc files.
+# Install everything all-at-once. This will fill the compile cache.
 install_all = helpers.quark_install("hello.q")
 
 # Install everything one-at-a-time to capture individual output for docs
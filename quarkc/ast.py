@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+from bisect import bisect_right
+
 from .coder import Coder
 from .exceptions import ParseError
 from .pprinter import PPrinter as _PPrinter
@@ -45,11 +48,185 @@ def coder(method):
         return method(self, coder)
     return result
 
+class _LineIndex(object):
+
+    """
+    Offsets of the start of every line of a source text, so positions can
+    be turned into lines and columns without rescanning the text.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.starts = [0] + [m.end() for m in re.finditer("\n", text)]
+
+    def lineinfo(self, offset):
+        line = bisect_right(self.starts, offset)
+        if line == 1:
+            return line, offset or 1
+        return line, offset - self.starts[line - 1] + 1
+
+# Every node of a parse shares the same full_text, so remembering the last
+# index builds it once per parse.
+_last_index = [_LineIndex("")]
+
+def line_index(text):
+    index = _last_index[0]
+    if index.text is not text:
+        index = _LineIndex(text)
+        _last_index[0] = index
+    return index
+
+# The visit and leave handlers of every visitor class, by node class. A
+# handler is the first visit_<name> or leave_<name> method of the visitor
+# for the classes in the node class __mro__, or None.
+_handlers = {}
+
+def _handler(vclass, prefix, nclass):
+    for cls in nclass.__mro__:
+        method = getattr(vclass, "%s_%s" % (prefix, cls.__name__), None)
+        if method is not None:
+            return getattr(method, "__func__", method)
+    return None
+
+def _table(vclass):
+    table = _handlers.get(vclass)
+    if table is None:
+        table = _handlers[vclass] = {}
+    return table
+
+def _entry(vclass, nclass):
+    entry = (_handler(vclass, "visit", nclass), _handler(vclass, "leave", nclass))
+    _table(vclass)[nclass] = entry
+    return entry
+
+_NOTHING = ()
+
+# The nodes walk() visited, in a one item list, counted while a
+# profiler.Profile is started.
+VISITS = None
+
+def walk(node, visitors, *args, **kwargs):
+    """
+    Walk the tree under node depth first, calling the visit_<name> method
+    of each visitor on a node before its children and then the
+    leave_<name> method after them, where <name> is the first class in
+    the node's __mro__ the visitor has a method for. Extra arguments are
+    passed on to every call. Nodes without a visit or leave method get
+    the visit_default or leave_default keyword argument, if any, called
+    without the visitor.
+
+    Several visitors walk the tree together, each seeing a node right
+    after the visitors before it, so they can share a walk when none of
+    them depends on what an earlier one does to nodes after the current
+    one.
+    """
+    visit_default = kwargs.pop("visit_default", None)
+    leave_default = kwargs.pop("leave_default", None)
+    pairs = [(v, _table(v.__class__)) for v in visitors]
+
+    visited = 0
+    stack = []
+    while True:
+        visited += 1
+        nclass = node.__class__
+        for v, table in pairs:
+            entry = table.get(nclass) or _entry(v.__class__, nclass)
+            if entry[0] is not None:
+                entry[0](v, node, *args, **kwargs)
+            elif visit_default is not None:
+                visit_default(node, *args, **kwargs)
+        children = node.children
+        stack.append((node, iter(children) if children else iter(_NOTHING)))
+        node = None
+        while stack:
+            for node in stack[-1][1]:
+                if node is not None:
+                    break
+            else:
+                node = None
+            if node is not None:
+                break
+            parent = stack.pop()[0]
+            nclass = parent.__class__
+            for v, table in pairs:
+                entry = table[nclass]
+                if entry[1] is not None:
+                    entry[1](v, parent, *args, **kwargs)
+                elif leave_default is not None:
+                    leave_default(parent, *args, **kwargs)
+        if node is None:
+            if VISITS is not None:
+                VISITS[0] += visited
+            return
+
+# Fields that pickling leaves out: the links Root.relink restores from
+# the shape of the tree, and what only matters while parsing or checking.
+_DERIVED = frozenset(["root", "parent", "file", "package", "clazz", "callable",
+                      "index", "count", "id", "imports", "_marked", "_rule",
+                      "_deprecated"])
+
+# The pickled fields of every node class, in __slots__ order.
+_stored = {}
+
+# The names of the fields a pickled node holds. Equal tuples are the same
+# object, so a pickle spells out each combination once.
+_shapes = {}
+
+def _stored_fields(cls):
+    names = _stored.get(cls)
+    if names is None:
+        names = []
+        for c in reversed(cls.__mro__):
+            for name in c.__dict__.get("__slots__", ()):
+                if name not in _DERIVED and name not in names:
+                    names.append(name)
+        names = _stored[cls] = tuple(names)
+    return names
+
 class AST(object):
 
+    # Every node declares its fields, so that none carries a __dict__.
+    # These are set by Crosswire and the passes after it.
+    __slots__ = ("root", "parent", "file", "package", "clazz", "callable",
+                 "index", "count", "id", "env", "imports", "resolved",
+                 "coersion", "line", "column", "_marked", "_rule", "_trace")
+
     indent = []
     fields = []
 
+    def __getstate__(self):
+        """
+        The fields of the node that are set, other than the derived ones
+        and env when it is that of the parent, as a tuple of their names
+        followed by their values.
+        """
+        names = []
+        values = []
+        for name in _stored_fields(self.__class__):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            if name == "env" and getattr(self, "parent", None) is not None and \
+               value is self.parent.env:
+                continue
+            names.append(name)
+            values.append(value)
+        # Subclasses that declare no __slots__ keep the rest in a __dict__.
+        for name, value in getattr(self, "__dict__", {}).items():
+            names.append(name)
+            values.append(value)
+        names = tuple(names)
+        shape = _shapes.get(names)
+        if shape is None:
+            shape = _shapes[names] = names
+        values.insert(0, shape)
+        return tuple(values)
+
+    def __setstate__(self, state):
+        for name, value in zip(state[0], state[1:]):
+            setattr(self, name, value)
+
     def origin(self, node):
         if not hasattr(self, "_marked"):
             self._marked = True
@@ -60,55 +237,10 @@ class AST(object):
         return self.file.name
 
     def _lineinfo(self, node):
-        text = node.full_text[:node.start]
-        line = text.count("\n") + 1
-        try:
-            column = len(text) - text.rindex("\n")
-        except ValueError:
-            column = len(text) or 1
-        return line, column
-
-    def lookup(self, target, prefix=None, default=None):
-        if hasattr(target, "lookup_cache"):
-            cache = target.lookup_cache
-        else:
-            cache = {}
-            target.lookup_cache = cache
-
-        key = (prefix, self.__class__)
-        if key in cache:
-            result = cache[key]
-            if result is None:
-                return default
-            else:
-                return cache[key]
-
-        for cls in self.__class__.__mro__:
-            if prefix is None:
-                method = cls.__name__
-            else:
-                method = "%s_%s" % (prefix, cls.__name__)
-            if hasattr(target, method):
-                result = getattr(target, method)
-                cache[key] = result
-                return result
-        if default is None:
-            raise AttributeError("%s has no suitable method for class: %s" % (target, self.__class__))
-        else:
-            cache[key] = None
-            return default
+        return line_index(node.full_text).lineinfo(node.start)
 
     def traverse(self, visitor, *args, **kwargs):
-        visit_default = kwargs.pop("visit_default", lambda *a, **kw: None)
-        leave_default = kwargs.pop("leave_default", lambda *a, **kw: None)
-        visit = self.lookup(visitor, "visit", visit_default)
-        leave = self.lookup(visitor, "leave", leave_default)
-        visit(self, *args, **kwargs)
-        if self.children:
-            for c in self.children:
-                if c is not None:
-                    c.traverse(visitor, *args, **kwargs)
-        leave(self, *args, **kwargs)
+        walk(self, (visitor,), *args, **kwargs)
 
     def __repr__(self):
         if hasattr(self, "id"):
@@ -128,6 +260,8 @@ class AST(object):
 
 class File(AST):
 
+    __slots__ = ("name", "definitions", "dist", "uses", "includes")
+
     indent = ["definitions"]
 
     def __init__(self, filename, definitions):
@@ -172,6 +306,8 @@ class File(AST):
 
 class Use(AST):
 
+    __slots__ = ("url", "qualified", "_silent")
+
     fields=["url"]
 
     def __init__(self, url):
@@ -190,6 +326,8 @@ class Use(AST):
 
 class Dependency(AST):
 
+    __slots__ = ("lang", "group", "artifact", "version")
+
     fields = ["lang", "group", "artifact", "version"]
 
     def __init__(self, lang, second, third, fourth_opt):
@@ -219,6 +357,8 @@ class Dependency(AST):
 
 class Include(AST):
 
+    __slots__ = ("url", "_silent")
+
     fields = ["url"]
 
     def __init__(self, url):
@@ -237,6 +377,8 @@ class Include(AST):
 
 class Import(AST):
 
+    __slots__ = ("path", "alias", "_silent")
+
     def __init__(self, path, alias=None):
         self.path = path
         self.alias = alias
@@ -261,6 +403,8 @@ class Import(AST):
 
 class Definition(AST):
 
+    __slots__ = ("annotations", "_replacement", "_deprecated")
+
     def __init__(self):
         self.annotations = []
 
@@ -270,6 +414,8 @@ class Definition(AST):
 
 class DistUnit(Definition):
 
+    __slots__ = ("name", "version")
+
     def __init__(self, name, version):
         self.name = name
         self.version = version
@@ -287,6 +433,8 @@ class DistUnit(Definition):
 
 class CompilerVersionSpec(AST):
 
+    __slots__ = ("spec_string", "strict")
+
     def __init__(self, spec_string, strict):
         self.spec_string = spec_string
         self.strict = strict
@@ -302,6 +450,8 @@ class CompilerVersionSpec(AST):
 
 class Package(Definition):
 
+    __slots__ = ("name", "definitions")
+
     indent = ["definitions"]
 
     def __init__(self, name, definitions):
@@ -329,6 +479,8 @@ class Package(Definition):
 
 class Callable(Definition):
 
+    __slots__ = ("static", "type", "name", "params", "body")
+
     def __init__(self, type, name, params, body):
         Definition.__init__(self)
         self.static = False
@@ -368,16 +520,20 @@ class Callable(Definition):
         return result
 
 class Function(Callable):
-    pass
+    __slots__ = ()
 
 class Macro(Callable):
 
+    __slots__ = ()
+
     @coder
     def code(self, coder):
         return "macro %s;" % Callable.code(self, coder)
 
 class Class(Definition):
 
+    __slots__ = ("name", "parameters", "bases", "definitions")
+
     indent = ["definitions"]
     keyword = "class"
 
@@ -417,10 +573,14 @@ class Class(Definition):
         return self.__class__(copy(self.name), copy(self.parameters), copy(self.bases), copy(self.definitions))
 
 class Method(Function):
+    __slots__ = ()
+
     fields=["static"]
 
 class Constructor(Method):
 
+    __slots__ = ()
+
     fields=[]
 
     def __init__(self, name, params, body):
@@ -431,6 +591,8 @@ class Constructor(Method):
                               copy(self.body))
 
 class ConstructorMacro(Macro):
+    __slots__ = ()
+
     def __init__(self, name, params, body):
         Macro.__init__(self, None, name, params, body)
 
@@ -440,20 +602,28 @@ class ConstructorMacro(Macro):
 
 class MethodMacro(Macro):
 
+    __slots__ = ()
+
     @coder
     def code(self, coder):
         return "macro %s;" % Callable.code(self, coder)
 
 class Interface(Class):
+    __slots__ = ()
+
     keyword = "interface"
 
 class Primitive(Class):
+    __slots__ = ()
+
     keyword = "primitive"
 
 ## Declarations
 
 class Declaration(AST):
 
+    __slots__ = ("annotations", "type", "name", "value", "static", "_replacement", "_deprecated")
+
     def __init__(self, type, name, value):
         self.annotations = []
         self.type = type
@@ -486,10 +656,12 @@ class Declaration(AST):
         return result
 
 class Param(Declaration):
-    pass
+    __slots__ = ()
 
 class Field(Declaration):
 
+    __slots__ = ()
+
     fields=["static"]
 
     @coder
@@ -499,10 +671,12 @@ class Field(Declaration):
 ## Statements
 
 class Statement(AST):
-    pass
+    __slots__ = ()
 
 class Return(Statement):
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
 
@@ -519,6 +693,8 @@ class Return(Statement):
 
 class Break(Statement):
 
+    __slots__ = ()
+
     @property
     def children(self): return ()
 
@@ -531,6 +707,8 @@ class Break(Statement):
 
 class Continue(Statement):
 
+    __slots__ = ()
+
     @property
     def children(self): return ()
 
@@ -543,6 +721,8 @@ class Continue(Statement):
 
 class Assign(Statement):
 
+    __slots__ = ("lhs", "rhs")
+
     def __init__(self, lhs, rhs):
         self.lhs = lhs
         self.rhs = rhs
@@ -561,6 +741,8 @@ class Assign(Statement):
 
 class If(Statement):
 
+    __slots__ = ("predicate", "consequence", "alternative")
+
     def __init__(self, predicate, consequence, alternative):
         self.predicate = predicate
         self.consequence = consequence
@@ -584,6 +766,8 @@ class If(Statement):
 
 class While(Statement):
 
+    __slots__ = ("condition", "body")
+
     def __init__(self, condition, body):
         self.condition = condition
         self.body = body
@@ -602,6 +786,8 @@ class While(Statement):
 
 class ExprStmt(Statement):
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
 
@@ -618,6 +804,8 @@ class ExprStmt(Statement):
 
 class Local(Statement):
 
+    __slots__ = ("declaration",)
+
     def __init__(self, declaration):
         self.declaration = declaration
 
@@ -635,10 +823,12 @@ class Local(Statement):
 ## Expressions
 
 class Expression(AST):
-    pass
+    __slots__ = ()
 
 class Super(Expression):
 
+    __slots__ = ()
+
     @property
     def children(self):
         return ()
@@ -652,6 +842,8 @@ class Super(Expression):
 
 class Var(Expression):
 
+    __slots__ = ("name", "definition")
+
     def __init__(self, name):
         self.name = name
 
@@ -668,6 +860,8 @@ class Var(Expression):
 
 class Attr(Expression):
 
+    __slots__ = ("expr", "attr")
+
     def __init__(self, expr, attr):
         self.expr = expr
         self.attr = attr
@@ -686,6 +880,8 @@ class Attr(Expression):
 
 class Call(Expression):
 
+    __slots__ = ("expr", "args")
+
     def __init__(self, expr, args):
         self.expr = expr
         self.args = args
@@ -708,6 +904,8 @@ class Call(Expression):
         return self.__class__(copy(self.expr), copy(self.args))
 
 class Operator(Call):
+    __slots__ = ("op",)
+
     def __init__(self, expr, args, op):
         self.expr = expr
         self.args = args
@@ -722,16 +920,18 @@ class Operator(Call):
         return self.__class__(copy(self.expr), copy(self.args), self.op)
 
 class ArithmeticOperator(Operator):
-    pass
+    __slots__ = ()
 
 class Literal(Expression):
-    pass
+    __slots__ = ()
 
 class CompoundLiteral(Literal):
-    pass
+    __slots__ = ()
 
 class PrimitiveLiteral(Literal):
 
+    __slots__ = ("text",)
+
     def __init__(self, text):
         self.text = text
 
@@ -747,15 +947,17 @@ class PrimitiveLiteral(Literal):
         return self.__class__(self.text)
 
 class Bool(PrimitiveLiteral):
-    pass
+    __slots__ = ()
 
 class Null(PrimitiveLiteral):
-    pass
+    __slots__ = ()
 
 class Number(PrimitiveLiteral):
-    pass
+    __slots__ = ()
 
 class String(PrimitiveLiteral):
+    __slots__ = ()
+
     @coder
     def code(self, coder):
         if "\n" in self.text:
@@ -765,6 +967,8 @@ class String(PrimitiveLiteral):
 
 class List(CompoundLiteral):
 
+    __slots__ = ("elements",)
+
     def __init__(self, elements):
         self.elements = elements
 
@@ -781,6 +985,8 @@ class List(CompoundLiteral):
 
 class Map(CompoundLiteral):
 
+    __slots__ = ("entries",)
+
     def __init__(self, entries):
         self.entries = entries
 
@@ -797,6 +1003,8 @@ class Map(CompoundLiteral):
 
 class Entry(AST):
 
+    __slots__ = ("key", "value")
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -815,6 +1023,8 @@ class Entry(AST):
 
 class Native(Expression):
 
+    __slots__ = ("cases",)
+
     def __init__(self, cases):
         self.cases = cases
 
@@ -832,6 +1042,8 @@ class Native(Expression):
 
 class NativeCase(AST):
 
+    __slots__ = ("name", "children")
+
     def __init__(self, name, children):
         self.name = name
         self.children = children
@@ -853,6 +1065,8 @@ class NativeCase(AST):
 
 class Fixed(Expression):
 
+    __slots__ = ("text",)
+
     def __init__(self, text):
         self.text = text
 
@@ -869,6 +1083,8 @@ class Fixed(Expression):
 
 class Cast(Expression):
 
+    __slots__ = ("expr",)
+
     def __init__(self, expr):
         self.expr = expr
 
@@ -887,6 +1103,8 @@ class Cast(Expression):
 
 class Name(AST):
 
+    __slots__ = ("text",)
+
     def __init__(self, text):
         self.text = text
 
@@ -906,6 +1124,8 @@ class Name(AST):
 
 class Type(AST):
 
+    __slots__ = ("path", "parameters")
+
     def __init__(self, path, parameters=None):
         self.path = path
         self.parameters = parameters
@@ -937,6 +1157,8 @@ class Type(AST):
 
 class TypeParam(AST):
 
+    __slots__ = ("name",)
+
     def __init__(self, name):
         self.name = name
 
@@ -953,6 +1175,8 @@ class TypeParam(AST):
 
 class Block(AST):
 
+    __slots__ = ("statements",)
+
     indent = ["statements"]
 
     def __init__(self, statements):
@@ -974,6 +1198,8 @@ class Block(AST):
 
 class Annotation(AST):
 
+    __slots__ = ("name", "arguments")
+
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
@@ -30,11 +30,12 @@ from .compiler import texpr, TypeExpr
 from .constants import (BUILTIN, BUILTIN_FILE, REFLECT)
 from .dispatch import overload
 from .helpers import (
-    is_meta, has_super, compiled_quark, is_newer, namever, mdroot, readme,
+    is_meta, has_super, is_newer, namever, mdroot, readme,
     base_type, get_defaulted_methods, is_abstract, base_constructors, doc,
     get_field, constructors, get_defaulted_statics
 )
 from quarkc import reflection
+from quarkc.profiler import phase
 
 class FakeExpr(object): pass
 
@@ -59,6 +60,10 @@ class Backend(object):
         self.root = None
         self.roots = None
         self.dependencies = OrderedDict()
+        # The methods and static fields reflection adds to classes, by
+        # class, as functions generating them.
+        self.extra_methods = {}
+        self.extra_statics = {}
         self.log = logging.getLogger("quark.compile")
 
     def install(self, offline):
@@ -66,8 +71,8 @@ class Backend(object):
         pkg = self.packages[0].name
 
         target = self.install_target()
-        if os.path.exists(self.root.url):
-            deps = (compiled_quark(self.root.url),)
+        if hasattr(self.root, "_artifact"):
+            deps = (self.root._artifact,)
         else:
             deps = ()
         modified = getattr(self.root, "_modified", False)
@@ -159,10 +164,15 @@ class Backend(object):
         return True
 
     def leave_Root(self, r):
+        with phase("%s.leave_Root" % self.__class__.__name__, r):
+            self.emit_Root(r)
+
+    def emit_Root(self, r):
         if self.dist:
             self.entry = self.dist.file
 
-        self.mdpkg, cleanup = reflection.reflect(r, self)
+        with phase("%s.reflect" % self.__class__.__name__, r):
+            self.mdpkg, cleanup = reflection.reflect(r, self)
 
         self.main = None
         for d in self.definitions:
@@ -283,6 +293,10 @@ class Backend(object):
         return self.gen.make_package_file(self.package(pkg.package), self.name(pkg.name), rtloc = self.rtloc)
 
     def write(self, target):
+        with phase("%s.write" % self.__class__.__name__, self.root):
+            self._write(target)
+
+    def _write(self, target):
         if not os.path.exists(target):
             os.makedirs(target)
         name, version = namever(self.entry)
@@ -365,14 +379,12 @@ class Backend(object):
         for d in cls.definitions + [None] + defaulted.values() + defaulted_statics.values():
             if isinstance(d, Macro): continue
             if d is None:
-                extra_methods = getattr(cls, "_extra_methods", None)
+                extra_methods = self.extra_methods.pop(cls, None)
                 if extra_methods:
                     methods.extend(extra_methods())
-                    del cls._extra_methods
-                extra_statics = getattr(cls, "_extra_statics", None)
+                extra_statics = self.extra_statics.pop(cls, None)
                 if extra_statics:
                     static_fields.extend(extra_statics())
-                    del cls._extra_statics
                 continue
             doc = self.doc(d)
             if isinstance(d, Field):
@@ -433,14 +445,12 @@ class Backend(object):
 
         for d in iface.definitions + [None]:
             if d is None:
-                extra_methods = getattr(iface, "_extra_methods", None)
+                extra_methods = self.extra_methods.pop(iface, None)
                 if extra_methods:
                     methods.extend(extra_methods())
-                    del iface._extra_methods
-                extra_statics = getattr(iface, "_extra_statics", None)
+                extra_statics = self.extra_statics.pop(iface, None)
                 if extra_statics:
                     static_fields.extend(extra_statics())
-                    del iface._extra_statics
             if isinstance(d, Field) and d.static:
                 static_fields.append(self.gen.static_field(self.doc(d),
                                                            name,
@@ -0,0 +1,296 @@
+# Copyright 2016 datawire. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Content addressed cache of compiled roots.
+
+Every root is stored on its own, keyed on the compiler, the text of the
+files it was parsed from and the keys of the roots it uses, so neither a
+key nor an artifact depends on where the files are: a checkout finds
+what another one compiled from the same sources. The nodes of those
+other roots an artifact refers to are stored by position, and resolved
+against the roots loaded before it. Since what a root includes and uses
+is only known once it is parsed, an index keyed on the text of its file
+alone lists them.
+
+Artifacts are written atomically, so one cache directory can be shared
+by concurrent compilers and restored by CI jobs regardless of file
+modification times. The least recently used artifacts are removed once
+the directory grows beyond `limit` bytes.
+
+The directory is $QUARK_CACHE_DIR, or ~/.quark/cache by default.
+"""
+
+from __future__ import absolute_import
+
+import os, gc, glob, hashlib, logging, tempfile, time, cPickle as pickle
+from contextlib import contextmanager
+
+from . import _metadata
+
+ARCHIVE_END = "ARCHIVE_END"
+
+def digest(*parts):
+    h = hashlib.sha1()
+    for p in parts:
+        h.update(p)
+        h.update("\0")
+    return h.hexdigest()
+
+def file_digest(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as fd:
+        return digest(fd.read())
+
+@contextmanager
+def collection_paused():
+    """
+    Unpickling a compiled tree allocates a lot of objects and none of
+    them are garbage, so skip the collections it would trigger.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+_fingerprint = []
+
+def fingerprint():
+    """
+    Identify the compiler: its version and the source of its modules,
+    since those define the pickled classes.
+    """
+    if not _fingerprint:
+        here = os.path.dirname(os.path.abspath(__file__))
+        parts = [_metadata.__version__]
+        for path in sorted(glob.glob(os.path.join(here, "*.py"))):
+            parts.append(file_digest(path))
+        _fingerprint.append(digest(*parts))
+    return _fingerprint[0]
+
+def default_directory():
+    return os.environ.get("QUARK_CACHE_DIR") or \
+        os.path.join(os.path.expanduser("~"), ".quark", "cache")
+
+class CompileCache(object):
+
+    limit = 256*1024*1024
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_directory()
+        self.log = logging.getLogger("quark.compiler")
+
+    def key(self, *parts):
+        return digest(fingerprint(), *map(str, parts))
+
+    def path(self, key):
+        return os.path.join(self.directory, "%s.qc" % key)
+
+    def index_path(self, source):
+        return os.path.join(self.directory, "%s.qi" % source)
+
+    def index(self, source, url):
+        """
+        Return the files a root parsed from url includes and the urls of
+        the roots it uses, as written, from the index under source. None
+        if no root was stored with a file of that text.
+        """
+        records = self._read(self.index_path(source), 1)
+        if records is None:
+            return None
+        includes, uses = records[0]
+        base = os.path.dirname(url)
+        return [os.path.normpath(os.path.join(base, i)) for i in includes], uses
+
+    def load(self, key, url, persistent_load):
+        """
+        Return the root stored under key, moved to url, or None when there
+        is none. The nodes of other roots it refers to are those that
+        persistent_load returns for their ids.
+        """
+        records = self._read(self.path(key), 2, persistent_load)
+        if records is None:
+            return None
+        header, root = records
+        base = os.path.dirname(url)
+        root.url = url
+        for f in root.files:
+            f.name = os.path.normpath(os.path.join(base, os.path.relpath(f.name, header["base"])))
+        return root
+
+    def store(self, source, key, url, includes, uses, root, persistent_id):
+        """
+        Store root under key, with the nodes of other roots it refers to
+        replaced by the ids persistent_id gives them, and index what it
+        includes and uses under source.
+        """
+        base = os.path.dirname(url)
+        path = self.path(key)
+        self._write(path, [dict(base=base), root], persistent_id)
+        self._write(self.index_path(source),
+                    [(tuple(os.path.relpath(i, base) for i in includes), tuple(uses))])
+        self.log.debug("Wrote %s", path)
+        self.prune()
+        return path
+
+    def _read(self, path, count, persistent_load=None):
+        try:
+            fd = open(path, "rb")
+        except IOError:
+            return None
+        with fd:
+            try:
+                unp = pickle.Unpickler(fd)
+                if persistent_load:
+                    unp.persistent_load = persistent_load
+                with collection_paused():
+                    records = [unp.load() for _ in range(count)]
+                # Check for the end record in case we
+                # encounter a partially written file.
+                if unp.load() != ARCHIVE_END:
+                    return None
+            except (EOFError, KeyError, TypeError, pickle.UnpicklingError, AttributeError,
+                    ImportError, IndexError):
+                return None
+        # Record the use for pruning without touching the modification
+        # time, which backends compare with what they installed.
+        try:
+            os.utime(path, (time.time(), os.stat(path).st_mtime))
+        except OSError:
+            pass
+        return records
+
+    def _write(self, path, records, persistent_id=None):
+        if not os.path.isdir(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                if not os.path.isdir(self.directory):
+                    raise
+        fdn, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".qc")
+        try:
+            with os.fdopen(fdn, "wb") as fd:
+                pickler = pickle.Pickler(fd, -1)
+                if persistent_id:
+                    pickler.persistent_id = persistent_id
+                for record in records:
+                    pickler.dump(record)
+                pickler.dump(ARCHIVE_END)
+            os.rename(tmp, path)
+        except:
+            os.unlink(tmp)
+            raise
+
+    def prune(self):
+        """
+        Remove the least recently used artifacts until the cache fits in limit.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith((".qc", ".qi")) or name.startswith("."):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_atime, st.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.limit:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib", "quark.snapshot")
+
+class Snapshot(object):
+
+    """
+    The compiled standard library, built when quarkc is installed.
+
+    Unlike cache artifacts a snapshot refers to the files it was built
+    from relative to their directory, so it stays valid when the package
+    is copied into place after the build.
+    """
+
+    def __init__(self, path=SNAPSHOT):
+        self.path = path
+        self.log = logging.getLogger("quark.compiler")
+
+    def load(self, url):
+        """
+        Return the roots compiled from url, or None if the snapshot is
+        missing, was built for another url or by another compiler, or
+        any of its files changed since.
+        """
+        base = os.path.dirname(url)
+        try:
+            fd = open(self.path, "rb")
+        except IOError:
+            return None
+        with fd:
+            try:
+                unp = pickle.Unpickler(fd)
+                header = unp.load()
+                if header["fingerprint"] != fingerprint() or \
+                   header["url"] != os.path.basename(url):
+                    return None
+                for name, dig in header["deps"]:
+                    if file_digest(os.path.join(base, name)) != dig:
+                        self.log.debug("stale %s: %s changed", self.path, name)
+                        return None
+                with collection_paused():
+                    roots = unp.load()
+                if unp.load() != ARCHIVE_END:
+                    return None
+            except (EOFError, KeyError, TypeError, pickle.UnpicklingError, AttributeError,
+                    ImportError, IndexError):
+                return None
+        for root in roots:
+            root.url = self.relocate(root.url, header["base"], base)
+            for f in root.files:
+                f.name = self.relocate(f.name, header["base"], base)
+            root._artifact = self.path
+        return roots
+
+    def relocate(self, url, old, new):
+        if url.startswith(old + os.sep):
+            return os.path.join(new, url[len(old) + 1:])
+        return url
+
+    def store(self, url, deps, roots):
+        base = os.path.dirname(url)
+        header = dict(fingerprint=fingerprint(), url=os.path.basename(url), base=base,
+                      deps=tuple((os.path.relpath(d, base), file_digest(d)) for d in deps))
+        fdn, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=".tmp-")
+        try:
+            with os.fdopen(fdn, "wb") as fd:
+                pickler = pickle.Pickler(fd, -1)
+                pickler.dump(header)
+                pickler.dump(roots)
+                pickler.dump(ARCHIVE_END)
+            os.chmod(tmp, 0644)
+            os.rename(tmp, self.path)
+        except:
+            os.unlink(tmp)
+            raise
+        self.log.debug("Wrote %s", self.path)
@@ -41,6 +41,13 @@ Options:
                         include the Quark standard library rather than having external
                         dependency on it.
   -o DIR, --output DIR  Target directory for output files. [default: output]
+  -j N, --jobs N        Number of processes emitting code, or of packages installed,
+                        in parallel. [default: 1]
+  --profile             Report the time spent in each compiler phase for every file,
+                        the AST nodes it walked and its dispatch cache hits and
+                        misses. Code is emitted by a single process.
+  --profile-out FILE    With --profile, also write the profile to FILE: as JSON if
+                        FILE ends in .json, as cProfile statistics otherwise.
 
   --all                 Install/emit code for all available target languages.
                         [this is the default if no targets are specified]
@@ -67,6 +74,7 @@ import compiler
 import backend
 import helpers
 import shell
+import profiler
 from .exceptions import QuarkError
 
 
@@ -164,6 +172,38 @@ def main(args):
     version = "Quark %s run at %s" % (_metadata.__version__, datetime.datetime.now())
     helpers.Code.identifier = version
 
+    output = args["--output"]
+    try:
+        jobs = int(args["--jobs"])
+    except ValueError:
+        return "--jobs must be a number, got %r" % args["--jobs"]
+    offline = not args["--online"]
+
+    profile = None
+    if args["--profile"]:
+        profile = profiler.Profile()
+        jobs = 1
+        out = args["--profile-out"]
+        if out and not out.endswith(".json"):
+            import cProfile
+            stats = cProfile.Profile()
+            stats.enable()
+        profile.start()
+
+    try:
+        return run(args, version, do_log, output, jobs, offline)
+    finally:
+        if profile:
+            profile.stop()
+            if out and not out.endswith(".json"):
+                stats.disable()
+                stats.dump_stats(out)
+            elif out:
+                profile.dump(out)
+            profile.report()
+
+
+def run(args, version, do_log, output, jobs, offline):
     java = args["--java"]
     ruby = args["--ruby"]
     python = args["--python"]
@@ -172,9 +212,6 @@ def main(args):
 
     all = args["--all"] or not (java or python or javascript or ruby or python3)
 
-    output = args["--output"]
-    offline = not args["--online"]
-
     try:
         shell.command_log.info("Checking environment")
         backends = []
@@ -203,9 +240,9 @@ def main(args):
             c = compiler.Compiler(args["--include-stdlib"])
             c.version_warning = args["--version-warning"]
             if args["install"]:
-                compiler.install(c, url, offline, *backends)
+                compiler.install(c, url, offline, *backends, jobs=jobs)
             elif args["compile"]:
-                compiler.compile(c, url, output, *backends)
+                compiler.compile(c, url, output, *backends, jobs=jobs)
             elif args["run"]:
                 compiler.run(c, url, args["<args>"], *backends)
             elif args["docs"]:
@@ -14,8 +14,8 @@
 
 from __future__ import absolute_import
 
-import os, sys, urllib, logging, cPickle as pickle, shutil
-from collections import OrderedDict
+import os, gc, sys, urllib, logging, shutil, tempfile, threading, traceback, multiprocessing
+from collections import OrderedDict, namedtuple
 
 try:  # py3
     from shlex import quote as sh_quote
@@ -27,9 +27,9 @@ from parsimonious import ParseError as GParseError
 from .ast import (
     AST, Class, Callable, Definition, Param, TypeParam, Function, Call,
     Package, Null, Type, Import, Cast, List, Map, Attr, Macro, Name,
-    Use as AstUse, code, copy, Interface, Include, CompilerVersionSpec,
+    Use as AstUse, code, copy, Interface, Include, CompilerVersionSpec, File, walk,
 )
-from .exceptions import CompileError, ParseError
+from .exceptions import CompileError, ParseError, QuarkError
 from .parser import (
     Parser,
     parse_strict_compiler_version_spec,
@@ -37,13 +37,16 @@ from .parser import (
 from .dispatch import overload
 from .helpers import (
     lineinfo, base_bindings, get_field, constructor, base_type, base_constructors,
-    has_super, has_return, is_newer, compiled_quark, namever, check_deprecated,
+    has_super, has_return, namever, check_deprecated,
     CompileWarning
 )
 from .environment import Environment
+from .cache import CompileCache, Snapshot, collection_paused, file_digest
 from . import docmaker
 from . import docrenderer
 from . import errors
+from . import shell
+from .profiler import phase
 from .versioning import (
     compiler_version_spec_messages,
     version_spec_string_messages,
@@ -63,6 +66,8 @@ def join(base, rel):
 
 class Roots(AST):
 
+    __slots__ = ("roots",)
+
     def __init__(self):
         self.roots = OrderedDict()
 
@@ -106,6 +111,8 @@ class Roots(AST):
 
 class Root(AST):
 
+    __slots__ = ("url", "files", "included", "uses", "_artifact", "_compiled", "_key", "_modified")
+
     def __init__(self, url):
         self.url = url
         self.index = 0
@@ -134,6 +141,88 @@ class Root(AST):
         for f in self.files:
             yield f
 
+    def relink(self):
+        """
+        Restore the links AST.__getstate__ leaves out of a tree loaded
+        from the cache, as Crosswire first set them: in the same order,
+        since nodes that are the child of two others end up linked to the
+        one visited last.
+        """
+        self.root = self
+        self.parent = self.file = self.package = self.clazz = self.callable = None
+        self.id = ""
+        self.index = 0
+        self.count = 0
+        self.imports = []
+        # The nodes being visited, with their remaining children and what
+        # those children link to.
+        stack = [(self, iter(self.files), None, None, None, "")]
+        while stack:
+            parent, children, package, clazz, callable, prefix = stack[-1]
+            for node in children:
+                if node is not None:
+                    break
+            else:
+                stack.pop()
+                continue
+            kind = _kinds.get(node.__class__) or _kind(node.__class__)
+            node.root = self
+            node.parent = parent
+            node.file = node if kind.file else parent.file
+            node.package = package
+            node.clazz = clazz
+            node.callable = callable
+            node.index = index = parent.count
+            parent.count = index + 1
+            node.count = 0
+            node.id = prefix + (node.name.text if kind.named else str(index))
+            node.imports = []
+            if kind.imported:
+                parent.imports.insert(0, node)
+            if not hasattr(node, "env"):
+                node.env = parent.env
+            grandchildren = node.children
+            if grandchildren:
+                stack.append((node, iter(grandchildren),
+                              node if kind.package else package,
+                              node if kind.clazz else clazz,
+                              node if kind.callable else callable,
+                              node.id + "."))
+
+    def position(self, node):
+        """
+        The indexes of the children leading from this root down to node,
+        or None if node is not linked under it.
+        """
+        path = []
+        at = node
+        while at is not self:
+            parent = getattr(at, "parent", None)
+            if parent is None:
+                return None
+            path.append(at.index)
+            at = parent
+        path.reverse()
+        return tuple(path) if self.at(path) is node else None
+
+    def at(self, path):
+        """The node at a position() under this root."""
+        node = self
+        for index in path:
+            node = [c for c in node.children if c is not None][index]
+        return node
+
+# What Root.relink needs to know of each node class.
+_Kind = namedtuple("_Kind", "file package clazz callable imported named")
+_kinds = {}
+
+def _kind(cls):
+    kind = _kinds[cls] = _Kind(issubclass(cls, File), issubclass(cls, Package),
+                               issubclass(cls, Class), issubclass(cls, Callable),
+                               issubclass(cls, Import),
+                               issubclass(cls, (Definition, Param, TypeParam)))
+    return kind
+
 def pkg_name(pkg):
     if pkg.package is None:
         return code(pkg.name)
@@ -847,7 +936,8 @@ def delegate(node):
     node.annotations = [a for a in node.annotations if a.name.text != "delegate"]
     return node
 
-ARCHIVE_END = "ARCHIVE_END"
+class _Unstorable(Exception):
+    pass
 
 class Compiler(object):
 
@@ -868,6 +958,9 @@ class Compiler(object):
         self.included = set()
         self.log = logging.getLogger("quark.compiler")
         self.entries = OrderedDict()
+        self.cache = CompileCache()
+        self.snapshot = Snapshot()
+        self.keys = {}
 
     def annotator(self, name, annotator):
         if name in self.annotators:
@@ -880,7 +973,8 @@ class Compiler(object):
     def parse(self, name, text):
         try:
             self.parser._filename = name
-            file = self.parser.parse(text)
+            with phase("parse", name):
+                file = self.parser.parse(text)
         except GParseError as e:
             location = '%s:%s:%s: ' % (name, e.line(), e.column())
             version_string = parse_strict_compiler_version_spec(text)
@@ -915,9 +1009,11 @@ class Compiler(object):
             file.definitions.insert(insert_builtin_index, stdlib)
         while True:
             file.name = name
-            file.traverse(Crosswire(self.root))
             aa = ApplyAnnotators(self.annotators)
-            file.traverse(aa)
+            # Annotators only look at the node they annotate, which
+            # Crosswire has reached by then, so both share one walk.
+            with phase("Crosswire+ApplyAnnotators", name):
+                walk(file, (Crosswire(self.root), aa))
             if aa.modified:
                 file = copy(file)
             else:
@@ -936,17 +1032,16 @@ class Compiler(object):
         it's added as a child of `self.root`.
 
         There are  two forms  of caching:  CACHE is  a shared  dictionary across
-        class instances of parsed roots.  Additionally .qc file are written with
-        pickled versions of  loaded roots. Given that both of  them store a root
-        these forms  of caching are only  relevant to top-level quark  files and
-        files referenced using `use`. Files  loaded with `include` should bypass
-        the  caching mechanism  since they  need to  be loaded  as child  of the
-        parent root.
+        class instances of parsed roots.  Additionally self.cache stores pickled
+        versions of compiled roots keyed on the content of their files. Given
+        that both of  them store a root these forms  of caching are only
+        relevant to top-level quark  files and files referenced using `use`.
+        Files  loaded with `include` should bypass the  caching mechanism  since
+        they  need to  be loaded  as child  of the parent root.
         """
         if os.path.exists(url):
             url = os.path.abspath(url)
 
-        urlc = compiled_quark(url)
         if not include and url in self.CACHE:
             self.log.debug("loading from cache: %s", url)
             root = self.CACHE[url]
@@ -957,25 +1052,18 @@ class Compiler(object):
                     self.roots.add(self.CACHE[u])
             if not include: self.entries[url] = root.files[0]
             return root.files[0]
-        elif not include and recurse and os.path.exists(url) and is_newer(urlc, url, __file__):
-            self.log.debug("loading from: %sc", url)
-            with open(urlc) as fd:
-                try:
-                    unp = pickle.Unpickler(fd)
-                    deps = unp.load()
-                    if is_newer(urlc, *deps):
-                        roots = unp.load()
-                        # Check for the end record in case we
-                        # encounter a partially written file.
-                        end = unp.load()
-                        if end == ARCHIVE_END:
-                            for root in roots:
-                                self.CACHE[root.url] = root
-                                self.roots.add(root)
-                            if not include: self.entries[url] = roots[0].files[0]
-                            return roots[0].files[0]
-                except EOFError:
-                    pass
+        elif not include and recurse and os.path.exists(url):
+            if text is None:
+                text = self.read(url)
+            self.keys[url] = self.cache.key(text, self.include_stdlib)
+            with phase("load", url):
+                root = self.load(url)
+            if root:
+                self.log.debug("loading from: %s", root._artifact)
+                self.CACHE[url] = root
+                self.roots.add(root)
+                self.entries[url] = root.files[0]
+                return root.files[0]
 
         old = None
         if not include and url not in self.roots:
@@ -1013,6 +1101,86 @@ class Compiler(object):
         finally:
             if old: self.root = old
 
+    def load(self, url):
+        """
+        Return the compiled root of url from the cache or the snapshot,
+        loaded after the roots it uses, or None if it has to be parsed.
+        """
+        root = self.load_cached(url)
+        if root is None and self.snapshot and url == os.path.abspath(join(None, BUILTIN_FILE)):
+            roots = self.snapshot.load(url)
+            root = roots[0] if roots else None
+        if root is not None:
+            with collection_paused():
+                root.relink()
+        return root
+
+    def load_cached(self, url):
+        index = self.cache.index(self.keys[url], url)
+        if index is None:
+            return None
+        includes, uses = index
+        deps = []
+        for u in uses:
+            qurl = join(url, u)
+            if qurl not in self.roots:
+                if not os.path.exists(qurl):
+                    return None
+                self.urlparse(qurl, top=False)
+            dep = self.roots[qurl]
+            # The root refers to the nodes of a compiled tree
+            if not getattr(dep, "_key", None) or not getattr(dep, "_compiled", False):
+                return None
+            deps.append(dep)
+        key = self.key(url, includes, deps)
+        owners = dict((r._key, r) for d in deps for r in self.trans_roots(d))
+        nodes = {}
+        def persistent_load(pid):
+            if pid not in nodes:
+                owner, path = pid
+                nodes[pid] = owners[owner].at(path)
+            return nodes[pid]
+        root = self.cache.load(key, url, persistent_load)
+        if root is None:
+            return None
+        root.uses = OrderedDict((join(url, u.url), u) for u in root.uses.values())
+        for qurl, u in root.uses.items():
+            u.qualified = qurl
+        root._key = key
+        root._artifact = self.cache.path(key)
+        return root
+
+    def key(self, url, includes, deps):
+        """
+        The key of a compiled root: that of the text of its file, of the
+        files it includes and the keys of the roots it uses.
+        """
+        return self.cache.key(self.keys[url], *([file_digest(i) for i in includes] +
+                                                [d._key for d in deps]))
+
+    def references(self, root):
+        """
+        The persistent_id of root on its own: the nodes of the roots it
+        uses are the key of their root and their position under it.
+        """
+        keys = dict((id(r), r._key) for r in self.trans_roots(root)[1:])
+        ids = {}
+        def persistent_id(obj):
+            owner = getattr(obj, "root", None)
+            if owner is root or not isinstance(owner, Root):
+                return None
+            if id(obj) not in ids:
+                if id(owner) not in keys:
+                    raise _Unstorable("%s refers to %s, which it does not use" %
+                                      (root.url, owner.url))
+                path = owner.position(obj)
+                if path is None:
+                    raise _Unstorable("%s refers to a node outside the tree of %s" %
+                                      (root.url, owner.url))
+                ids[id(obj)] = (keys[id(owner)], path)
+            return ids[id(obj)]
+        return persistent_id
+
     def perform_use(self, qurl, use):
         if qurl not in self.roots:
             try:
@@ -1063,22 +1231,26 @@ class Compiler(object):
 
         try:
             def_ = Def(errors)
-            ast.traverse(def_)
+            with phase("Def", ast):
+                ast.traverse(def_)
             self.raise_errors(errors)
 
             use = Use(errors)
-            ast.traverse(use)
+            with phase("Use", ast):
+                ast.traverse(use)
             if use.unresolved:
                 use.errors.extend(["%s: unresolved variable: %s" % (lineinfo(node), name)
                         for node, name in use.unresolved])
             self.raise_errors(errors)
 
             res = Resolver(errors)
-            ast.traverse(res)
+            with phase("Resolver", ast):
+                ast.traverse(res)
             self.raise_errors(errors)
 
             check = Check(errors)
-            ast.traverse(check)
+            with phase("Check", ast):
+                ast.traverse(check)
             self.raise_errors(errors)
 
         except CompileError as ce:
@@ -1119,7 +1291,7 @@ class Compiler(object):
             result[r.url] = True
             for f in r.files:
                 for url in f.includes:
-                    result[join(r.url, url)] = True
+                    result[join(f.name, url)] = True
         return tuple(result.keys())
 
     def compile(self):
@@ -1134,55 +1306,283 @@ class Compiler(object):
             self.icompile(root)
             root._compiled = True
 
+        # Roots loaded from the cache or the snapshot already have an
+        # artifact, the others get one each, after the roots they use since
+        # their key is made of those roots' keys.
         modified = []
-        for url, file in self.entries.items():
-            if not os.path.exists(url): continue
-            urlc = compiled_quark(url)
-            trans_roots = tuple(self.trans_roots(file.root))
-            deps = tuple(self.deps(trans_roots))
-            if not is_newer(urlc, __file__, *deps):
-                self.log.info("Writing %s" % urlc)
-                with open(urlc, "w") as fd:
-                    pickler = pickle.Pickler(fd, -1)
-                    pickler.dump(deps)
-                    pickler.dump(trans_roots)
-                    # Write out an object to mark the archive end so
-                    # we can detect partial writes.
-                    pickler.dump(ARCHIVE_END)
-                modified.append(file.root)
+        for root in self.roots.sorted():
+            if root.url not in self.keys or hasattr(root, "_artifact"): continue
+            modified.append(root)
+            deps = [self.roots[u] for u in root.uses]
+            if not all(getattr(d, "_key", None) for d in deps): continue
+            includes = self.deps([root])[1:]
+            root._key = self.key(root.url, includes, deps)
+            try:
+                self.log.info("Writing %s" % self.cache.path(root._key))
+                root._artifact = self.cache.store(
+                    self.keys[root.url], root._key, root.url, includes,
+                    [u.url for u in root.uses.values()], root, self.references(root))
+            except _Unstorable as e:
+                self.log.debug("Not caching: %s", e)
         # We compute the modified flag here so it never gets saved to disk.
-        for r in modified:
-            r._modified = True
+        for root in modified:
+            root._modified = True
+
+def build_snapshot(path=None):
+    """
+    Compile the standard library into a snapshot that Compiler.urlparse
+    loads instead of parsing quark.q.
+    """
+    c = Compiler()
+    # Start from source, whatever this process or the caches already hold.
+    c.CACHE = {}
+    c.cache = CompileCache(tempfile.mkdtemp(prefix="quark-snapshot-"))
+    snapshot = Snapshot(path) if path else c.snapshot
+    c.snapshot = None
+    try:
+        url = os.path.abspath(join(None, BUILTIN_FILE))
+        c.urlparse(url)
+        c.compile()
+        roots = tuple(c.trans_roots(c.roots[url]))
+        for r in roots:
+            del r._artifact
+            del r._modified
+        snapshot.store(url, c.deps(roots), roots)
+        return snapshot.path
+    finally:
+        shutil.rmtree(c.cache.directory)
+
+# Traversals only run Python code, which threads do not speed up, so one
+# thread traverses at a time and installs overlap in the tools they run.
+_traversal = threading.Lock()
+
+def install_one(c, root, backend, offline):
+    b = backend(c.include_stdlib)
+    b.roots = c.roots
+    with _traversal, phase("%s.traverse" % backend.__name__, root):
+        root.traverse(b)
+    b.install(offline)
+
+class _Installs(object):
+
+    """
+    Run the (root, backend) installs from worker threads, since they
+    mostly wait on the package tools. An install starts once the same
+    backend has installed every root its root uses; when one fails, the
+    installs depending on it are skipped and the others carry on.
+
+    A backend installs one root at a time, as its tool installs into a
+    target shared by every root, so only different backends overlap.
+    """
+
+    def __init__(self, c, tasks, offline):
+        self.c = c
+        self.tasks = tasks
+        self.offline = offline
+        index = dict(((id(root), backend), i) for i, (root, backend) in enumerate(tasks))
+        self.waiting = []
+        self.dependents = [[] for _ in tasks]
+        for i, (root, backend) in enumerate(tasks):
+            uses = [index[(id(c.roots[u]), backend)] for u in root.uses]
+            self.waiting.append(len(uses))
+            for u in uses:
+                self.dependents[u].append(i)
+        self.ready = [i for i in range(len(tasks)) if not self.waiting[i]]
+        self.busy = set()
+        self.pending = len(tasks)
+        self.skipped = set()
+        self.errors = []
+        self.condition = threading.Condition()
+
+    def label(self, i):
+        root, backend = self.tasks[i]
+        return "%s %s" % (backend.ext, os.path.splitext(os.path.basename(root.url))[0])
+
+    def next(self):
+        with self.condition:
+            while self.pending:
+                for i in self.ready:
+                    backend = self.tasks[i][1]
+                    if backend not in self.busy:
+                        self.ready.remove(i)
+                        self.busy.add(backend)
+                        return i
+                self.condition.wait()
+            return None
+
+    def done(self, i, failed):
+        with self.condition:
+            self.busy.discard(self.tasks[i][1])
+            self.pending -= 1
+            for d in self.dependents[i]:
+                if failed:
+                    self.skip(d)
+                elif d not in self.skipped:
+                    self.waiting[d] -= 1
+                    if not self.waiting[d]:
+                        self.ready.append(d)
+            self.condition.notify_all()
+
+    def skip(self, i):
+        if i in self.skipped:
+            return
+        self.skipped.add(i)
+        self.pending -= 1
+        self.c.log.debug("Skipping %s, an install it depends on failed", self.label(i))
+        for d in self.dependents[i]:
+            self.skip(d)
 
-def install(c, url, offline=False, *backends):
+    def work(self):
+        while True:
+            i = self.next()
+            if i is None:
+                return
+            root, backend = self.tasks[i]
+            try:
+                with shell.labelled(self.label(i)):
+                    install_one(self.c, root, backend, self.offline)
+            except:  # pylint: disable=bare-except
+                self.errors.append(sys.exc_info())
+                self.done(i, True)
+            else:
+                self.done(i, False)
+
+    def run(self, jobs):
+        lanes = len(set(backend for _, backend in self.tasks))
+        workers = [threading.Thread(target=self.work) for _ in range(min(jobs, lanes))]
+        for w in workers:
+            w.daemon = True
+            w.start()
+        for w in workers:
+            # Joining with a timeout keeps the main thread interruptible.
+            while w.is_alive():
+                w.join(0.1)
+        for exc_info in self.errors:
+            if not isinstance(exc_info[1], QuarkError):
+                raise exc_info[0], exc_info[1], exc_info[2]
+        if len(self.errors) == 1:
+            exc_info = self.errors[0]
+            raise exc_info[0], exc_info[1], exc_info[2]
+        if self.errors:
+            errors = [e for _, e, _ in self.errors]
+            if all(isinstance(e, shell.ShellError) for e in errors):
+                cls = shell.ShellError
+            else:
+                cls = QuarkError
+            raise cls("\n".join(str(e) for e in errors))
+
+def install(c, url, offline=False, *backends, **kwargs):
+    """
+    Compile url and install every root with each backend. With jobs > 1
+    up to that many backends install at once, each root after the roots
+    it uses.
+    """
+    jobs = kwargs.pop("jobs", 1)
     c.log.info("Parsing: %s", url)
     c.urlparse(url)
     c.compile()
 
-    for root in c.roots.sorted():
-        for backend in backends:
-            b = backend(c.include_stdlib)
-            b.roots = c.roots
-            root.traverse(b)
-            b.install(offline)
+    tasks = [(root, backend) for root in c.roots.sorted() for backend in backends]
+    if jobs <= 1 or len(tasks) <= 1:
+        for root, backend in tasks:
+            install_one(c, root, backend, offline)
+        return
+    _Installs(c, tasks, offline).run(jobs)
+
+def emit(c, root, backend, target):
+    b = backend(c.include_stdlib)
+    b.roots = c.roots
+    with phase("%s.traverse" % backend.__name__, root):
+        root.traverse(b)
+    dir = os.path.splitext(os.path.basename(root.url))[0]
+    out = os.path.join(os.path.join(target, b.ext), dir)
+    b.write(out)
+
+class _Records(logging.Handler):
 
-def compile(c, url, target, *backends):
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.name, record.levelno, record.getMessage()))
+
+# What _emit_task works on. Set before the pool forks, so workers inherit
+# the compiled roots instead of unpickling them.
+_EMISSION = None
+
+def _emit_task(index):
+    """
+    Emit one (root, backend) pair in a worker. Log records are handed back
+    so the parent can replay them in task order.
+    """
+    # Workers are short lived, and a collection would touch every object
+    # inherited from the parent, copying its whole heap.
+    gc.disable()
+    c, tasks, target = _EMISSION
+    root, backend = tasks[index]
+    log = logging.getLogger("quark")
+    handlers = log.handlers
+    records = _Records()
+    log.handlers = [records]
+    try:
+        emit(c, root, backend, target)
+        error = None
+    except QuarkError as e:
+        error = (True, str(e))
+    except Exception:
+        error = (False, "%s for %s:\n%s" % (backend.__name__, root.url, traceback.format_exc()))
+    finally:
+        log.handlers = handlers
+    return records.records, error
+
+def compile(c, url, target, *backends, **kwargs):
+    """
+    Compile url and emit code for every root with each backend. With
+    jobs > 1 the (root, backend) pairs are emitted by that many worker
+    processes.
+    """
+    jobs = kwargs.pop("jobs", 1)
     c.log.info("Parsing: %s", url)
     c.urlparse(url)
     c.compile()
 
     dirs = []
+    tasks = []
 
     for root in c.roots.sorted():
         dir = os.path.splitext(os.path.basename(root.url))[0]
         if dir not in dirs:
             dirs.append(dir)
         for backend in backends:
-            b = backend(c.include_stdlib)
-            b.roots = c.roots
-            root.traverse(b)
-            out = os.path.join(os.path.join(target, b.ext), dir)
-            b.write(out)
+            tasks.append((root, backend))
+
+    if jobs <= 1 or len(tasks) <= 1 or not hasattr(os, "fork"):
+        for root, backend in tasks:
+            emit(c, root, backend, target)
+        return dirs
+
+    global _EMISSION
+    _EMISSION = (c, tasks, target)
+    pool = multiprocessing.Pool(min(jobs, len(tasks)))
+    try:
+        # A timeout keeps the wait interruptible by KeyboardInterrupt.
+        results = pool.map_async(_emit_task, range(len(tasks)), chunksize=1).get(2**31)
+    finally:
+        pool.terminate()
+        pool.join()
+        _EMISSION = None
+
+    errors = []
+    internal = []
+    for records, error in results:
+        for name, level, msg in records:
+            logging.getLogger(name).log(level, "%s", msg)
+        if error:
+            (errors if error[0] else internal).append(error[1])
+    if internal:
+        raise RuntimeError("\n".join(internal))
+    CompileError.raise_if_any(errors)
 
     return dirs
 
@@ -12,78 +12,149 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import inspect
-
-def signatures(types):
-    if types:
-        first = types[0]
-        rest = types[1:]
-        for sig in signatures(rest):
-            for t in first.__mro__:
-                yield (t,) + sig
-    else:
-        yield ()
-
-class _BoundDispatcher(object):
-
-    def __init__(self, clazz, object, dispatcher):
-        self.clazz = clazz
-        self.object = object
-        self.dispatcher = dispatcher
+"""
+Multiple dispatch on the types of positional arguments.
+
+A signature matches arguments that are instances of its types. Of the
+matching signatures the one whose last type comes first in the __mro__
+of the last argument wins, then the one whose next to last type comes
+first, and so on. An overloaded method looks for a match in the
+dispatchers of its name along the __mro__ of the class, so overloads in
+a subclass win over those of its bases.
+
+Resolved methods are cached by the types of the arguments: the type
+itself for a single argument and a tuple of types otherwise, so calls
+with one or two arguments do no more than build a pair. Methods resolve
+through a table per class, built when a class first uses the dispatcher
+and bound like a plain function, so no object is allocated per call.
+"""
 
-    def get(self, types):
-        key = (self.clazz, types)
-        if key in self.dispatcher.cache:
-            return self.dispatcher.cache[key]
+import inspect
+from types import MethodType
+
+# Cache hits and misses per dispatcher name, counted while a
+# profiler.Profile is started.
+STATS = None
+
+def _types(key):
+    return key if isinstance(key, tuple) else (key,)
+
+def _method_caller(name, cache, resolve):
+    def call(self, *args, **kwargs):
+        n = len(args)
+        if n == 1:
+            key = type(args[0])
+        elif n == 2:
+            key = (type(args[0]), type(args[1]))
         else:
-            for c in self.clazz.__mro__:
-                if self.dispatcher.name in c.__dict__:
-                    method = c.__dict__[self.dispatcher.name].get(types)
-                else:
-                    method = None
-                if method is None: continue
-                self.dispatcher.cache[key] = method
-                return method
-            self.dispatcher.error(types)
-
-    def __call__(self, *args, **kwargs):
-        types = tuple([type(arg) for arg in args])
-        method = self.get(types)
-        return method(self.object, *args, **kwargs)
+            key = tuple(map(type, args))
+        method = cache.get(key)
+        if method is None:
+            if STATS is not None: STATS[name][1] += 1
+            method = resolve(key)
+        elif STATS is not None: STATS[name][0] += 1
+        if kwargs:
+            return method(self, *args, **kwargs)
+        return method(self, *args)
+    return call
 
 class _Dispatcher(object):
 
     def __init__(self, name):
         self.name = name
         self.methods = {}
+        self.arities = {}
         self.cache = {}
+        self.classes = {}
 
     def add(self, types, method):
         assert types not in self.methods
         self.methods[types] = method
+        self.arities.setdefault(len(types), []).append((types, method))
+        self.cache.clear()
+        self.classes.clear()
 
     def get(self, types):
-        for sig in signatures(types):
-            if sig in self.methods:
-                return self.methods[sig]
-        return None
+        """
+        Return the method of the best signature matching types, or None.
+        """
+        if types in self.methods:
+            return self.methods[types]
+        candidates = self.arities.get(len(types))
+        if not candidates:
+            return None
+        # Rank each signature by the position of its types in the
+        # __mro__ of the argument types, last argument first.
+        positions = [dict((t, i) for i, t in enumerate(inspect.getmro(a)))
+                     for a in reversed(types)]
+        best = None
+        for signature, method in candidates:
+            rank = []
+            for position, t in zip(positions, reversed(signature)):
+                i = position.get(t)
+                if i is None:
+                    break
+                rank.append(i)
+            else:
+                if best is None or rank < best[0]:
+                    best = (rank, method)
+        return best and best[1]
+
+    def resolve(self, key):
+        function = self.get(_types(key))
+        if function is None: self.error(_types(key))
+        self.cache[key] = function
+        return function
+
+    def table(self, clazz):
+        """
+        Build the method table of clazz: a function binding like a method
+        that dispatches to the overloads of clazz and its bases.
+        """
+        chain = []
+        for c in inspect.getmro(clazz):
+            d = c.__dict__.get(self.name)
+            if isinstance(d, _Dispatcher):
+                chain.append(d)
+        cache = {}
+        def resolve(key):
+            types = _types(key)
+            for d in chain:
+                method = d.get(types)
+                if method is not None:
+                    cache[key] = method
+                    return method
+            self.error(types)
+        call = _method_caller(self.name, cache, resolve)
+        self.classes[clazz] = call
+        return call
 
     def __get__(self, object, clazz):
-        return _BoundDispatcher(clazz, object, self)
+        call = self.classes.get(clazz)
+        if call is None:
+            call = self.table(clazz)
+        return MethodType(call, object, clazz)
 
     def error(self, types):
         raise TypeError("%s has no matching method: (%s)" %
                         (self.name, ", ".join([t.__name__ for t in types])))
 
     def __call__(self, *args, **kwargs):
-        types = tuple([type(arg) for arg in args])
-        if types in self.cache:
-            function = self.cache[types]
+        n = len(args)
+        if n == 1:
+            key = type(args[0])
+        elif n == 2:
+            key = (type(args[0]), type(args[1]))
         else:
-            function = self.get(types)
-            if function is None: self.error(types)
-            self.cache[types] = function
-        return function(*args, **kwargs)
+            key = tuple(map(type, args))
+        function = self.cache.get(key)
+        if function is None:
+            if STATS is not None: STATS[self.name][1] += 1
+            function = self.resolve(key)
+        elif STATS is not None: STATS[self.name][0] += 1
+        if kwargs:
+            return function(*args, **kwargs)
+        return function(*args)
 
 def _decorate(namespace, function, types, offset=0):
     name = function.__name__
@@ -446,9 +446,6 @@ def eval_deprecated(a, deprecated):
 def eval_deprecated(a, deprecated):
     deprecated.append(a.text)
 
-def compiled_quark(url):
-    return "%sc" % url
-
 def lineinfo(node):
     trace = getattr(node, "_trace", None)
     stack = [getattr(node, "filename", "<none>")]
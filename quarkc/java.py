@@ -259,6 +259,13 @@ def constructor(doc, clazz, parameters, body):
 def method(doc, clazz, type, name, parameters, body):
     return "%spublic %s %s(%s)%s" % (doc, type, name, ", ".join(parameters), body)
 
+def switch_method(doc, clazz, type, name, parameters, key, cases, default):
+    labels = ["case %s:%s" % (label, block(statements)) for label, statements in cases]
+    switch = "switch (%s)%s" % (key, block(labels))
+    # Switching on a null string throws.
+    body = [if_("%s != null" % key, block([switch]), None)] + default
+    return method(doc, clazz, type, name, parameters, block(body))
+
 def static_method(doc, clazz, type, name, parameters, body):
     return "%spublic static %s %s(%s)%s" % (doc, type, name, ", ".join(parameters), body)
 
@@ -219,6 +219,11 @@ def method(doc, clazz, type, name, parameters, body):
     trailer = "%s.prototype.%s = %s;" % (clazz, name, full_name)
     return "\n%sfunction %s(%s)%s\n" % (doc, full_name, params, body) + trailer
 
+def switch_method(doc, clazz, type, name, parameters, key, cases, default):
+    labels = ["case %s:%s" % (label, block(statements)) for label, statements in cases]
+    switch = "switch (%s)%s" % (key, block(labels))
+    return method(doc, clazz, type, name, parameters, block([switch] + default))
+
 def static_method(doc, clazz, type, name, parameters, body):
     doc = add_doc(doc, ["@memberof %s" % clazz, "@static"])
     doc = add_param_doc(doc, parameters)
@@ -282,6 +282,12 @@ module DatawireQuarkCore
       self.class.new value[index]
     end
 
+    def values
+      return nil unless isList
+
+      List.new(value.map { |item| self.class.new item })
+    end
+
     def setListItem(index, item)
       setList unless isList
       value[index] = item.value
@@ -507,6 +513,7 @@ module DatawireQuarkCore
     end
 
     def execute(final, block)
+      Thread.current[:quark_runtime_thread] = true
       begin
         block.call()
       rescue => ex
@@ -1022,6 +1029,10 @@ module DatawireQuarkCore
     Net::HTTP.get(URI(url))
   end
 
+  def self.runtime_thread?
+    Thread.current[:quark_runtime_thread] == true
+  end
+
   def self.default_codec
     Codec.new
   end
@@ -1073,7 +1084,7 @@ module DatawireQuarkCore
       if !@lock.owned?
         fail "Illegal waitWakeup of a not-acquired quark Condition"
       end
-      @condition.wait(@lock, timeout / 1000.0)
+      @condition.wait(@lock, timeout > 0 ? timeout / 1000.0 : nil)
     end
 
     def wakeup
@@ -56,6 +56,7 @@ import io.netty.handler.ssl.SslContextBuilder;
 import io.netty.handler.ssl.util.InsecureTrustManagerFactory;
 import io.netty.handler.ssl.util.SelfSignedCertificate;
 import io.netty.util.CharsetUtil;
+import io.netty.util.concurrent.DefaultThreadFactory;
 import io.netty.util.concurrent.EventExecutor;
 import io.netty.util.concurrent.Future;
 import io.netty.util.concurrent.Promise;
@@ -67,6 +68,7 @@ import java.net.URISyntaxException;
 import java.security.cert.CertificateException;
 import java.util.HashMap;
 import java.util.Map;
+import java.util.concurrent.ThreadFactory;
 import java.util.concurrent.TimeUnit;
 import java.util.concurrent.atomic.AtomicLong;
 import java.util.logging.Level;
@@ -78,7 +80,21 @@ public class QuarkNettyRuntime extends AbstractDatawireRuntime implements Runtim
     private final static Logger log = Logger.getLogger(QuarkNettyRuntime.class.getName());
     private final Object lock = new Object();
     private boolean locked = false;
-    private final NioEventLoopGroup group = new NioEventLoopGroup();
+    private final NioEventLoopGroup group = new NioEventLoopGroup(0, new ThreadFactory() {
+        private final ThreadFactory threads = new DefaultThreadFactory(QuarkNettyRuntime.class);
+
+        @Override
+        public Thread newThread(final Runnable r) {
+            return threads.newThread(new Runnable() {
+
+                @Override
+                public void run() {
+                    Builtins.markRuntimeThread();
+                    r.run();
+                }
+            });
+        }
+    });
     private Map<Integer,DatawireNettyHttpContainer> servers = new HashMap<>();
 
     @Deprecated
@@ -289,6 +305,25 @@ public class QuarkNettyRuntime extends AbstractDatawireRuntime implements Runtim
         }, Double.valueOf(delayInSeconds * 1000).intValue(), TimeUnit.MILLISECONDS);
     }
 
+    @Override
+    public void cancel(Task handler) {
+        // The wrapped task keeps the runtime busy until it runs, so let it
+        // run; cancelled tasks find nothing left to do.
+    }
+
+    @Override
+    public void execute(Task handler) {
+        final Task t_handler = wrap(handler);
+        final Runtime self = this;
+        group.execute(new Runnable() {
+
+            @Override
+            public void run() {
+                t_handler.onExecute(self);
+            }
+        });
+    }
+
     @Override
     public void request(final HTTPRequest request, HTTPHandler handler) {
         final HTTPHandler ht_handler = wrap(handler);
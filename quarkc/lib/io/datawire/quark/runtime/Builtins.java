@@ -31,6 +31,19 @@ public class Builtins {
         }
     };
 
+    private static final ThreadLocal<Boolean> RUNTIME_THREAD = new ThreadLocal<Boolean>();
+
+    /**
+     * Mark the current thread as one that runs quark handlers and must never block.
+     */
+    public static void markRuntimeThread() {
+        RUNTIME_THREAD.set(Boolean.TRUE);
+    }
+
+    public static boolean isRuntimeThread() {
+        return RUNTIME_THREAD.get() != null;
+    }
+
     public static int modulo(int a, int b) {
         return a % b + (a*b < 0 ? b : 0);
     }
@@ -11,7 +11,11 @@ public class Condition extends Lock implements Mutex {
             fail(msg);
         }
         try {
-            condition.await(timeout, TimeUnit.MILLISECONDS);
+            if (timeout > 0) {
+                condition.await(timeout, TimeUnit.MILLISECONDS);
+            } else {
+                condition.await();
+            }
         } catch (InterruptedException e) {
             // ignore
         }
@@ -150,6 +150,19 @@ public class JSONObject {
         return new ArrayList(m.keySet());
     }
 
+    public ArrayList<JSONObject> values() {
+        if (!isList()) {
+            return null;
+        }
+        @SuppressWarnings("unchecked")
+            List<Object> l = (List<Object>) this.value;
+        ArrayList<JSONObject> result = new ArrayList<JSONObject>(l.size());
+        for (Object item : l) {
+            result.add(wrap(item));
+        }
+        return result;
+    }
+
     public Double getNumber() {
         if (this.value instanceof Number) {
             return ((Number) this.value).doubleValue();
@@ -0,0 +1,1098 @@
+# Quark's asyncio Runtime
+#
+# Runs every handler, timer, HTTP exchange, servlet and websocket of a
+# program on a single asyncio event loop with non-blocking sockets.
+# Select it with QUARK_PYTHON_RUNTIME=asyncio; it needs Python 3.4 or
+# later. The module is written without async/await so that it still
+# byte-compiles wherever the package is installed.
+
+from __future__ import print_function
+
+__version__ = '0.4.2'
+
+from past.builtins import long
+
+import atexit
+import base64
+import collections
+import hashlib
+import os
+import ssl
+import struct
+import sys
+import threading
+import time
+import traceback
+import uuid
+
+try:
+    import asyncio
+except ImportError:
+    raise ImportError("The asyncio runtime needs Python 3.4 or later")
+
+from http.client import responses
+from urllib.parse import urlparse, urljoin, unquote
+
+from quark_runtime import _HTTPRequest, _HTTPResponse, _default_codec, _runtime_thread, Buffer
+from quark_runtime_logging import Logger
+from quark_threaded_runtime import Url
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC11B85"
+
+
+def _ws_accept(key):
+    digest = hashlib.sha1((key + _WS_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _ws_mask(data, key):
+    n = len(data)
+    if not n:
+        return b""
+    repeated = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(repeated, "big")).to_bytes(n, "big")
+
+
+def _follows_redirect(code, method):
+    # the same rules as urllib2's HTTPRedirectHandler
+    return ((code in (301, 302, 303, 307) and method in ("GET", "HEAD")) or
+            (code in (301, 302, 303) and method == "POST"))
+
+
+class _ProtocolError(Exception):
+    pass
+
+
+class _Message(object):
+
+    __slots__ = ("start", "headers", "body", "keep_alive")
+
+    def header(self, name):
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+class _HTTPParser(object):
+
+    """
+    Incremental parser for the HTTP/1.x messages arriving on one
+    connection: requests on the server side, responses on the client
+    side. Bytes after a message stay in the buffer for the next one, or
+    for the websocket that takes over the connection after an upgrade.
+    """
+
+    max_head = 65536
+
+    def __init__(self, responses=False):
+        self.responses = responses
+        self.buffer = bytearray()
+        self.message = None  # head parsed, body still arriving
+        self.body = None
+        self.remaining = 0  # body bytes still expected, None until close
+        self.chunked = False
+        self.chunk = None  # bytes left in the current chunk, -1 in trailers
+        self.method = "GET"  # of the request the next response answers
+
+    def feed(self, data):
+        self.buffer += data
+
+    def next(self):
+        """Return the next complete message, or None until more data arrives."""
+        if self.message is None and not self._head():
+            return None
+        if self.chunked:
+            done = self._chunks()
+        elif self.remaining is None:
+            return None
+        else:
+            take = min(self.remaining, len(self.buffer))
+            self.body += self.buffer[:take]
+            del self.buffer[:take]
+            self.remaining -= take
+            done = self.remaining == 0
+        return self._complete() if done else None
+
+    def finish(self):
+        """The connection closed: complete a body that ran until the close."""
+        if self.message is not None and self.remaining is None and not self.chunked:
+            self.body += self.buffer
+            del self.buffer[:]
+            return self._complete()
+        return None
+
+    def _complete(self):
+        message = self.message
+        message.body = bytes(self.body)
+        self.message = self.body = None
+        return message
+
+    def _head(self):
+        while self.buffer.startswith(b"\r\n"):
+            del self.buffer[:2]
+        end = self.buffer.find(b"\r\n\r\n")
+        if end < 0:
+            if len(self.buffer) > self.max_head:
+                raise _ProtocolError("header section too large")
+            return False
+        lines = bytes(self.buffer[:end]).decode("iso-8859-1").split("\r\n")
+        del self.buffer[:end + 4]
+        start = lines[0].split(None, 2)
+        if len(start) < (2 if self.responses else 3):
+            raise _ProtocolError("malformed start line %r" % lines[0])
+        message = _Message()
+        message.start = start
+        message.headers = []
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if not sep:
+                raise _ProtocolError("malformed header %r" % line)
+            message.headers.append((name.strip(), value.strip()))
+        version = start[0] if self.responses else start[2]
+        connection = (message.header("connection") or "").lower()
+        if version == "HTTP/1.1":
+            message.keep_alive = "close" not in connection
+        else:
+            message.keep_alive = "keep-alive" in connection
+        self.chunked = "chunked" in (message.header("transfer-encoding") or "").lower()
+        self.chunk = None
+        length = message.header("content-length")
+        if self.responses:
+            try:
+                code = int(start[1])
+            except ValueError:
+                raise _ProtocolError("malformed status %r" % start[1])
+            if self.method == "HEAD" or code < 200 or code in (204, 304):
+                self.chunked = False
+                length = "0"
+        if self.chunked:
+            pass
+        elif length is not None:
+            try:
+                self.remaining = int(length)
+            except ValueError:
+                raise _ProtocolError("malformed Content-Length %r" % length)
+            if self.remaining < 0:
+                raise _ProtocolError("malformed Content-Length %r" % length)
+        elif self.responses:
+            self.remaining = None
+            message.keep_alive = False
+        else:
+            self.remaining = 0
+        self.message = message
+        self.body = bytearray()
+        return True
+
+    def _chunks(self):
+        buffer = self.buffer
+        while True:
+            if self.chunk is None:
+                end = buffer.find(b"\r\n")
+                if end < 0:
+                    return False
+                try:
+                    size = int(bytes(buffer[:end]).split(b";")[0].strip(), 16)
+                except ValueError:
+                    raise _ProtocolError("malformed chunk size")
+                del buffer[:end + 2]
+                self.chunk = size if size else -1
+            elif self.chunk == -1:
+                end = buffer.find(b"\r\n")
+                if end < 0:
+                    return False
+                del buffer[:end + 2]
+                if end == 0:
+                    self.chunk = None
+                    return True
+            else:
+                if len(buffer) < self.chunk + 2:
+                    return False
+                self.body += buffer[:self.chunk]
+                del buffer[:self.chunk + 2]
+                self.chunk = None
+
+
+class _HTTPConnection(asyncio.Protocol):
+
+    """A client connection that carries one exchange at a time."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.transport = None
+        self.parser = _HTTPParser(responses=True)
+        self.exchange = None
+        self.received = False
+        self.closed = False
+        self.idle = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def send(self, exchange, data):
+        self.exchange = exchange
+        self.received = False
+        self.parser.method = exchange.method
+        self.transport.write(data)
+
+    def data_received(self, data):
+        self.received = True
+        self.parser.feed(data)
+        try:
+            message = self.parser.next()
+        except _ProtocolError as exc:
+            self.abort(str(exc))
+            return
+        if message is not None:
+            exchange, self.exchange = self.exchange, None
+            if exchange is not None:
+                exchange.complete(self, message)
+
+    def connection_lost(self, exc):
+        self.closed = True
+        self.unpark()
+        message = self.parser.finish()
+        self.pool.forget(self)
+        exchange, self.exchange = self.exchange, None
+        if exchange is None:
+            return
+        if message is not None:
+            exchange.complete(self, message)
+        else:
+            exchange.lost(self, str(exc) if exc else "connection closed")
+
+    def abort(self, reason):
+        exchange, self.exchange = self.exchange, None
+        self.transport.close()
+        if exchange is not None:
+            exchange.fail(reason)
+
+    def park(self, timeout):
+        self.idle = self.pool.loop.call_later(timeout, self.transport.close)
+
+    def unpark(self):
+        if self.idle is not None:
+            self.idle.cancel()
+            self.idle = None
+
+
+class _ConnectionPool(object):
+
+    """Connections to one scheme, host and port, with a cap on how many."""
+
+    def __init__(self, client, scheme, host, port):
+        self.client = client
+        self.loop = client.runtime.loop
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.idle = []
+        self.waiting = collections.deque()
+        self.count = 0  # open or opening connections
+
+    def acquire(self, callback):
+        """Call callback(connection, reused), or callback(None, reason)."""
+        while self.idle:
+            connection = self.idle.pop()
+            connection.unpark()
+            if not connection.closed:
+                callback(connection, True)
+                return
+        if self.count < self.client.max_per_host:
+            self.count += 1
+            self._connect(callback)
+        else:
+            self.waiting.append(callback)
+
+    def release(self, connection, reusable):
+        if not reusable or connection.closed:
+            connection.transport.close()
+        elif self.waiting:
+            self.waiting.popleft()(connection, True)
+        else:
+            connection.park(self.client.idle_timeout)
+            self.idle.append(connection)
+
+    def forget(self, connection):
+        if connection in self.idle:
+            self.idle.remove(connection)
+        self.count -= 1
+        self._next()
+
+    def _next(self):
+        if self.waiting and self.count < self.client.max_per_host:
+            self.count += 1
+            self._connect(self.waiting.popleft())
+
+    def _connect(self, callback):
+        context = ssl.create_default_context() if self.scheme == "https" else None
+        task = self.loop.create_task(self.loop.create_connection(
+            lambda: _HTTPConnection(self), self.host, self.port, ssl=context))
+
+        def connected(task):
+            if task.cancelled() or task.exception() is not None:
+                self.count -= 1
+                callback(None, "cancelled" if task.cancelled() else str(task.exception()))
+                self._next()
+            else:
+                callback(task.result()[1], False)
+        task.add_done_callback(connected)
+
+
+class _HTTPClient(object):
+
+    """
+    Connection pools for Runtime.request. The class attributes are the
+    defaults: connections kept per scheme, host and port, how long an
+    idle one is kept and how many redirects a request follows.
+    """
+
+    max_per_host = 64
+    idle_timeout = 30.0
+    max_redirects = 10
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self.pools = {}
+
+    def pool(self, scheme, host, port):
+        key = (scheme, host, port)
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.pools[key] = _ConnectionPool(self, scheme, host, port)
+        return pool
+
+
+class _Exchange(object):
+
+    """One Runtime.request, including the redirects it follows."""
+
+    def __init__(self, runtime, request, handler, token):
+        self.runtime = runtime
+        self.request = request
+        self.handler = handler
+        self.token = token
+        self.url = request.url
+        self.method = request.method
+        self.body = request.body.encode("utf-8") if request.body else b""
+        self.headers = dict((key.lower(), str(value)) for key, value in request.headers.items())
+        self.redirects = 0
+        self.pool = None
+        self.payload = None
+        self.reused = False
+
+    def start(self):
+        self.runtime._call(self.handler.onHTTPInit, self.request)
+        self.send()
+
+    def send(self):
+        uri = urlparse(self.url)
+        if uri.scheme not in ("http", "https"):
+            self.fail("unknown url type: %s" % (uri.scheme or self.url))
+            return
+        if not uri.hostname:
+            self.fail("no host given")
+            return
+        default = 443 if uri.scheme == "https" else 80
+        port = uri.port or default
+        path = uri.path or "/"
+        if uri.query:
+            path += "?" + uri.query
+        host = uri.hostname if port == default else "%s:%d" % (uri.hostname, port)
+        lines = ["%s %s HTTP/1.1" % (self.method, path), "Host: %s" % host]
+        for key, value in self.headers.items():
+            if key not in ("host", "content-length"):
+                lines.append("%s: %s" % (key, value))
+        if self.body or self.method in ("POST", "PUT", "PATCH"):
+            lines.append("Content-Length: %d" % len(self.body))
+        self.payload = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + self.body
+        self.pool = self.runtime.http.pool(uri.scheme, uri.hostname, port)
+        self.pool.acquire(self.connected)
+
+    def connected(self, connection, reused):
+        if connection is None:
+            self.fail(reused)
+            return
+        self.reused = reused
+        connection.send(self, self.payload)
+
+    def complete(self, connection, message):
+        self.pool.release(connection, message.keep_alive)
+        try:
+            code = int(message.start[1])
+            location = message.header("location")
+            if (location is not None and _follows_redirect(code, self.method) and
+                    self.redirects < self.runtime.http.max_redirects):
+                self.redirects += 1
+                self.url = urljoin(self.url, location.strip())
+                if self.method == "POST":
+                    self.method = "GET"
+                    self.body = b""
+                    self.headers.pop("content-type", None)
+                self.send()
+                return
+            response = _HTTPResponse()
+            response.setCode(code)
+            response._setBodyChunks([message.body])
+            for key, value in message.headers:
+                response.setHeader(key, value)
+        except Exception as exc:
+            self.fail(str(exc))
+            return
+        self.runtime._call(self.handler.onHTTPResponse, self.request, response)
+        self.finish()
+
+    def lost(self, connection, reason):
+        if self.reused and not connection.received:
+            # went stale while it sat in the pool, try a fresh one
+            self.pool.acquire(self.connected)
+        else:
+            self.fail(reason)
+
+    def fail(self, reason):
+        import quark
+        self.runtime._call(self.handler.onHTTPError, self.request, quark.HTTPError(reason))
+        self.finish()
+
+    def finish(self):
+        self.runtime._call(self.handler.onHTTPFinal, self.request)
+        self.runtime._remove_event_source(self.token)
+
+
+class _WSAdapter(object):
+
+    """The quark WebSocket handed to handlers; safe to use from any thread."""
+
+    def __init__(self, socket):
+        self.socket = socket
+
+    def send(self, message):
+        socket = self.socket
+        if socket is not None:
+            socket.runtime._call(socket.send_frame, 0x1, message.encode("utf-8"))
+
+    def sendBinary(self, buffer):
+        socket = self.socket
+        if socket is not None:
+            socket.runtime._call(socket.send_frame, 0x2, bytes(buffer.data))
+
+    def close(self):
+        socket = self.socket
+        if socket is not None:
+            socket.runtime._call(socket.close)
+
+
+class _WebSocket(object):
+
+    """RFC 6455 framing on top of an established connection."""
+
+    close_timeout = 5.0
+
+    def __init__(self, runtime, handler, token, client):
+        self.runtime = runtime
+        self.handler = handler
+        self.token = token
+        self.client = client  # clients mask what they send
+        self.transport = None
+        self.buffer = bytearray()
+        self.fragments = None
+        self.closing = False
+        self.close_code = None
+        self.close_reason = ""
+        self.finished = False
+        self.ws = _WSAdapter(self)
+        runtime._call(handler.onWSInit, self.ws)
+
+    def connected(self, transport, data):
+        self.transport = transport
+        self.runtime._call(self.handler.onWSConnected, self.ws)
+        if data:
+            self.data_received(data)
+
+    def send_frame(self, opcode, payload):
+        if self.transport is None or self.closing or self.transport.is_closing():
+            return
+        n = len(payload)
+        mask = 0x80 if self.client else 0
+        header = bytearray((0x80 | opcode,))
+        if n < 126:
+            header.append(mask | n)
+        elif n < 65536:
+            header.append(mask | 126)
+            header += struct.pack("!H", n)
+        else:
+            header.append(mask | 127)
+            header += struct.pack("!Q", n)
+        if self.client:
+            key = os.urandom(4)
+            header += key
+            payload = _ws_mask(payload, key)
+        self.transport.write(bytes(header) + payload)
+
+    def close(self, code=1000):
+        if self.transport is None or self.closing:
+            return
+        self.send_frame(0x8, struct.pack("!H", code))
+        self.closing = True
+        # the peer echoes the close and hangs up; don't wait forever
+        self.runtime.loop.call_later(self.close_timeout, self.transport.close)
+
+    def data_received(self, data):
+        self.buffer += data
+        while not self.finished:
+            frame = self._frame()
+            if frame is None:
+                return
+            self._handle(*frame)
+
+    def _frame(self):
+        buffer = self.buffer
+        if len(buffer) < 2:
+            return None
+        n = buffer[1] & 0x7f
+        offset = 2
+        if n == 126:
+            if len(buffer) < 4:
+                return None
+            n = struct.unpack_from("!H", buffer, 2)[0]
+            offset = 4
+        elif n == 127:
+            if len(buffer) < 10:
+                return None
+            n = struct.unpack_from("!Q", buffer, 2)[0]
+            offset = 10
+        key = None
+        if buffer[1] & 0x80:
+            key = bytes(buffer[offset:offset + 4])
+            offset += 4
+        if len(buffer) < offset + n:
+            return None
+        fin = bool(buffer[0] & 0x80)
+        opcode = buffer[0] & 0x0f
+        payload = bytes(buffer[offset:offset + n])
+        del buffer[:offset + n]
+        if key is not None:
+            payload = _ws_mask(payload, key)
+        return fin, opcode, payload
+
+    def _handle(self, fin, opcode, payload):
+        if opcode == 0x8:
+            if len(payload) >= 2:
+                self.close_code = struct.unpack("!H", payload[:2])[0]
+                self.close_reason = payload[2:].decode("utf-8", "replace")
+            else:
+                self.close_code = 1000
+            if not self.closing:
+                self.send_frame(0x8, payload[:2])
+                self.closing = True
+            self.transport.close()
+        elif opcode == 0x9:
+            self.send_frame(0xA, payload)
+        elif opcode == 0xA:
+            pass
+        elif opcode in (0x1, 0x2) and self.fragments is None:
+            if fin:
+                self._deliver(opcode, payload)
+            else:
+                self.fragments = (opcode, bytearray(payload))
+        elif opcode == 0x0 and self.fragments is not None:
+            self.fragments[1].extend(payload)
+            if fin:
+                opcode, payload = self.fragments
+                self.fragments = None
+                self._deliver(opcode, bytes(payload))
+        else:
+            self.close(1002)
+
+    def _deliver(self, opcode, payload):
+        if opcode == 0x1:
+            try:
+                message = payload.decode("utf-8")
+            except UnicodeDecodeError:
+                self.close(1007)
+                return
+            self.runtime._call(self.handler.onWSMessage, self.ws, message)
+        else:
+            self.runtime._call(self.handler.onWSBinary, self.ws, Buffer(payload))
+
+    def connection_lost(self, exc):
+        if self.finished:
+            return
+        code = 1006 if self.close_code is None else self.close_code
+        if code in (1000, 1006):
+            self.runtime._call(self.handler.onWSClosed, self.ws)
+        else:
+            import quark
+            error = quark.WSError("%s %s" % (code, self.close_reason))
+            self.runtime._call(self.handler.onWSError, self.ws, error)
+        self._finish()
+
+    def failed(self, reason):
+        if self.finished:
+            return
+        import quark
+        self.runtime._call(self.handler.onWSError, self.ws, quark.WSError(reason))
+        self._finish()
+
+    def _finish(self):
+        self.finished = True
+        self.runtime._call(self.handler.onWSFinal, self.ws)
+        self.runtime._remove_event_source(self.token)
+        self.ws.socket = None
+
+
+class _WSClientConnection(asyncio.Protocol):
+
+    """Performs the client handshake, then hands the connection to a _WebSocket."""
+
+    def __init__(self, socket, uri):
+        self.socket = socket
+        self.uri = uri
+        self.key = base64.b64encode(os.urandom(16)).decode("ascii")
+        self.parser = _HTTPParser(responses=True)
+        self.transport = None
+        self.upgraded = False
+        self.rejected = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+        path = self.uri.path or "/"
+        if self.uri.query:
+            path += "?" + self.uri.query
+        host = self.uri.hostname
+        if self.uri.port is not None:
+            host = "%s:%d" % (host, self.uri.port)
+        transport.write(("GET %s HTTP/1.1\r\n"
+                         "Host: %s\r\n"
+                         "Upgrade: websocket\r\n"
+                         "Connection: Upgrade\r\n"
+                         "Sec-WebSocket-Key: %s\r\n"
+                         "Sec-WebSocket-Version: 13\r\n"
+                         "\r\n" % (path, host, self.key)).encode("utf-8"))
+
+    def data_received(self, data):
+        if self.upgraded:
+            self.socket.data_received(data)
+            return
+        self.parser.feed(data)
+        try:
+            message = self.parser.next()
+        except _ProtocolError as exc:
+            self.reject(str(exc))
+            return
+        if message is None:
+            return
+        if message.start[1] != "101" or message.header("sec-websocket-accept") != _ws_accept(self.key):
+            self.reject("Handshake failed (%s)" % " ".join(message.start[1:]))
+            return
+        self.upgraded = True
+        leftover = bytes(self.parser.buffer)
+        del self.parser.buffer[:]
+        self.socket.connected(self.transport, leftover)
+
+    def connection_lost(self, exc):
+        if self.upgraded:
+            self.socket.connection_lost(exc)
+        elif not self.rejected:
+            self.socket.failed(str(exc) if exc else "Connection closed during handshake")
+
+    def reject(self, reason):
+        self.rejected = True
+        self.socket.failed(reason)
+        self.transport.close()
+
+
+class _ServletResponse(_HTTPResponse):
+
+    """A response that goes out on its connection once the servlet responds."""
+
+    def __init__(self, connection, keep_alive):
+        super(_ServletResponse, self).__init__()
+        self._connection = connection
+        self._keep_alive = keep_alive
+
+    def _respond(self):
+        if self._responded:
+            return
+        self._responded = True
+        body = (self.body or "").encode("utf-8")
+        headers = list(self.headers.items())
+        connection = self._connection
+        connection.runtime._call(connection.reply, self.code, headers, body, self._keep_alive)
+
+    def _fail(self, code, body):
+        self.setCode(code)
+        self.setBody(body)
+        self.setHeader("Content-Type", "text/plain")
+        self._respond()
+
+
+class _ServerConnection(asyncio.Protocol):
+
+    """One accepted connection: keep-alive HTTP/1.1, or a websocket after an upgrade."""
+
+    keepalive_timeout = 15.0
+
+    def __init__(self, site):
+        self.site = site
+        self.runtime = site.runtime
+        self.parser = _HTTPParser()
+        self.transport = None
+        self.busy = False
+        self.socket = None
+        self.idle = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.park()
+
+    def data_received(self, data):
+        if self.socket is not None:
+            self.socket.data_received(data)
+            return
+        self.parser.feed(data)
+        self.process()
+
+    def connection_lost(self, exc):
+        self.unpark()
+        self.transport = None
+        if self.socket is not None:
+            self.socket.connection_lost(exc)
+
+    def process(self):
+        while not self.busy and self.socket is None and self.transport is not None:
+            try:
+                message = self.parser.next()
+            except _ProtocolError as exc:
+                self.busy = True
+                self.reply(400, [("Content-Type", "text/plain")],
+                           ("400 Bad Request (%s)\r\n" % exc).encode("utf-8"), False)
+                return
+            if message is None:
+                return
+            self.unpark()
+            self.busy = True
+            self.site.dispatch(self, message)
+
+    def reply(self, code, headers, body, keep_alive):
+        if self.transport is None:
+            return
+        lines = ["HTTP/1.1 %d %s" % (code, responses.get(code, "Unknown"))]
+        lines.extend("%s: %s" % (key, value) for key, value in headers)
+        lines.append("Content-Length: %d" % len(body))
+        if not keep_alive:
+            lines.append("Connection: close")
+        self.transport.write(("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + body)
+        self.busy = False
+        if keep_alive:
+            self.park()
+            self.runtime.loop.call_soon(self.process)
+        else:
+            self.transport.close()
+
+    def upgrade(self, handler, key):
+        self.transport.write(("HTTP/1.1 101 Switching Protocols\r\n"
+                              "Upgrade: websocket\r\n"
+                              "Connection: Upgrade\r\n"
+                              "Sec-WebSocket-Accept: %s\r\n"
+                              "\r\n" % _ws_accept(key)).encode("ascii"))
+        self.busy = False
+        token = self.runtime._add_event_source("server websocket")
+        self.socket = _WebSocket(self.runtime, handler, token, client=False)
+        leftover = bytes(self.parser.buffer)
+        del self.parser.buffer[:]
+        self.socket.connected(self.transport, leftover)
+
+    def park(self):
+        self.idle = self.runtime.loop.call_later(self.keepalive_timeout, self.transport.close)
+
+    def unpark(self):
+        if self.idle is not None:
+            self.idle.cancel()
+            self.idle = None
+
+
+class _Mount(object):
+
+    def __init__(self, url, servlet, websocket):
+        self.url = url
+        self.servlet = servlet
+        self.websocket = websocket
+
+
+class _Site(object):
+
+    """A listening socket and the servlets mounted on its paths."""
+
+    def __init__(self, runtime, url):
+        self.runtime = runtime
+        self.url = url
+        self.mounts = {}  # path -> _Mount
+        self.pending = []
+        self.server = None
+        self.error = None
+        self.token = runtime._add_event_source("container")
+
+    def start(self):
+        loop = self.runtime.loop
+        task = loop.create_task(loop.create_server(
+            lambda: _ServerConnection(self), self.url.host, self.url.port))
+        task.add_done_callback(self._started)
+
+    def _started(self, task):
+        if task.cancelled() or task.exception() is not None:
+            self.error = "cancelled" if task.cancelled() else task.exception()
+            self.runtime.sites.pop((self.url.host, self.url.port), None)
+            self.runtime._remove_event_source(self.token)
+        else:
+            self.server = task.result()
+            self.url.port = self.server.sockets[0].getsockname()[1]
+            self.runtime.sites[self.url.host, self.url.port] = self
+        pending, self.pending = self.pending, []
+        for mount in pending:
+            self.add(mount)
+
+    def add(self, mount):
+        if self.error is not None:
+            import quark
+            error = quark.ServletError("Failed to bind to %s:%s (%s)" % (self.url.host, self.url.port, self.error))
+            self.runtime._call(mount.servlet.onServletError, mount.url.url, error)
+            return
+        if self.server is None:
+            self.pending.append(mount)
+            return
+        mount.url.port = self.url.port
+        self.runtime._call(mount.servlet.onServletInit, mount.url.url, self.runtime)
+        old = self.mounts.get(mount.url.path)
+        self.mounts[mount.url.path] = mount
+        if old is not None:
+            self.runtime._call(old.servlet.onServletEnd, old.url.url)
+
+    def dispatch(self, connection, message):
+        method, target = message.start[0], message.start[1]
+        path = unquote(urlparse(target).path)
+        mount = self.mounts.get(path)
+        if mount is None:
+            connection.reply(404, [("Content-Type", "text/plain")],
+                             ("404 Not Found (%r)" % path).encode("utf-8"), message.keep_alive)
+            return
+        host = message.header("host") or "%s:%s" % (self.url.host, self.url.port)
+        request = _HTTPRequest("http://%s%s" % (host, target))
+        request.setMethod(method)
+        request.setBody(message.body.decode("utf-8", "replace"))
+        request.setHeader("Content-Type", "text/plain")
+        request.setHeader("Content-Length", str(len(message.body)))
+        for key, value in message.headers:
+            request.setHeader(key, value)
+        if mount.websocket:
+            self.upgrade(connection, mount, request, message)
+            return
+        response = _ServletResponse(connection, message.keep_alive)
+        try:
+            mount.servlet.onHTTPRequest(request, response)
+        except Exception as exc:
+            response._fail(500, "500 Internal Server Error (%s)\r\n" % exc)
+            print("Servlet call for %s failed." % request.getUrl())
+            print(traceback.format_exc())
+
+    def upgrade(self, connection, mount, request, message):
+        key = message.header("sec-websocket-key")
+        if "websocket" not in (message.header("upgrade") or "").lower() or not key:
+            connection.reply(400, [("Content-Type", "text/plain")],
+                             b"400 Bad Request (expected a websocket upgrade)\r\n", message.keep_alive)
+            return
+        try:
+            handler = mount.servlet.onWSConnect(request)
+        except Exception as exc:
+            connection.reply(500, [("Content-Type", "text/plain")],
+                             ("500 Internal Server Error (%s)\r\n" % exc).encode("utf-8"), False)
+            print("Servlet call for %s failed." % request.getUrl())
+            print(traceback.format_exc())
+            return
+        if handler is None:
+            connection.reply(403, [("Content-Type", "text/plain")], b"Forbidden\r\n", message.keep_alive)
+            return
+        connection.upgrade(handler, key)
+
+
+class AsyncioRuntime(object):
+
+    def __init__(self):
+        self._codec = _default_codec()
+        self.sources = 0
+        self.idle = threading.Condition()
+        self.sites = {}  # host, port -> _Site
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name="quark-asyncio")
+        self.thread.daemon = True
+        self.thread.start()
+        self.http = _HTTPClient(self)
+        self.log = Logger("quark.runtime")
+
+    def _run_loop(self):
+        _runtime_thread.active = True
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _call(self, function, *args):
+        """Run function(*args) on the event loop after everything already queued."""
+        if threading.current_thread() is self.thread:
+            self.loop.call_soon(self._run, function, args)
+        else:
+            self.loop.call_soon_threadsafe(self._run, function, args)
+
+    def _run(self, function, args):
+        try:
+            function(*args)
+        except Exception as exc:
+            print("Event handler %s failed (%s)." % (function, exc))
+            print(traceback.format_exc())
+
+    def _add_event_source(self, name):
+        with self.idle:
+            self.sources += 1
+        return name
+
+    def _remove_event_source(self, token):
+        self._call(self._release)
+
+    def _release(self):
+        with self.idle:
+            self.sources -= 1
+            if not self.sources:
+                self.idle.notify_all()
+
+    def wait_until_idle(self, timeout=None):
+        """Wait until no event sources are left; return whether that happened."""
+        deadline = None if timeout is None else time.time() + timeout
+        with self.idle:
+            while self.sources:
+                remaining = 1.0 if deadline is None else min(1.0, deadline - time.time())
+                if remaining <= 0:
+                    return False
+                self.idle.wait(remaining)
+            return True
+
+    def open(self, url, handler):
+        self._call(self._open, url, handler, self._add_event_source("client websocket"))
+
+    def _open(self, url, handler, token):
+        socket = _WebSocket(self, handler, token, client=True)
+        uri = urlparse(url)
+        if uri.scheme not in ("ws", "wss") or not uri.hostname:
+            socket.failed("Unsupported websocket url %s" % url)
+            return
+        context = ssl.create_default_context() if uri.scheme == "wss" else None
+        port = uri.port or (443 if uri.scheme == "wss" else 80)
+        task = self.loop.create_task(self.loop.create_connection(
+            lambda: _WSClientConnection(socket, uri), uri.hostname, port, ssl=context))
+
+        def connected(task):
+            if task.cancelled():
+                socket.failed("cancelled")
+            elif task.exception() is not None:
+                socket.failed(str(task.exception()))
+        task.add_done_callback(connected)
+
+    def request(self, request, handler):
+        exchange = _Exchange(self, request, handler, self._add_event_source("request"))
+        self._call(exchange.start)
+
+    def schedule(self, handler, delayInSeconds):
+        self._call(self._schedule, handler, delayInSeconds, self._add_event_source("task"))
+
+    def _schedule(self, handler, delayInSeconds, token):
+        if delayInSeconds > 0:
+            self.loop.call_later(delayInSeconds, self._fire, handler)
+        else:
+            self._fire(handler)
+
+    def _fire(self, handler):
+        self._run(handler.onExecute, (self,))
+        self._release()
+
+    def serveHTTP(self, url, servlet):
+        self._serve(Url(url), servlet, "http", False)
+
+    def serveWS(self, url, servlet):
+        self._serve(Url(url), servlet, "ws", True)
+
+    def _serve(self, url, servlet, scheme, websocket):
+        if url.scheme not in (scheme, scheme + "s"):
+            self._refuse(url, servlet, url.scheme + " is not supported")
+        elif url.is_secure:
+            self._refuse(url, servlet, url.scheme + " is not supported yet")
+        else:
+            self._call(self._mount, _Mount(url, servlet, websocket))
+
+    def _refuse(self, url, servlet, reason):
+        import quark
+        self._call(servlet.onServletError, url.url, quark.ServletError(reason))
+
+    def _mount(self, mount):
+        site = self.sites.get((mount.url.host, mount.url.port))
+        if site is None:
+            site = _Site(self, Url(mount.url.url))
+            if site.url.port:
+                # later mounts on this port wait for the bind in progress
+                self.sites[site.url.host, site.url.port] = site
+            site.start()
+        site.add(mount)
+
+    def respond(self, request, response):
+        response._respond()
+
+    def fail(self, message):
+        sys.stderr.write(message + "\n")
+        os._exit(1)
+
+    def codec(self):
+        return self._codec
+
+    def logger(self, topic):
+        return Logger(topic)
+
+    def now(self):
+        return long(time.time() * 1000)
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def uuid(self):
+        return str(uuid.uuid4())
+
+    def callSafely(self, unary_callable, default):
+        try:
+            import quark
+            return quark.callUnaryCallable(unary_callable, None)
+        except:
+            self.log.error("Exception while calling safely: "
+                           + traceback.format_exc())
+            return default
+
+_global_lock = threading.Lock()
+_asyncio_runtime = None
+
+
+def get_runtime():
+    global _asyncio_runtime
+    with _global_lock:
+        if _asyncio_runtime is None:
+            _asyncio_runtime = AsyncioRuntime()
+    return _asyncio_runtime
+
+
+getRuntime = get_runtime
+
+
+@atexit.register
+def wait_for_completion():
+    if _asyncio_runtime is None:
+        return
+    try:
+        _asyncio_runtime.wait_until_idle()
+    except KeyboardInterrupt:
+        pass
+    _asyncio_runtime.loop.call_soon_threadsafe(_asyncio_runtime.loop.stop)
+    _asyncio_runtime.thread.join(1.0)
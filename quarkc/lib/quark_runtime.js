@@ -275,6 +275,14 @@
     }
     JSONObject.prototype.keys = JSONObject_keys;
 
+    function JSONObject_values() {
+        if (this.getType() !== "list") {
+            return null;
+        }
+        return this.value.map(_JSONObject_wrap);
+    }
+    JSONObject.prototype.values = JSONObject_values;
+
     function JSONObject_setString(value) {
         this.value = value;
         return this;
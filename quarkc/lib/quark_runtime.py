@@ -11,7 +11,7 @@ __version__ = '0.4.2'
 __all__ = str(
     """os sys time _Map _List _println _toString _url_get _urlencode _JSONObject
     _HTTPRequest _HTTPResponse _default_codec _getClass _map_remove
-    _RuntimeFactory _Lock _Condition _TLS _TLSInitializer
+    _RuntimeFactory _Lock _Condition _TLS _TLSInitializer _runtime_thread
     _configure_logging _cast _get_file_contents _QObject
     _lazyImport""").split()
 
@@ -29,7 +29,9 @@ except ImportError:
     from urllib2 import urlopen
 
 import json
+import codecs
 import collections
+import re
 from collections import namedtuple
 from struct import Struct
 import threading
@@ -93,7 +95,53 @@ def _cast(value, callback):
     # but that doesn't support interfaces yet.
     return value
 
+def _json_type(value):
+    # Ordered as getType always checked, so bools are numbers.
+    if isinstance(value, dict):
+        return 'object'
+    elif isinstance(value, (list, tuple)):
+        return 'list'
+    elif isinstance(value, (str, unicode)):
+        return 'string'
+    elif isinstance(value, (int,float,long)):
+        return 'number'
+    elif isinstance(value, bool):
+        return 'bool'
+    elif value is None:
+        return 'null'
+    else:
+        raise TypeError("Unknown JSONObject type " + str(type(value)))
+
+
+# The getType of values of each Python type, filled in as types are met.
+_json_types = {}
+
+
+def _json_tag(value):
+    try:
+        return _json_types[type(value)]
+    except KeyError:
+        tag = _json_types[type(value)] = _json_type(value)
+        return tag
+
+
+# The value of _JSONObject.undefined().
+_json_undefined = object()
+_json_containers = (dict, list, tuple)
+
+
+def _json_item(value, key):
+    # The item of a decoded dict or list, or _json_undefined.
+    try:
+        if isinstance(value, _json_containers):
+            return value[key]
+    except (KeyError, IndexError, TypeError):
+        pass
+    return _json_undefined
+
+
 class _JSONObject(object):
+    __slots__ = ("value",)
     _backend = json
     _dict = collections.OrderedDict
     _undefined = None
@@ -103,7 +151,7 @@ class _JSONObject(object):
 
     @classmethod
     def _wrap(cls, value):
-        wrapped = cls()
+        wrapped = cls.__new__(cls)
         wrapped.value = value
         return wrapped
 
@@ -114,20 +162,7 @@ class _JSONObject(object):
             return self.value == other.value
 
     def getType(self):
-        if isinstance(self.value, dict):
-            return 'object'
-        elif isinstance(self.value, (list, tuple)):
-            return 'list'
-        elif isinstance(self.value, (str, unicode)):
-            return 'string'
-        elif isinstance(self.value, (int,float,long)):
-            return 'number'
-        elif isinstance(self.value, bool):
-            return 'bool'
-        elif self.value is None:
-            return 'null'
-        else:
-            raise TypeError("Unknown JSONObject type " + str(type(self.value)))
+        return _json_tag(self.value)
 
     def getObjectItem(self, key):
         try:
@@ -187,7 +222,7 @@ class _JSONObject(object):
     @classmethod
     def undefined(cls):
         if cls._undefined is None:
-            cls._undefined = _UndefinedJSON._wrap(object())
+            cls._undefined = _UndefinedJSON._wrap(_json_undefined)
         return cls._undefined
 
     def toString(self):
@@ -198,6 +233,37 @@ class _JSONObject(object):
             return None
         return _List(self.value.keys())
 
+    def values(self):
+        if not isinstance(self.value, (list, tuple)):
+            return None
+        wrap = self._wrap
+        return _List([wrap(item) for item in self.value])
+
+    def items(self):
+        """The (key, JSONObject) pairs of an object, or None."""
+        if not isinstance(self.value, dict):
+            return None
+        wrap = self._wrap
+        return _List([(key, wrap(item)) for key, item in self.value.items()])
+
+    def cursor(self):
+        return _JSONCursor(self.value)
+
+    def getPath(self, *path):
+        """
+        The item at the end of path, a key for each object and an index for
+        each list on the way, or undefined(). Only the result is wrapped.
+        """
+        value = self.value
+        try:
+            for key in path:
+                if not isinstance(value, _json_containers):
+                    return self.undefined()
+                value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return self.undefined()
+        return self._wrap(value)
+
     def setString(self, value):
         self.value = value
         return self
@@ -247,11 +313,15 @@ class _JSONObject(object):
         return self
 
     @classmethod
-    def parse(cls, value):
-        return cls._wrap(cls._backend.loads(value, object_pairs_hook=cls._dict))
+    def parse(cls, value, ordered=True):
+        # Plain dicts are cheaper when nothing reads the keys in order.
+        hook = cls._dict if ordered else None
+        return cls._wrap(cls._backend.loads(value, object_pairs_hook=hook))
 
 
 class _UndefinedJSON(_JSONObject):
+    __slots__ = ()
+
     def setString(self, value):
         pass
 
@@ -277,6 +347,318 @@ class _UndefinedJSON(_JSONObject):
         pass
 
 
+class _JSONCursor(object):
+    """
+    A position in a decoded JSON value, for reading it without wrapping
+    every value on the way in a _JSONObject. down() and up() move the
+    cursor in place, elements() and entries() move it across the items of
+    a list or an object, and get() wraps the current value.
+    """
+    __slots__ = ("value", "_trail")
+
+    def __init__(self, value):
+        self.value = value
+        self._trail = []
+
+    def down(self, *path):
+        """Move to an item, through a key for objects or an index for lists."""
+        trail = self._trail
+        value = self.value
+        for key in path:
+            trail.append(value)
+            value = _json_item(value, key)
+        self.value = value
+        return self
+
+    def up(self, levels=1):
+        for _ in range(levels):
+            self.value = self._trail.pop()
+        return self
+
+    def elements(self):
+        """Move to each element of a list in turn, yielding the cursor."""
+        items = self.value
+        if not isinstance(items, (list, tuple)):
+            return
+        self._trail.append(items)
+        try:
+            for item in items:
+                self.value = item
+                yield self
+        finally:
+            self.value = self._trail.pop()
+
+    def entries(self):
+        """Move to each item of an object in turn, yielding (key, cursor)."""
+        items = self.value
+        if not isinstance(items, dict):
+            return
+        self._trail.append(items)
+        try:
+            for key, item in items.items():
+                self.value = item
+                yield key, self
+        finally:
+            self.value = self._trail.pop()
+
+    def get(self):
+        if self.value is _json_undefined:
+            return _JSONObject.undefined()
+        return _JSONObject._wrap(self.value)
+
+    def getType(self):
+        return _json_tag(self.value)
+
+    def isUndefined(self):
+        return self.value is _json_undefined
+
+    def isDefined(self):
+        return not self.isUndefined()
+
+    def isNull(self):
+        return self.value is None
+
+    def isObject(self):
+        return isinstance(self.value, dict)
+
+    def isList(self):
+        return isinstance(self.value, list)
+
+    def isString(self):
+        return isinstance(self.value, basestring)
+
+    def isNumber(self):
+        return isinstance(self.value, (int, long, float))
+
+    def size(self):
+        if self.isList() or self.isObject():
+            return len(self.value)
+        else:
+            return 1
+
+    def getString(self):
+        return self.value if isinstance(self.value, basestring) else None
+
+    def getNumber(self):
+        return self.value if isinstance(self.value, (int, long, float)) else None
+
+    def getBool(self):
+        return self.value if isinstance(self.value, bool) else None
+
+    def keys(self):
+        if not isinstance(self.value, dict):
+            return None
+        return _List(self.value.keys())
+
+
+
+_json_space = re.compile(r"[ \t\n\r]*")
+_json_string = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_json_number = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+_json_number_chars = re.compile(r"[-+0-9.eE]*")
+_json_literals = (("true", "boolean", True), ("false", "boolean", False), ("null", "null", None))
+
+
+class _JSONParser(object):
+    """
+    An incremental JSON parser for a body that arrives in chunks.
+
+    feed() takes each chunk as it arrives, as UTF-8 bytes or as text, and
+    close() marks the end of the body. events() yields the parse events of
+    what has been fed so far -- ("start_map", None), ("map_key", key),
+    ("end_map", None), ("start_array", None), ("end_array", None) and
+    ("string" | "number" | "boolean" | "null", value) -- and returns when
+    it needs more input; calling it again after the next feed() carries on
+    where it stopped. values() does the same for decoded values, wrapped
+    in _JSONObjects: each element of the list at path, which is a sequence
+    of object keys and list indexes, or each top level value without a
+    path. A large list is then only ever decoded an element at a time.
+    Objects decode to OrderedDicts unless ordered is False.
+    """
+
+    def __init__(self, path=None, ordered=True):
+        self.path = None if path is None else list(path)
+        self.closed = False
+        self._decoder = json.JSONDecoder(object_pairs_hook=collections.OrderedDict if ordered else None)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._offset = 0    # of _text in the whole body
+        self._chunks = []   # fed but not yet appended to _text
+        self._pending = 0
+        self._wanted = 0    # unparsed length needed to try again
+        self._stack = []    # [is object, current key or index] per open container
+        self._expect = "value"
+
+    def feed(self, chunk):
+        if not isinstance(chunk, unicode):
+            chunk = self._utf8.decode(chunk)
+        if chunk:
+            self._chunks.append(chunk)
+            self._pending += len(chunk)
+        return self
+
+    def close(self):
+        self.feed(self._utf8.decode(b"", True))
+        self.closed = True
+        return self
+
+    def events(self):
+        return self._parse(False)
+
+    def values(self):
+        for event, value in self._parse(True):
+            if event == "value":
+                yield _JSONObject._wrap(value)
+
+    def _error(self, pos):
+        if pos >= len(self._text):
+            return ValueError("Unexpected end of JSON")
+        return ValueError("Invalid JSON at offset %d" % (self._offset + pos))
+
+    def _captures(self, stack):
+        path = self.path
+        if path is None:
+            return not stack
+        if len(stack) != len(path) + 1 or stack[-1][0]:
+            return False
+        for entry, key in zip(stack, path):
+            if entry[1] != key:
+                return False
+        return True
+
+    def _parse(self, capture):
+        # Yields events, and ("value", value) for each value captured,
+        # keeping the state current at every yield so that a new generator
+        # can carry on from there.
+        stack = self._stack
+        while True:
+            if not self.closed and len(self._text) - self._pos + self._pending < self._wanted:
+                return
+            self._wanted = 0
+            if self._chunks:
+                self._text = self._text[self._pos:] + "".join(self._chunks)
+                self._offset += self._pos
+                self._pos = 0
+                self._chunks = []
+                self._pending = 0
+            text = self._text
+            pos = self._pos = _json_space.match(text, self._pos).end()
+            if pos == len(text):
+                if self.closed and (stack or self._expect != "value"):
+                    raise self._error(pos)
+                self._wanted = 1
+                return
+            char = text[pos]
+            expect = self._expect
+
+            if expect == "colon":
+                if char != ":":
+                    raise self._error(pos)
+                self._pos = pos + 1
+                self._expect = "value"
+                continue
+            if expect == "next":
+                if char == ",":
+                    self._pos = pos + 1
+                    self._expect = "key" if stack[-1][0] else "value"
+                    continue
+                if char != ("}" if stack[-1][0] else "]"):
+                    raise self._error(pos)
+            elif expect == "first_key" or expect == "key":
+                if char == '"':
+                    key, end = self._string(text, pos)
+                    if end is None:
+                        return
+                    stack[-1][1] = key
+                    self._pos = end
+                    self._expect = "colon"
+                    yield "map_key", key
+                    continue
+                if char != "}" or expect == "key":
+                    raise self._error(pos)
+            elif char != "]" or expect != "first":
+                # The start of a value, decoded whole when captured.
+                if capture and self._captures(stack):
+                    try:
+                        value, end = self._decoder.raw_decode(text, pos)
+                    except ValueError:
+                        if self.closed:
+                            raise
+                        # Wait for the input to double, so that a large
+                        # value is not decoded over and over.
+                        self._wanted = 2 * (len(text) - pos)
+                        return
+                    if not self.closed and _json_number_chars.match(text, end).end() == len(text):
+                        self._wanted = len(text) - pos + 1  # a number may go on
+                        return
+                    event = "value"
+                elif char == "{" or char == "[":
+                    if stack and not stack[-1][0]:
+                        stack[-1][1] += 1
+                    if char == "{":
+                        stack.append([True, None])
+                        self._expect = "first_key"
+                        event = "start_map"
+                    else:
+                        stack.append([False, -1])
+                        self._expect = "first"
+                        event = "start_array"
+                    self._pos = pos + 1
+                    yield event, None
+                    continue
+                elif char == '"':
+                    value, end = self._string(text, pos)
+                    if end is None:
+                        return
+                    event = "string"
+                elif char == "-" or "0" <= char <= "9":
+                    end = _json_number_chars.match(text, pos).end()
+                    if end == len(text) and not self.closed:
+                        self._wanted = end - pos + 1
+                        return
+                    match = _json_number.match(text, pos)
+                    if match is None or match.end() != end:
+                        raise self._error(pos)
+                    if match.group(1) or match.group(2):
+                        value = float(match.group())
+                    else:
+                        value = int(match.group())
+                    event = "number"
+                else:
+                    for word, event, value in _json_literals:
+                        end = pos + len(word)
+                        if text.startswith(word, pos):
+                            break
+                        if end > len(text) and word.startswith(text[pos:]) and not self.closed:
+                            self._wanted = len(word)
+                            return
+                    else:
+                        raise self._error(pos)
+                if stack and not stack[-1][0]:
+                    stack[-1][1] += 1
+                self._pos = end
+                self._expect = "next" if stack else "value"
+                yield event, value
+                continue
+
+            # The end of the innermost object or list.
+            self._pos = pos + 1
+            is_object = stack.pop()[0]
+            self._expect = "next" if stack else "value"
+            yield "end_map" if is_object else "end_array", None
+
+    def _string(self, text, pos):
+        # The string at pos and the position after it, or an end of None
+        # when it is not all there yet.
+        if _json_string.match(text, pos) is None:
+            if self.closed:
+                raise self._error(len(text))
+            self._wanted = len(text) - pos + 1
+            return None, None
+        return json.decoder.scanstring(text, pos + 1)
+
+
 class _HTTPRequest(object):
 
     def __init__(self, url):
@@ -317,6 +699,7 @@ class _HTTPResponse(object):
         self.body = ""
         self.headers = {}
         self._responded = False
+        self._chunks = None
 
     def getCode(self):
         return self.code
@@ -325,10 +708,35 @@ class _HTTPResponse(object):
         self.code = code
 
     def getBody(self):
+        if self._chunks is not None:
+            data = b"".join(self._chunks)
+            self._chunks = None
+            self.body = data.decode("utf-8")
         return self.body
 
     def setBody(self, body):
         self.body = body
+        self._chunks = None
+
+    def _setBodyChunks(self, chunks):
+        # The body as it was read, only joined and decoded if getBody is
+        # called, so that iterJSON can parse it a chunk at a time instead.
+        self._chunks = chunks
+        self.body = None
+
+    def iterJSON(self, path=None, ordered=True):
+        """
+        Parse the body incrementally, yielding each element of the list at
+        path, or the whole body without a path, as a _JSONObject.
+        """
+        parser = _JSONParser(path, ordered)
+        for chunk in self._chunks if self._chunks is not None else [self.body or ""]:
+            parser.feed(chunk)
+            for value in parser.values():
+                yield value
+        parser.close()
+        for value in parser.values():
+            yield value
 
     def setHeader(self, key, value):
         self.headers[key.lower()] = value
@@ -472,11 +880,18 @@ def _getClass(obj):
 
 class _RuntimeFactory(object):
     RUNTIME_MODULE="quark_threaded_runtime"
+    # QUARK_PYTHON_RUNTIME picks one of these, or names a module directly
+    RUNTIME_MODULES = {
+        "threaded": "quark_threaded_runtime",
+        "asyncio": "quark_asyncio_runtime",
+    }
 
     @classmethod
     def create(cls):
         import importlib
-        rt_module = importlib.import_module(cls.RUNTIME_MODULE)
+        name = os.environ.get("QUARK_PYTHON_RUNTIME")
+        module = cls.RUNTIME_MODULES.get(name, name) if name else cls.RUNTIME_MODULE
+        rt_module = importlib.import_module(module)
         return rt_module.get_runtime()
 
 class _Lock(object):
@@ -508,13 +923,20 @@ class _Condition(_Lock):
     def waitWakeup(self, timeout):
         if not self._lock._is_owned():
             self._fail("Illegal waitWakeup of a not-acquired quark Condition")
-        self._condition.wait(timeout / 1000.0) # XXX: fix time units
+        # XXX: fix time units
+        self._condition.wait(timeout / 1000.0 if timeout > 0 else None)
 
     def wakeup(self):
         if not self._lock._is_owned():
             self._fail("Illegal wakeup of a not-acquired quark Condition")
         self._condition.notify()
 
+class _RuntimeThread(threading.local):
+    """Runtimes set active on the threads that run quark handlers, which must never block."""
+    active = False
+
+_runtime_thread = _RuntimeThread()
+
 class _TLSInitializer(object):
     def getValue(self): raise TypeError("Method not implemented")
 
@@ -7,7 +7,11 @@ __version__ = '0.4.2'
 from past.builtins import unicode, long
 
 import atexit
+import errno
+import heapq
+import itertools
 import os
+import socket
 import sys
 import threading
 import contextlib
@@ -16,14 +20,20 @@ import traceback
 
 # future stdlib stuff is broken: https://github.com/PythonCharmers/python-future/issues/238
 try:
-    from urllib.request import Request, urlopen
+    from urllib.request import Request, urlopen, getproxies, proxy_bypass
     from urllib.error import HTTPError, URLError
-    from urllib.parse import urlparse
-    from queue import Queue, Empty
+    from urllib.parse import urlparse, urljoin
+    from queue import Queue, Empty, Full
 except ImportError:
     from urllib2 import Request, urlopen, HTTPError, URLError
-    from urlparse import urlparse
-    from Queue import Queue, Empty
+    from urllib import getproxies, proxy_bypass
+    from urlparse import urlparse, urljoin
+    from Queue import Queue, Empty, Full
+
+try:
+    import httplib
+except ImportError:
+    import http.client as httplib
 
 import uuid
 from wsgiref import util
@@ -31,17 +41,22 @@ from wsgiref import util
 import ws4py
 if ws4py.__version__ != "0.3.4":
     from ws4py.server.wsgirefserver import WebSocketWSGIRequestHandler as _QuarkWSGIRequestHandler
+    from ws4py.server.wsgirefserver import WebSocketWSGIHandler as _QuarkWSGIHandler
 else:
     from quark_ws4py_fixup import WebSocketWSGIRequestHandler as _QuarkWSGIRequestHandler
+    from quark_ws4py_fixup import WebSocketWSGIHandler as _QuarkWSGIHandler
 from ws4py.client.threadedclient import WebSocketClient
 from ws4py.server.wsgirefserver import WSGIServer as _QuarkWSGIServer
 from ws4py.server.wsgiutils import WebSocketWSGIApplication
 from ws4py.websocket import WebSocket
 from ws4py.exc import HandshakeError
 
-from quark_runtime import _HTTPRequest, _HTTPResponse, _default_codec, Buffer
+from quark_runtime import _HTTPRequest, _HTTPResponse, _default_codec, _runtime_thread, Buffer
 from quark_runtime_logging import Logger
 
+# time.monotonic is py3 only; fall back to wall clock time on py2
+_clock = getattr(time, "monotonic", time.time)
+
 class _Terminator(object):
 
     def remove(self, other):
@@ -57,6 +72,76 @@ class _Terminator(object):
         return False
 
 
+class _EventQueue(object):
+
+    """
+    Unbounded event queue for the single event thread.
+
+    Producers append under one lock and only notify when the event thread
+    is actually asleep; the event thread takes everything queued so far
+    in one go instead of locking once per event.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ready = threading.Condition(self.lock)
+        self.pending = []
+        self.sleeping = False
+
+    def put(self, event):
+        with self.lock:
+            self.pending.append(event)
+            if self.sleeping:
+                self.sleeping = False
+                self.ready.notify()
+
+    def take(self):
+        """Block until there are events, then return all of them in order."""
+        with self.lock:
+            while not self.pending:
+                self.sleeping = True
+                self.ready.wait()
+            batch, self.pending = self.pending, []
+        return batch
+
+
+class _BatchStats(object):
+
+    """
+    Counters the event thread updates after every batch. They are only
+    written by the event thread, so readers see a consistent-enough view
+    without any locking.
+    """
+
+    def __init__(self):
+        self.batches = 0
+        self.events = 0
+        self.dropped = 0
+        self.largest = 0
+        self.handler_time = 0.0
+        self.last_size = 0
+        self.last_time = 0.0
+
+    def record(self, size, dropped, elapsed):
+        self.batches += 1
+        self.events += size
+        self.dropped += dropped
+        self.largest = max(self.largest, size)
+        self.handler_time += elapsed
+        self.last_size = size
+        self.last_time = elapsed
+
+    def snapshot(self):
+        return {
+            "batches": self.batches,
+            "events": self.events,
+            "dropped": self.dropped,
+            "largest": self.largest,
+            "handler_time": self.handler_time,
+            "mean_size": float(self.events) / self.batches if self.batches else 0.0,
+        }
+
+
 class _EventProcessor(threading.Thread):
 
     QUIT = ("QUIT",)
@@ -65,42 +150,300 @@ class _EventProcessor(threading.Thread):
         super(_EventProcessor, self).__init__()
         self.runtime = runtime
         self.live = set()
-        self.token_lock = threading.Lock()
+        self.token_lock = threading.Condition()
         self.die_now = False
+        self.stats = _BatchStats()
 
     @property
     def is_live(self):
         with self.token_lock:
             return bool(self.live)
 
+    def wait_until_idle(self, timeout=None):
+        """Wait until no event sources are left; return whether that happened."""
+        deadline = None if timeout is None else _clock() + timeout
+        with self.token_lock:
+            while self.live:
+                remaining = 1.0 if deadline is None else min(1.0, deadline - _clock())
+                if remaining <= 0:
+                    return False
+                # a bounded wait keeps KeyboardInterrupt deliverable on py2
+                self.token_lock.wait(remaining)
+            return True
+
+    def remove(self, token):
+        with self.token_lock:
+            self.live.remove(token)
+            if not self.live:
+                self.token_lock.notify_all()
+
     def run(self):
-        main_thread_running = True
-        while main_thread_running or self.is_live:
+        _runtime_thread.active = True
+        events = self.runtime.events
+        stats = self.stats
+        while True:
+            batch = events.take()
             if self.die_now:
                 with self.token_lock:
                     self.live = _Terminator()
-            try:
-                event = self.runtime.events.get(block=True, timeout=1)
-            except Empty:
+            started = _clock()
+            dropped = 0
+            for event in batch:
+                if event is self.QUIT:
+                    stats.record(len(batch), dropped, _clock() - started)
+                    return
+                # Only handlers running here remove tokens, so an unlocked
+                # read is enough; with no sources left events are dropped.
+                if not self.live:
+                    dropped += 1
+                    continue
+                function, args, kwargs = event
+                try:
+                    function(*args, **kwargs)
+                except Exception as exc:
+                    print("Event handler %s failed (%s)." % (function, exc))
+                    print(traceback.format_exc())
+            stats.record(len(batch), dropped, _clock() - started)
+
+
+class _TimerEntry(object):
+
+    __slots__ = ("deadline", "handler", "token")
+
+    def __init__(self, deadline, handler, token):
+        self.deadline = deadline
+        self.handler = handler
+        self.token = token
+
+
+class _Timer(threading.Thread):
+
+    """
+    A single thread firing every scheduled task of a runtime.
+
+    Pending tasks live in a heap ordered by deadline, and are found by
+    task for cancel(). Cancellation just clears the entry's handler;
+    cancelled entries are skipped when they reach the top of the heap,
+    and the heap is compacted once they make up more than half of it.
+    """
+
+    COMPACT_MINIMUM = 64
+
+    def __init__(self, runtime):
+        super(_Timer, self).__init__()
+        self.runtime = runtime
+        self.heap = []
+        self.pending = {}   # id(handler) -> its entries in the heap
+        self.sequence = itertools.count()
+        self.cancelled = 0
+        self.condition = threading.Condition()
+
+    def add(self, handler, delayInSeconds):
+        token = self.runtime._add_event_source("task")
+        entry = _TimerEntry(_clock() + delayInSeconds, handler, token)
+        with self.condition:
+            heapq.heappush(self.heap, (entry.deadline, next(self.sequence), entry))
+            self.pending.setdefault(id(handler), []).append(entry)
+            if self.heap[0][2] is entry:
+                self.condition.notify()
+
+    def cancel(self, handler):
+        with self.condition:
+            entries = self.pending.pop(id(handler), None)
+            if not entries:
+                return False
+            for entry in entries:
+                entry.handler = None
+            self.cancelled += len(entries)
+            if self.heap[0][2].handler is None:
+                self.condition.notify()
+            if self.cancelled > self.COMPACT_MINIMUM and 2 * self.cancelled > len(self.heap):
+                self.heap = [item for item in self.heap if item[2].handler is not None]
+                heapq.heapify(self.heap)
+                self.cancelled = 0
+        for entry in entries:
+            self.runtime._remove_event_source(entry.token)
+        return True
+
+    def _expired(self):
+        # Called with the condition held; blocks until something is due
+        while True:
+            if not self.heap:
+                self.condition.wait()
                 continue
+            now = _clock()
+            due = []
+            # cancelled entries on top go too, so as not to wake up for them
+            while self.heap and (self.heap[0][0] <= now or self.heap[0][2].handler is None):
+                entry = heapq.heappop(self.heap)[2]
+                if entry.handler is None:
+                    self.cancelled -= 1
+                else:
+                    key = id(entry.handler)
+                    entries = self.pending[key]
+                    entries.remove(entry)
+                    if not entries:
+                        del self.pending[key]
+                    due.append((entry.handler, entry.token))
+                    entry.handler = None
+            if due:
+                return due
+            if self.heap:
+                self.condition.wait(self.heap[0][0] - now)
+
+    def run(self):
+        while True:
+            with self.condition:
+                due = self._expired()
+            for handler, token in due:
+                self.runtime.events.put((handler.onExecute, [self.runtime], {}))
+                self.runtime._remove_event_source(token)
 
-            self.runtime.acquire()
+
+class _WorkerPool(object):
+
+    """
+    A fixed number of daemon threads running callables from a bounded queue.
+
+    Threads are started on first use. When the queue is full submit()
+    refuses the work instead of blocking the caller. Workers that stay
+    idle for idle_interval seconds call on_idle().
+    """
+
+    def __init__(self, name, workers, max_queued, idle_interval=None, on_idle=None):
+        self.name = name
+        self.workers = workers
+        self.queue = Queue(max_queued)
+        self.idle_interval = idle_interval
+        self.on_idle = on_idle
+        self.threads = []
+        self.lock = threading.Lock()
+
+    def submit(self, work):
+        if len(self.threads) < self.workers:
+            self._start()
+        try:
+            self.queue.put(work, block=False)
+        except Full:
+            return False
+        return True
+
+    def _start(self):
+        with self.lock:
+            while len(self.threads) < self.workers:
+                thread = threading.Thread(target=self._work,
+                                          name="%s-%d" % (self.name, len(self.threads)))
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+
+    def _work(self):
+        while True:
             try:
-                while self.is_live:
-                    if event == self.QUIT:
-                        return
-                    function, args, kwargs = event
-                    try:
-                        function(*args, **kwargs)
-                    except Exception as exc:
-                        print("Event handler %s failed (%s)." % (function, exc))
-                        print(traceback.format_exc())
-                    event = self.runtime.events.get(block=False)  # Raises Empty to break out of loop
+                work = self.queue.get(timeout=self.idle_interval)
             except Empty:
-                pass
-            finally:
-                self.runtime._notify()
-                self.runtime.release()
+                self.on_idle()
+                continue
+            try:
+                work()
+            except Exception:
+                print(traceback.format_exc())
+
+
+class _ConnectionPool(object):
+
+    """Persistent HTTP connections to a single (scheme, host, port)."""
+
+    def __init__(self, scheme, host, port, max_connections, idle_timeout):
+        self.factory = httplib.HTTPSConnection if scheme == "https" else httplib.HTTPConnection
+        self.host = host
+        self.port = port
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.idle = []  # (connection, released at), most recently used last
+        self.active = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Return a (connection, reused) pair, waiting for a free slot if needed."""
+        with self.condition:
+            while True:
+                self._evict()
+                if self.idle:
+                    self.active += 1
+                    return self.idle.pop()[0], True
+                if self.active < self.max_connections:
+                    self.active += 1
+                    break
+                self.condition.wait()
+        # connections are lazy, nothing blocks here
+        return self.factory(self.host, self.port), False
+
+    def release(self, connection, reusable):
+        with self.condition:
+            self.active -= 1
+            if reusable:
+                self.idle.append((connection, _clock()))
+            else:
+                connection.close()
+            self.condition.notify()
+
+    def evict(self):
+        with self.condition:
+            self._evict()
+
+    def _evict(self):
+        if not self.idle:
+            return
+        horizon = _clock() - self.idle_timeout
+        stale = 0
+        while stale < len(self.idle) and self.idle[stale][1] < horizon:
+            self.idle[stale][0].close()
+            stale += 1
+        del self.idle[:stale]
+
+
+class _HTTPClient(object):
+
+    """
+    Runs outgoing requests for a ThreadedRuntime on a fixed pool of threads.
+
+    Set the class attributes before the first request to change the
+    defaults: the number of worker threads, the connections kept per
+    (scheme, host, port), how long an unused connection is kept open,
+    and how many requests may wait for a worker before new ones fail.
+    """
+
+    workers = 8
+    max_per_host = 8
+    idle_timeout = 30.0
+    max_queued = 1024
+    max_redirects = 10
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+        self.pools = {}
+        self.lock = threading.Lock()
+        self.executor = _WorkerPool("quark-http", self.workers, self.max_queued,
+                                    self.idle_timeout, self.evict)
+
+    def submit(self, request):
+        return self.executor.submit(request)
+
+    def pool(self, scheme, host, port):
+        key = (scheme, host, port)
+        with self.lock:
+            pool = self.pools.get(key)
+            if pool is None:
+                pool = _ConnectionPool(scheme, host, port, self.max_per_host, self.idle_timeout)
+                self.pools[key] = pool
+        return pool
+
+    def evict(self):
+        with self.lock:
+            pools = list(self.pools.values())
+        for pool in pools:
+            pool.evict()
 
 
 # http://stackoverflow.com/questions/4511598/how-to-make-http-delete-method-using-urllib2
@@ -114,6 +457,55 @@ class _RequestWithMethod(Request):
         return self._method if self._method else super(_RequestWithMethod, self).get_method()
 
 
+# Methods that are safe to send again when a pooled connection turns out
+# to have gone stale while it sat idle
+_IDEMPOTENT = frozenset(["GET", "HEAD", "PUT", "DELETE", "OPTIONS"])
+
+
+def _went_stale(exc, sent):
+    """
+    Whether exc means the server closed the connection before it could
+    have seen the request: sending failed, or the server hung up before
+    any status line. Timeouts never count.
+    """
+    if isinstance(exc, socket.timeout):
+        return False
+    if not sent:
+        return isinstance(exc, socket.error)
+    if isinstance(exc, httplib.BadStatusLine):
+        return True
+    return isinstance(exc, socket.error) and exc.errno == errno.ECONNRESET
+
+# Bytes read from a response at a time
+_READ_SIZE = 64 * 1024
+
+
+def _read_chunks(response):
+    # The body as a list of chunks, so that it is never copied into one
+    # string unless the handler asks for it.
+    chunks = []
+    while True:
+        chunk = response.read(_READ_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    # read(amt) returns nothing when the server closes early too, leaving
+    # what is still owed of the Content-Length in length
+    missing = _remaining(response)
+    if missing:
+        raise httplib.IncompleteRead(b"".join(chunks), missing)
+    return chunks
+
+
+def _remaining(response):
+    # py2 urllib2 hands out the httplib response wrapped in a socket file
+    for source in (response, getattr(getattr(response, "fp", None), "_sock", None)):
+        length = getattr(source, "length", None)
+        if length is not None:
+            return length
+    return None
+
+
 class _QuarkRequest(object):
 
     def __init__(self, runtime, request, handler):
@@ -121,42 +513,103 @@ class _QuarkRequest(object):
         self.request = request
         self.handler = handler
         self.response = None
-        headers = {key.encode("utf-8"): str(value).encode("utf-8") for key, value in request.headers.items()}
+        # header names must be native strings for httplib's Host detection
+        self.headers = {(key if isinstance(key, str) else key.encode("utf-8")): str(value).encode("utf-8")
+                        for key, value in request.headers.items()}
         if self.request.body:
-            bodyBytes = self.request.body.encode("utf-8")
-            headers["Content-Length"] = str(len(bodyBytes))
+            self.body = self.request.body.encode("utf-8")
+            self.headers["Content-Length"] = str(len(self.body))
         else:
-            bodyBytes = None
-        self.py_request = _RequestWithMethod(self.request.url, bodyBytes, headers, method=self.request.method)
+            self.body = None
 
     def __call__(self):
         self.runtime.events.put((self.handler.onHTTPInit, (self.request,), {}))
         try:
-            handle = urlopen(self.py_request)
-            body = handle.read()
-        except HTTPError as e:
-            response = _HTTPResponse()
-            response.setCode(e.code)
-            response.setBody(e.read().decode('utf-8'))
-            for k,v in e.info().items():
-                response.setHeader(k, v.strip())
-            self.runtime.events.put((self.handler.onHTTPResponse, (self.request, response), {}))
+            code, headers, body = self.fetch()
         except URLError as exc:
-            import quark
-            self.runtime.events.put((self.handler.onHTTPError, (self.request, quark.HTTPError(str(exc.reason))), {}))
+            self.error(str(exc.reason))
         except Exception as exc:
-            import quark
-            self.runtime.events.put((self.handler.onHTTPError, (self.request, quark.HTTPError(str(exc))), {}))
+            self.error(str(exc))
         else:
             response = _HTTPResponse()
-            response.setCode(handle.getcode())
-            response.setBody(body.decode('utf-8'))
-            for k,v in handle.info().items():
+            response.setCode(code)
+            response._setBodyChunks(body)
+            for k,v in headers:
                 response.setHeader(k, v.strip())
             self.runtime.events.put((self.handler.onHTTPResponse, (self.request, response), {}))
 
         self.runtime.events.put((self.handler.onHTTPFinal, (self.request,), {}))
 
+    def reject(self, reason):
+        self.runtime.events.put((self.handler.onHTTPInit, (self.request,), {}))
+        self.error(reason)
+        self.runtime.events.put((self.handler.onHTTPFinal, (self.request,), {}))
+
+    def error(self, reason):
+        import quark
+        self.runtime.events.put((self.handler.onHTTPError, (self.request, quark.HTTPError(reason)), {}))
+
+    def fetch(self):
+        url = self.request.url
+        uri = urlparse(url)
+        if uri.scheme in getproxies() and not proxy_bypass(uri.hostname or ""):
+            return self.fetch_urllib()
+        method = self.request.method
+        body = self.body
+        headers = self.headers
+        for redirect in range(_HTTPClient.max_redirects + 1):
+            code, response_headers, response_body = self.fetch_pooled(uri, method, body, headers)
+            location = dict((k.lower(), v) for k, v in response_headers).get("location")
+            # follow redirects the way urllib2's HTTPRedirectHandler does
+            if location is None or not ((code in (301, 302, 303, 307) and method in ("GET", "HEAD")) or
+                                        (code in (301, 302, 303) and method == "POST")):
+                break
+            url = urljoin(url, location.strip())
+            uri = urlparse(url)
+            if method == "POST":
+                method = "GET"
+                body = None
+                headers = dict((k, v) for k, v in headers.items()
+                               if k.lower() not in ("content-length", "content-type"))
+        return code, response_headers, response_body
+
+    def fetch_pooled(self, uri, method, body, headers):
+        if uri.scheme not in ("http", "https"):
+            raise URLError("unknown url type: %s" % uri.scheme)
+        if not uri.hostname:
+            raise URLError("no host given")
+        port = uri.port or (443 if uri.scheme == "https" else 80)
+        pool = self.runtime.http.pool(uri.scheme, uri.hostname, port)
+        path = uri.path or "/"
+        if uri.query:
+            path += "?" + uri.query
+        while True:
+            connection, reused = pool.acquire()
+            sent = False
+            response = None
+            try:
+                connection.request(method, path, body, headers)
+                sent = True
+                response = connection.getresponse()
+                data = _read_chunks(response)
+            except Exception as exc:
+                pool.release(connection, False)
+                if reused and response is None and method in _IDEMPOTENT and _went_stale(exc, sent):
+                    continue  # went stale while idle, try the next one
+                if isinstance(exc, socket.error):
+                    raise URLError(exc)
+                raise
+            pool.release(connection, not response.will_close)
+            return response.status, response.getheaders(), data
+
+    def fetch_urllib(self):
+        py_request = _RequestWithMethod(self.request.url, self.body, self.headers, method=self.request.method)
+        try:
+            handle = urlopen(py_request)
+            return handle.getcode(), handle.info().items(), _read_chunks(handle)
+        except HTTPError as e:
+            return e.code, e.info().items(), _read_chunks(e)
+
 class _QuarkWSAdapter(object):
     def __init__(self, ws):
         self.ws = ws
@@ -230,8 +683,35 @@ class _QuarkWS(_QuarkWSMixin, WebSocketClient):
             self.runtime.log.debug("Caught ws4py exception %s in handler for %s:\n%s" %
                                    (ex, self.url, "".join(traceback.format_stack())))
 
+class _ServletResponse(_HTTPResponse):
+
+    """A response the container thread waits on until the servlet is done."""
+
+    def __init__(self):
+        super(_ServletResponse, self).__init__()
+        self._done = threading.Event()
+
+    def _respond(self):
+        self._responded = True
+        self._done.set()
+
+    def _wait(self, timeout):
+        """Wait for the servlet to respond, False if it did not in time."""
+        return self._done.wait(timeout)
+
+
 class _QuarkWSGIApp(object):
 
+    """
+    Dispatches requests to the servlets of a server.
+
+    A container thread waits for the servlet to respond for up to
+    response_timeout seconds, then answers 504 Gateway Timeout so that a
+    servlet that never responds does not hold the thread for good.
+    """
+
+    response_timeout = 60.0
+
     def __init__(self, runtime, url):
         self.runtime = runtime
         self.url = url
@@ -263,22 +743,26 @@ class _QuarkWSGIApp(object):
         for key in environ:
             if key.startswith("HTTP_"):
                 request.setHeader(key[5:], environ[key])
-        response = _HTTPResponse()
+        response = _ServletResponse()
 
         with self.lock:
             servlet = self.servlets.get(path, None)
         if servlet is None:
-            start_response("404 Not Found", [("Content-Type", "text/plain")])
-            yield "404 Not Found (%r)" % path
+            body = ("404 Not Found (%r)" % path).encode("utf-8")
+            start_response("404 Not Found", [("Content-Type", "text/plain"),
+                                             ("Content-Length", str(len(body)))])
+            yield body
             return
 
         self.runtime.events.put((self.call_servlet, (servlet, request, response), {}))
-        try:
-            self.runtime.acquire()
-            while not response._responded:
-                self.runtime.wait(60)
-        finally:
-            self.runtime.release()
+        if not response._wait(self.response_timeout):
+            self.runtime.log.warn("No response from the servlet for %s after %s seconds" %
+                                  (url, self.response_timeout))
+            body = b"504 Gateway Timeout\r\n"
+            start_response("504 Gateway Timeout", [("Content-Type", "text/plain"),
+                                                   ("Content-Length", str(len(body)))])
+            yield body
+            return
 
         for chunk in servlet.respond(environ, start_response, request, response):
             yield chunk
@@ -308,7 +792,7 @@ class HttpServletAdapter(object):
         response.setCode(code)
         response.setBody(body)
         response.setHeader("Content-Type", "text/plain")
-        response._responded = True
+        response._respond()
 
     def respond(self, environ, start_response, request, response):
         if response.code == 200:
@@ -329,7 +813,7 @@ class WSServletAdapter(HttpServletAdapter):
     def call_servlet(self, request, response):
         handler = self.servlet.onWSConnect(request)
         response._ws_handler = handler
-        response._responded = True
+        response._respond()
 
 
     def respond(self, environ, start_response, request, response):
@@ -348,6 +832,113 @@ class WSServletAdapter(HttpServletAdapter):
                 self.fail(response, 400, str(exc))
         return super(WSServletAdapter,self).respond(environ, start_response, request, response)
 
+class _QuarkKeepAliveWSGIHandler(_QuarkWSGIHandler):
+
+    def setup_environ(self):
+        _QuarkWSGIHandler.setup_environ(self)
+        self.http_version = self.environ['SERVER_PROTOCOL'].rsplit('/')[-1]
+
+    def close(self):
+        request_handler = self.request_handler
+        if self.status is not None and self.status.startswith("101"):
+            # ws4py owns the socket from now on
+            request_handler.upgraded = True
+            request_handler.connection.settimeout(None)
+            request_handler.close_connection = 1
+        elif self.headers is None or "Content-Length" not in self.headers:
+            # without a length the client reads the body until we close
+            request_handler.close_connection = 1
+        _QuarkWSGIHandler.close(self)
+
+
+class _QuarkKeepAliveRequestHandler(_QuarkWSGIRequestHandler):
+
+    """Serves HTTP/1.1 requests on a connection until it closes or upgrades."""
+
+    protocol_version = "HTTP/1.1"
+    upgraded = False
+
+    def setup(self):
+        self.timeout = getattr(self.server, "keepalive_timeout", None)
+        _QuarkWSGIRequestHandler.setup(self)
+        # wsgiref writes headers and body separately; without this Nagle
+        # and delayed ACKs stall every response on a kept-alive connection
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def handle(self):
+        self.close_connection = 1
+        self.handle_one_request()
+        while not self.close_connection:
+            self.handle_one_request()
+
+    def handle_one_request(self):
+        try:
+            self.raw_requestline = self.rfile.readline(65537)
+        except socket.timeout:
+            self.raw_requestline = None
+        if not self.raw_requestline:
+            self.close_connection = 1
+            return
+        if not self.parse_request():  # An error code has been sent
+            return
+        if self.headers.get("Transfer-Encoding"):
+            # _QuarkWSGIApp only reads Content-Length bodies
+            self.close_connection = 1
+        handler = _QuarkKeepAliveWSGIHandler(
+            self.rfile, self.wfile, self.get_stderr(), self.get_environ()
+        )
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+
+class _QuarkConcurrentWSGIServer(_QuarkWSGIServer):
+
+    """
+    Serves every connection on a thread from a fixed pool.
+
+    A slow servlet only holds up the connection it is answering. Set the
+    class attributes before serving to change the number of workers, the
+    listen backlog, how many accepted connections may wait for a worker,
+    and how long an idle keep-alive connection is kept.
+    """
+
+    workers = 16
+    request_queue_size = 128
+    max_queued = 1024
+    keepalive_timeout = 15.0
+
+    REFUSED = (b"HTTP/1.1 503 Service Unavailable\r\n"
+               b"Content-Length: 0\r\nConnection: close\r\n\r\n")
+
+    def __init__(self, server_address, RequestHandlerClass):
+        _QuarkWSGIServer.__init__(self, server_address, RequestHandlerClass)
+        self.pool = _WorkerPool("quark-container", self.workers, self.max_queued)
+
+    def process_request(self, request, client_address):
+        if not self.pool.submit(lambda: self.process_connection(request, client_address)):
+            try:
+                request.sendall(self.REFUSED)
+            finally:
+                self.close_connection(request)
+
+    def process_connection(self, request, client_address):
+        handler = None
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+        if not getattr(handler, "upgraded", False):
+            self.close_connection(request)
+
+    def close_connection(self, request):
+        # the ws4py server leaves sockets open for websockets
+        try:
+            request.shutdown(socket.SHUT_WR)
+        except socket.error:
+            pass
+        request.close()
+
+
 class Tracker(object):
     def __init__(self, runtime, name, target):
         self.runtime = runtime
@@ -396,16 +987,30 @@ class Url(object):
 
 class ThreadedRuntime(object):
 
+    # The container behind serveHTTP and serveWS. _QuarkWSGIServer with
+    # _QuarkWSGIRequestHandler serves one connection at a time instead.
+    server_class = _QuarkConcurrentWSGIServer
+    handler_class = _QuarkKeepAliveRequestHandler
+
+    # The pool behind execute(). Tasks that find it saturated run on the
+    # event thread instead.
+    workers = 8
+    max_queued = 1024
 
     def __init__(self):
         self._codec = _default_codec()
         self.lock = threading.Condition()
-        self.events = Queue()
+        self.events = _EventQueue()
         self.token_counter = 0
         self.sites = {}  # host, port -> site
         self.event_thread = _EventProcessor(self)
         self.event_thread.daemon = True
         self.event_thread.start()
+        self.timer = _Timer(self)
+        self.timer.daemon = True
+        self.timer.start()
+        self.http = _HTTPClient(self)
+        self.executor = _WorkerPool("quark-worker", self.workers, self.max_queued)
         self._codec = _default_codec()
         self.log = Logger("quark.runtime")
 
@@ -415,12 +1020,6 @@ class ThreadedRuntime(object):
     def release(self):
         self.lock.release()
 
-    def _notify(self):
-        self.lock.notify_all()
-
-    def wait(self, timeoutInSeconds):
-        self.lock.wait(timeoutInSeconds)
-
     def _add_event_source(self, name):
         with self.event_thread.token_lock:
             token = (self.token_counter, name, self)
@@ -429,10 +1028,7 @@ class ThreadedRuntime(object):
         return token
 
     def _remove_event_source(self, token):
-        def remove_token():
-            with self.event_thread.token_lock:
-                self.event_thread.live.remove(token)
-        self.events.put((remove_token, (), {}))
+        self.events.put((self.event_thread.remove, (token,), {}))
 
     def open(self, url, handler):
         def pump_websocket(runtime, url, handler):
@@ -454,26 +1050,31 @@ class ThreadedRuntime(object):
             self.release()
 
     def request(self, request, handler):
-        try:
-            self.acquire()
-            thread = threading.Thread(target=Tracker(self, "request", _QuarkRequest(self, request, handler)))
-            thread.setDaemon(True)
-            thread.start()
-        finally:
-            self.release()
+        tracked = Tracker(self, "request", _QuarkRequest(self, request, handler))
+        if not self.http.submit(tracked):
+            tracked.target.reject("Too many outstanding HTTP requests (%d queued)" % self.http.max_queued)
+            self._remove_event_source(tracked.token)
 
     def schedule(self, handler, delayInSeconds):
-        def run_scheduled(runtime, handler, delayInSeconds):
-            time.sleep(delayInSeconds)
-            runtime.events.put((handler.onExecute, [runtime], {}))
-        try:
-            self.acquire()
-            thread = threading.Thread(target=Tracker(self, "task", run_scheduled),
-                                      args=(self, handler, delayInSeconds))
-            thread.setDaemon(True)
-            thread.start()
-        finally:
-            self.release()
+        if delayInSeconds > 0:
+            self.timer.add(handler, delayInSeconds)
+        else:
+            # Even from the event thread: the running handler's own token
+            # removal may already be queued ahead of the task
+            self.events.put((Tracker(self, "task", handler.onExecute), [self], {}))
+
+    def execute(self, handler):
+        tracked = Tracker(self, "task", handler.onExecute)
+        if not self.executor.submit(lambda: self._work(tracked)):
+            self.events.put((tracked, [self], {}))
+
+    def _work(self, tracked):
+        _runtime_thread.active = True
+        tracked(self)
+
+    def cancel(self, handler):
+        """Cancel a task passed to schedule(); False if it is not pending."""
+        return self.timer.cancel(handler)
 
     def serveHTTP(self, url, servlet):
         url = Url(url)
@@ -505,7 +1106,7 @@ class ThreadedRuntime(object):
                 server = self.sites.get((url.host, url.port))
                 if not server:
                     # synchronous bind and listen...
-                    server = _QuarkWSGIServer((url.host, url.port), _QuarkWSGIRequestHandler)
+                    server = self.server_class((url.host, url.port), self.handler_class)
                     url.port = server.server_port
                     app = _QuarkWSGIApp(self, url)
                     server.set_app(app)
@@ -520,7 +1121,7 @@ class ThreadedRuntime(object):
             return _NoApplication(self, url, exc)
 
     def respond(self, request, response):
-        response._responded = True
+        response._respond()
 
     def fail(self, message):
         self.event_thread.die_now = True
@@ -574,9 +1175,10 @@ getRuntime = get_runtime
 def wait_for_completion():
     if _threaded_runtime is None:
         return
-    _threaded_runtime.event_thread.main_thread_running = False
     try:
-        while _threaded_runtime.event_thread.is_live:
-            time.sleep(1)
+        _threaded_runtime.event_thread.wait_until_idle()
     except KeyboardInterrupt:
         pass
+    # let the event thread finish before the interpreter tears down modules
+    _threaded_runtime.events.put(_EventProcessor.QUIT)
+    _threaded_runtime.event_thread.join(1.0)
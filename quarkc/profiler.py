@@ -0,0 +1,165 @@
+# Copyright 2016 datawire. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Where the compiler spends its time, for quark --profile.
+
+The compiler wraps each of its phases in `phase(name, where)`. While
+a Profile is started it records, for every phase and file or root, the
+time spent in the phase itself (nested phases are reported separately),
+the number of AST nodes ast.walk visited for the phase and the
+_Dispatcher lookups served from the cache (hits) or resolved from the
+class hierarchy (misses). Otherwise phase() only checks that no profile
+is active.
+"""
+
+from __future__ import absolute_import
+
+import os, sys, json, time
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+
+from . import ast, dispatch
+
+ACTIVE = None
+
+def location(where):
+    if where is None:
+        return ""
+    where = getattr(where, "url", where)
+    relative = os.path.relpath(where)
+    return relative if len(relative) < len(where) else where
+
+class Entry(object):
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.nodes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def add(self, other):
+        for k in ("calls", "seconds", "nodes", "hits", "misses"):
+            setattr(self, k, getattr(self, k) + getattr(other, k))
+
+    def json(self):
+        return OrderedDict((k, getattr(self, k)) for k in ("calls", "seconds", "nodes", "hits", "misses"))
+
+class Profile(object):
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.stack = []
+        self.dispatchers = defaultdict(lambda: [0, 0])
+        self.visits = [0]
+        self.seconds = 0.0
+
+    def start(self):
+        global ACTIVE
+        assert ACTIVE is None
+        ACTIVE = self
+        dispatch.STATS = self.dispatchers
+        ast.VISITS = self.visits
+        self.started = time.time()
+
+    def stop(self):
+        global ACTIVE
+        self.seconds += time.time() - self.started
+        dispatch.STATS = None
+        ast.VISITS = None
+        ACTIVE = None
+
+    def lookups(self):
+        hits = misses = 0
+        for h, m in self.dispatchers.values():
+            hits += h
+            misses += m
+        return hits, misses
+
+    def counts(self):
+        hits, misses = self.lookups()
+        return self.visits[0], hits, misses
+
+    def enter(self):
+        self.stack.append([time.time(), 0.0, self.counts(), (0, 0, 0)])
+
+    def leave(self, name, where):
+        start, nested, before, nested_counts = self.stack.pop()
+        elapsed = time.time() - start
+        counts = tuple(now - then for now, then in zip(self.counts(), before))
+        nodes, hits, misses = (c - n for c, n in zip(counts, nested_counts))
+        entry = self.entries.setdefault((name, location(where)), Entry())
+        entry.calls += 1
+        entry.seconds += elapsed - nested
+        entry.nodes += nodes
+        entry.hits += hits
+        entry.misses += misses
+        if self.stack:
+            parent = self.stack[-1]
+            parent[1] += elapsed
+            parent[3] = tuple(p + c for p, c in zip(parent[3], counts))
+
+    def phases(self):
+        result = OrderedDict()
+        for (name, _), entry in self.entries.items():
+            result.setdefault(name, Entry()).add(entry)
+        return result
+
+    def json(self):
+        return OrderedDict([
+            ("seconds", self.seconds),
+            ("phases", OrderedDict((name, e.json()) for name, e in self.phases().items())),
+            ("entries", [OrderedDict([("phase", name), ("location", where)] + e.json().items())
+                         for (name, where), e in self.entries.items()]),
+            ("dispatchers", OrderedDict((name, OrderedDict(hits=h, misses=m))
+                                        for name, (h, m) in sorted(self.dispatchers.items())))])
+
+    def dump(self, path):
+        with open(path, "w") as fd:
+            json.dump(self.json(), fd, indent=2)
+            fd.write("\n")
+
+    def report(self, stream=sys.stdout):
+        header = ["phase", "location", "calls", "seconds", "nodes", "hits", "misses"]
+        def row(name, where, e):
+            return [name, where, str(e.calls), "%.3f" % e.seconds, str(e.nodes), str(e.hits), str(e.misses)]
+        phases = sorted(self.phases().items(), key=lambda i: -i[1].seconds)
+        entries = sorted(self.entries.items(), key=lambda i: -i[1].seconds)
+        stream.write("\nCompiler profile, %.3f seconds in total:\n\n" % self.seconds)
+        table(stream, header, [row(name, "*", e) for name, e in phases])
+        stream.write("\n")
+        table(stream, header, [row(name, where, e) for (name, where), e in entries])
+
+def table(stream, header, rows):
+    widths = [max(len(r[i]) for r in [header] + rows) for i in range(len(header))]
+    for r in [header, ["-" * w for w in widths]] + rows:
+        cells = [c.ljust(w) if i < 2 else c.rjust(w) for i, (c, w) in enumerate(zip(r, widths))]
+        stream.write("  ".join(cells).rstrip() + "\n")
+
+@contextmanager
+def phase(name, where=None):
+    """
+    Attribute the time spent in the block, and the nodes walked in it, to
+    phase name of where, a file name or root.
+    """
+    profile = ACTIVE
+    if profile is None:
+        yield
+        return
+    profile.enter()
+    try:
+        yield
+    finally:
+        profile.leave(name, where)
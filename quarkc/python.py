@@ -263,6 +263,23 @@ def method(doc, clazz, type, name, parameters, body):
     body_with_doc = ":" + doc + body[1:]
     return "\ndef %s(%s)%s" % (name, ", ".join(["self"] + parameters), body_with_doc)
 
+def switch_method(doc, clazz, type, name, parameters, key, cases, default):
+    # Python has no switch statement: each case becomes a method of its
+    # own, which the method looks up in a dict the class builds once.
+    result = []
+    entries = []
+    for index, (label, statements) in enumerate(cases):
+        case = "%s_%d" % (name, index)
+        result.append(method("", clazz, type, case, parameters, block(statements)))
+        entries.append((label, case))
+    table = "%s_cases" % name
+    result.append("%s = %s" % (table, map(entries)))
+    call = "case(%s)" % ", ".join(["self"] + parameters)
+    body = ["case = %s.%s.get(%s)" % (clazz, table, key),
+            if_("case is not None", block([return_(call)]), None)] + default
+    result.append(method(doc, clazz, type, name, parameters, block(body)))
+    return "\n".join(result)
+
 def static_method(doc, clazz, type, name, parameters, body):
     if body is None: body = ":\n    assert False"
     body_with_doc = ":" + doc + body[1:]
@@ -97,29 +97,23 @@ class Reflector:
                 self.classes.append(cls)
             return
 
-        cls._extra_methods = lambda: self.gen_accessors(cls)
+        self.backend.extra_methods[cls] = lambda: self.gen_accessors(cls)
 
         self.classes.append(cls)
 
-    def gen_pred(self, field):
-        return self.apply_macro(self.get("Object", "__eq__"), self.texpr("String"), self.gen.name("name"),
-                                [self.string(field.name)])
-
-    def gen_ladder(self, texp, rung, default=None, pred=lambda f: True):
+    def gen_cases(self, texp, access, pred=lambda f: True):
         cls, use_bindings = texp.type, texp.bindings
 
-        ladder = []
+        cases = OrderedDict()
         bindings = base_bindings(cls)
         bindings.update(use_bindings)
         for f in get_fields(cls):
-            if pred(f):
-                ladder.append(rung(f, bindings))
-        if default:
-            ladder.append(default)
+            if pred(f) and f.name.text not in cases:
+                cases[f.name.text] = (self.string(f.name), access(f, bindings))
 
-        return ladder
+        return cases.values()
 
-    def gen_accessrung(self, field, bindings, get=True):
+    def gen_access(self, field, bindings, get=True):
         if field.static:
             path = self.backend.add_import(field.clazz)
             cons = self.gen.get_static_field(path,
@@ -129,20 +123,26 @@ class Reflector:
             cons = self.gen.get_field(self.gen.name("self"), self.backend.name(field.name))
 
         if get:
-            cons = self.gen.return_(cons)
+            return [self.gen.return_(cons)]
         else:
-            cons = self.gen.assign(cons, self.gen_cast(texpr(field.resolved.type, bindings, field.resolved.bindings),
-                                                       self.texpr("Object"),
-                                                       self.gen.name("value")))
-
-        return self.gen.if_(self.gen_pred(field), self.gen.block([cons]), None)
+            # Cases of a switch_method end by returning.
+            return [self.gen.assign(cons, self.gen_cast(texpr(field.resolved.type, bindings, field.resolved.bindings),
+                                                        self.texpr("Object"),
+                                                        self.gen.name("value"))),
+                    self.gen.return_(None)]
 
     def gen_fieldgets(self, texp):
-        return self.gen_ladder(texp, self.gen_accessrung, self.gen.return_(self.gen.null()))
+        return self.gen_cases(texp, self.gen_access)
 
     def gen_fieldsets(self, texp):
         pred = lambda f: not isinstance(f.clazz, Interface)
-        return self.gen_ladder(texp, lambda f, b: self.gen_accessrung(f, b, False), pred=pred)
+        return self.gen_cases(texp, lambda f, b: self.gen_access(f, b, False), pred=pred)
+
+    def gen_switch(self, cls, type, name, params, cases, default):
+        if not cases:
+            return self.gen.method("", self.backend.name(cls.name), type, name, params, self.gen.block(default))
+        return self.gen.switch_method("", self.backend.name(cls.name), type, name, params,
+                                      self.gen.name("name"), cases, default)
 
     def gen_accessors(self, cls):
         methods = [
@@ -150,14 +150,14 @@ class Reflector:
                             self.gen.name("_getClass"), [],
                             self.gen.block([self.gen.return_(self.string(self.qtype(cls.resolved)))])
             ),
-            self.gen.method("", self.backend.name(cls.name), self.type("Object"), self.gen.name("_getField"),
+            self.gen_switch(cls, self.type("Object"), self.gen.name("_getField"),
                             [self.gen.param(self.type("String"), self.gen.name("name"), None)],
-                            self.gen.block(self.gen_fieldgets(cls.resolved))
+                            self.gen_fieldgets(cls.resolved), [self.gen.return_(self.gen.null())]
             ),
-            self.gen.method("", self.backend.name(cls.name), self.type("void"), self.gen.name("_setField"),
+            self.gen_switch(cls, self.type("void"), self.gen.name("_setField"),
                             [self.gen.param(self.type("String"), self.gen.name("name"), None),
                              self.gen.param(self.type("Object"), self.gen.name("value"), None)],
-                            self.gen.block(self.gen_fieldsets(cls.resolved))
+                            self.gen_fieldsets(cls.resolved), []
             )
         ]
         return methods
@@ -323,9 +323,88 @@ class Reflector:
 
         dfn_code = self.gen.clazz("", False, gname, [], base, [], [singleton], [], [self.cons(gname, base, supargs,
                                                                                               body)],
-                                  [construct, isabs] + self.gen_boilerplate(gname))
+                                  [construct, isabs] + self.gen_codecs(texp, cls, gname) +
+                                  self.gen_boilerplate(gname))
         self.backend.files[fname] += dfn_code
 
+    # Fields of these types are encoded and decoded without going through
+    # toJSON and fromJSON, by the quark._encode<codec> and _decode<codec>
+    # functions.
+    CODECS = {
+        "quark.String": ("String", "String"),
+        "quark.int": ("Number", "Int"),
+        "quark.long": ("Number", "Long"),
+        "quark.float": ("Number", "Float"),
+    }
+
+    def codec(self, field, bindings):
+        if isinstance(field.resolved.type, TypeParam):
+            return None
+        return self.CODECS.get(self.qname(texpr(field.resolved.type, bindings, field.resolved.bindings)))
+
+    def call(self, name, args):
+        func = self.root.env["quark"].env[name]
+        return self.gen.invoke_function(self.backend.add_import(func), self.backend.name(func.name), args)
+
+    def gen_codecs(self, texp, cls, gname):
+        if (isinstance(cls, (Interface, Primitive)) or is_abstract(cls) or
+            cls.package and cls.package.name.text in (BUILTIN, REFLECT)):
+            return []
+
+        bindings = base_bindings(cls)
+        bindings.update(texp.bindings)
+        obj = self.gen.local(self.backend.type(self.erase(texp)), self.gen.name("obj"),
+                             self.gen_cast(self.erase(texp), self.texpr("Object"), self.gen.name("object")))
+        json = self.gen.name("json")
+        item = self.gen.name("item")
+        encode = [self.gen.expr_stmt(self.call("_encodeString", [json, self.string("$class"),
+                                                                   self.gen.get_field(self.gen.name("self"),
+                                                                                      self.gen.name("id"))]))]
+        decode = []
+        seen = set()
+        for index, f in enumerate(get_fields(cls)):
+            if f.name.text in seen or f.name.text.startswith("_"):
+                continue
+            seen.add(f.name.text)
+            if f.static:
+                value = self.gen.get_static_field(self.backend.add_import(f.clazz),
+                                                  self.backend.name(f.clazz.name),
+                                                  self.backend.name(f.name))
+            else:
+                value = self.gen.get_field(self.gen.name("obj"), self.backend.name(f.name))
+            name = self.string(f.name)
+            codec = self.codec(f, bindings)
+            if codec:
+                encode.append(self.gen.expr_stmt(self.call("_encode%s" % codec[0], [json, name, value])))
+            else:
+                encode.append(self.gen.expr_stmt(self.call("_encodeField", [json, self.gen.name("self"),
+                                                                            self.number(index), value])))
+
+            if isinstance(f.clazz, Interface):
+                continue
+            if codec:
+                decoded = self.call("_decode%s" % codec[1], [item])
+            else:
+                decoded = self.gen_cast(texpr(f.resolved.type, bindings, f.resolved.bindings), self.texpr("Object"),
+                                        self.call("_decodeField", [self.gen.name("self"), self.number(index), item]))
+            decode.append(self.gen.assign(item, self.call("_decodeItem", [json, name])))
+            decode.append(self.gen.if_(self.apply_macro(self.get("Object", "__ne__"), self.texpr("Object"),
+                                                        item, [self.gen.null()]),
+                                       self.gen.block([self.gen.assign(value, decoded)]),
+                                       None))
+
+        if len(encode) > 1:
+            encode.insert(1, obj)
+        if decode:
+            decode[:0] = [obj, self.gen.local(self.type("JSONObject"), item, None)]
+        params = [self.gen.param(self.type("Object"), self.gen.name("object"), None),
+                  self.gen.param(self.type("JSONObject"), json, None)]
+        done = self.gen.return_(self.gen.bool_(Bool("true")))
+        return [self.gen.method("", gname, self.type("bool"), self.gen.name("_encodeFields"), params,
+                                self.gen.block(encode + [done])),
+                self.gen.method("", gname, self.type("bool"), self.gen.name("_decodeFields"), params,
+                                self.gen.block(decode + [done]))]
+
     def gen_meths(self, texp, cls, cid):
         if cls.package and cls.package.name.text in (BUILTIN, REFLECT): return self.gen.list_([])
         methods = []
@@ -489,13 +568,12 @@ class Reflector:
                                self.gen.block([]))
 
     def cleanup(self):
-        for cls in self.metadata:
-            if getattr(cls, "_extra_statics", None):
-                del cls._extra_statics
+        self.backend.extra_methods.clear()
+        self.backend.extra_statics.clear()
 
 def reflect(root, be):
     ref = Reflector(root, be)
     root.traverse(ref)
     for cls, deps in ref.metadata.items():
-        cls._extra_statics = lambda c=cls, d=deps: ref.gen_refs(c, d)
+        be.extra_statics[cls] = lambda c=cls, d=deps: ref.gen_refs(c, d)
     return [mdroot(ref.entry)], ref.cleanup
@@ -268,6 +268,13 @@ def method(doc, clazz, type, name, parameters, body):
         body=body,
     )
 
+def switch_method(doc, clazz, type, name, parameters, key, cases, default):
+    # A case whose labels are all string literals looks its label up in a
+    # hash.
+    whens = "".join('when {}{}'.format(label, block(statements)) for label, statements in cases)
+    body = ['case {}\n{}end'.format(key, whens)] + default
+    return method(doc, clazz, type, name, parameters, block(body))
+
 def static_method(doc, clazz, type, name, parameters, body):
     return Templates.method(
         doc=doc,
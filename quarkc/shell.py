@@ -16,7 +16,9 @@ import os
 import shlex
 import subprocess
 import logging
+import threading
 import pkg_resources
+from contextlib import contextmanager
 from distutils.version import StrictVersion  # pylint: disable=import-error
 
 from .exceptions import QuarkError
@@ -97,6 +99,25 @@ def user_override(command):
 
 command_log = logging.getLogger("quark.command")
 
+_context = threading.local()
+
+@contextmanager
+def labelled(label):
+    """
+    Prefix the logged output and errors of the commands this thread runs
+    with label, so concurrent installs can be told apart.
+    """
+    previous = getattr(_context, "label", None)
+    _context.label = label
+    try:
+        yield
+    finally:
+        _context.label = previous
+
+def label():
+    current = getattr(_context, "label", None)
+    return "[%s] " % current if current else ""
+
 
 class ShellError(QuarkError):
     pass
@@ -109,19 +130,20 @@ def call(*command, **kwargs):
     command = user_override(command)
     check(role, command[0], cwd)
 
+    prefix = label()
     def format_output(out):
-        return ("\n  %s: " % os.path.basename(command[0])).join(("\n" + out).splitlines())
-    command_log.debug("%s: cd %s && %s", stage, cwd or ".", " ".join(command))
+        return ("\n  %s%s: " % (prefix, os.path.basename(command[0]))).join(("\n" + out).splitlines())
+    command_log.debug("%s%s: cd %s && %s", prefix, stage, cwd or ".", " ".join(command))
     try:
         out = subprocess.check_output(command, cwd=cwd, stderr=subprocess.STDOUT)
-        command_log.debug("%s: %s", stage, format_output(out))
+        command_log.debug("%s%s: %s", prefix, stage, format_output(out))
     except subprocess.CalledProcessError as ex:
         if errok:
             log = command_log.debug
         else:
             log = command_log.warning
-        log("%s: %s", stage, format_output(ex.output))
-        raise ShellError("quark (%s): FAILURE (%s)" % (stage, " ".join(command)))
+        log("%s%s: %s", prefix, stage, format_output(ex.output))
+        raise ShellError("%squark (%s): FAILURE (%s)" % (prefix, stage, " ".join(command)))
     return out
 
 def get_pip_pkg(name, stage=None, command="pip"):
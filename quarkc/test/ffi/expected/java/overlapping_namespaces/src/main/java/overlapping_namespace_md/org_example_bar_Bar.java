@@ -16,6 +16,13 @@ public class org_example_bar_Bar extends quark.reflect.Class implements io.dataw
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
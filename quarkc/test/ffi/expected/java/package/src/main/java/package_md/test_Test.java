@@ -16,6 +16,21 @@ public class test_Test extends quark.reflect.Class implements io.datawire.quark.
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        test.Test obj = (test.Test) (object);
+        quark.Functions._encodeString(json, "name", (obj).name);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        test.Test obj = (test.Test) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "name");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).name = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,21 @@ public class test_subtest_Test extends quark.reflect.Class implements io.datawir
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        test.subtest.Test obj = (test.subtest.Test) (object);
+        quark.Functions._encodeNumber(json, "size", (obj).size);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        test.subtest.Test obj = (test.subtest.Test) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "size");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).size = quark.Functions._decodeInt(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -15,14 +15,23 @@ public class Test implements io.datawire.quark.runtime.QObject {
         return "test.Test";
     }
     public Object _getField(String name) {
-        if ((name)==("name") || ((Object)(name) != null && ((Object) (name)).equals("name"))) {
-            return (this).name;
+        if (name != null) {
+            switch (name) {
+                case "name": {
+                    return (this).name;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("name") || ((Object)(name) != null && ((Object) (name)).equals("name"))) {
-            (this).name = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "name": {
+                    (this).name = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -9,14 +9,23 @@ public class Test implements io.datawire.quark.runtime.QObject {
         return "test.subtest.Test";
     }
     public Object _getField(String name) {
-        if ((name)==("size") || ((Object)(name) != null && ((Object) (name)).equals("size"))) {
-            return (this).size;
+        if (name != null) {
+            switch (name) {
+                case "size": {
+                    return (this).size;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("size") || ((Object)(name) != null && ((Object) (name)).equals("size"))) {
-            (this).size = (Integer) (value);
+        if (name != null) {
+            switch (name) {
+                case "size": {
+                    (this).size = (Integer) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -17,20 +17,30 @@ public class test_find extends string_test implements io.datawire.quark.runtime.
         return "classes.test_find";
     }
     public Object _getField(String name) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            return (this).what;
-        }
-        if ((name)==("_that") || ((Object)(name) != null && ((Object) (name)).equals("_that"))) {
-            return (this)._that;
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    return (this).what;
+                }
+                case "_that": {
+                    return (this)._that;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            (this).what = (String) (value);
-        }
-        if ((name)==("_that") || ((Object)(name) != null && ((Object) (name)).equals("_that"))) {
-            (this)._that = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    (this).what = (String) (value);
+                    return;
+                }
+                case "_that": {
+                    (this)._that = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -22,32 +22,44 @@ public class test_join extends string_test implements io.datawire.quark.runtime.
         return "classes.test_join";
     }
     public Object _getField(String name) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            return (this).what;
-        }
-        if ((name)==("parts") || ((Object)(name) != null && ((Object) (name)).equals("parts"))) {
-            return (this).parts;
-        }
-        if ((name)==("strparts") || ((Object)(name) != null && ((Object) (name)).equals("strparts"))) {
-            return (this).strparts;
-        }
-        if ((name)==("sep") || ((Object)(name) != null && ((Object) (name)).equals("sep"))) {
-            return (this).sep;
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    return (this).what;
+                }
+                case "parts": {
+                    return (this).parts;
+                }
+                case "strparts": {
+                    return (this).strparts;
+                }
+                case "sep": {
+                    return (this).sep;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            (this).what = (String) (value);
-        }
-        if ((name)==("parts") || ((Object)(name) != null && ((Object) (name)).equals("parts"))) {
-            (this).parts = (java.util.ArrayList<String>) (value);
-        }
-        if ((name)==("strparts") || ((Object)(name) != null && ((Object) (name)).equals("strparts"))) {
-            (this).strparts = (String) (value);
-        }
-        if ((name)==("sep") || ((Object)(name) != null && ((Object) (name)).equals("sep"))) {
-            (this).sep = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    (this).what = (String) (value);
+                    return;
+                }
+                case "parts": {
+                    (this).parts = (java.util.ArrayList<String>) (value);
+                    return;
+                }
+                case "strparts": {
+                    (this).strparts = (String) (value);
+                    return;
+                }
+                case "sep": {
+                    (this).sep = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -18,26 +18,37 @@ public class test_replace extends string_test implements io.datawire.quark.runti
         return "classes.test_replace";
     }
     public Object _getField(String name) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            return (this).what;
-        }
-        if ((name)==("start") || ((Object)(name) != null && ((Object) (name)).equals("start"))) {
-            return (this).start;
-        }
-        if ((name)==("end") || ((Object)(name) != null && ((Object) (name)).equals("end"))) {
-            return (this).end;
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    return (this).what;
+                }
+                case "start": {
+                    return (this).start;
+                }
+                case "end": {
+                    return (this).end;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            (this).what = (String) (value);
-        }
-        if ((name)==("start") || ((Object)(name) != null && ((Object) (name)).equals("start"))) {
-            (this).start = (String) (value);
-        }
-        if ((name)==("end") || ((Object)(name) != null && ((Object) (name)).equals("end"))) {
-            (this).end = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    (this).what = (String) (value);
+                    return;
+                }
+                case "start": {
+                    (this).start = (String) (value);
+                    return;
+                }
+                case "end": {
+                    (this).end = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
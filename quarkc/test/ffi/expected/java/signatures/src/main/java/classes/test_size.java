@@ -13,14 +13,23 @@ public class test_size extends string_test implements io.datawire.quark.runtime.
         return "classes.test_size";
     }
     public Object _getField(String name) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            return (this).what;
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    return (this).what;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            (this).what = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    (this).what = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -18,26 +18,37 @@ public class test_split extends string_test implements io.datawire.quark.runtime
         return "classes.test_split";
     }
     public Object _getField(String name) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            return (this).what;
-        }
-        if ((name)==("sep") || ((Object)(name) != null && ((Object) (name)).equals("sep"))) {
-            return (this).sep;
-        }
-        if ((name)==("altsep") || ((Object)(name) != null && ((Object) (name)).equals("altsep"))) {
-            return (this).altsep;
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    return (this).what;
+                }
+                case "sep": {
+                    return (this).sep;
+                }
+                case "altsep": {
+                    return (this).altsep;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("what") || ((Object)(name) != null && ((Object) (name)).equals("what"))) {
-            (this).what = (String) (value);
-        }
-        if ((name)==("sep") || ((Object)(name) != null && ((Object) (name)).equals("sep"))) {
-            (this).sep = (String) (value);
-        }
-        if ((name)==("altsep") || ((Object)(name) != null && ((Object) (name)).equals("altsep"))) {
-            (this).altsep = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "what": {
+                    (this).what = (String) (value);
+                    return;
+                }
+                case "sep": {
+                    (this).sep = (String) (value);
+                    return;
+                }
+                case "altsep": {
+                    (this).altsep = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
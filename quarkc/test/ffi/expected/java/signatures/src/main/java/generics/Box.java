@@ -11,14 +11,23 @@ public class Box<T> implements io.datawire.quark.runtime.QObject {
         return "generics.Box<quark.Object>";
     }
     public Object _getField(String name) {
-        if ((name)==("contents") || ((Object)(name) != null && ((Object) (name)).equals("contents"))) {
-            return (this).contents;
+        if (name != null) {
+            switch (name) {
+                case "contents": {
+                    return (this).contents;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("contents") || ((Object)(name) != null && ((Object) (name)).equals("contents"))) {
-            (this).contents = (T) (value);
+        if (name != null) {
+            switch (name) {
+                case "contents": {
+                    (this).contents = (T) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -15,20 +15,30 @@ public class Crate<T> implements io.datawire.quark.runtime.QObject {
         return "generics.Crate<quark.Object>";
     }
     public Object _getField(String name) {
-        if ((name)==("box") || ((Object)(name) != null && ((Object) (name)).equals("box"))) {
-            return (this).box;
-        }
-        if ((name)==("ibox") || ((Object)(name) != null && ((Object) (name)).equals("ibox"))) {
-            return (this).ibox;
+        if (name != null) {
+            switch (name) {
+                case "box": {
+                    return (this).box;
+                }
+                case "ibox": {
+                    return (this).ibox;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("box") || ((Object)(name) != null && ((Object) (name)).equals("box"))) {
-            (this).box = (Box<T>) (value);
-        }
-        if ((name)==("ibox") || ((Object)(name) != null && ((Object) (name)).equals("ibox"))) {
-            (this).ibox = (Box<Integer>) (value);
+        if (name != null) {
+            switch (name) {
+                case "box": {
+                    (this).box = (Box<T>) (value);
+                    return;
+                }
+                case "ibox": {
+                    (this).ibox = (Box<Integer>) (value);
+                    return;
+                }
+            }
         }
     }
 }
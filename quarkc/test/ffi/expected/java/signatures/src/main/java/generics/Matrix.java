@@ -16,26 +16,37 @@ public class Matrix<T> implements io.datawire.quark.runtime.QObject {
         return "generics.Matrix<quark.Object>";
     }
     public Object _getField(String name) {
-        if ((name)==("width") || ((Object)(name) != null && ((Object) (name)).equals("width"))) {
-            return (this).width;
-        }
-        if ((name)==("height") || ((Object)(name) != null && ((Object) (name)).equals("height"))) {
-            return (this).height;
-        }
-        if ((name)==("columns") || ((Object)(name) != null && ((Object) (name)).equals("columns"))) {
-            return (this).columns;
+        if (name != null) {
+            switch (name) {
+                case "width": {
+                    return (this).width;
+                }
+                case "height": {
+                    return (this).height;
+                }
+                case "columns": {
+                    return (this).columns;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("width") || ((Object)(name) != null && ((Object) (name)).equals("width"))) {
-            (this).width = (Integer) (value);
-        }
-        if ((name)==("height") || ((Object)(name) != null && ((Object) (name)).equals("height"))) {
-            (this).height = (Integer) (value);
-        }
-        if ((name)==("columns") || ((Object)(name) != null && ((Object) (name)).equals("columns"))) {
-            (this).columns = (java.util.ArrayList<java.util.ArrayList<T>>) (value);
+        if (name != null) {
+            switch (name) {
+                case "width": {
+                    (this).width = (Integer) (value);
+                    return;
+                }
+                case "height": {
+                    (this).height = (Integer) (value);
+                    return;
+                }
+                case "columns": {
+                    (this).columns = (java.util.ArrayList<java.util.ArrayList<T>>) (value);
+                    return;
+                }
+            }
         }
     }
 }
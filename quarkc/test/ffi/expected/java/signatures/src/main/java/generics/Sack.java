@@ -8,14 +8,23 @@ public class Sack implements io.datawire.quark.runtime.QObject {
         return "generics.Sack";
     }
     public Object _getField(String name) {
-        if ((name)==("ints") || ((Object)(name) != null && ((Object) (name)).equals("ints"))) {
-            return (this).ints;
+        if (name != null) {
+            switch (name) {
+                case "ints": {
+                    return (this).ints;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("ints") || ((Object)(name) != null && ((Object) (name)).equals("ints"))) {
-            (this).ints = (Box<Integer>) (value);
+        if (name != null) {
+            switch (name) {
+                case "ints": {
+                    (this).ints = (Box<Integer>) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -17,26 +17,37 @@ public class Context implements io.datawire.quark.runtime.QObject {
         return "generics.ccc.Context";
     }
     public Object _getField(String name) {
-        if ((name)==("_global") || ((Object)(name) != null && ((Object) (name)).equals("_global"))) {
-            return Context._global;
-        }
-        if ((name)==("_current") || ((Object)(name) != null && ((Object) (name)).equals("_current"))) {
-            return Context._current;
-        }
-        if ((name)==("parent") || ((Object)(name) != null && ((Object) (name)).equals("parent"))) {
-            return (this).parent;
+        if (name != null) {
+            switch (name) {
+                case "_global": {
+                    return Context._global;
+                }
+                case "_current": {
+                    return Context._current;
+                }
+                case "parent": {
+                    return (this).parent;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("_global") || ((Object)(name) != null && ((Object) (name)).equals("_global"))) {
-            Context._global = (Context) (value);
-        }
-        if ((name)==("_current") || ((Object)(name) != null && ((Object) (name)).equals("_current"))) {
-            Context._current = (TLS<Context>) (value);
-        }
-        if ((name)==("parent") || ((Object)(name) != null && ((Object) (name)).equals("parent"))) {
-            (this).parent = (Context) (value);
+        if (name != null) {
+            switch (name) {
+                case "_global": {
+                    Context._global = (Context) (value);
+                    return;
+                }
+                case "_current": {
+                    Context._current = (TLS<Context>) (value);
+                    return;
+                }
+                case "parent": {
+                    (this).parent = (Context) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -10,14 +10,23 @@ public class TLS<T> implements io.datawire.quark.runtime.QObject {
         return "generics.ccc.TLS<quark.Object>";
     }
     public Object _getField(String name) {
-        if ((name)==("_value") || ((Object)(name) != null && ((Object) (name)).equals("_value"))) {
-            return (this)._value;
+        if (name != null) {
+            switch (name) {
+                case "_value": {
+                    return (this)._value;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("_value") || ((Object)(name) != null && ((Object) (name)).equals("_value"))) {
-            (this)._value = (T) (value);
+        if (name != null) {
+            switch (name) {
+                case "_value": {
+                    (this)._value = (T) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -10,14 +10,23 @@ public class StringBox extends Box<String> implements io.datawire.quark.runtime.
         return "generics.pkg.StringBox";
     }
     public Object _getField(String name) {
-        if ((name)==("contents") || ((Object)(name) != null && ((Object) (name)).equals("contents"))) {
-            return (this).contents;
+        if (name != null) {
+            switch (name) {
+                case "contents": {
+                    return (this).contents;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("contents") || ((Object)(name) != null && ((Object) (name)).equals("contents"))) {
-            (this).contents = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "contents": {
+                    (this).contents = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
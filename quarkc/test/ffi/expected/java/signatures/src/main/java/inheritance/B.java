@@ -10,14 +10,23 @@ public class B extends A implements io.datawire.quark.runtime.QObject {
         return "inheritance.B";
     }
     public Object _getField(String name) {
-        if ((name)==("name") || ((Object)(name) != null && ((Object) (name)).equals("name"))) {
-            return (this).name;
+        if (name != null) {
+            switch (name) {
+                case "name": {
+                    return (this).name;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("name") || ((Object)(name) != null && ((Object) (name)).equals("name"))) {
-            (this).name = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "name": {
+                    (this).name = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
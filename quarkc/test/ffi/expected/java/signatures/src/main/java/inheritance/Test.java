@@ -11,26 +11,37 @@ public class Test extends Base implements io.datawire.quark.runtime.QObject {
         return "inheritance.Test";
     }
     public Object _getField(String name) {
-        if ((name)==("name") || ((Object)(name) != null && ((Object) (name)).equals("name"))) {
-            return (this).name;
-        }
-        if ((name)==("mumble") || ((Object)(name) != null && ((Object) (name)).equals("mumble"))) {
-            return (this).mumble;
-        }
-        if ((name)==("later") || ((Object)(name) != null && ((Object) (name)).equals("later"))) {
-            return (this).later;
+        if (name != null) {
+            switch (name) {
+                case "name": {
+                    return (this).name;
+                }
+                case "mumble": {
+                    return (this).mumble;
+                }
+                case "later": {
+                    return (this).later;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("name") || ((Object)(name) != null && ((Object) (name)).equals("name"))) {
-            (this).name = (String) (value);
-        }
-        if ((name)==("mumble") || ((Object)(name) != null && ((Object) (name)).equals("mumble"))) {
-            (this).mumble = (String) (value);
-        }
-        if ((name)==("later") || ((Object)(name) != null && ((Object) (name)).equals("later"))) {
-            (this).later = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "name": {
+                    (this).name = (String) (value);
+                    return;
+                }
+                case "mumble": {
+                    (this).mumble = (String) (value);
+                    return;
+                }
+                case "later": {
+                    (this).later = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -8,8 +8,12 @@ public class Constants implements IConstants, io.datawire.quark.runtime.QObject
         return "interfaces.Constants";
     }
     public Object _getField(String name) {
-        if ((name)==("FOO") || ((Object)(name) != null && ((Object) (name)).equals("FOO"))) {
-            return IConstants.FOO;
+        if (name != null) {
+            switch (name) {
+                case "FOO": {
+                    return IConstants.FOO;
+                }
+            }
         }
         return null;
     }
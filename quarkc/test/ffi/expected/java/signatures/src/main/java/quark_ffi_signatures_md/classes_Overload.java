@@ -16,6 +16,21 @@ public class classes_Overload extends quark.reflect.Class implements io.datawire
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        classes.Overload obj = (classes.Overload) (object);
+        quark.Functions._encodeString(json, "name", (obj).name);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        classes.Overload obj = (classes.Overload) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "name");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).name = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,21 @@ public class classes_test_endsWith extends quark.reflect.Class implements io.dat
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        classes.test_endsWith obj = (classes.test_endsWith) (object);
+        quark.Functions._encodeString(json, "what", (obj).what);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        classes.test_endsWith obj = (classes.test_endsWith) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "what");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).what = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,36 @@ public class classes_test_join extends quark.reflect.Class implements io.datawir
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        classes.test_join obj = (classes.test_join) (object);
+        quark.Functions._encodeString(json, "what", (obj).what);
+        quark.Functions._encodeField(json, this, 1, (obj).parts);
+        quark.Functions._encodeString(json, "strparts", (obj).strparts);
+        quark.Functions._encodeString(json, "sep", (obj).sep);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        classes.test_join obj = (classes.test_join) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "what");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).what = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "parts");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).parts = (java.util.ArrayList<String>) (quark.Functions._decodeField(this, 1, item));
+        }
+        item = quark.Functions._decodeItem(json, "strparts");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).strparts = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "sep");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).sep = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,31 @@ public class classes_test_replace extends quark.reflect.Class implements io.data
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        classes.test_replace obj = (classes.test_replace) (object);
+        quark.Functions._encodeString(json, "what", (obj).what);
+        quark.Functions._encodeString(json, "start", (obj).start);
+        quark.Functions._encodeString(json, "end", (obj).end);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        classes.test_replace obj = (classes.test_replace) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "what");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).what = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "start");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).start = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "end");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).end = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,31 @@ public class classes_test_split extends quark.reflect.Class implements io.datawi
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        classes.test_split obj = (classes.test_split) (object);
+        quark.Functions._encodeString(json, "what", (obj).what);
+        quark.Functions._encodeString(json, "sep", (obj).sep);
+        quark.Functions._encodeString(json, "altsep", (obj).altsep);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        classes.test_split obj = (classes.test_split) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "what");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).what = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "sep");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).sep = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "altsep");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).altsep = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,31 @@ public class classes_test_substring extends quark.reflect.Class implements io.da
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        classes.test_substring obj = (classes.test_substring) (object);
+        quark.Functions._encodeString(json, "what", (obj).what);
+        quark.Functions._encodeNumber(json, "start", (obj).start);
+        quark.Functions._encodeNumber(json, "end", (obj).end);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        classes.test_substring obj = (classes.test_substring) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "what");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).what = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "start");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).start = quark.Functions._decodeInt(item);
+        }
+        item = quark.Functions._decodeItem(json, "end");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).end = quark.Functions._decodeInt(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,21 @@ public class generics_Box_quark_int_ extends quark.reflect.Class implements io.d
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        generics.Box<Integer> obj = (generics.Box<Integer>) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).contents);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        generics.Box<Integer> obj = (generics.Box<Integer>) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "contents");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).contents = (Integer) (quark.Functions._decodeField(this, 0, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,26 @@ public class generics_Crate_quark_Object_ extends quark.reflect.Class implements
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        generics.Crate<Object> obj = (generics.Crate<Object>) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).box);
+        quark.Functions._encodeField(json, this, 1, (obj).ibox);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        generics.Crate<Object> obj = (generics.Crate<Object>) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "box");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).box = (generics.Box<T>) (quark.Functions._decodeField(this, 0, item));
+        }
+        item = quark.Functions._decodeItem(json, "ibox");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).ibox = (generics.Box<Integer>) (quark.Functions._decodeField(this, 1, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,31 @@ public class generics_Matrix_quark_Object_ extends quark.reflect.Class implement
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        generics.Matrix<Object> obj = (generics.Matrix<Object>) (object);
+        quark.Functions._encodeNumber(json, "width", (obj).width);
+        quark.Functions._encodeNumber(json, "height", (obj).height);
+        quark.Functions._encodeField(json, this, 2, (obj).columns);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        generics.Matrix<Object> obj = (generics.Matrix<Object>) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "width");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).width = quark.Functions._decodeInt(item);
+        }
+        item = quark.Functions._decodeItem(json, "height");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).height = quark.Functions._decodeInt(item);
+        }
+        item = quark.Functions._decodeItem(json, "columns");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).columns = (java.util.ArrayList<java.util.ArrayList<T>>) (quark.Functions._decodeField(this, 2, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
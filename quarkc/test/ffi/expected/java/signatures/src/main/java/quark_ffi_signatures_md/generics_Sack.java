@@ -16,6 +16,21 @@ public class generics_Sack extends quark.reflect.Class implements io.datawire.qu
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        generics.Sack obj = (generics.Sack) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).ints);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        generics.Sack obj = (generics.Sack) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "ints");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).ints = (generics.Box<Integer>) (quark.Functions._decodeField(this, 0, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,21 @@ public class generics_ccc_Context extends quark.reflect.Class implements io.data
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        generics.ccc.Context obj = (generics.ccc.Context) (object);
+        quark.Functions._encodeField(json, this, 2, (obj).parent);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        generics.ccc.Context obj = (generics.ccc.Context) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "parent");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).parent = (generics.ccc.Context) (quark.Functions._decodeField(this, 2, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
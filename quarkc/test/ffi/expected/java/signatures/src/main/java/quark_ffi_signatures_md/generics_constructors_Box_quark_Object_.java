@@ -16,6 +16,21 @@ public class generics_constructors_Box_quark_Object_ extends quark.reflect.Class
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        generics.constructors.Box<Object> obj = (generics.constructors.Box<Object>) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).contents);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        generics.constructors.Box<Object> obj = (generics.constructors.Box<Object>) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "contents");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).contents = (T) (quark.Functions._decodeField(this, 0, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,21 @@ public class generics_pkg_Box_quark_String_ extends quark.reflect.Class implemen
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        generics.pkg.Box<String> obj = (generics.pkg.Box<String>) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).contents);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        generics.pkg.Box<String> obj = (generics.pkg.Box<String>) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "contents");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).contents = (String) (quark.Functions._decodeField(this, 0, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
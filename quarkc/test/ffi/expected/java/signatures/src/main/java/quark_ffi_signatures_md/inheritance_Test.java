@@ -16,6 +16,31 @@ public class inheritance_Test extends quark.reflect.Class implements io.datawire
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        inheritance.Test obj = (inheritance.Test) (object);
+        quark.Functions._encodeString(json, "name", (obj).name);
+        quark.Functions._encodeString(json, "mumble", (obj).mumble);
+        quark.Functions._encodeString(json, "later", (obj).later);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        inheritance.Test obj = (inheritance.Test) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "name");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).name = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "mumble");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).mumble = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "later");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).later = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
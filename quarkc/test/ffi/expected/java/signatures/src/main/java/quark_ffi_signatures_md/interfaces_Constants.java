@@ -16,6 +16,15 @@ public class interfaces_Constants extends quark.reflect.Class implements io.data
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        interfaces.Constants obj = (interfaces.Constants) (object);
+        quark.Functions._encodeString(json, "FOO", interfaces.IConstants.FOO);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,21 @@ public class statics_Foo extends quark.reflect.Class implements io.datawire.quar
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        statics.Foo obj = (statics.Foo) (object);
+        quark.Functions._encodeNumber(json, "count", statics.Foo.count);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        statics.Foo obj = (statics.Foo) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "count");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            statics.Foo.count = quark.Functions._decodeInt(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
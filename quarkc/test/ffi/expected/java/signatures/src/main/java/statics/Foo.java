@@ -16,14 +16,23 @@ public class Foo implements io.datawire.quark.runtime.QObject {
         return "statics.Foo";
     }
     public Object _getField(String name) {
-        if ((name)==("count") || ((Object)(name) != null && ((Object) (name)).equals("count"))) {
-            return Foo.count;
+        if (name != null) {
+            switch (name) {
+                case "count": {
+                    return Foo.count;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("count") || ((Object)(name) != null && ((Object) (name)).equals("count"))) {
-            Foo.count = (Integer) (value);
+        if (name != null) {
+            switch (name) {
+                case "count": {
+                    Foo.count = (Integer) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -16,20 +16,30 @@ public class Channel implements io.datawire.quark.runtime.QObject {
         return "slack.Channel";
     }
     public Object _getField(String name) {
-        if ((name)==("client") || ((Object)(name) != null && ((Object) (name)).equals("client"))) {
-            return (this).client;
-        }
-        if ((name)==("channel") || ((Object)(name) != null && ((Object) (name)).equals("channel"))) {
-            return (this).channel;
+        if (name != null) {
+            switch (name) {
+                case "client": {
+                    return (this).client;
+                }
+                case "channel": {
+                    return (this).channel;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("client") || ((Object)(name) != null && ((Object) (name)).equals("client"))) {
-            (this).client = (Client) (value);
-        }
-        if ((name)==("channel") || ((Object)(name) != null && ((Object) (name)).equals("channel"))) {
-            (this).channel = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "client": {
+                    (this).client = (Client) (value);
+                    return;
+                }
+                case "channel": {
+                    (this).channel = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
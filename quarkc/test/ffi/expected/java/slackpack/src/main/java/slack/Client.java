@@ -31,38 +31,51 @@ public class Client implements quark.WSHandler, quark.HTTPHandler, io.datawire.q
         return "slack.Client";
     }
     public Object _getField(String name) {
-        if ((name)==("runtime") || ((Object)(name) != null && ((Object) (name)).equals("runtime"))) {
-            return (this).runtime;
-        }
-        if ((name)==("token") || ((Object)(name) != null && ((Object) (name)).equals("token"))) {
-            return (this).token;
-        }
-        if ((name)==("handler") || ((Object)(name) != null && ((Object) (name)).equals("handler"))) {
-            return (this).handler;
-        }
-        if ((name)==("event_id") || ((Object)(name) != null && ((Object) (name)).equals("event_id"))) {
-            return (this).event_id;
-        }
-        if ((name)==("socket") || ((Object)(name) != null && ((Object) (name)).equals("socket"))) {
-            return (this).socket;
+        if (name != null) {
+            switch (name) {
+                case "runtime": {
+                    return (this).runtime;
+                }
+                case "token": {
+                    return (this).token;
+                }
+                case "handler": {
+                    return (this).handler;
+                }
+                case "event_id": {
+                    return (this).event_id;
+                }
+                case "socket": {
+                    return (this).socket;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("runtime") || ((Object)(name) != null && ((Object) (name)).equals("runtime"))) {
-            (this).runtime = (quark.Runtime) (value);
-        }
-        if ((name)==("token") || ((Object)(name) != null && ((Object) (name)).equals("token"))) {
-            (this).token = (String) (value);
-        }
-        if ((name)==("handler") || ((Object)(name) != null && ((Object) (name)).equals("handler"))) {
-            (this).handler = (SlackHandler) (value);
-        }
-        if ((name)==("event_id") || ((Object)(name) != null && ((Object) (name)).equals("event_id"))) {
-            (this).event_id = (Integer) (value);
-        }
-        if ((name)==("socket") || ((Object)(name) != null && ((Object) (name)).equals("socket"))) {
-            (this).socket = (quark.WebSocket) (value);
+        if (name != null) {
+            switch (name) {
+                case "runtime": {
+                    (this).runtime = (quark.Runtime) (value);
+                    return;
+                }
+                case "token": {
+                    (this).token = (String) (value);
+                    return;
+                }
+                case "handler": {
+                    (this).handler = (SlackHandler) (value);
+                    return;
+                }
+                case "event_id": {
+                    (this).event_id = (Integer) (value);
+                    return;
+                }
+                case "socket": {
+                    (this).socket = (quark.WebSocket) (value);
+                    return;
+                }
+            }
         }
     }
     /**
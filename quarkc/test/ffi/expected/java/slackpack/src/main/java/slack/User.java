@@ -12,20 +12,30 @@ public class User implements io.datawire.quark.runtime.QObject {
         return "slack.User";
     }
     public Object _getField(String name) {
-        if ((name)==("client") || ((Object)(name) != null && ((Object) (name)).equals("client"))) {
-            return (this).client;
-        }
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            return (this).user;
+        if (name != null) {
+            switch (name) {
+                case "client": {
+                    return (this).client;
+                }
+                case "user": {
+                    return (this).user;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("client") || ((Object)(name) != null && ((Object) (name)).equals("client"))) {
-            (this).client = (Client) (value);
-        }
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            (this).user = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "client": {
+                    (this).client = (Client) (value);
+                    return;
+                }
+                case "user": {
+                    (this).user = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
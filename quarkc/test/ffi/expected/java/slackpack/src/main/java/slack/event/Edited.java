@@ -12,20 +12,30 @@ public class Edited implements io.datawire.quark.runtime.QObject {
         return "slack.event.Edited";
     }
     public Object _getField(String name) {
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            return (this).user;
-        }
-        if ((name)==("timestamp") || ((Object)(name) != null && ((Object) (name)).equals("timestamp"))) {
-            return (this).timestamp;
+        if (name != null) {
+            switch (name) {
+                case "user": {
+                    return (this).user;
+                }
+                case "timestamp": {
+                    return (this).timestamp;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            (this).user = (slack.User) (value);
-        }
-        if ((name)==("timestamp") || ((Object)(name) != null && ((Object) (name)).equals("timestamp"))) {
-            (this).timestamp = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "user": {
+                    (this).user = (slack.User) (value);
+                    return;
+                }
+                case "timestamp": {
+                    (this).timestamp = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
@@ -13,32 +13,44 @@ public class Hello extends SlackEvent implements io.datawire.quark.runtime.QObje
         return "slack.event.Hello";
     }
     public Object _getField(String name) {
-        if ((name)==("type") || ((Object)(name) != null && ((Object) (name)).equals("type"))) {
-            return (this).type;
-        }
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            return (this).user;
-        }
-        if ((name)==("channel") || ((Object)(name) != null && ((Object) (name)).equals("channel"))) {
-            return (this).channel;
-        }
-        if ((name)==("timestamp") || ((Object)(name) != null && ((Object) (name)).equals("timestamp"))) {
-            return (this).timestamp;
+        if (name != null) {
+            switch (name) {
+                case "type": {
+                    return (this).type;
+                }
+                case "user": {
+                    return (this).user;
+                }
+                case "channel": {
+                    return (this).channel;
+                }
+                case "timestamp": {
+                    return (this).timestamp;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("type") || ((Object)(name) != null && ((Object) (name)).equals("type"))) {
-            (this).type = (String) (value);
-        }
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            (this).user = (slack.User) (value);
-        }
-        if ((name)==("channel") || ((Object)(name) != null && ((Object) (name)).equals("channel"))) {
-            (this).channel = (slack.Channel) (value);
-        }
-        if ((name)==("timestamp") || ((Object)(name) != null && ((Object) (name)).equals("timestamp"))) {
-            (this).timestamp = (String) (value);
+        if (name != null) {
+            switch (name) {
+                case "type": {
+                    (this).type = (String) (value);
+                    return;
+                }
+                case "user": {
+                    (this).user = (slack.User) (value);
+                    return;
+                }
+                case "channel": {
+                    (this).channel = (slack.Channel) (value);
+                    return;
+                }
+                case "timestamp": {
+                    (this).timestamp = (String) (value);
+                    return;
+                }
+            }
         }
     }
 }
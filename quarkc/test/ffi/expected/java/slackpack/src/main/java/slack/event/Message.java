@@ -21,56 +21,72 @@ public class Message extends SlackEvent implements io.datawire.quark.runtime.QOb
         return "slack.event.Message";
     }
     public Object _getField(String name) {
-        if ((name)==("type") || ((Object)(name) != null && ((Object) (name)).equals("type"))) {
-            return (this).type;
-        }
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            return (this).user;
-        }
-        if ((name)==("channel") || ((Object)(name) != null && ((Object) (name)).equals("channel"))) {
-            return (this).channel;
-        }
-        if ((name)==("timestamp") || ((Object)(name) != null && ((Object) (name)).equals("timestamp"))) {
-            return (this).timestamp;
-        }
-        if ((name)==("subtype") || ((Object)(name) != null && ((Object) (name)).equals("subtype"))) {
-            return (this).subtype;
-        }
-        if ((name)==("hidden") || ((Object)(name) != null && ((Object) (name)).equals("hidden"))) {
-            return (this).hidden;
-        }
-        if ((name)==("text") || ((Object)(name) != null && ((Object) (name)).equals("text"))) {
-            return (this).text;
-        }
-        if ((name)==("edited") || ((Object)(name) != null && ((Object) (name)).equals("edited"))) {
-            return (this).edited;
+        if (name != null) {
+            switch (name) {
+                case "type": {
+                    return (this).type;
+                }
+                case "user": {
+                    return (this).user;
+                }
+                case "channel": {
+                    return (this).channel;
+                }
+                case "timestamp": {
+                    return (this).timestamp;
+                }
+                case "subtype": {
+                    return (this).subtype;
+                }
+                case "hidden": {
+                    return (this).hidden;
+                }
+                case "text": {
+                    return (this).text;
+                }
+                case "edited": {
+                    return (this).edited;
+                }
+            }
         }
         return null;
     }
     public void _setField(String name, Object value) {
-        if ((name)==("type") || ((Object)(name) != null && ((Object) (name)).equals("type"))) {
-            (this).type = (String) (value);
-        }
-        if ((name)==("user") || ((Object)(name) != null && ((Object) (name)).equals("user"))) {
-            (this).user = (slack.User) (value);
-        }
-        if ((name)==("channel") || ((Object)(name) != null && ((Object) (name)).equals("channel"))) {
-            (this).channel = (slack.Channel) (value);
-        }
-        if ((name)==("timestamp") || ((Object)(name) != null && ((Object) (name)).equals("timestamp"))) {
-            (this).timestamp = (String) (value);
-        }
-        if ((name)==("subtype") || ((Object)(name) != null && ((Object) (name)).equals("subtype"))) {
-            (this).subtype = (String) (value);
-        }
-        if ((name)==("hidden") || ((Object)(name) != null && ((Object) (name)).equals("hidden"))) {
-            (this).hidden = (Boolean) (value);
-        }
-        if ((name)==("text") || ((Object)(name) != null && ((Object) (name)).equals("text"))) {
-            (this).text = (String) (value);
-        }
-        if ((name)==("edited") || ((Object)(name) != null && ((Object) (name)).equals("edited"))) {
-            (this).edited = (Edited) (value);
+        if (name != null) {
+            switch (name) {
+                case "type": {
+                    (this).type = (String) (value);
+                    return;
+                }
+                case "user": {
+                    (this).user = (slack.User) (value);
+                    return;
+                }
+                case "channel": {
+                    (this).channel = (slack.Channel) (value);
+                    return;
+                }
+                case "timestamp": {
+                    (this).timestamp = (String) (value);
+                    return;
+                }
+                case "subtype": {
+                    (this).subtype = (String) (value);
+                    return;
+                }
+                case "hidden": {
+                    (this).hidden = (Boolean) (value);
+                    return;
+                }
+                case "text": {
+                    (this).text = (String) (value);
+                    return;
+                }
+                case "edited": {
+                    (this).edited = (Edited) (value);
+                    return;
+                }
+            }
         }
     }
 }
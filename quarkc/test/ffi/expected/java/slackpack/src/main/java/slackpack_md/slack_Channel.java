@@ -16,6 +16,26 @@ public class slack_Channel extends quark.reflect.Class implements io.datawire.qu
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        slack.Channel obj = (slack.Channel) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).client);
+        quark.Functions._encodeString(json, "channel", (obj).channel);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        slack.Channel obj = (slack.Channel) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "client");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).client = (slack.Client) (quark.Functions._decodeField(this, 0, item));
+        }
+        item = quark.Functions._decodeItem(json, "channel");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).channel = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
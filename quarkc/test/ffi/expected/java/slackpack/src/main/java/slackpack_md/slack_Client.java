@@ -16,6 +16,41 @@ public class slack_Client extends quark.reflect.Class implements io.datawire.qua
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        slack.Client obj = (slack.Client) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).runtime);
+        quark.Functions._encodeString(json, "token", (obj).token);
+        quark.Functions._encodeField(json, this, 2, (obj).handler);
+        quark.Functions._encodeNumber(json, "event_id", (obj).event_id);
+        quark.Functions._encodeField(json, this, 4, (obj).socket);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        slack.Client obj = (slack.Client) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "runtime");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).runtime = (quark.Runtime) (quark.Functions._decodeField(this, 0, item));
+        }
+        item = quark.Functions._decodeItem(json, "token");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).token = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "handler");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).handler = (slack.SlackHandler) (quark.Functions._decodeField(this, 2, item));
+        }
+        item = quark.Functions._decodeItem(json, "event_id");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).event_id = quark.Functions._decodeInt(item);
+        }
+        item = quark.Functions._decodeItem(json, "socket");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).socket = (quark.WebSocket) (quark.Functions._decodeField(this, 4, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -16,6 +16,26 @@ public class slack_User extends quark.reflect.Class implements io.datawire.quark
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        slack.User obj = (slack.User) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).client);
+        quark.Functions._encodeString(json, "user", (obj).user);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        slack.User obj = (slack.User) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "client");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).client = (slack.Client) (quark.Functions._decodeField(this, 0, item));
+        }
+        item = quark.Functions._decodeItem(json, "user");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).user = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
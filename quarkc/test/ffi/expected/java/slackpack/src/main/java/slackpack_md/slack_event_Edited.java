@@ -16,6 +16,26 @@ public class slack_event_Edited extends quark.reflect.Class implements io.datawi
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        slack.event.Edited obj = (slack.event.Edited) (object);
+        quark.Functions._encodeField(json, this, 0, (obj).user);
+        quark.Functions._encodeString(json, "timestamp", (obj).timestamp);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        slack.event.Edited obj = (slack.event.Edited) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "user");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).user = (slack.User) (quark.Functions._decodeField(this, 0, item));
+        }
+        item = quark.Functions._decodeItem(json, "timestamp");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).timestamp = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
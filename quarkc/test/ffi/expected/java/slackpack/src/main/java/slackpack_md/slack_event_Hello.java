@@ -16,6 +16,36 @@ public class slack_event_Hello extends quark.reflect.Class implements io.datawir
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        slack.event.Hello obj = (slack.event.Hello) (object);
+        quark.Functions._encodeString(json, "type", (obj).type);
+        quark.Functions._encodeField(json, this, 1, (obj).user);
+        quark.Functions._encodeField(json, this, 2, (obj).channel);
+        quark.Functions._encodeString(json, "timestamp", (obj).timestamp);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        slack.event.Hello obj = (slack.event.Hello) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "type");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).type = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "user");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).user = (slack.User) (quark.Functions._decodeField(this, 1, item));
+        }
+        item = quark.Functions._decodeItem(json, "channel");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).channel = (slack.Channel) (quark.Functions._decodeField(this, 2, item));
+        }
+        item = quark.Functions._decodeItem(json, "timestamp");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).timestamp = quark.Functions._decodeString(item);
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
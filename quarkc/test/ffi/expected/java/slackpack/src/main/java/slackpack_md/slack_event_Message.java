@@ -16,6 +16,56 @@ public class slack_event_Message extends quark.reflect.Class implements io.dataw
     public Boolean isAbstract() {
         return false;
     }
+    public Boolean _encodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        quark.Functions._encodeString(json, "$class", (this).id);
+        slack.event.Message obj = (slack.event.Message) (object);
+        quark.Functions._encodeString(json, "type", (obj).type);
+        quark.Functions._encodeField(json, this, 1, (obj).user);
+        quark.Functions._encodeField(json, this, 2, (obj).channel);
+        quark.Functions._encodeString(json, "timestamp", (obj).timestamp);
+        quark.Functions._encodeString(json, "subtype", (obj).subtype);
+        quark.Functions._encodeField(json, this, 5, (obj).hidden);
+        quark.Functions._encodeString(json, "text", (obj).text);
+        quark.Functions._encodeField(json, this, 7, (obj).edited);
+        return true;
+    }
+    public Boolean _decodeFields(Object object, io.datawire.quark.runtime.JSONObject json) {
+        slack.event.Message obj = (slack.event.Message) (object);
+        io.datawire.quark.runtime.JSONObject item;
+        item = quark.Functions._decodeItem(json, "type");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).type = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "user");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).user = (slack.User) (quark.Functions._decodeField(this, 1, item));
+        }
+        item = quark.Functions._decodeItem(json, "channel");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).channel = (slack.Channel) (quark.Functions._decodeField(this, 2, item));
+        }
+        item = quark.Functions._decodeItem(json, "timestamp");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).timestamp = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "subtype");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).subtype = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "hidden");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).hidden = (Boolean) (quark.Functions._decodeField(this, 5, item));
+        }
+        item = quark.Functions._decodeItem(json, "text");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).text = quark.Functions._decodeString(item);
+        }
+        item = quark.Functions._decodeItem(json, "edited");
+        if (!((item)==(null) || ((Object)(item) != null && ((Object) (item)).equals(null)))) {
+            (obj).edited = (slack.event.Edited) (quark.Functions._decodeField(this, 7, item));
+        }
+        return true;
+    }
     public String _getClass() {
         return (String) (null);
     }
@@ -65,6 +65,17 @@ function org_example_foo_Foo_isAbstract() {
 }
 org_example_foo_Foo.prototype.isAbstract = org_example_foo_Foo_isAbstract;
 
+function org_example_foo_Foo__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+org_example_foo_Foo.prototype._encodeFields = org_example_foo_Foo__encodeFields;
+
+function org_example_foo_Foo__decodeFields(object, json) {
+    return true;
+}
+org_example_foo_Foo.prototype._decodeFields = org_example_foo_Foo__decodeFields;
+
 function org_example_foo_Foo__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -105,6 +116,11 @@ var org; _qrt.lazyImport('../org/index.js', function(){
     exports.org = org;
 });
 
+var quark; _qrt.lazyImport('quark', function(){
+    quark = require('quark').quark;
+    exports.quark = quark;
+});
+
 
 
 _qrt.pumpImports("org_example_foo_md/org_example_foo_Foo_test_Method");
@@ -65,6 +65,17 @@ function org_example_bar_Bar_isAbstract() {
 }
 org_example_bar_Bar.prototype.isAbstract = org_example_bar_Bar_isAbstract;
 
+function org_example_bar_Bar__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+org_example_bar_Bar.prototype._encodeFields = org_example_bar_Bar__encodeFields;
+
+function org_example_bar_Bar__decodeFields(object, json) {
+    return true;
+}
+org_example_bar_Bar.prototype._decodeFields = org_example_bar_Bar__decodeFields;
+
 function org_example_bar_Bar__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -105,6 +116,11 @@ var org; _qrt.lazyImport('../org/index.js', function(){
     exports.org = org;
 });
 
+var quark; _qrt.lazyImport('quark', function(){
+    quark = require('quark').quark;
+    exports.quark = quark;
+});
+
 
 
 _qrt.pumpImports("overlapping_namespace_md/org_example_bar_Bar_test_Method");
@@ -65,6 +65,25 @@ function test_Test_isAbstract() {
 }
 test_Test.prototype.isAbstract = test_Test_isAbstract;
 
+function test_Test__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return test.Test; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+test_Test.prototype._encodeFields = test_Test__encodeFields;
+
+function test_Test__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return test.Test; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+test_Test.prototype._decodeFields = test_Test__decodeFields;
+
 function test_Test__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -139,6 +158,25 @@ function test_subtest_Test_isAbstract() {
 }
 test_subtest_Test.prototype.isAbstract = test_subtest_Test_isAbstract;
 
+function test_subtest_Test__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return test.subtest.Test; });
+    quark._encodeNumber(json, "size", (obj).size);
+    return true;
+}
+test_subtest_Test.prototype._encodeFields = test_subtest_Test__encodeFields;
+
+function test_subtest_Test__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return test.subtest.Test; });
+    var item = null;
+    item = quark._decodeItem(json, "size");
+    if ((item) !== (null)) {
+        (obj).size = quark._decodeInt(item);
+    }
+    return true;
+}
+test_subtest_Test.prototype._decodeFields = test_subtest_Test__decodeFields;
+
 function test_subtest_Test__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -180,6 +218,11 @@ var test; _qrt.lazyImport('../test/index.js', function(){
     exports.test = test;
 });
 
+var quark; _qrt.lazyImport('quark', function(){
+    quark = require('quark').quark;
+    exports.quark = quark;
+});
+
 
 
 
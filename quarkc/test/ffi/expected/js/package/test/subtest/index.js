@@ -28,16 +28,21 @@ function Test__getClass() {
 Test.prototype._getClass = Test__getClass;
 
 function Test__getField(name) {
-    if (_qrt.equals((name), ("size"))) {
-        return (this).size;
+    switch (name) {
+        case "size": {
+            return (this).size;
+        }
     }
     return null;
 }
 Test.prototype._getField = Test__getField;
 
 function Test__setField(name, value) {
-    if (_qrt.equals((name), ("size"))) {
-        (this).size = _qrt.cast(value, function () { return Number; });
+    switch (name) {
+        case "size": {
+            (this).size = _qrt.cast(value, function () { return Number; });
+            return;
+        }
     }
 }
 Test.prototype._setField = Test__setField;
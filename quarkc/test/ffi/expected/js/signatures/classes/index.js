@@ -38,16 +38,21 @@ function Overload__getClass() {
 Overload.prototype._getClass = Overload__getClass;
 
 function Overload__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 Overload.prototype._getField = Overload__getField;
 
 function Overload__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Overload.prototype._setField = Overload__setField;
@@ -127,16 +132,21 @@ function test_size__getClass() {
 test_size.prototype._getClass = test_size__getClass;
 
 function test_size__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
     }
     return null;
 }
 test_size.prototype._getField = test_size__getField;
 
 function test_size__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 test_size.prototype._setField = test_size__setField;
@@ -172,22 +182,28 @@ function test_startsWith__getClass() {
 test_startsWith.prototype._getClass = test_startsWith__getClass;
 
 function test_startsWith__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
-    }
-    if (_qrt.equals((name), ("_that"))) {
-        return (this)._that;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
+        case "_that": {
+            return (this)._that;
+        }
     }
     return null;
 }
 test_startsWith.prototype._getField = test_startsWith__getField;
 
 function test_startsWith__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("_that"))) {
-        (this)._that = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "_that": {
+            (this)._that = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 test_startsWith.prototype._setField = test_startsWith__setField;
@@ -223,22 +239,28 @@ function test_endsWith__getClass() {
 test_endsWith.prototype._getClass = test_endsWith__getClass;
 
 function test_endsWith__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
-    }
-    if (_qrt.equals((name), ("_that"))) {
-        return (this)._that;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
+        case "_that": {
+            return (this)._that;
+        }
     }
     return null;
 }
 test_endsWith.prototype._getField = test_endsWith__getField;
 
 function test_endsWith__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("_that"))) {
-        (this)._that = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "_that": {
+            (this)._that = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 test_endsWith.prototype._setField = test_endsWith__setField;
@@ -274,22 +296,28 @@ function test_find__getClass() {
 test_find.prototype._getClass = test_find__getClass;
 
 function test_find__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
-    }
-    if (_qrt.equals((name), ("_that"))) {
-        return (this)._that;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
+        case "_that": {
+            return (this)._that;
+        }
     }
     return null;
 }
 test_find.prototype._getField = test_find__getField;
 
 function test_find__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("_that"))) {
-        (this)._that = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "_that": {
+            (this)._that = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 test_find.prototype._setField = test_find__setField;
@@ -326,28 +354,35 @@ function test_substring__getClass() {
 test_substring.prototype._getClass = test_substring__getClass;
 
 function test_substring__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
-    }
-    if (_qrt.equals((name), ("start"))) {
-        return (this).start;
-    }
-    if (_qrt.equals((name), ("end"))) {
-        return (this).end;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
+        case "start": {
+            return (this).start;
+        }
+        case "end": {
+            return (this).end;
+        }
     }
     return null;
 }
 test_substring.prototype._getField = test_substring__getField;
 
 function test_substring__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("start"))) {
-        (this).start = _qrt.cast(value, function () { return Number; });
-    }
-    if (_qrt.equals((name), ("end"))) {
-        (this).end = _qrt.cast(value, function () { return Number; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "start": {
+            (this).start = _qrt.cast(value, function () { return Number; });
+            return;
+        }
+        case "end": {
+            (this).end = _qrt.cast(value, function () { return Number; });
+            return;
+        }
     }
 }
 test_substring.prototype._setField = test_substring__setField;
@@ -384,28 +419,35 @@ function test_replace__getClass() {
 test_replace.prototype._getClass = test_replace__getClass;
 
 function test_replace__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
-    }
-    if (_qrt.equals((name), ("start"))) {
-        return (this).start;
-    }
-    if (_qrt.equals((name), ("end"))) {
-        return (this).end;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
+        case "start": {
+            return (this).start;
+        }
+        case "end": {
+            return (this).end;
+        }
     }
     return null;
 }
 test_replace.prototype._getField = test_replace__getField;
 
 function test_replace__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("start"))) {
-        (this).start = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("end"))) {
-        (this).end = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "start": {
+            (this).start = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "end": {
+            (this).end = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 test_replace.prototype._setField = test_replace__setField;
@@ -448,34 +490,42 @@ function test_join__getClass() {
 test_join.prototype._getClass = test_join__getClass;
 
 function test_join__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
-    }
-    if (_qrt.equals((name), ("parts"))) {
-        return (this).parts;
-    }
-    if (_qrt.equals((name), ("strparts"))) {
-        return (this).strparts;
-    }
-    if (_qrt.equals((name), ("sep"))) {
-        return (this).sep;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
+        case "parts": {
+            return (this).parts;
+        }
+        case "strparts": {
+            return (this).strparts;
+        }
+        case "sep": {
+            return (this).sep;
+        }
     }
     return null;
 }
 test_join.prototype._getField = test_join__getField;
 
 function test_join__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("parts"))) {
-        (this).parts = _qrt.cast(value, function () { return Array; });
-    }
-    if (_qrt.equals((name), ("strparts"))) {
-        (this).strparts = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("sep"))) {
-        (this).sep = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "parts": {
+            (this).parts = _qrt.cast(value, function () { return Array; });
+            return;
+        }
+        case "strparts": {
+            (this).strparts = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "sep": {
+            (this).sep = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 test_join.prototype._setField = test_join__setField;
@@ -512,28 +562,35 @@ function test_split__getClass() {
 test_split.prototype._getClass = test_split__getClass;
 
 function test_split__getField(name) {
-    if (_qrt.equals((name), ("what"))) {
-        return (this).what;
-    }
-    if (_qrt.equals((name), ("sep"))) {
-        return (this).sep;
-    }
-    if (_qrt.equals((name), ("altsep"))) {
-        return (this).altsep;
+    switch (name) {
+        case "what": {
+            return (this).what;
+        }
+        case "sep": {
+            return (this).sep;
+        }
+        case "altsep": {
+            return (this).altsep;
+        }
     }
     return null;
 }
 test_split.prototype._getField = test_split__getField;
 
 function test_split__setField(name, value) {
-    if (_qrt.equals((name), ("what"))) {
-        (this).what = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("sep"))) {
-        (this).sep = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("altsep"))) {
-        (this).altsep = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "what": {
+            (this).what = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "sep": {
+            (this).sep = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "altsep": {
+            (this).altsep = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 test_split.prototype._setField = test_split__setField;
@@ -43,16 +43,21 @@ function Test__getClass() {
 Test.prototype._getClass = Test__getClass;
 
 function Test__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 Test.prototype._getField = Test__getField;
 
 function Test__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Test.prototype._setField = Test__setField;
@@ -63,28 +63,35 @@ function Context__getClass() {
 Context.prototype._getClass = Context__getClass;
 
 function Context__getField(name) {
-    if (_qrt.equals((name), ("_global"))) {
-        return Context._global;
-    }
-    if (_qrt.equals((name), ("_current"))) {
-        return Context._current;
-    }
-    if (_qrt.equals((name), ("parent"))) {
-        return (this).parent;
+    switch (name) {
+        case "_global": {
+            return Context._global;
+        }
+        case "_current": {
+            return Context._current;
+        }
+        case "parent": {
+            return (this).parent;
+        }
     }
     return null;
 }
 Context.prototype._getField = Context__getField;
 
 function Context__setField(name, value) {
-    if (_qrt.equals((name), ("_global"))) {
-        Context._global = _qrt.cast(value, function () { return Context; });
-    }
-    if (_qrt.equals((name), ("_current"))) {
-        Context._current = _qrt.cast(value, function () { return TLS; });
-    }
-    if (_qrt.equals((name), ("parent"))) {
-        (this).parent = _qrt.cast(value, function () { return Context; });
+    switch (name) {
+        case "_global": {
+            Context._global = _qrt.cast(value, function () { return Context; });
+            return;
+        }
+        case "_current": {
+            Context._current = _qrt.cast(value, function () { return TLS; });
+            return;
+        }
+        case "parent": {
+            (this).parent = _qrt.cast(value, function () { return Context; });
+            return;
+        }
     }
 }
 Context.prototype._setField = Context__setField;
@@ -124,16 +131,21 @@ function TLS__getClass() {
 TLS.prototype._getClass = TLS__getClass;
 
 function TLS__getField(name) {
-    if (_qrt.equals((name), ("_value"))) {
-        return (this)._value;
+    switch (name) {
+        case "_value": {
+            return (this)._value;
+        }
     }
     return null;
 }
 TLS.prototype._getField = TLS__getField;
 
 function TLS__setField(name, value) {
-    if (_qrt.equals((name), ("_value"))) {
-        (this)._value = _qrt.cast(value, function () { return T; });
+    switch (name) {
+        case "_value": {
+            (this)._value = _qrt.cast(value, function () { return T; });
+            return;
+        }
     }
 }
 TLS.prototype._setField = TLS__setField;
@@ -28,16 +28,21 @@ function Box__getClass() {
 Box.prototype._getClass = Box__getClass;
 
 function Box__getField(name) {
-    if (_qrt.equals((name), ("contents"))) {
-        return (this).contents;
+    switch (name) {
+        case "contents": {
+            return (this).contents;
+        }
     }
     return null;
 }
 Box.prototype._getField = Box__getField;
 
 function Box__setField(name, value) {
-    if (_qrt.equals((name), ("contents"))) {
-        (this).contents = _qrt.cast(value, function () { return T; });
+    switch (name) {
+        case "contents": {
+            (this).contents = _qrt.cast(value, function () { return T; });
+            return;
+        }
     }
 }
 Box.prototype._setField = Box__setField;
@@ -36,16 +36,21 @@ function Box__getClass() {
 Box.prototype._getClass = Box__getClass;
 
 function Box__getField(name) {
-    if (_qrt.equals((name), ("contents"))) {
-        return (this).contents;
+    switch (name) {
+        case "contents": {
+            return (this).contents;
+        }
     }
     return null;
 }
 Box.prototype._getField = Box__getField;
 
 function Box__setField(name, value) {
-    if (_qrt.equals((name), ("contents"))) {
-        (this).contents = _qrt.cast(value, function () { return T; });
+    switch (name) {
+        case "contents": {
+            (this).contents = _qrt.cast(value, function () { return T; });
+            return;
+        }
     }
 }
 Box.prototype._setField = Box__setField;
@@ -78,22 +83,28 @@ function Crate__getClass() {
 Crate.prototype._getClass = Crate__getClass;
 
 function Crate__getField(name) {
-    if (_qrt.equals((name), ("box"))) {
-        return (this).box;
-    }
-    if (_qrt.equals((name), ("ibox"))) {
-        return (this).ibox;
+    switch (name) {
+        case "box": {
+            return (this).box;
+        }
+        case "ibox": {
+            return (this).ibox;
+        }
     }
     return null;
 }
 Crate.prototype._getField = Crate__getField;
 
 function Crate__setField(name, value) {
-    if (_qrt.equals((name), ("box"))) {
-        (this).box = _qrt.cast(value, function () { return Box; });
-    }
-    if (_qrt.equals((name), ("ibox"))) {
-        (this).ibox = _qrt.cast(value, function () { return Box; });
+    switch (name) {
+        case "box": {
+            (this).box = _qrt.cast(value, function () { return Box; });
+            return;
+        }
+        case "ibox": {
+            (this).ibox = _qrt.cast(value, function () { return Box; });
+            return;
+        }
     }
 }
 Crate.prototype._setField = Crate__setField;
@@ -115,16 +126,21 @@ function Sack__getClass() {
 Sack.prototype._getClass = Sack__getClass;
 
 function Sack__getField(name) {
-    if (_qrt.equals((name), ("ints"))) {
-        return (this).ints;
+    switch (name) {
+        case "ints": {
+            return (this).ints;
+        }
     }
     return null;
 }
 Sack.prototype._getField = Sack__getField;
 
 function Sack__setField(name, value) {
-    if (_qrt.equals((name), ("ints"))) {
-        (this).ints = _qrt.cast(value, function () { return Box; });
+    switch (name) {
+        case "ints": {
+            (this).ints = _qrt.cast(value, function () { return Box; });
+            return;
+        }
     }
 }
 Sack.prototype._setField = Sack__setField;
@@ -159,28 +175,35 @@ function Matrix__getClass() {
 Matrix.prototype._getClass = Matrix__getClass;
 
 function Matrix__getField(name) {
-    if (_qrt.equals((name), ("width"))) {
-        return (this).width;
-    }
-    if (_qrt.equals((name), ("height"))) {
-        return (this).height;
-    }
-    if (_qrt.equals((name), ("columns"))) {
-        return (this).columns;
+    switch (name) {
+        case "width": {
+            return (this).width;
+        }
+        case "height": {
+            return (this).height;
+        }
+        case "columns": {
+            return (this).columns;
+        }
     }
     return null;
 }
 Matrix.prototype._getField = Matrix__getField;
 
 function Matrix__setField(name, value) {
-    if (_qrt.equals((name), ("width"))) {
-        (this).width = _qrt.cast(value, function () { return Number; });
-    }
-    if (_qrt.equals((name), ("height"))) {
-        (this).height = _qrt.cast(value, function () { return Number; });
-    }
-    if (_qrt.equals((name), ("columns"))) {
-        (this).columns = _qrt.cast(value, function () { return Array; });
+    switch (name) {
+        case "width": {
+            (this).width = _qrt.cast(value, function () { return Number; });
+            return;
+        }
+        case "height": {
+            (this).height = _qrt.cast(value, function () { return Number; });
+            return;
+        }
+        case "columns": {
+            (this).columns = _qrt.cast(value, function () { return Array; });
+            return;
+        }
     }
 }
 Matrix.prototype._setField = Matrix__setField;
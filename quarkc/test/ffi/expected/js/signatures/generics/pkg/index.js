@@ -72,16 +72,21 @@ function Box__getClass() {
 Box.prototype._getClass = Box__getClass;
 
 function Box__getField(name) {
-    if (_qrt.equals((name), ("contents"))) {
-        return (this).contents;
+    switch (name) {
+        case "contents": {
+            return (this).contents;
+        }
     }
     return null;
 }
 Box.prototype._getField = Box__getField;
 
 function Box__setField(name, value) {
-    if (_qrt.equals((name), ("contents"))) {
-        (this).contents = _qrt.cast(value, function () { return T; });
+    switch (name) {
+        case "contents": {
+            (this).contents = _qrt.cast(value, function () { return T; });
+            return;
+        }
     }
 }
 Box.prototype._setField = Box__setField;
@@ -106,16 +111,21 @@ function StringBox__getClass() {
 StringBox.prototype._getClass = StringBox__getClass;
 
 function StringBox__getField(name) {
-    if (_qrt.equals((name), ("contents"))) {
-        return (this).contents;
+    switch (name) {
+        case "contents": {
+            return (this).contents;
+        }
     }
     return null;
 }
 StringBox.prototype._getField = StringBox__getField;
 
 function StringBox__setField(name, value) {
-    if (_qrt.equals((name), ("contents"))) {
-        (this).contents = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "contents": {
+            (this).contents = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 StringBox.prototype._setField = StringBox__setField;
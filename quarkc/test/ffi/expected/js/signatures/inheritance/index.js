@@ -32,16 +32,21 @@ function Base__getClass() {
 Base.prototype._getClass = Base__getClass;
 
 function Base__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 Base.prototype._getField = Base__getField;
 
 function Base__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Base.prototype._setField = Base__setField;
@@ -67,28 +72,35 @@ function Test__getClass() {
 Test.prototype._getClass = Test__getClass;
 
 function Test__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
-    }
-    if (_qrt.equals((name), ("mumble"))) {
-        return (this).mumble;
-    }
-    if (_qrt.equals((name), ("later"))) {
-        return (this).later;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
+        case "mumble": {
+            return (this).mumble;
+        }
+        case "later": {
+            return (this).later;
+        }
     }
     return null;
 }
 Test.prototype._getField = Test__getField;
 
 function Test__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("mumble"))) {
-        (this).mumble = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("later"))) {
-        (this).later = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "mumble": {
+            (this).mumble = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "later": {
+            (this).later = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Test.prototype._setField = Test__setField;
@@ -111,16 +123,21 @@ function A__getClass() {
 A.prototype._getClass = A__getClass;
 
 function A__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 A.prototype._getField = A__getField;
 
 function A__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 A.prototype._setField = A__setField;
@@ -147,16 +164,21 @@ function B__getClass() {
 B.prototype._getClass = B__getClass;
 
 function B__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 B.prototype._getField = B__getField;
 
 function B__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 B.prototype._setField = B__setField;
@@ -183,16 +205,21 @@ function C__getClass() {
 C.prototype._getClass = C__getClass;
 
 function C__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 C.prototype._getField = C__getField;
 
 function C__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 C.prototype._setField = C__setField;
@@ -242,16 +269,21 @@ function Y__getClass() {
 Y.prototype._getClass = Y__getClass;
 
 function Y__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 Y.prototype._getField = Y__getField;
 
 function Y__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Y.prototype._setField = Y__setField;
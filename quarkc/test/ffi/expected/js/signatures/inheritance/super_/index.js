@@ -26,16 +26,21 @@ function A__getClass() {
 A.prototype._getClass = A__getClass;
 
 function A__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 A.prototype._getField = A__getField;
 
 function A__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 A.prototype._setField = A__setField;
@@ -62,16 +67,21 @@ function B__getClass() {
 B.prototype._getClass = B__getClass;
 
 function B__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 B.prototype._getField = B__getField;
 
 function B__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 B.prototype._setField = B__setField;
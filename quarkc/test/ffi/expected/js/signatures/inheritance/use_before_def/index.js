@@ -47,16 +47,21 @@ function Foo__getClass() {
 Foo.prototype._getClass = Foo__getClass;
 
 function Foo__getField(name) {
-    if (_qrt.equals((name), ("name"))) {
-        return (this).name;
+    switch (name) {
+        case "name": {
+            return (this).name;
+        }
     }
     return null;
 }
 Foo.prototype._getField = Foo__getField;
 
 function Foo__setField(name, value) {
-    if (_qrt.equals((name), ("name"))) {
-        (this).name = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "name": {
+            (this).name = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Foo.prototype._setField = Foo__setField;
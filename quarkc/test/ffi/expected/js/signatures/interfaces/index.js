@@ -361,8 +361,10 @@ function Constants__getClass() {
 Constants.prototype._getClass = Constants__getClass;
 
 function Constants__getField(name) {
-    if (_qrt.equals((name), ("FOO"))) {
-        return IConstants.FOO;
+    switch (name) {
+        case "FOO": {
+            return IConstants.FOO;
+        }
     }
     return null;
 }
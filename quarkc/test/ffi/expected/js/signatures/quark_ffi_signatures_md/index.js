@@ -97,6 +97,25 @@ function generics_Box_quark_Object__isAbstract() {
 }
 generics_Box_quark_Object_.prototype.isAbstract = generics_Box_quark_Object__isAbstract;
 
+function generics_Box_quark_Object___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.Box; });
+    quark._encodeField(json, this, 0, (obj).contents);
+    return true;
+}
+generics_Box_quark_Object_.prototype._encodeFields = generics_Box_quark_Object___encodeFields;
+
+function generics_Box_quark_Object___decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.Box; });
+    var item = null;
+    item = quark._decodeItem(json, "contents");
+    if ((item) !== (null)) {
+        (obj).contents = _qrt.cast(quark._decodeField(this, 0, item), function () { return T; });
+    }
+    return true;
+}
+generics_Box_quark_Object_.prototype._decodeFields = generics_Box_quark_Object___decodeFields;
+
 function generics_Box_quark_Object___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -203,6 +222,25 @@ function generics_Box_quark_int__isAbstract() {
 }
 generics_Box_quark_int_.prototype.isAbstract = generics_Box_quark_int__isAbstract;
 
+function generics_Box_quark_int___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.Box; });
+    quark._encodeField(json, this, 0, (obj).contents);
+    return true;
+}
+generics_Box_quark_int_.prototype._encodeFields = generics_Box_quark_int___encodeFields;
+
+function generics_Box_quark_int___decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.Box; });
+    var item = null;
+    item = quark._decodeItem(json, "contents");
+    if ((item) !== (null)) {
+        (obj).contents = _qrt.cast(quark._decodeField(this, 0, item), function () { return Number; });
+    }
+    return true;
+}
+generics_Box_quark_int_.prototype._decodeFields = generics_Box_quark_int___decodeFields;
+
 function generics_Box_quark_int___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -309,6 +347,30 @@ function generics_Crate_quark_Object__isAbstract() {
 }
 generics_Crate_quark_Object_.prototype.isAbstract = generics_Crate_quark_Object__isAbstract;
 
+function generics_Crate_quark_Object___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.Crate; });
+    quark._encodeField(json, this, 0, (obj).box);
+    quark._encodeField(json, this, 1, (obj).ibox);
+    return true;
+}
+generics_Crate_quark_Object_.prototype._encodeFields = generics_Crate_quark_Object___encodeFields;
+
+function generics_Crate_quark_Object___decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.Crate; });
+    var item = null;
+    item = quark._decodeItem(json, "box");
+    if ((item) !== (null)) {
+        (obj).box = _qrt.cast(quark._decodeField(this, 0, item), function () { return generics.Box; });
+    }
+    item = quark._decodeItem(json, "ibox");
+    if ((item) !== (null)) {
+        (obj).ibox = _qrt.cast(quark._decodeField(this, 1, item), function () { return generics.Box; });
+    }
+    return true;
+}
+generics_Crate_quark_Object_.prototype._decodeFields = generics_Crate_quark_Object___decodeFields;
+
 function generics_Crate_quark_Object___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -350,6 +412,25 @@ function generics_Sack_isAbstract() {
 }
 generics_Sack.prototype.isAbstract = generics_Sack_isAbstract;
 
+function generics_Sack__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.Sack; });
+    quark._encodeField(json, this, 0, (obj).ints);
+    return true;
+}
+generics_Sack.prototype._encodeFields = generics_Sack__encodeFields;
+
+function generics_Sack__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.Sack; });
+    var item = null;
+    item = quark._decodeItem(json, "ints");
+    if ((item) !== (null)) {
+        (obj).ints = _qrt.cast(quark._decodeField(this, 0, item), function () { return generics.Box; });
+    }
+    return true;
+}
+generics_Sack.prototype._decodeFields = generics_Sack__decodeFields;
+
 function generics_Sack__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -456,6 +537,35 @@ function generics_Matrix_quark_Object__isAbstract() {
 }
 generics_Matrix_quark_Object_.prototype.isAbstract = generics_Matrix_quark_Object__isAbstract;
 
+function generics_Matrix_quark_Object___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.Matrix; });
+    quark._encodeNumber(json, "width", (obj).width);
+    quark._encodeNumber(json, "height", (obj).height);
+    quark._encodeField(json, this, 2, (obj).columns);
+    return true;
+}
+generics_Matrix_quark_Object_.prototype._encodeFields = generics_Matrix_quark_Object___encodeFields;
+
+function generics_Matrix_quark_Object___decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.Matrix; });
+    var item = null;
+    item = quark._decodeItem(json, "width");
+    if ((item) !== (null)) {
+        (obj).width = quark._decodeInt(item);
+    }
+    item = quark._decodeItem(json, "height");
+    if ((item) !== (null)) {
+        (obj).height = quark._decodeInt(item);
+    }
+    item = quark._decodeItem(json, "columns");
+    if ((item) !== (null)) {
+        (obj).columns = _qrt.cast(quark._decodeField(this, 2, item), function () { return Array; });
+    }
+    return true;
+}
+generics_Matrix_quark_Object_.prototype._decodeFields = generics_Matrix_quark_Object___decodeFields;
+
 function generics_Matrix_quark_Object___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -529,6 +639,25 @@ function generics_constructors_Box_quark_Object__isAbstract() {
 }
 generics_constructors_Box_quark_Object_.prototype.isAbstract = generics_constructors_Box_quark_Object__isAbstract;
 
+function generics_constructors_Box_quark_Object___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.constructors.Box; });
+    quark._encodeField(json, this, 0, (obj).contents);
+    return true;
+}
+generics_constructors_Box_quark_Object_.prototype._encodeFields = generics_constructors_Box_quark_Object___encodeFields;
+
+function generics_constructors_Box_quark_Object___decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.constructors.Box; });
+    var item = null;
+    item = quark._decodeItem(json, "contents");
+    if ((item) !== (null)) {
+        (obj).contents = _qrt.cast(quark._decodeField(this, 0, item), function () { return T; });
+    }
+    return true;
+}
+generics_constructors_Box_quark_Object_.prototype._decodeFields = generics_constructors_Box_quark_Object___decodeFields;
+
 function generics_constructors_Box_quark_Object___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -739,6 +868,17 @@ function generics_pkg_StringFoo_isAbstract() {
 }
 generics_pkg_StringFoo.prototype.isAbstract = generics_pkg_StringFoo_isAbstract;
 
+function generics_pkg_StringFoo__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+generics_pkg_StringFoo.prototype._encodeFields = generics_pkg_StringFoo__encodeFields;
+
+function generics_pkg_StringFoo__decodeFields(object, json) {
+    return true;
+}
+generics_pkg_StringFoo.prototype._decodeFields = generics_pkg_StringFoo__decodeFields;
+
 function generics_pkg_StringFoo__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -780,6 +920,25 @@ function generics_pkg_Box_quark_String__isAbstract() {
 }
 generics_pkg_Box_quark_String_.prototype.isAbstract = generics_pkg_Box_quark_String__isAbstract;
 
+function generics_pkg_Box_quark_String___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.pkg.Box; });
+    quark._encodeField(json, this, 0, (obj).contents);
+    return true;
+}
+generics_pkg_Box_quark_String_.prototype._encodeFields = generics_pkg_Box_quark_String___encodeFields;
+
+function generics_pkg_Box_quark_String___decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.pkg.Box; });
+    var item = null;
+    item = quark._decodeItem(json, "contents");
+    if ((item) !== (null)) {
+        (obj).contents = _qrt.cast(quark._decodeField(this, 0, item), function () { return String; });
+    }
+    return true;
+}
+generics_pkg_Box_quark_String_.prototype._decodeFields = generics_pkg_Box_quark_String___decodeFields;
+
 function generics_pkg_Box_quark_String___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -821,6 +980,25 @@ function generics_pkg_StringBox_isAbstract() {
 }
 generics_pkg_StringBox.prototype.isAbstract = generics_pkg_StringBox_isAbstract;
 
+function generics_pkg_StringBox__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.pkg.StringBox; });
+    quark._encodeField(json, this, 0, (obj).contents);
+    return true;
+}
+generics_pkg_StringBox.prototype._encodeFields = generics_pkg_StringBox__encodeFields;
+
+function generics_pkg_StringBox__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.pkg.StringBox; });
+    var item = null;
+    item = quark._decodeItem(json, "contents");
+    if ((item) !== (null)) {
+        (obj).contents = _qrt.cast(quark._decodeField(this, 0, item), function () { return String; });
+    }
+    return true;
+}
+generics_pkg_StringBox.prototype._decodeFields = generics_pkg_StringBox__decodeFields;
+
 function generics_pkg_StringBox__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -894,6 +1072,17 @@ function generics_ccc_TLSContextInitializer_isAbstract() {
 }
 generics_ccc_TLSContextInitializer.prototype.isAbstract = generics_ccc_TLSContextInitializer_isAbstract;
 
+function generics_ccc_TLSContextInitializer__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+generics_ccc_TLSContextInitializer.prototype._encodeFields = generics_ccc_TLSContextInitializer__encodeFields;
+
+function generics_ccc_TLSContextInitializer__decodeFields(object, json) {
+    return true;
+}
+generics_ccc_TLSContextInitializer.prototype._decodeFields = generics_ccc_TLSContextInitializer__decodeFields;
+
 function generics_ccc_TLSContextInitializer__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -999,6 +1188,25 @@ function generics_ccc_Context_isAbstract() {
 }
 generics_ccc_Context.prototype.isAbstract = generics_ccc_Context_isAbstract;
 
+function generics_ccc_Context__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return generics.ccc.Context; });
+    quark._encodeField(json, this, 2, (obj).parent);
+    return true;
+}
+generics_ccc_Context.prototype._encodeFields = generics_ccc_Context__encodeFields;
+
+function generics_ccc_Context__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return generics.ccc.Context; });
+    var item = null;
+    item = quark._decodeItem(json, "parent");
+    if ((item) !== (null)) {
+        (obj).parent = _qrt.cast(quark._decodeField(this, 2, item), function () { return generics.ccc.Context; });
+    }
+    return true;
+}
+generics_ccc_Context.prototype._decodeFields = generics_ccc_Context__decodeFields;
+
 function generics_ccc_Context__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1145,6 +1353,17 @@ function generics_ccc_TLS_generics_ccc_Context__isAbstract() {
 }
 generics_ccc_TLS_generics_ccc_Context_.prototype.isAbstract = generics_ccc_TLS_generics_ccc_Context__isAbstract;
 
+function generics_ccc_TLS_generics_ccc_Context___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+generics_ccc_TLS_generics_ccc_Context_.prototype._encodeFields = generics_ccc_TLS_generics_ccc_Context___encodeFields;
+
+function generics_ccc_TLS_generics_ccc_Context___decodeFields(object, json) {
+    return true;
+}
+generics_ccc_TLS_generics_ccc_Context_.prototype._decodeFields = generics_ccc_TLS_generics_ccc_Context___decodeFields;
+
 function generics_ccc_TLS_generics_ccc_Context___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1186,6 +1405,25 @@ function inheritance_Base_isAbstract() {
 }
 inheritance_Base.prototype.isAbstract = inheritance_Base_isAbstract;
 
+function inheritance_Base__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.Base; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_Base.prototype._encodeFields = inheritance_Base__encodeFields;
+
+function inheritance_Base__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.Base; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_Base.prototype._decodeFields = inheritance_Base__decodeFields;
+
 function inheritance_Base__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1227,6 +1465,35 @@ function inheritance_Test_isAbstract() {
 }
 inheritance_Test.prototype.isAbstract = inheritance_Test_isAbstract;
 
+function inheritance_Test__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.Test; });
+    quark._encodeString(json, "name", (obj).name);
+    quark._encodeString(json, "mumble", (obj).mumble);
+    quark._encodeString(json, "later", (obj).later);
+    return true;
+}
+inheritance_Test.prototype._encodeFields = inheritance_Test__encodeFields;
+
+function inheritance_Test__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.Test; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "mumble");
+    if ((item) !== (null)) {
+        (obj).mumble = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "later");
+    if ((item) !== (null)) {
+        (obj).later = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_Test.prototype._decodeFields = inheritance_Test__decodeFields;
+
 function inheritance_Test__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1268,6 +1535,25 @@ function inheritance_A_isAbstract() {
 }
 inheritance_A.prototype.isAbstract = inheritance_A_isAbstract;
 
+function inheritance_A__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.A; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_A.prototype._encodeFields = inheritance_A__encodeFields;
+
+function inheritance_A__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.A; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_A.prototype._decodeFields = inheritance_A__decodeFields;
+
 function inheritance_A__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1342,6 +1628,25 @@ function inheritance_B_isAbstract() {
 }
 inheritance_B.prototype.isAbstract = inheritance_B_isAbstract;
 
+function inheritance_B__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.B; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_B.prototype._encodeFields = inheritance_B__encodeFields;
+
+function inheritance_B__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.B; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_B.prototype._decodeFields = inheritance_B__decodeFields;
+
 function inheritance_B__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1416,6 +1721,25 @@ function inheritance_C_isAbstract() {
 }
 inheritance_C.prototype.isAbstract = inheritance_C_isAbstract;
 
+function inheritance_C__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.C; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_C.prototype._encodeFields = inheritance_C__encodeFields;
+
+function inheritance_C__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.C; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_C.prototype._decodeFields = inheritance_C__decodeFields;
+
 function inheritance_C__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1457,6 +1781,17 @@ function inheritance_X_isAbstract() {
 }
 inheritance_X.prototype.isAbstract = inheritance_X_isAbstract;
 
+function inheritance_X__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_X.prototype._encodeFields = inheritance_X__encodeFields;
+
+function inheritance_X__decodeFields(object, json) {
+    return true;
+}
+inheritance_X.prototype._decodeFields = inheritance_X__decodeFields;
+
 function inheritance_X__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1531,6 +1866,25 @@ function inheritance_Y_isAbstract() {
 }
 inheritance_Y.prototype.isAbstract = inheritance_Y_isAbstract;
 
+function inheritance_Y__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.Y; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_Y.prototype._encodeFields = inheritance_Y__encodeFields;
+
+function inheritance_Y__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.Y; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_Y.prototype._decodeFields = inheritance_Y__decodeFields;
+
 function inheritance_Y__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1605,6 +1959,17 @@ function inheritance_t1_A_isAbstract() {
 }
 inheritance_t1_A.prototype.isAbstract = inheritance_t1_A_isAbstract;
 
+function inheritance_t1_A__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_t1_A.prototype._encodeFields = inheritance_t1_A__encodeFields;
+
+function inheritance_t1_A__decodeFields(object, json) {
+    return true;
+}
+inheritance_t1_A.prototype._decodeFields = inheritance_t1_A__decodeFields;
+
 function inheritance_t1_A__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1679,6 +2044,17 @@ function inheritance_t1_B_isAbstract() {
 }
 inheritance_t1_B.prototype.isAbstract = inheritance_t1_B_isAbstract;
 
+function inheritance_t1_B__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_t1_B.prototype._encodeFields = inheritance_t1_B__encodeFields;
+
+function inheritance_t1_B__decodeFields(object, json) {
+    return true;
+}
+inheritance_t1_B.prototype._decodeFields = inheritance_t1_B__decodeFields;
+
 function inheritance_t1_B__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1753,6 +2129,17 @@ function inheritance_t1_C_isAbstract() {
 }
 inheritance_t1_C.prototype.isAbstract = inheritance_t1_C_isAbstract;
 
+function inheritance_t1_C__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_t1_C.prototype._encodeFields = inheritance_t1_C__encodeFields;
+
+function inheritance_t1_C__decodeFields(object, json) {
+    return true;
+}
+inheritance_t1_C.prototype._decodeFields = inheritance_t1_C__decodeFields;
+
 function inheritance_t1_C__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1794,6 +2181,17 @@ function inheritance_t2_A_isAbstract() {
 }
 inheritance_t2_A.prototype.isAbstract = inheritance_t2_A_isAbstract;
 
+function inheritance_t2_A__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_t2_A.prototype._encodeFields = inheritance_t2_A__encodeFields;
+
+function inheritance_t2_A__decodeFields(object, json) {
+    return true;
+}
+inheritance_t2_A.prototype._decodeFields = inheritance_t2_A__decodeFields;
+
 function inheritance_t2_A__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1835,6 +2233,17 @@ function inheritance_t2_B_isAbstract() {
 }
 inheritance_t2_B.prototype.isAbstract = inheritance_t2_B_isAbstract;
 
+function inheritance_t2_B__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_t2_B.prototype._encodeFields = inheritance_t2_B__encodeFields;
+
+function inheritance_t2_B__decodeFields(object, json) {
+    return true;
+}
+inheritance_t2_B.prototype._decodeFields = inheritance_t2_B__decodeFields;
+
 function inheritance_t2_B__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1876,6 +2285,17 @@ function inheritance_t2_X_quark_int__isAbstract() {
 }
 inheritance_t2_X_quark_int_.prototype.isAbstract = inheritance_t2_X_quark_int__isAbstract;
 
+function inheritance_t2_X_quark_int___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_t2_X_quark_int_.prototype._encodeFields = inheritance_t2_X_quark_int___encodeFields;
+
+function inheritance_t2_X_quark_int___decodeFields(object, json) {
+    return true;
+}
+inheritance_t2_X_quark_int_.prototype._decodeFields = inheritance_t2_X_quark_int___decodeFields;
+
 function inheritance_t2_X_quark_int___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1917,6 +2337,17 @@ function inheritance_t2_Y_isAbstract() {
 }
 inheritance_t2_Y.prototype.isAbstract = inheritance_t2_Y_isAbstract;
 
+function inheritance_t2_Y__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_t2_Y.prototype._encodeFields = inheritance_t2_Y__encodeFields;
+
+function inheritance_t2_Y__decodeFields(object, json) {
+    return true;
+}
+inheritance_t2_Y.prototype._decodeFields = inheritance_t2_Y__decodeFields;
+
 function inheritance_t2_Y__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2065,6 +2496,17 @@ function inheritance_pets_Cat_isAbstract() {
 }
 inheritance_pets_Cat.prototype.isAbstract = inheritance_pets_Cat_isAbstract;
 
+function inheritance_pets_Cat__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_pets_Cat.prototype._encodeFields = inheritance_pets_Cat__encodeFields;
+
+function inheritance_pets_Cat__decodeFields(object, json) {
+    return true;
+}
+inheritance_pets_Cat.prototype._decodeFields = inheritance_pets_Cat__decodeFields;
+
 function inheritance_pets_Cat__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2139,6 +2581,17 @@ function inheritance_pets_Dog_isAbstract() {
 }
 inheritance_pets_Dog.prototype.isAbstract = inheritance_pets_Dog_isAbstract;
 
+function inheritance_pets_Dog__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_pets_Dog.prototype._encodeFields = inheritance_pets_Dog__encodeFields;
+
+function inheritance_pets_Dog__decodeFields(object, json) {
+    return true;
+}
+inheritance_pets_Dog.prototype._decodeFields = inheritance_pets_Dog__decodeFields;
+
 function inheritance_pets_Dog__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2212,6 +2665,17 @@ function inheritance_Message_isAbstract() {
 }
 inheritance_Message.prototype.isAbstract = inheritance_Message_isAbstract;
 
+function inheritance_Message__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_Message.prototype._encodeFields = inheritance_Message__encodeFields;
+
+function inheritance_Message__decodeFields(object, json) {
+    return true;
+}
+inheritance_Message.prototype._decodeFields = inheritance_Message__decodeFields;
+
 function inheritance_Message__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2285,6 +2749,17 @@ function inheritance_Ping_isAbstract() {
 }
 inheritance_Ping.prototype.isAbstract = inheritance_Ping_isAbstract;
 
+function inheritance_Ping__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_Ping.prototype._encodeFields = inheritance_Ping__encodeFields;
+
+function inheritance_Ping__decodeFields(object, json) {
+    return true;
+}
+inheritance_Ping.prototype._decodeFields = inheritance_Ping__decodeFields;
+
 function inheritance_Ping__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2390,6 +2865,17 @@ function inheritance_Pong_isAbstract() {
 }
 inheritance_Pong.prototype.isAbstract = inheritance_Pong_isAbstract;
 
+function inheritance_Pong__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_Pong.prototype._encodeFields = inheritance_Pong__encodeFields;
+
+function inheritance_Pong__decodeFields(object, json) {
+    return true;
+}
+inheritance_Pong.prototype._decodeFields = inheritance_Pong__decodeFields;
+
 function inheritance_Pong__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2464,6 +2950,25 @@ function inheritance_super__A_isAbstract() {
 }
 inheritance_super__A.prototype.isAbstract = inheritance_super__A_isAbstract;
 
+function inheritance_super__A__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.super_.A; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_super__A.prototype._encodeFields = inheritance_super__A__encodeFields;
+
+function inheritance_super__A__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.super_.A; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_super__A.prototype._decodeFields = inheritance_super__A__decodeFields;
+
 function inheritance_super__A__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2538,6 +3043,25 @@ function inheritance_super__B_isAbstract() {
 }
 inheritance_super__B.prototype.isAbstract = inheritance_super__B_isAbstract;
 
+function inheritance_super__B__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.super_.B; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_super__B.prototype._encodeFields = inheritance_super__B__encodeFields;
+
+function inheritance_super__B__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.super_.B; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_super__B.prototype._decodeFields = inheritance_super__B__decodeFields;
+
 function inheritance_super__B__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2612,6 +3136,17 @@ function inheritance_use_before_def_Bar_isAbstract() {
 }
 inheritance_use_before_def_Bar.prototype.isAbstract = inheritance_use_before_def_Bar_isAbstract;
 
+function inheritance_use_before_def_Bar__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+inheritance_use_before_def_Bar.prototype._encodeFields = inheritance_use_before_def_Bar__encodeFields;
+
+function inheritance_use_before_def_Bar__decodeFields(object, json) {
+    return true;
+}
+inheritance_use_before_def_Bar.prototype._decodeFields = inheritance_use_before_def_Bar__decodeFields;
+
 function inheritance_use_before_def_Bar__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -2653,6 +3188,25 @@ function inheritance_use_before_def_Foo_isAbstract() {
 }
 inheritance_use_before_def_Foo.prototype.isAbstract = inheritance_use_before_def_Foo_isAbstract;
 
+function inheritance_use_before_def_Foo__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return inheritance.use_before_def.Foo; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+inheritance_use_before_def_Foo.prototype._encodeFields = inheritance_use_before_def_Foo__encodeFields;
+
+function inheritance_use_before_def_Foo__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return inheritance.use_before_def.Foo; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+inheritance_use_before_def_Foo.prototype._decodeFields = inheritance_use_before_def_Foo__decodeFields;
+
 function inheritance_use_before_def_Foo__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -3015,6 +3569,17 @@ function interfaces_T1_isAbstract() {
 }
 interfaces_T1.prototype.isAbstract = interfaces_T1_isAbstract;
 
+function interfaces_T1__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_T1.prototype._encodeFields = interfaces_T1__encodeFields;
+
+function interfaces_T1__decodeFields(object, json) {
+    return true;
+}
+interfaces_T1.prototype._decodeFields = interfaces_T1__decodeFields;
+
 function interfaces_T1__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -3122,6 +3687,17 @@ function interfaces_T2_isAbstract() {
 }
 interfaces_T2.prototype.isAbstract = interfaces_T2_isAbstract;
 
+function interfaces_T2__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_T2.prototype._encodeFields = interfaces_T2__encodeFields;
+
+function interfaces_T2__decodeFields(object, json) {
+    return true;
+}
+interfaces_T2.prototype._decodeFields = interfaces_T2__decodeFields;
+
 function interfaces_T2__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -3229,6 +3805,17 @@ function interfaces_T3_isAbstract() {
 }
 interfaces_T3.prototype.isAbstract = interfaces_T3_isAbstract;
 
+function interfaces_T3__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_T3.prototype._encodeFields = interfaces_T3__encodeFields;
+
+function interfaces_T3__decodeFields(object, json) {
+    return true;
+}
+interfaces_T3.prototype._decodeFields = interfaces_T3__decodeFields;
+
 function interfaces_T3__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -3336,6 +3923,17 @@ function interfaces_T4_isAbstract() {
 }
 interfaces_T4.prototype.isAbstract = interfaces_T4_isAbstract;
 
+function interfaces_T4__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_T4.prototype._encodeFields = interfaces_T4__encodeFields;
+
+function interfaces_T4__decodeFields(object, json) {
+    return true;
+}
+interfaces_T4.prototype._decodeFields = interfaces_T4__decodeFields;
+
 function interfaces_T4__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -3443,6 +4041,17 @@ function interfaces_T5_isAbstract() {
 }
 interfaces_T5.prototype.isAbstract = interfaces_T5_isAbstract;
 
+function interfaces_T5__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_T5.prototype._encodeFields = interfaces_T5__encodeFields;
+
+function interfaces_T5__decodeFields(object, json) {
+    return true;
+}
+interfaces_T5.prototype._decodeFields = interfaces_T5__decodeFields;
+
 function interfaces_T5__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -3863,6 +4472,17 @@ function interfaces_Baz_isAbstract() {
 }
 interfaces_Baz.prototype.isAbstract = interfaces_Baz_isAbstract;
 
+function interfaces_Baz__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_Baz.prototype._encodeFields = interfaces_Baz__encodeFields;
+
+function interfaces_Baz__decodeFields(object, json) {
+    return true;
+}
+interfaces_Baz.prototype._decodeFields = interfaces_Baz__decodeFields;
+
 function interfaces_Baz__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -4283,6 +4903,17 @@ function interfaces_BazBar_isAbstract() {
 }
 interfaces_BazBar.prototype.isAbstract = interfaces_BazBar_isAbstract;
 
+function interfaces_BazBar__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_BazBar.prototype._encodeFields = interfaces_BazBar__encodeFields;
+
+function interfaces_BazBar__decodeFields(object, json) {
+    return true;
+}
+interfaces_BazBar.prototype._decodeFields = interfaces_BazBar__decodeFields;
+
 function interfaces_BazBar__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -4423,6 +5054,17 @@ function interfaces_BazFaz_quark_Object__isAbstract() {
 }
 interfaces_BazFaz_quark_Object_.prototype.isAbstract = interfaces_BazFaz_quark_Object__isAbstract;
 
+function interfaces_BazFaz_quark_Object___encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+interfaces_BazFaz_quark_Object_.prototype._encodeFields = interfaces_BazFaz_quark_Object___encodeFields;
+
+function interfaces_BazFaz_quark_Object___decodeFields(object, json) {
+    return true;
+}
+interfaces_BazFaz_quark_Object_.prototype._decodeFields = interfaces_BazFaz_quark_Object___decodeFields;
+
 function interfaces_BazFaz_quark_Object___getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -4505,6 +5147,19 @@ function interfaces_Constants_isAbstract() {
 }
 interfaces_Constants.prototype.isAbstract = interfaces_Constants_isAbstract;
 
+function interfaces_Constants__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return interfaces.Constants; });
+    quark._encodeString(json, "FOO", interfaces.IConstants.FOO);
+    return true;
+}
+interfaces_Constants.prototype._encodeFields = interfaces_Constants__encodeFields;
+
+function interfaces_Constants__decodeFields(object, json) {
+    return true;
+}
+interfaces_Constants.prototype._decodeFields = interfaces_Constants__decodeFields;
+
 function interfaces_Constants__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -4643,6 +5298,25 @@ function classes_Overload_isAbstract() {
 }
 classes_Overload.prototype.isAbstract = classes_Overload_isAbstract;
 
+function classes_Overload__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.Overload; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+classes_Overload.prototype._encodeFields = classes_Overload__encodeFields;
+
+function classes_Overload__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.Overload; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+classes_Overload.prototype._decodeFields = classes_Overload__decodeFields;
+
 function classes_Overload__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -4717,6 +5391,17 @@ function classes_Test_isAbstract() {
 }
 classes_Test.prototype.isAbstract = classes_Test_isAbstract;
 
+function classes_Test__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+classes_Test.prototype._encodeFields = classes_Test__encodeFields;
+
+function classes_Test__decodeFields(object, json) {
+    return true;
+}
+classes_Test.prototype._decodeFields = classes_Test__decodeFields;
+
 function classes_Test__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -4791,6 +5476,17 @@ function classes_string_test_isAbstract() {
 }
 classes_string_test.prototype.isAbstract = classes_string_test_isAbstract;
 
+function classes_string_test__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+classes_string_test.prototype._encodeFields = classes_string_test__encodeFields;
+
+function classes_string_test__decodeFields(object, json) {
+    return true;
+}
+classes_string_test.prototype._decodeFields = classes_string_test__decodeFields;
+
 function classes_string_test__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -4897,6 +5593,25 @@ function classes_test_size_isAbstract() {
 }
 classes_test_size.prototype.isAbstract = classes_test_size_isAbstract;
 
+function classes_test_size__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_size; });
+    quark._encodeString(json, "what", (obj).what);
+    return true;
+}
+classes_test_size.prototype._encodeFields = classes_test_size__encodeFields;
+
+function classes_test_size__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_size; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    return true;
+}
+classes_test_size.prototype._decodeFields = classes_test_size__decodeFields;
+
 function classes_test_size__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -5035,6 +5750,25 @@ function classes_test_startsWith_isAbstract() {
 }
 classes_test_startsWith.prototype.isAbstract = classes_test_startsWith_isAbstract;
 
+function classes_test_startsWith__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_startsWith; });
+    quark._encodeString(json, "what", (obj).what);
+    return true;
+}
+classes_test_startsWith.prototype._encodeFields = classes_test_startsWith__encodeFields;
+
+function classes_test_startsWith__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_startsWith; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    return true;
+}
+classes_test_startsWith.prototype._decodeFields = classes_test_startsWith__decodeFields;
+
 function classes_test_startsWith__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -5173,6 +5907,25 @@ function classes_test_endsWith_isAbstract() {
 }
 classes_test_endsWith.prototype.isAbstract = classes_test_endsWith_isAbstract;
 
+function classes_test_endsWith__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_endsWith; });
+    quark._encodeString(json, "what", (obj).what);
+    return true;
+}
+classes_test_endsWith.prototype._encodeFields = classes_test_endsWith__encodeFields;
+
+function classes_test_endsWith__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_endsWith; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    return true;
+}
+classes_test_endsWith.prototype._decodeFields = classes_test_endsWith__decodeFields;
+
 function classes_test_endsWith__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -5311,6 +6064,25 @@ function classes_test_find_isAbstract() {
 }
 classes_test_find.prototype.isAbstract = classes_test_find_isAbstract;
 
+function classes_test_find__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_find; });
+    quark._encodeString(json, "what", (obj).what);
+    return true;
+}
+classes_test_find.prototype._encodeFields = classes_test_find__encodeFields;
+
+function classes_test_find__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_find; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    return true;
+}
+classes_test_find.prototype._decodeFields = classes_test_find__decodeFields;
+
 function classes_test_find__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -5449,6 +6221,35 @@ function classes_test_substring_isAbstract() {
 }
 classes_test_substring.prototype.isAbstract = classes_test_substring_isAbstract;
 
+function classes_test_substring__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_substring; });
+    quark._encodeString(json, "what", (obj).what);
+    quark._encodeNumber(json, "start", (obj).start);
+    quark._encodeNumber(json, "end", (obj).end);
+    return true;
+}
+classes_test_substring.prototype._encodeFields = classes_test_substring__encodeFields;
+
+function classes_test_substring__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_substring; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "start");
+    if ((item) !== (null)) {
+        (obj).start = quark._decodeInt(item);
+    }
+    item = quark._decodeItem(json, "end");
+    if ((item) !== (null)) {
+        (obj).end = quark._decodeInt(item);
+    }
+    return true;
+}
+classes_test_substring.prototype._decodeFields = classes_test_substring__decodeFields;
+
 function classes_test_substring__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -5587,6 +6388,35 @@ function classes_test_replace_isAbstract() {
 }
 classes_test_replace.prototype.isAbstract = classes_test_replace_isAbstract;
 
+function classes_test_replace__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_replace; });
+    quark._encodeString(json, "what", (obj).what);
+    quark._encodeString(json, "start", (obj).start);
+    quark._encodeString(json, "end", (obj).end);
+    return true;
+}
+classes_test_replace.prototype._encodeFields = classes_test_replace__encodeFields;
+
+function classes_test_replace__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_replace; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "start");
+    if ((item) !== (null)) {
+        (obj).start = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "end");
+    if ((item) !== (null)) {
+        (obj).end = quark._decodeString(item);
+    }
+    return true;
+}
+classes_test_replace.prototype._decodeFields = classes_test_replace__decodeFields;
+
 function classes_test_replace__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -5757,6 +6587,40 @@ function classes_test_join_isAbstract() {
 }
 classes_test_join.prototype.isAbstract = classes_test_join_isAbstract;
 
+function classes_test_join__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_join; });
+    quark._encodeString(json, "what", (obj).what);
+    quark._encodeField(json, this, 1, (obj).parts);
+    quark._encodeString(json, "strparts", (obj).strparts);
+    quark._encodeString(json, "sep", (obj).sep);
+    return true;
+}
+classes_test_join.prototype._encodeFields = classes_test_join__encodeFields;
+
+function classes_test_join__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_join; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "parts");
+    if ((item) !== (null)) {
+        (obj).parts = _qrt.cast(quark._decodeField(this, 1, item), function () { return Array; });
+    }
+    item = quark._decodeItem(json, "strparts");
+    if ((item) !== (null)) {
+        (obj).strparts = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "sep");
+    if ((item) !== (null)) {
+        (obj).sep = quark._decodeString(item);
+    }
+    return true;
+}
+classes_test_join.prototype._decodeFields = classes_test_join__decodeFields;
+
 function classes_test_join__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -5895,6 +6759,35 @@ function classes_test_split_isAbstract() {
 }
 classes_test_split.prototype.isAbstract = classes_test_split_isAbstract;
 
+function classes_test_split__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return classes.test_split; });
+    quark._encodeString(json, "what", (obj).what);
+    quark._encodeString(json, "sep", (obj).sep);
+    quark._encodeString(json, "altsep", (obj).altsep);
+    return true;
+}
+classes_test_split.prototype._encodeFields = classes_test_split__encodeFields;
+
+function classes_test_split__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return classes.test_split; });
+    var item = null;
+    item = quark._decodeItem(json, "what");
+    if ((item) !== (null)) {
+        (obj).what = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "sep");
+    if ((item) !== (null)) {
+        (obj).sep = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "altsep");
+    if ((item) !== (null)) {
+        (obj).altsep = quark._decodeString(item);
+    }
+    return true;
+}
+classes_test_split.prototype._decodeFields = classes_test_split__decodeFields;
+
 function classes_test_split__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -6001,6 +6894,17 @@ function classes_stuff_Test_isAbstract() {
 }
 classes_stuff_Test.prototype.isAbstract = classes_stuff_Test_isAbstract;
 
+function classes_stuff_Test__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+classes_stuff_Test.prototype._encodeFields = classes_stuff_Test__encodeFields;
+
+function classes_stuff_Test__decodeFields(object, json) {
+    return true;
+}
+classes_stuff_Test.prototype._decodeFields = classes_stuff_Test__decodeFields;
+
 function classes_stuff_Test__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -6239,6 +7143,25 @@ function statics_Foo_isAbstract() {
 }
 statics_Foo.prototype.isAbstract = statics_Foo_isAbstract;
 
+function statics_Foo__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return statics.Foo; });
+    quark._encodeNumber(json, "count", statics.Foo.count);
+    return true;
+}
+statics_Foo.prototype._encodeFields = statics_Foo__encodeFields;
+
+function statics_Foo__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return statics.Foo; });
+    var item = null;
+    item = quark._decodeItem(json, "count");
+    if ((item) !== (null)) {
+        statics.Foo.count = quark._decodeInt(item);
+    }
+    return true;
+}
+statics_Foo.prototype._decodeFields = statics_Foo__decodeFields;
+
 function statics_Foo__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -6312,6 +7235,25 @@ function docs_Test_isAbstract() {
 }
 docs_Test.prototype.isAbstract = docs_Test_isAbstract;
 
+function docs_Test__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return docs.Test; });
+    quark._encodeString(json, "name", (obj).name);
+    return true;
+}
+docs_Test.prototype._encodeFields = docs_Test__encodeFields;
+
+function docs_Test__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return docs.Test; });
+    var item = null;
+    item = quark._decodeItem(json, "name");
+    if ((item) !== (null)) {
+        (obj).name = quark._decodeString(item);
+    }
+    return true;
+}
+docs_Test.prototype._decodeFields = docs_Test__decodeFields;
+
 function docs_Test__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -6546,6 +7488,11 @@ var generics; _qrt.lazyImport('../generics/index.js', function(){
     exports.generics = generics;
 });
 
+var quark; _qrt.lazyImport('quark', function(){
+    quark = require('quark').quark;
+    exports.quark = quark;
+});
+
 
 
 
@@ -42,16 +42,21 @@ function Foo__getClass() {
 Foo.prototype._getClass = Foo__getClass;
 
 function Foo__getField(name) {
-    if (_qrt.equals((name), ("count"))) {
-        return Foo.count;
+    switch (name) {
+        case "count": {
+            return Foo.count;
+        }
     }
     return null;
 }
 Foo.prototype._getField = Foo__getField;
 
 function Foo__setField(name, value) {
-    if (_qrt.equals((name), ("count"))) {
-        Foo.count = _qrt.cast(value, function () { return Number; });
+    switch (name) {
+        case "count": {
+            Foo.count = _qrt.cast(value, function () { return Number; });
+            return;
+        }
     }
 }
 Foo.prototype._setField = Foo__setField;
@@ -49,34 +49,42 @@ function SlackEvent__getClass() {
 SlackEvent.prototype._getClass = SlackEvent__getClass;
 
 function SlackEvent__getField(name) {
-    if (_qrt.equals((name), ("type"))) {
-        return (this).type;
-    }
-    if (_qrt.equals((name), ("user"))) {
-        return (this).user;
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        return (this).channel;
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        return (this).timestamp;
+    switch (name) {
+        case "type": {
+            return (this).type;
+        }
+        case "user": {
+            return (this).user;
+        }
+        case "channel": {
+            return (this).channel;
+        }
+        case "timestamp": {
+            return (this).timestamp;
+        }
     }
     return null;
 }
 SlackEvent.prototype._getField = SlackEvent__getField;
 
 function SlackEvent__setField(name, value) {
-    if (_qrt.equals((name), ("type"))) {
-        (this).type = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("user"))) {
-        (this).user = _qrt.cast(value, function () { return slack.User; });
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        (this).channel = _qrt.cast(value, function () { return slack.Channel; });
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        (this).timestamp = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "type": {
+            (this).type = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "user": {
+            (this).user = _qrt.cast(value, function () { return slack.User; });
+            return;
+        }
+        case "channel": {
+            (this).channel = _qrt.cast(value, function () { return slack.Channel; });
+            return;
+        }
+        case "timestamp": {
+            (this).timestamp = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 SlackEvent.prototype._setField = SlackEvent__setField;
@@ -118,46 +126,56 @@ function SlackError__getClass() {
 SlackError.prototype._getClass = SlackError__getClass;
 
 function SlackError__getField(name) {
-    if (_qrt.equals((name), ("type"))) {
-        return (this).type;
-    }
-    if (_qrt.equals((name), ("user"))) {
-        return (this).user;
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        return (this).channel;
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        return (this).timestamp;
-    }
-    if (_qrt.equals((name), ("code"))) {
-        return (this).code;
-    }
-    if (_qrt.equals((name), ("text"))) {
-        return (this).text;
+    switch (name) {
+        case "type": {
+            return (this).type;
+        }
+        case "user": {
+            return (this).user;
+        }
+        case "channel": {
+            return (this).channel;
+        }
+        case "timestamp": {
+            return (this).timestamp;
+        }
+        case "code": {
+            return (this).code;
+        }
+        case "text": {
+            return (this).text;
+        }
     }
     return null;
 }
 SlackError.prototype._getField = SlackError__getField;
 
 function SlackError__setField(name, value) {
-    if (_qrt.equals((name), ("type"))) {
-        (this).type = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("user"))) {
-        (this).user = _qrt.cast(value, function () { return slack.User; });
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        (this).channel = _qrt.cast(value, function () { return slack.Channel; });
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        (this).timestamp = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("code"))) {
-        (this).code = _qrt.cast(value, function () { return Number; });
-    }
-    if (_qrt.equals((name), ("text"))) {
-        (this).text = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "type": {
+            (this).type = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "user": {
+            (this).user = _qrt.cast(value, function () { return slack.User; });
+            return;
+        }
+        case "channel": {
+            (this).channel = _qrt.cast(value, function () { return slack.Channel; });
+            return;
+        }
+        case "timestamp": {
+            (this).timestamp = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "code": {
+            (this).code = _qrt.cast(value, function () { return Number; });
+            return;
+        }
+        case "text": {
+            (this).text = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 SlackError.prototype._setField = SlackError__setField;
@@ -188,34 +206,42 @@ function Hello__getClass() {
 Hello.prototype._getClass = Hello__getClass;
 
 function Hello__getField(name) {
-    if (_qrt.equals((name), ("type"))) {
-        return (this).type;
-    }
-    if (_qrt.equals((name), ("user"))) {
-        return (this).user;
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        return (this).channel;
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        return (this).timestamp;
+    switch (name) {
+        case "type": {
+            return (this).type;
+        }
+        case "user": {
+            return (this).user;
+        }
+        case "channel": {
+            return (this).channel;
+        }
+        case "timestamp": {
+            return (this).timestamp;
+        }
     }
     return null;
 }
 Hello.prototype._getField = Hello__getField;
 
 function Hello__setField(name, value) {
-    if (_qrt.equals((name), ("type"))) {
-        (this).type = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("user"))) {
-        (this).user = _qrt.cast(value, function () { return slack.User; });
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        (this).channel = _qrt.cast(value, function () { return slack.Channel; });
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        (this).timestamp = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "type": {
+            (this).type = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "user": {
+            (this).user = _qrt.cast(value, function () { return slack.User; });
+            return;
+        }
+        case "channel": {
+            (this).channel = _qrt.cast(value, function () { return slack.Channel; });
+            return;
+        }
+        case "timestamp": {
+            (this).timestamp = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Hello.prototype._setField = Hello__setField;
@@ -256,58 +282,70 @@ function Message__getClass() {
 Message.prototype._getClass = Message__getClass;
 
 function Message__getField(name) {
-    if (_qrt.equals((name), ("type"))) {
-        return (this).type;
-    }
-    if (_qrt.equals((name), ("user"))) {
-        return (this).user;
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        return (this).channel;
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        return (this).timestamp;
-    }
-    if (_qrt.equals((name), ("subtype"))) {
-        return (this).subtype;
-    }
-    if (_qrt.equals((name), ("hidden"))) {
-        return (this).hidden;
-    }
-    if (_qrt.equals((name), ("text"))) {
-        return (this).text;
-    }
-    if (_qrt.equals((name), ("edited"))) {
-        return (this).edited;
+    switch (name) {
+        case "type": {
+            return (this).type;
+        }
+        case "user": {
+            return (this).user;
+        }
+        case "channel": {
+            return (this).channel;
+        }
+        case "timestamp": {
+            return (this).timestamp;
+        }
+        case "subtype": {
+            return (this).subtype;
+        }
+        case "hidden": {
+            return (this).hidden;
+        }
+        case "text": {
+            return (this).text;
+        }
+        case "edited": {
+            return (this).edited;
+        }
     }
     return null;
 }
 Message.prototype._getField = Message__getField;
 
 function Message__setField(name, value) {
-    if (_qrt.equals((name), ("type"))) {
-        (this).type = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("user"))) {
-        (this).user = _qrt.cast(value, function () { return slack.User; });
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        (this).channel = _qrt.cast(value, function () { return slack.Channel; });
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        (this).timestamp = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("subtype"))) {
-        (this).subtype = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("hidden"))) {
-        (this).hidden = _qrt.cast(value, function () { return Boolean; });
-    }
-    if (_qrt.equals((name), ("text"))) {
-        (this).text = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("edited"))) {
-        (this).edited = _qrt.cast(value, function () { return Edited; });
+    switch (name) {
+        case "type": {
+            (this).type = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "user": {
+            (this).user = _qrt.cast(value, function () { return slack.User; });
+            return;
+        }
+        case "channel": {
+            (this).channel = _qrt.cast(value, function () { return slack.Channel; });
+            return;
+        }
+        case "timestamp": {
+            (this).timestamp = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "subtype": {
+            (this).subtype = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "hidden": {
+            (this).hidden = _qrt.cast(value, function () { return Boolean; });
+            return;
+        }
+        case "text": {
+            (this).text = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "edited": {
+            (this).edited = _qrt.cast(value, function () { return Edited; });
+            return;
+        }
     }
 }
 Message.prototype._setField = Message__setField;
@@ -334,22 +372,28 @@ function Edited__getClass() {
 Edited.prototype._getClass = Edited__getClass;
 
 function Edited__getField(name) {
-    if (_qrt.equals((name), ("user"))) {
-        return (this).user;
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        return (this).timestamp;
+    switch (name) {
+        case "user": {
+            return (this).user;
+        }
+        case "timestamp": {
+            return (this).timestamp;
+        }
     }
     return null;
 }
 Edited.prototype._getField = Edited__getField;
 
 function Edited__setField(name, value) {
-    if (_qrt.equals((name), ("user"))) {
-        (this).user = _qrt.cast(value, function () { return slack.User; });
-    }
-    if (_qrt.equals((name), ("timestamp"))) {
-        (this).timestamp = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "user": {
+            (this).user = _qrt.cast(value, function () { return slack.User; });
+            return;
+        }
+        case "timestamp": {
+            (this).timestamp = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Edited.prototype._setField = Edited__setField;
@@ -58,22 +58,28 @@ function User__getClass() {
 User.prototype._getClass = User__getClass;
 
 function User__getField(name) {
-    if (_qrt.equals((name), ("client"))) {
-        return (this).client;
-    }
-    if (_qrt.equals((name), ("user"))) {
-        return (this).user;
+    switch (name) {
+        case "client": {
+            return (this).client;
+        }
+        case "user": {
+            return (this).user;
+        }
     }
     return null;
 }
 User.prototype._getField = User__getField;
 
 function User__setField(name, value) {
-    if (_qrt.equals((name), ("client"))) {
-        (this).client = _qrt.cast(value, function () { return Client; });
-    }
-    if (_qrt.equals((name), ("user"))) {
-        (this).user = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "client": {
+            (this).client = _qrt.cast(value, function () { return Client; });
+            return;
+        }
+        case "user": {
+            (this).user = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 User.prototype._setField = User__setField;
@@ -111,22 +117,28 @@ function Channel__getClass() {
 Channel.prototype._getClass = Channel__getClass;
 
 function Channel__getField(name) {
-    if (_qrt.equals((name), ("client"))) {
-        return (this).client;
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        return (this).channel;
+    switch (name) {
+        case "client": {
+            return (this).client;
+        }
+        case "channel": {
+            return (this).channel;
+        }
     }
     return null;
 }
 Channel.prototype._getField = Channel__getField;
 
 function Channel__setField(name, value) {
-    if (_qrt.equals((name), ("client"))) {
-        (this).client = _qrt.cast(value, function () { return Client; });
-    }
-    if (_qrt.equals((name), ("channel"))) {
-        (this).channel = _qrt.cast(value, function () { return String; });
+    switch (name) {
+        case "client": {
+            (this).client = _qrt.cast(value, function () { return Client; });
+            return;
+        }
+        case "channel": {
+            (this).channel = _qrt.cast(value, function () { return String; });
+            return;
+        }
     }
 }
 Channel.prototype._setField = Channel__setField;
@@ -196,40 +208,49 @@ function Client__getClass() {
 Client.prototype._getClass = Client__getClass;
 
 function Client__getField(name) {
-    if (_qrt.equals((name), ("runtime"))) {
-        return (this).runtime;
-    }
-    if (_qrt.equals((name), ("token"))) {
-        return (this).token;
-    }
-    if (_qrt.equals((name), ("handler"))) {
-        return (this).handler;
-    }
-    if (_qrt.equals((name), ("event_id"))) {
-        return (this).event_id;
-    }
-    if (_qrt.equals((name), ("socket"))) {
-        return (this).socket;
+    switch (name) {
+        case "runtime": {
+            return (this).runtime;
+        }
+        case "token": {
+            return (this).token;
+        }
+        case "handler": {
+            return (this).handler;
+        }
+        case "event_id": {
+            return (this).event_id;
+        }
+        case "socket": {
+            return (this).socket;
+        }
     }
     return null;
 }
 Client.prototype._getField = Client__getField;
 
 function Client__setField(name, value) {
-    if (_qrt.equals((name), ("runtime"))) {
-        (this).runtime = _qrt.cast(value, function () { return quark.Runtime; });
-    }
-    if (_qrt.equals((name), ("token"))) {
-        (this).token = _qrt.cast(value, function () { return String; });
-    }
-    if (_qrt.equals((name), ("handler"))) {
-        (this).handler = _qrt.cast(value, function () { return SlackHandler; });
-    }
-    if (_qrt.equals((name), ("event_id"))) {
-        (this).event_id = _qrt.cast(value, function () { return Number; });
-    }
-    if (_qrt.equals((name), ("socket"))) {
-        (this).socket = _qrt.cast(value, function () { return quark.WebSocket; });
+    switch (name) {
+        case "runtime": {
+            (this).runtime = _qrt.cast(value, function () { return quark.Runtime; });
+            return;
+        }
+        case "token": {
+            (this).token = _qrt.cast(value, function () { return String; });
+            return;
+        }
+        case "handler": {
+            (this).handler = _qrt.cast(value, function () { return SlackHandler; });
+            return;
+        }
+        case "event_id": {
+            (this).event_id = _qrt.cast(value, function () { return Number; });
+            return;
+        }
+        case "socket": {
+            (this).socket = _qrt.cast(value, function () { return quark.WebSocket; });
+            return;
+        }
     }
 }
 Client.prototype._setField = Client__setField;
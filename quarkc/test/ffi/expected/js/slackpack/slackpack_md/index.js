@@ -98,6 +98,40 @@ function slack_event_SlackEvent_isAbstract() {
 }
 slack_event_SlackEvent.prototype.isAbstract = slack_event_SlackEvent_isAbstract;
 
+function slack_event_SlackEvent__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.event.SlackEvent; });
+    quark._encodeString(json, "type", (obj).type);
+    quark._encodeField(json, this, 1, (obj).user);
+    quark._encodeField(json, this, 2, (obj).channel);
+    quark._encodeString(json, "timestamp", (obj).timestamp);
+    return true;
+}
+slack_event_SlackEvent.prototype._encodeFields = slack_event_SlackEvent__encodeFields;
+
+function slack_event_SlackEvent__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.event.SlackEvent; });
+    var item = null;
+    item = quark._decodeItem(json, "type");
+    if ((item) !== (null)) {
+        (obj).type = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "user");
+    if ((item) !== (null)) {
+        (obj).user = _qrt.cast(quark._decodeField(this, 1, item), function () { return slack.User; });
+    }
+    item = quark._decodeItem(json, "channel");
+    if ((item) !== (null)) {
+        (obj).channel = _qrt.cast(quark._decodeField(this, 2, item), function () { return slack.Channel; });
+    }
+    item = quark._decodeItem(json, "timestamp");
+    if ((item) !== (null)) {
+        (obj).timestamp = quark._decodeString(item);
+    }
+    return true;
+}
+slack_event_SlackEvent.prototype._decodeFields = slack_event_SlackEvent__decodeFields;
+
 function slack_event_SlackEvent__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -205,6 +239,50 @@ function slack_event_SlackError_isAbstract() {
 }
 slack_event_SlackError.prototype.isAbstract = slack_event_SlackError_isAbstract;
 
+function slack_event_SlackError__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.event.SlackError; });
+    quark._encodeString(json, "type", (obj).type);
+    quark._encodeField(json, this, 1, (obj).user);
+    quark._encodeField(json, this, 2, (obj).channel);
+    quark._encodeString(json, "timestamp", (obj).timestamp);
+    quark._encodeNumber(json, "code", (obj).code);
+    quark._encodeString(json, "text", (obj).text);
+    return true;
+}
+slack_event_SlackError.prototype._encodeFields = slack_event_SlackError__encodeFields;
+
+function slack_event_SlackError__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.event.SlackError; });
+    var item = null;
+    item = quark._decodeItem(json, "type");
+    if ((item) !== (null)) {
+        (obj).type = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "user");
+    if ((item) !== (null)) {
+        (obj).user = _qrt.cast(quark._decodeField(this, 1, item), function () { return slack.User; });
+    }
+    item = quark._decodeItem(json, "channel");
+    if ((item) !== (null)) {
+        (obj).channel = _qrt.cast(quark._decodeField(this, 2, item), function () { return slack.Channel; });
+    }
+    item = quark._decodeItem(json, "timestamp");
+    if ((item) !== (null)) {
+        (obj).timestamp = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "code");
+    if ((item) !== (null)) {
+        (obj).code = quark._decodeInt(item);
+    }
+    item = quark._decodeItem(json, "text");
+    if ((item) !== (null)) {
+        (obj).text = quark._decodeString(item);
+    }
+    return true;
+}
+slack_event_SlackError.prototype._decodeFields = slack_event_SlackError__decodeFields;
+
 function slack_event_SlackError__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -312,6 +390,40 @@ function slack_event_Hello_isAbstract() {
 }
 slack_event_Hello.prototype.isAbstract = slack_event_Hello_isAbstract;
 
+function slack_event_Hello__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.event.Hello; });
+    quark._encodeString(json, "type", (obj).type);
+    quark._encodeField(json, this, 1, (obj).user);
+    quark._encodeField(json, this, 2, (obj).channel);
+    quark._encodeString(json, "timestamp", (obj).timestamp);
+    return true;
+}
+slack_event_Hello.prototype._encodeFields = slack_event_Hello__encodeFields;
+
+function slack_event_Hello__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.event.Hello; });
+    var item = null;
+    item = quark._decodeItem(json, "type");
+    if ((item) !== (null)) {
+        (obj).type = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "user");
+    if ((item) !== (null)) {
+        (obj).user = _qrt.cast(quark._decodeField(this, 1, item), function () { return slack.User; });
+    }
+    item = quark._decodeItem(json, "channel");
+    if ((item) !== (null)) {
+        (obj).channel = _qrt.cast(quark._decodeField(this, 2, item), function () { return slack.Channel; });
+    }
+    item = quark._decodeItem(json, "timestamp");
+    if ((item) !== (null)) {
+        (obj).timestamp = quark._decodeString(item);
+    }
+    return true;
+}
+slack_event_Hello.prototype._decodeFields = slack_event_Hello__decodeFields;
+
 function slack_event_Hello__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -419,6 +531,60 @@ function slack_event_Message_isAbstract() {
 }
 slack_event_Message.prototype.isAbstract = slack_event_Message_isAbstract;
 
+function slack_event_Message__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.event.Message; });
+    quark._encodeString(json, "type", (obj).type);
+    quark._encodeField(json, this, 1, (obj).user);
+    quark._encodeField(json, this, 2, (obj).channel);
+    quark._encodeString(json, "timestamp", (obj).timestamp);
+    quark._encodeString(json, "subtype", (obj).subtype);
+    quark._encodeField(json, this, 5, (obj).hidden);
+    quark._encodeString(json, "text", (obj).text);
+    quark._encodeField(json, this, 7, (obj).edited);
+    return true;
+}
+slack_event_Message.prototype._encodeFields = slack_event_Message__encodeFields;
+
+function slack_event_Message__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.event.Message; });
+    var item = null;
+    item = quark._decodeItem(json, "type");
+    if ((item) !== (null)) {
+        (obj).type = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "user");
+    if ((item) !== (null)) {
+        (obj).user = _qrt.cast(quark._decodeField(this, 1, item), function () { return slack.User; });
+    }
+    item = quark._decodeItem(json, "channel");
+    if ((item) !== (null)) {
+        (obj).channel = _qrt.cast(quark._decodeField(this, 2, item), function () { return slack.Channel; });
+    }
+    item = quark._decodeItem(json, "timestamp");
+    if ((item) !== (null)) {
+        (obj).timestamp = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "subtype");
+    if ((item) !== (null)) {
+        (obj).subtype = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "hidden");
+    if ((item) !== (null)) {
+        (obj).hidden = _qrt.cast(quark._decodeField(this, 5, item), function () { return Boolean; });
+    }
+    item = quark._decodeItem(json, "text");
+    if ((item) !== (null)) {
+        (obj).text = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "edited");
+    if ((item) !== (null)) {
+        (obj).edited = _qrt.cast(quark._decodeField(this, 7, item), function () { return slack.event.Edited; });
+    }
+    return true;
+}
+slack_event_Message.prototype._decodeFields = slack_event_Message__decodeFields;
+
 function slack_event_Message__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -460,6 +626,30 @@ function slack_event_Edited_isAbstract() {
 }
 slack_event_Edited.prototype.isAbstract = slack_event_Edited_isAbstract;
 
+function slack_event_Edited__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.event.Edited; });
+    quark._encodeField(json, this, 0, (obj).user);
+    quark._encodeString(json, "timestamp", (obj).timestamp);
+    return true;
+}
+slack_event_Edited.prototype._encodeFields = slack_event_Edited__encodeFields;
+
+function slack_event_Edited__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.event.Edited; });
+    var item = null;
+    item = quark._decodeItem(json, "user");
+    if ((item) !== (null)) {
+        (obj).user = _qrt.cast(quark._decodeField(this, 0, item), function () { return slack.User; });
+    }
+    item = quark._decodeItem(json, "timestamp");
+    if ((item) !== (null)) {
+        (obj).timestamp = quark._decodeString(item);
+    }
+    return true;
+}
+slack_event_Edited.prototype._decodeFields = slack_event_Edited__decodeFields;
+
 function slack_event_Edited__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -674,6 +864,30 @@ function slack_User_isAbstract() {
 }
 slack_User.prototype.isAbstract = slack_User_isAbstract;
 
+function slack_User__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.User; });
+    quark._encodeField(json, this, 0, (obj).client);
+    quark._encodeString(json, "user", (obj).user);
+    return true;
+}
+slack_User.prototype._encodeFields = slack_User__encodeFields;
+
+function slack_User__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.User; });
+    var item = null;
+    item = quark._decodeItem(json, "client");
+    if ((item) !== (null)) {
+        (obj).client = _qrt.cast(quark._decodeField(this, 0, item), function () { return slack.Client; });
+    }
+    item = quark._decodeItem(json, "user");
+    if ((item) !== (null)) {
+        (obj).user = quark._decodeString(item);
+    }
+    return true;
+}
+slack_User.prototype._decodeFields = slack_User__decodeFields;
+
 function slack_User__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -748,6 +962,30 @@ function slack_Channel_isAbstract() {
 }
 slack_Channel.prototype.isAbstract = slack_Channel_isAbstract;
 
+function slack_Channel__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.Channel; });
+    quark._encodeField(json, this, 0, (obj).client);
+    quark._encodeString(json, "channel", (obj).channel);
+    return true;
+}
+slack_Channel.prototype._encodeFields = slack_Channel__encodeFields;
+
+function slack_Channel__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.Channel; });
+    var item = null;
+    item = quark._decodeItem(json, "client");
+    if ((item) !== (null)) {
+        (obj).client = _qrt.cast(quark._decodeField(this, 0, item), function () { return slack.Client; });
+    }
+    item = quark._decodeItem(json, "channel");
+    if ((item) !== (null)) {
+        (obj).channel = quark._decodeString(item);
+    }
+    return true;
+}
+slack_Channel.prototype._decodeFields = slack_Channel__decodeFields;
+
 function slack_Channel__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1349,6 +1587,45 @@ function slack_Client_isAbstract() {
 }
 slack_Client.prototype.isAbstract = slack_Client_isAbstract;
 
+function slack_Client__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    var obj = _qrt.cast(object, function () { return slack.Client; });
+    quark._encodeField(json, this, 0, (obj).runtime);
+    quark._encodeString(json, "token", (obj).token);
+    quark._encodeField(json, this, 2, (obj).handler);
+    quark._encodeNumber(json, "event_id", (obj).event_id);
+    quark._encodeField(json, this, 4, (obj).socket);
+    return true;
+}
+slack_Client.prototype._encodeFields = slack_Client__encodeFields;
+
+function slack_Client__decodeFields(object, json) {
+    var obj = _qrt.cast(object, function () { return slack.Client; });
+    var item = null;
+    item = quark._decodeItem(json, "runtime");
+    if ((item) !== (null)) {
+        (obj).runtime = _qrt.cast(quark._decodeField(this, 0, item), function () { return quark.Runtime; });
+    }
+    item = quark._decodeItem(json, "token");
+    if ((item) !== (null)) {
+        (obj).token = quark._decodeString(item);
+    }
+    item = quark._decodeItem(json, "handler");
+    if ((item) !== (null)) {
+        (obj).handler = _qrt.cast(quark._decodeField(this, 2, item), function () { return slack.SlackHandler; });
+    }
+    item = quark._decodeItem(json, "event_id");
+    if ((item) !== (null)) {
+        (obj).event_id = quark._decodeInt(item);
+    }
+    item = quark._decodeItem(json, "socket");
+    if ((item) !== (null)) {
+        (obj).socket = _qrt.cast(quark._decodeField(this, 4, item), function () { return quark.WebSocket; });
+    }
+    return true;
+}
+slack_Client.prototype._decodeFields = slack_Client__decodeFields;
+
 function slack_Client__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
@@ -1522,6 +1799,17 @@ function slackpack_Handler_isAbstract() {
 }
 slackpack_Handler.prototype.isAbstract = slackpack_Handler_isAbstract;
 
+function slackpack_Handler__encodeFields(object, json) {
+    quark._encodeString(json, "$class", (this).id);
+    return true;
+}
+slackpack_Handler.prototype._encodeFields = slackpack_Handler__encodeFields;
+
+function slackpack_Handler__decodeFields(object, json) {
+    return true;
+}
+slackpack_Handler.prototype._decodeFields = slackpack_Handler__decodeFields;
+
 function slackpack_Handler__getClass() {
     return _qrt.cast(null, function () { return String; });
 }
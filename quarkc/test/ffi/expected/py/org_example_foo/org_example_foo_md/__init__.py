@@ -47,6 +47,13 @@ class org_example_foo_Foo(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -76,6 +83,11 @@ def _lazy_import_org_example_foo():
     globals().update(locals())
 _lazyImport("import org.example.foo", _lazy_import_org_example_foo)
 
+def _lazy_import_quark():
+    import quark
+    globals().update(locals())
+_lazyImport("import quark", _lazy_import_quark)
+
 
 
 _lazyImport.pump("org_example_foo_md.org_example_foo_Foo_test_Method")
@@ -47,6 +47,21 @@ class test_Test(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: test.Test);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: test.Test);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -95,6 +110,21 @@ class test_subtest_Test(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: test.subtest.Test);
+        quark._encodeNumber(json, u"size", (obj).size);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: test.subtest.Test);
+        item = None;
+        item = quark._decodeItem(json, u"size")
+        if ((item) != (None)):
+            (obj).size = quark._decodeInt(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -125,6 +155,11 @@ def _lazy_import_test():
     globals().update(locals())
 _lazyImport("import test", _lazy_import_test)
 
+def _lazy_import_quark():
+    import quark
+    globals().update(locals())
+_lazyImport("import quark", _lazy_import_quark)
+
 def _lazy_import_test_subtest():
     import test.subtest
     globals().update(locals())
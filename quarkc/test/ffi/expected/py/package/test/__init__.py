@@ -31,15 +31,28 @@ class Test(_QObject):
     def _getClass(self):
         return u"test.Test"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = Test._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = Test._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Test.test_Test_ref = None
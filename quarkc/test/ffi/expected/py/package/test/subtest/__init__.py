@@ -24,15 +24,28 @@ class Test(_QObject):
     def _getClass(self):
         return u"test.subtest.Test"
 
+    def _getField_0(self, name):
+        return (self).size
+
+    _getField_cases = {u"size": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"size")):
-            return (self).size
+        case = Test._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).size = _cast(value, lambda: int)
+        return
+
+    _setField_cases = {u"size": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"size")):
-            (self).size = _cast(value, lambda: int)
+        case = Test._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Test.test_subtest_Test_ref = None
@@ -29,15 +29,28 @@ class Overload(_QObject):
     def _getClass(self):
         return u"classes.Overload"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = Overload._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = Overload._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Overload.classes_Overload_ref = None
@@ -89,15 +102,28 @@ class test_size(string_test):
     def _getClass(self):
         return u"classes.test_size"
 
+    def _getField_0(self, name):
+        return (self).what
+
+    _getField_cases = {u"what": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+        case = test_size._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"what": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+        case = test_size._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_size.classes_test_size_ref = None
@@ -119,21 +145,35 @@ class test_startsWith(string_test):
     def _getClass(self):
         return u"classes.test_startsWith"
 
-    def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+    def _getField_0(self, name):
+        return (self).what
+
+    def _getField_1(self, name):
+        return (self)._that
 
-        if ((name) == (u"_that")):
-            return (self)._that
+    _getField_cases = {u"what": _getField_0, u"_that": _getField_1}
+
+    def _getField(self, name):
+        case = test_startsWith._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self)._that = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"_that")):
-            (self)._that = _cast(value, lambda: unicode)
+    _setField_cases = {u"what": _setField_0, u"_that": _setField_1}
+
+    def _setField(self, name, value):
+        case = test_startsWith._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_startsWith.classes_test_startsWith_ref = None
@@ -155,21 +195,35 @@ class test_endsWith(string_test):
     def _getClass(self):
         return u"classes.test_endsWith"
 
-    def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+    def _getField_0(self, name):
+        return (self).what
+
+    def _getField_1(self, name):
+        return (self)._that
 
-        if ((name) == (u"_that")):
-            return (self)._that
+    _getField_cases = {u"what": _getField_0, u"_that": _getField_1}
+
+    def _getField(self, name):
+        case = test_endsWith._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self)._that = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"_that")):
-            (self)._that = _cast(value, lambda: unicode)
+    _setField_cases = {u"what": _setField_0, u"_that": _setField_1}
+
+    def _setField(self, name, value):
+        case = test_endsWith._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_endsWith.classes_test_endsWith_ref = None
@@ -191,21 +245,35 @@ class test_find(string_test):
     def _getClass(self):
         return u"classes.test_find"
 
-    def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+    def _getField_0(self, name):
+        return (self).what
+
+    def _getField_1(self, name):
+        return (self)._that
 
-        if ((name) == (u"_that")):
-            return (self)._that
+    _getField_cases = {u"what": _getField_0, u"_that": _getField_1}
+
+    def _getField(self, name):
+        case = test_find._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self)._that = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"_that")):
-            (self)._that = _cast(value, lambda: unicode)
+    _setField_cases = {u"what": _setField_0, u"_that": _setField_1}
+
+    def _setField(self, name, value):
+        case = test_find._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_find.classes_test_find_ref = None
@@ -228,27 +296,42 @@ class test_substring(string_test):
     def _getClass(self):
         return u"classes.test_substring"
 
-    def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+    def _getField_0(self, name):
+        return (self).what
+
+    def _getField_1(self, name):
+        return (self).start
 
-        if ((name) == (u"start")):
-            return (self).start
+    def _getField_2(self, name):
+        return (self).end
 
-        if ((name) == (u"end")):
-            return (self).end
+    _getField_cases = {u"what": _getField_0, u"start": _getField_1, u"end": _getField_2}
+
+    def _getField(self, name):
+        case = test_substring._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self).start = _cast(value, lambda: int)
+        return
 
-        if ((name) == (u"start")):
-            (self).start = _cast(value, lambda: int)
+    def _setField_2(self, name, value):
+        (self).end = _cast(value, lambda: int)
+        return
 
-        if ((name) == (u"end")):
-            (self).end = _cast(value, lambda: int)
+    _setField_cases = {u"what": _setField_0, u"start": _setField_1, u"end": _setField_2}
+
+    def _setField(self, name, value):
+        case = test_substring._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_substring.classes_test_substring_ref = None
@@ -271,27 +354,42 @@ class test_replace(string_test):
     def _getClass(self):
         return u"classes.test_replace"
 
-    def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+    def _getField_0(self, name):
+        return (self).what
+
+    def _getField_1(self, name):
+        return (self).start
 
-        if ((name) == (u"start")):
-            return (self).start
+    def _getField_2(self, name):
+        return (self).end
 
-        if ((name) == (u"end")):
-            return (self).end
+    _getField_cases = {u"what": _getField_0, u"start": _getField_1, u"end": _getField_2}
+
+    def _getField(self, name):
+        case = test_replace._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self).start = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"start")):
-            (self).start = _cast(value, lambda: unicode)
+    def _setField_2(self, name, value):
+        (self).end = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"end")):
-            (self).end = _cast(value, lambda: unicode)
+    _setField_cases = {u"what": _setField_0, u"start": _setField_1, u"end": _setField_2}
+
+    def _setField(self, name, value):
+        case = test_replace._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_replace.classes_test_replace_ref = None
@@ -318,33 +416,49 @@ class test_join(string_test):
     def _getClass(self):
         return u"classes.test_join"
 
-    def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+    def _getField_0(self, name):
+        return (self).what
+
+    def _getField_1(self, name):
+        return (self).parts
 
-        if ((name) == (u"parts")):
-            return (self).parts
+    def _getField_2(self, name):
+        return (self).strparts
 
-        if ((name) == (u"strparts")):
-            return (self).strparts
+    def _getField_3(self, name):
+        return (self).sep
 
-        if ((name) == (u"sep")):
-            return (self).sep
+    _getField_cases = {u"what": _getField_0, u"parts": _getField_1, u"strparts": _getField_2, u"sep": _getField_3}
+
+    def _getField(self, name):
+        case = test_join._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self).parts = _cast(value, lambda: _List)
+        return
 
-        if ((name) == (u"parts")):
-            (self).parts = _cast(value, lambda: _List)
+    def _setField_2(self, name, value):
+        (self).strparts = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"strparts")):
-            (self).strparts = _cast(value, lambda: unicode)
+    def _setField_3(self, name, value):
+        (self).sep = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"sep")):
-            (self).sep = _cast(value, lambda: unicode)
+    _setField_cases = {u"what": _setField_0, u"parts": _setField_1, u"strparts": _setField_2, u"sep": _setField_3}
+
+    def _setField(self, name, value):
+        case = test_join._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_join.classes_test_join_ref = None
@@ -367,27 +481,42 @@ class test_split(string_test):
     def _getClass(self):
         return u"classes.test_split"
 
-    def _getField(self, name):
-        if ((name) == (u"what")):
-            return (self).what
+    def _getField_0(self, name):
+        return (self).what
+
+    def _getField_1(self, name):
+        return (self).sep
 
-        if ((name) == (u"sep")):
-            return (self).sep
+    def _getField_2(self, name):
+        return (self).altsep
 
-        if ((name) == (u"altsep")):
-            return (self).altsep
+    _getField_cases = {u"what": _getField_0, u"sep": _getField_1, u"altsep": _getField_2}
+
+    def _getField(self, name):
+        case = test_split._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"what")):
-            (self).what = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).what = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self).sep = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"sep")):
-            (self).sep = _cast(value, lambda: unicode)
+    def _setField_2(self, name, value):
+        (self).altsep = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"altsep")):
-            (self).altsep = _cast(value, lambda: unicode)
+    _setField_cases = {u"what": _setField_0, u"sep": _setField_1, u"altsep": _setField_2}
+
+    def _setField(self, name, value):
+        case = test_split._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 test_split.classes_test_split_ref = None
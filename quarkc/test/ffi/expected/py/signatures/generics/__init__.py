@@ -27,15 +27,28 @@ class Box(_QObject):
     def _getClass(self):
         return u"generics.Box<quark.Object>"
 
+    def _getField_0(self, name):
+        return (self).contents
+
+    _getField_cases = {u"contents": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"contents")):
-            return (self).contents
+        case = Box._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).contents = _cast(value, lambda: T)
+        return
+
+    _setField_cases = {u"contents": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"contents")):
-            (self).contents = _cast(value, lambda: T)
+        case = Box._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 
@@ -55,21 +68,35 @@ class Crate(_QObject):
     def _getClass(self):
         return u"generics.Crate<quark.Object>"
 
-    def _getField(self, name):
-        if ((name) == (u"box")):
-            return (self).box
+    def _getField_0(self, name):
+        return (self).box
+
+    def _getField_1(self, name):
+        return (self).ibox
 
-        if ((name) == (u"ibox")):
-            return (self).ibox
+    _getField_cases = {u"box": _getField_0, u"ibox": _getField_1}
+
+    def _getField(self, name):
+        case = Crate._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"box")):
-            (self).box = _cast(value, lambda: Box)
+    def _setField_0(self, name, value):
+        (self).box = _cast(value, lambda: Box)
+        return
 
-        if ((name) == (u"ibox")):
-            (self).ibox = _cast(value, lambda: Box)
+    def _setField_1(self, name, value):
+        (self).ibox = _cast(value, lambda: Box)
+        return
+
+    _setField_cases = {u"box": _setField_0, u"ibox": _setField_1}
+
+    def _setField(self, name, value):
+        case = Crate._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Crate.generics_Box_quark_Object__ref = None
@@ -84,15 +111,28 @@ class Sack(_QObject):
     def _getClass(self):
         return u"generics.Sack"
 
+    def _getField_0(self, name):
+        return (self).ints
+
+    _getField_cases = {u"ints": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"ints")):
-            return (self).ints
+        case = Sack._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).ints = _cast(value, lambda: Box)
+        return
+
+    _setField_cases = {u"ints": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"ints")):
-            (self).ints = _cast(value, lambda: Box)
+        case = Sack._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Sack.generics_Sack_ref = None
@@ -114,27 +154,42 @@ class Matrix(_QObject):
     def _getClass(self):
         return u"generics.Matrix<quark.Object>"
 
-    def _getField(self, name):
-        if ((name) == (u"width")):
-            return (self).width
+    def _getField_0(self, name):
+        return (self).width
+
+    def _getField_1(self, name):
+        return (self).height
 
-        if ((name) == (u"height")):
-            return (self).height
+    def _getField_2(self, name):
+        return (self).columns
 
-        if ((name) == (u"columns")):
-            return (self).columns
+    _getField_cases = {u"width": _getField_0, u"height": _getField_1, u"columns": _getField_2}
+
+    def _getField(self, name):
+        case = Matrix._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"width")):
-            (self).width = _cast(value, lambda: int)
+    def _setField_0(self, name, value):
+        (self).width = _cast(value, lambda: int)
+        return
 
-        if ((name) == (u"height")):
-            (self).height = _cast(value, lambda: int)
+    def _setField_1(self, name, value):
+        (self).height = _cast(value, lambda: int)
+        return
 
-        if ((name) == (u"columns")):
-            (self).columns = _cast(value, lambda: _List)
+    def _setField_2(self, name, value):
+        (self).columns = _cast(value, lambda: _List)
+        return
+
+    _setField_cases = {u"width": _setField_0, u"height": _setField_1, u"columns": _setField_2}
+
+    def _setField(self, name, value):
+        case = Matrix._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Matrix.generics_Matrix_quark_Object__ref = None
@@ -44,27 +44,42 @@ class Context(_QObject):
     def _getClass(self):
         return u"generics.ccc.Context"
 
-    def _getField(self, name):
-        if ((name) == (u"_global")):
-            return Context._global
+    def _getField_0(self, name):
+        return Context._global
+
+    def _getField_1(self, name):
+        return Context._current
+
+    def _getField_2(self, name):
+        return (self).parent
 
-        if ((name) == (u"_current")):
-            return Context._current
+    _getField_cases = {u"_global": _getField_0, u"_current": _getField_1, u"parent": _getField_2}
 
-        if ((name) == (u"parent")):
-            return (self).parent
+    def _getField(self, name):
+        case = Context._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"_global")):
-            Context._global = _cast(value, lambda: Context)
+    def _setField_0(self, name, value):
+        Context._global = _cast(value, lambda: Context)
+        return
+
+    def _setField_1(self, name, value):
+        Context._current = _cast(value, lambda: TLS)
+        return
 
-        if ((name) == (u"_current")):
-            Context._current = _cast(value, lambda: TLS)
+    def _setField_2(self, name, value):
+        (self).parent = _cast(value, lambda: Context)
+        return
 
-        if ((name) == (u"parent")):
-            (self).parent = _cast(value, lambda: Context)
+    _setField_cases = {u"_global": _setField_0, u"_current": _setField_1, u"parent": _setField_2}
+
+    def _setField(self, name, value):
+        case = Context._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Context._global = None
@@ -90,15 +105,28 @@ class TLS(_QObject):
     def _getClass(self):
         return u"generics.ccc.TLS<quark.Object>"
 
+    def _getField_0(self, name):
+        return (self)._value
+
+    _getField_cases = {u"_value": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"_value")):
-            return (self)._value
+        case = TLS._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self)._value = _cast(value, lambda: T)
+        return
+
+    _setField_cases = {u"_value": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"_value")):
-            (self)._value = _cast(value, lambda: T)
+        case = TLS._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 
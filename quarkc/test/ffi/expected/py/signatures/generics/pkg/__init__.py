@@ -49,15 +49,28 @@ class Box(_QObject):
     def _getClass(self):
         return u"generics.pkg.Box<quark.Object>"
 
+    def _getField_0(self, name):
+        return (self).contents
+
+    _getField_cases = {u"contents": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"contents")):
-            return (self).contents
+        case = Box._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).contents = _cast(value, lambda: T)
+        return
+
+    _setField_cases = {u"contents": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"contents")):
-            (self).contents = _cast(value, lambda: T)
+        case = Box._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 
@@ -71,15 +84,28 @@ class StringBox(Box):
     def _getClass(self):
         return u"generics.pkg.StringBox"
 
+    def _getField_0(self, name):
+        return (self).contents
+
+    _getField_cases = {u"contents": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"contents")):
-            return (self).contents
+        case = StringBox._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).contents = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"contents": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"contents")):
-            (self).contents = _cast(value, lambda: unicode)
+        case = StringBox._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 StringBox.generics_pkg_Box_quark_String__ref = None
@@ -23,15 +23,28 @@ class Base(_QObject):
     def _getClass(self):
         return u"inheritance.Base"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = Base._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = Base._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Base.inheritance_Base_ref = None
@@ -47,27 +60,42 @@ class Test(Base):
     def _getClass(self):
         return u"inheritance.Test"
 
-    def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+    def _getField_0(self, name):
+        return (self).name
+
+    def _getField_1(self, name):
+        return (self).mumble
+
+    def _getField_2(self, name):
+        return (self).later
 
-        if ((name) == (u"mumble")):
-            return (self).mumble
+    _getField_cases = {u"name": _getField_0, u"mumble": _getField_1, u"later": _getField_2}
 
-        if ((name) == (u"later")):
-            return (self).later
+    def _getField(self, name):
+        case = Test._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"mumble")):
-            (self).mumble = _cast(value, lambda: unicode)
+    def _setField_1(self, name, value):
+        (self).mumble = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"later")):
-            (self).later = _cast(value, lambda: unicode)
+    def _setField_2(self, name, value):
+        (self).later = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0, u"mumble": _setField_1, u"later": _setField_2}
+
+    def _setField(self, name, value):
+        case = Test._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Test.inheritance_Test_ref = None
@@ -81,15 +109,28 @@ class A(_QObject):
     def _getClass(self):
         return u"inheritance.A"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = A._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = A._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 A.inheritance_A_ref = None
@@ -106,15 +147,28 @@ class B(A):
     def _getClass(self):
         return u"inheritance.B"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = B._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = B._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 B.inheritance_B_ref = None
@@ -131,15 +185,28 @@ class C(A):
     def _getClass(self):
         return u"inheritance.C"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = C._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = C._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 C.inheritance_C_ref = None
@@ -171,15 +238,28 @@ class Y(X):
     def _getClass(self):
         return u"inheritance.Y"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = Y._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = Y._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Y.inheritance_Y_ref = None
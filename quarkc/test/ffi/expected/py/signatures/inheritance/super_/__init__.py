@@ -22,15 +22,28 @@ class A(_QObject):
     def _getClass(self):
         return u"inheritance.super_.A"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = A._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = A._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 A.inheritance_super__A_ref = None
@@ -47,15 +60,28 @@ class B(A):
     def _getClass(self):
         return u"inheritance.super_.B"
 
+    def _getField_0(self, name):
+        return (self).name
+
+    _getField_cases = {u"name": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"name")):
-            return (self).name
+        case = B._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        (self).name = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"name": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"name")):
-            (self).name = _cast(value, lambda: unicode)
+        case = B._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 B.inheritance_super__B_ref = None
@@ -242,9 +242,15 @@ class Constants(_QObject):
     def _getClass(self):
         return u"interfaces.Constants"
 
+    def _getField_0(self, name):
+        return IConstants.FOO
+
+    _getField_cases = {u"FOO": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"FOO")):
-            return IConstants.FOO
+        case = Constants._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
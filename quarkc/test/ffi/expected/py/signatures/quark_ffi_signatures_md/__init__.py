@@ -67,6 +67,21 @@ class generics_Box_quark_Object_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.Box);
+        quark._encodeField(json, self, 0, (obj).contents);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.Box);
+        item = None;
+        item = quark._decodeItem(json, u"contents")
+        if ((item) != (None)):
+            (obj).contents = _cast(quark._decodeField(self, 0, item), lambda: T)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -135,6 +150,21 @@ class generics_Box_quark_int_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.Box);
+        quark._encodeField(json, self, 0, (obj).contents);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.Box);
+        item = None;
+        item = quark._decodeItem(json, u"contents")
+        if ((item) != (None)):
+            (obj).contents = _cast(quark._decodeField(self, 0, item), lambda: int)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -203,6 +233,26 @@ class generics_Crate_quark_Object_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.Crate);
+        quark._encodeField(json, self, 0, (obj).box);
+        quark._encodeField(json, self, 1, (obj).ibox);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.Crate);
+        item = None;
+        item = quark._decodeItem(json, u"box")
+        if ((item) != (None)):
+            (obj).box = _cast(quark._decodeField(self, 0, item), lambda: generics.Box)
+
+        item = quark._decodeItem(json, u"ibox")
+        if ((item) != (None)):
+            (obj).ibox = _cast(quark._decodeField(self, 1, item), lambda: generics.Box)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -230,6 +280,21 @@ class generics_Sack(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.Sack);
+        quark._encodeField(json, self, 0, (obj).ints);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.Sack);
+        item = None;
+        item = quark._decodeItem(json, u"ints")
+        if ((item) != (None)):
+            (obj).ints = _cast(quark._decodeField(self, 0, item), lambda: generics.Box)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -298,6 +363,31 @@ class generics_Matrix_quark_Object_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.Matrix);
+        quark._encodeNumber(json, u"width", (obj).width);
+        quark._encodeNumber(json, u"height", (obj).height);
+        quark._encodeField(json, self, 2, (obj).columns);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.Matrix);
+        item = None;
+        item = quark._decodeItem(json, u"width")
+        if ((item) != (None)):
+            (obj).width = quark._decodeInt(item)
+
+        item = quark._decodeItem(json, u"height")
+        if ((item) != (None)):
+            (obj).height = quark._decodeInt(item)
+
+        item = quark._decodeItem(json, u"columns")
+        if ((item) != (None)):
+            (obj).columns = _cast(quark._decodeField(self, 2, item), lambda: _List)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -345,6 +435,21 @@ class generics_constructors_Box_quark_Object_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.constructors.Box);
+        quark._encodeField(json, self, 0, (obj).contents);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.constructors.Box);
+        item = None;
+        item = quark._decodeItem(json, u"contents")
+        if ((item) != (None)):
+            (obj).contents = _cast(quark._decodeField(self, 0, item), lambda: T)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -479,6 +584,13 @@ class generics_pkg_StringFoo(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -506,6 +618,21 @@ class generics_pkg_Box_quark_String_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.pkg.Box);
+        quark._encodeField(json, self, 0, (obj).contents);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.pkg.Box);
+        item = None;
+        item = quark._decodeItem(json, u"contents")
+        if ((item) != (None)):
+            (obj).contents = _cast(quark._decodeField(self, 0, item), lambda: unicode)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -533,6 +660,21 @@ class generics_pkg_StringBox(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.pkg.StringBox);
+        quark._encodeField(json, self, 0, (obj).contents);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.pkg.StringBox);
+        item = None;
+        item = quark._decodeItem(json, u"contents")
+        if ((item) != (None)):
+            (obj).contents = _cast(quark._decodeField(self, 0, item), lambda: unicode)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -580,6 +722,13 @@ class generics_ccc_TLSContextInitializer(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -647,6 +796,21 @@ class generics_ccc_Context(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: generics.ccc.Context);
+        quark._encodeField(json, self, 2, (obj).parent);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: generics.ccc.Context);
+        item = None;
+        item = quark._decodeItem(json, u"parent")
+        if ((item) != (None)):
+            (obj).parent = _cast(quark._decodeField(self, 2, item), lambda: generics.ccc.Context)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -741,6 +905,13 @@ class generics_ccc_TLS_generics_ccc_Context_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -768,6 +939,21 @@ class inheritance_Base(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.Base);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.Base);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -795,6 +981,31 @@ class inheritance_Test(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.Test);
+        quark._encodeString(json, u"name", (obj).name);
+        quark._encodeString(json, u"mumble", (obj).mumble);
+        quark._encodeString(json, u"later", (obj).later);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.Test);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"mumble")
+        if ((item) != (None)):
+            (obj).mumble = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"later")
+        if ((item) != (None)):
+            (obj).later = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -822,6 +1033,21 @@ class inheritance_A(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.A);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.A);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -870,6 +1096,21 @@ class inheritance_B(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.B);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.B);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -918,6 +1159,21 @@ class inheritance_C(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.C);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.C);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -945,6 +1201,13 @@ class inheritance_X(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -993,6 +1256,21 @@ class inheritance_Y(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.Y);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.Y);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1041,6 +1319,13 @@ class inheritance_t1_A(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1089,6 +1374,13 @@ class inheritance_t1_B(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1137,6 +1429,13 @@ class inheritance_t1_C(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1164,6 +1463,13 @@ class inheritance_t2_A(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1191,6 +1497,13 @@ class inheritance_t2_B(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1218,6 +1531,13 @@ class inheritance_t2_X_quark_int_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1245,6 +1565,13 @@ class inheritance_t2_Y(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1341,6 +1668,13 @@ class inheritance_pets_Cat(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1389,6 +1723,13 @@ class inheritance_pets_Dog(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1436,6 +1777,13 @@ class inheritance_Message(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1483,6 +1831,13 @@ class inheritance_Ping(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1550,6 +1905,13 @@ class inheritance_Pong(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1598,6 +1960,21 @@ class inheritance_super__A(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.super_.A);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.super_.A);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1646,6 +2023,21 @@ class inheritance_super__B(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.super_.B);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.super_.B);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1694,6 +2086,13 @@ class inheritance_use_before_def_Bar(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1721,6 +2120,21 @@ class inheritance_use_before_def_Foo(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: inheritance.use_before_def.Foo);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: inheritance.use_before_def.Foo);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -1955,6 +2369,13 @@ class interfaces_T1(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2024,6 +2445,13 @@ class interfaces_T2(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2093,6 +2521,13 @@ class interfaces_T3(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2162,6 +2597,13 @@ class interfaces_T4(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2231,6 +2673,13 @@ class interfaces_T5(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2501,6 +2950,13 @@ class interfaces_Baz(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2771,6 +3227,13 @@ class interfaces_BazBar(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2861,6 +3324,13 @@ class interfaces_BazFaz_quark_Object_(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -2915,6 +3385,15 @@ class interfaces_Constants(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: interfaces.Constants);
+        quark._encodeString(json, u"FOO", interfaces.IConstants.FOO);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3003,6 +3482,21 @@ class classes_Overload(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.Overload);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.Overload);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3051,6 +3545,13 @@ class classes_Test(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3099,6 +3600,13 @@ class classes_string_test(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3167,6 +3675,21 @@ class classes_test_size(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_size);
+        quark._encodeString(json, u"what", (obj).what);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_size);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3255,6 +3778,21 @@ class classes_test_startsWith(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_startsWith);
+        quark._encodeString(json, u"what", (obj).what);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_startsWith);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3343,6 +3881,21 @@ class classes_test_endsWith(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_endsWith);
+        quark._encodeString(json, u"what", (obj).what);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_endsWith);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3431,6 +3984,21 @@ class classes_test_find(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_find);
+        quark._encodeString(json, u"what", (obj).what);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_find);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3519,6 +4087,31 @@ class classes_test_substring(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_substring);
+        quark._encodeString(json, u"what", (obj).what);
+        quark._encodeNumber(json, u"start", (obj).start);
+        quark._encodeNumber(json, u"end", (obj).end);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_substring);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"start")
+        if ((item) != (None)):
+            (obj).start = quark._decodeInt(item)
+
+        item = quark._decodeItem(json, u"end")
+        if ((item) != (None)):
+            (obj).end = quark._decodeInt(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3607,6 +4200,31 @@ class classes_test_replace(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_replace);
+        quark._encodeString(json, u"what", (obj).what);
+        quark._encodeString(json, u"start", (obj).start);
+        quark._encodeString(json, u"end", (obj).end);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_replace);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"start")
+        if ((item) != (None)):
+            (obj).start = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"end")
+        if ((item) != (None)):
+            (obj).end = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3715,6 +4333,36 @@ class classes_test_join(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_join);
+        quark._encodeString(json, u"what", (obj).what);
+        quark._encodeField(json, self, 1, (obj).parts);
+        quark._encodeString(json, u"strparts", (obj).strparts);
+        quark._encodeString(json, u"sep", (obj).sep);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_join);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"parts")
+        if ((item) != (None)):
+            (obj).parts = _cast(quark._decodeField(self, 1, item), lambda: _List)
+
+        item = quark._decodeItem(json, u"strparts")
+        if ((item) != (None)):
+            (obj).strparts = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"sep")
+        if ((item) != (None)):
+            (obj).sep = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3803,6 +4451,31 @@ class classes_test_split(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: classes.test_split);
+        quark._encodeString(json, u"what", (obj).what);
+        quark._encodeString(json, u"sep", (obj).sep);
+        quark._encodeString(json, u"altsep", (obj).altsep);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: classes.test_split);
+        item = None;
+        item = quark._decodeItem(json, u"what")
+        if ((item) != (None)):
+            (obj).what = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"sep")
+        if ((item) != (None)):
+            (obj).sep = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"altsep")
+        if ((item) != (None)):
+            (obj).altsep = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -3871,6 +4544,13 @@ class classes_stuff_Test(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -4023,6 +4703,21 @@ class statics_Foo(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: statics.Foo);
+        quark._encodeNumber(json, u"count", statics.Foo.count);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: statics.Foo);
+        item = None;
+        item = quark._decodeItem(json, u"count")
+        if ((item) != (None)):
+            statics.Foo.count = quark._decodeInt(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -4070,6 +4765,21 @@ class docs_Test(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: docs.Test);
+        quark._encodeString(json, u"name", (obj).name);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: docs.Test);
+        item = None;
+        item = quark._decodeItem(json, u"name")
+        if ((item) != (None)):
+            (obj).name = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -4251,6 +4961,11 @@ def _lazy_import_generics():
     globals().update(locals())
 _lazyImport("import generics", _lazy_import_generics)
 
+def _lazy_import_quark():
+    import quark
+    globals().update(locals())
+_lazyImport("import quark", _lazy_import_quark)
+
 def _lazy_import_generics_constructors():
     import generics.constructors
     globals().update(locals())
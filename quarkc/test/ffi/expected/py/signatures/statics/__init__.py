@@ -38,15 +38,28 @@ class Foo(_QObject):
     def _getClass(self):
         return u"statics.Foo"
 
+    def _getField_0(self, name):
+        return Foo.count
+
+    _getField_cases = {u"count": _getField_0}
+
     def _getField(self, name):
-        if ((name) == (u"count")):
-            return Foo.count
+        case = Foo._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
+    def _setField_0(self, name, value):
+        Foo.count = _cast(value, lambda: int)
+        return
+
+    _setField_cases = {u"count": _setField_0}
+
     def _setField(self, name, value):
-        if ((name) == (u"count")):
-            Foo.count = _cast(value, lambda: int)
+        case = Foo._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Foo.count = None
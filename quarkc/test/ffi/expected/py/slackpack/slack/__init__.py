@@ -44,21 +44,35 @@ class User(_QObject):
     def _getClass(self):
         return u"slack.User"
 
-    def _getField(self, name):
-        if ((name) == (u"client")):
-            return (self).client
+    def _getField_0(self, name):
+        return (self).client
+
+    def _getField_1(self, name):
+        return (self).user
+
+    _getField_cases = {u"client": _getField_0, u"user": _getField_1}
 
-        if ((name) == (u"user")):
-            return (self).user
+    def _getField(self, name):
+        case = User._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"client")):
-            (self).client = _cast(value, lambda: Client)
+    def _setField_0(self, name, value):
+        (self).client = _cast(value, lambda: Client)
+        return
+
+    def _setField_1(self, name, value):
+        (self).user = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"user")):
-            (self).user = _cast(value, lambda: unicode)
+    _setField_cases = {u"client": _setField_0, u"user": _setField_1}
+
+    def _setField(self, name, value):
+        case = User._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 User.slack_User_ref = None
@@ -82,21 +96,35 @@ class Channel(_QObject):
     def _getClass(self):
         return u"slack.Channel"
 
-    def _getField(self, name):
-        if ((name) == (u"client")):
-            return (self).client
+    def _getField_0(self, name):
+        return (self).client
 
-        if ((name) == (u"channel")):
-            return (self).channel
+    def _getField_1(self, name):
+        return (self).channel
+
+    _getField_cases = {u"client": _getField_0, u"channel": _getField_1}
+
+    def _getField(self, name):
+        case = Channel._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"client")):
-            (self).client = _cast(value, lambda: Client)
+    def _setField_0(self, name, value):
+        (self).client = _cast(value, lambda: Client)
+        return
+
+    def _setField_1(self, name, value):
+        (self).channel = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"client": _setField_0, u"channel": _setField_1}
 
-        if ((name) == (u"channel")):
-            (self).channel = _cast(value, lambda: unicode)
+    def _setField(self, name, value):
+        case = Channel._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Channel.slack_Channel_ref = None
@@ -150,39 +178,56 @@ class Client(_QObject):
     def _getClass(self):
         return u"slack.Client"
 
-    def _getField(self, name):
-        if ((name) == (u"runtime")):
-            return (self).runtime
+    def _getField_0(self, name):
+        return (self).runtime
+
+    def _getField_1(self, name):
+        return (self).token
 
-        if ((name) == (u"token")):
-            return (self).token
+    def _getField_2(self, name):
+        return (self).handler
 
-        if ((name) == (u"handler")):
-            return (self).handler
+    def _getField_3(self, name):
+        return (self).event_id
 
-        if ((name) == (u"event_id")):
-            return (self).event_id
+    def _getField_4(self, name):
+        return (self).socket
 
-        if ((name) == (u"socket")):
-            return (self).socket
+    _getField_cases = {u"runtime": _getField_0, u"token": _getField_1, u"handler": _getField_2, u"event_id": _getField_3, u"socket": _getField_4}
+
+    def _getField(self, name):
+        case = Client._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"runtime")):
-            (self).runtime = _cast(value, lambda: quark.Runtime)
+    def _setField_0(self, name, value):
+        (self).runtime = _cast(value, lambda: quark.Runtime)
+        return
 
-        if ((name) == (u"token")):
-            (self).token = _cast(value, lambda: unicode)
+    def _setField_1(self, name, value):
+        (self).token = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"handler")):
-            (self).handler = _cast(value, lambda: SlackHandler)
+    def _setField_2(self, name, value):
+        (self).handler = _cast(value, lambda: SlackHandler)
+        return
 
-        if ((name) == (u"event_id")):
-            (self).event_id = _cast(value, lambda: int)
+    def _setField_3(self, name, value):
+        (self).event_id = _cast(value, lambda: int)
+        return
 
-        if ((name) == (u"socket")):
-            (self).socket = _cast(value, lambda: quark.WebSocket)
+    def _setField_4(self, name, value):
+        (self).socket = _cast(value, lambda: quark.WebSocket)
+        return
+
+    _setField_cases = {u"runtime": _setField_0, u"token": _setField_1, u"handler": _setField_2, u"event_id": _setField_3, u"socket": _setField_4}
+
+    def _setField(self, name, value):
+        case = Client._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
     def onWSInit(self, socket):
         """
@@ -31,33 +31,49 @@ class SlackEvent(_QObject):
     def _getClass(self):
         return u"slack.event.SlackEvent"
 
-    def _getField(self, name):
-        if ((name) == (u"type")):
-            return (self).type
+    def _getField_0(self, name):
+        return (self).type
+
+    def _getField_1(self, name):
+        return (self).user
 
-        if ((name) == (u"user")):
-            return (self).user
+    def _getField_2(self, name):
+        return (self).channel
 
-        if ((name) == (u"channel")):
-            return (self).channel
+    def _getField_3(self, name):
+        return (self).timestamp
 
-        if ((name) == (u"timestamp")):
-            return (self).timestamp
+    _getField_cases = {u"type": _getField_0, u"user": _getField_1, u"channel": _getField_2, u"timestamp": _getField_3}
+
+    def _getField(self, name):
+        case = SlackEvent._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"type")):
-            (self).type = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).type = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"user")):
-            (self).user = _cast(value, lambda: slack.User)
+    def _setField_1(self, name, value):
+        (self).user = _cast(value, lambda: slack.User)
+        return
 
-        if ((name) == (u"channel")):
-            (self).channel = _cast(value, lambda: slack.Channel)
+    def _setField_2(self, name, value):
+        (self).channel = _cast(value, lambda: slack.Channel)
+        return
 
-        if ((name) == (u"timestamp")):
-            (self).timestamp = _cast(value, lambda: unicode)
+    def _setField_3(self, name, value):
+        (self).timestamp = _cast(value, lambda: unicode)
+        return
+
+    _setField_cases = {u"type": _setField_0, u"user": _setField_1, u"channel": _setField_2, u"timestamp": _setField_3}
+
+    def _setField(self, name, value):
+        case = SlackEvent._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 SlackEvent.slack_event_SlackEvent_ref = None
@@ -82,45 +98,63 @@ class SlackError(SlackEvent):
     def _getClass(self):
         return u"slack.event.SlackError"
 
-    def _getField(self, name):
-        if ((name) == (u"type")):
-            return (self).type
+    def _getField_0(self, name):
+        return (self).type
+
+    def _getField_1(self, name):
+        return (self).user
 
-        if ((name) == (u"user")):
-            return (self).user
+    def _getField_2(self, name):
+        return (self).channel
 
-        if ((name) == (u"channel")):
-            return (self).channel
+    def _getField_3(self, name):
+        return (self).timestamp
 
-        if ((name) == (u"timestamp")):
-            return (self).timestamp
+    def _getField_4(self, name):
+        return (self).code
 
-        if ((name) == (u"code")):
-            return (self).code
+    def _getField_5(self, name):
+        return (self).text
 
-        if ((name) == (u"text")):
-            return (self).text
+    _getField_cases = {u"type": _getField_0, u"user": _getField_1, u"channel": _getField_2, u"timestamp": _getField_3, u"code": _getField_4, u"text": _getField_5}
+
+    def _getField(self, name):
+        case = SlackError._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"type")):
-            (self).type = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).type = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self).user = _cast(value, lambda: slack.User)
+        return
+
+    def _setField_2(self, name, value):
+        (self).channel = _cast(value, lambda: slack.Channel)
+        return
 
-        if ((name) == (u"user")):
-            (self).user = _cast(value, lambda: slack.User)
+    def _setField_3(self, name, value):
+        (self).timestamp = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"channel")):
-            (self).channel = _cast(value, lambda: slack.Channel)
+    def _setField_4(self, name, value):
+        (self).code = _cast(value, lambda: int)
+        return
 
-        if ((name) == (u"timestamp")):
-            (self).timestamp = _cast(value, lambda: unicode)
+    def _setField_5(self, name, value):
+        (self).text = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"code")):
-            (self).code = _cast(value, lambda: int)
+    _setField_cases = {u"type": _setField_0, u"user": _setField_1, u"channel": _setField_2, u"timestamp": _setField_3, u"code": _setField_4, u"text": _setField_5}
 
-        if ((name) == (u"text")):
-            (self).text = _cast(value, lambda: unicode)
+    def _setField(self, name, value):
+        case = SlackError._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 SlackError.slack_event_SlackError_ref = None
@@ -140,33 +174,49 @@ class Hello(SlackEvent):
     def _getClass(self):
         return u"slack.event.Hello"
 
-    def _getField(self, name):
-        if ((name) == (u"type")):
-            return (self).type
+    def _getField_0(self, name):
+        return (self).type
+
+    def _getField_1(self, name):
+        return (self).user
 
-        if ((name) == (u"user")):
-            return (self).user
+    def _getField_2(self, name):
+        return (self).channel
 
-        if ((name) == (u"channel")):
-            return (self).channel
+    def _getField_3(self, name):
+        return (self).timestamp
 
-        if ((name) == (u"timestamp")):
-            return (self).timestamp
+    _getField_cases = {u"type": _getField_0, u"user": _getField_1, u"channel": _getField_2, u"timestamp": _getField_3}
+
+    def _getField(self, name):
+        case = Hello._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"type")):
-            (self).type = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).type = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self).user = _cast(value, lambda: slack.User)
+        return
 
-        if ((name) == (u"user")):
-            (self).user = _cast(value, lambda: slack.User)
+    def _setField_2(self, name, value):
+        (self).channel = _cast(value, lambda: slack.Channel)
+        return
 
-        if ((name) == (u"channel")):
-            (self).channel = _cast(value, lambda: slack.Channel)
+    def _setField_3(self, name, value):
+        (self).timestamp = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"timestamp")):
-            (self).timestamp = _cast(value, lambda: unicode)
+    _setField_cases = {u"type": _setField_0, u"user": _setField_1, u"channel": _setField_2, u"timestamp": _setField_3}
+
+    def _setField(self, name, value):
+        case = Hello._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Hello.slack_event_Hello_ref = None
@@ -193,57 +243,77 @@ class Message(SlackEvent):
     def _getClass(self):
         return u"slack.event.Message"
 
-    def _getField(self, name):
-        if ((name) == (u"type")):
-            return (self).type
+    def _getField_0(self, name):
+        return (self).type
 
-        if ((name) == (u"user")):
-            return (self).user
+    def _getField_1(self, name):
+        return (self).user
 
-        if ((name) == (u"channel")):
-            return (self).channel
+    def _getField_2(self, name):
+        return (self).channel
 
-        if ((name) == (u"timestamp")):
-            return (self).timestamp
+    def _getField_3(self, name):
+        return (self).timestamp
 
-        if ((name) == (u"subtype")):
-            return (self).subtype
+    def _getField_4(self, name):
+        return (self).subtype
 
-        if ((name) == (u"hidden")):
-            return (self).hidden
+    def _getField_5(self, name):
+        return (self).hidden
 
-        if ((name) == (u"text")):
-            return (self).text
+    def _getField_6(self, name):
+        return (self).text
 
-        if ((name) == (u"edited")):
-            return (self).edited
+    def _getField_7(self, name):
+        return (self).edited
+
+    _getField_cases = {u"type": _getField_0, u"user": _getField_1, u"channel": _getField_2, u"timestamp": _getField_3, u"subtype": _getField_4, u"hidden": _getField_5, u"text": _getField_6, u"edited": _getField_7}
+
+    def _getField(self, name):
+        case = Message._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"type")):
-            (self).type = _cast(value, lambda: unicode)
+    def _setField_0(self, name, value):
+        (self).type = _cast(value, lambda: unicode)
+        return
+
+    def _setField_1(self, name, value):
+        (self).user = _cast(value, lambda: slack.User)
+        return
 
-        if ((name) == (u"user")):
-            (self).user = _cast(value, lambda: slack.User)
+    def _setField_2(self, name, value):
+        (self).channel = _cast(value, lambda: slack.Channel)
+        return
 
-        if ((name) == (u"channel")):
-            (self).channel = _cast(value, lambda: slack.Channel)
+    def _setField_3(self, name, value):
+        (self).timestamp = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"timestamp")):
-            (self).timestamp = _cast(value, lambda: unicode)
+    def _setField_4(self, name, value):
+        (self).subtype = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"subtype")):
-            (self).subtype = _cast(value, lambda: unicode)
+    def _setField_5(self, name, value):
+        (self).hidden = _cast(value, lambda: bool)
+        return
 
-        if ((name) == (u"hidden")):
-            (self).hidden = _cast(value, lambda: bool)
+    def _setField_6(self, name, value):
+        (self).text = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"text")):
-            (self).text = _cast(value, lambda: unicode)
+    def _setField_7(self, name, value):
+        (self).edited = _cast(value, lambda: Edited)
+        return
 
-        if ((name) == (u"edited")):
-            (self).edited = _cast(value, lambda: Edited)
+    _setField_cases = {u"type": _setField_0, u"user": _setField_1, u"channel": _setField_2, u"timestamp": _setField_3, u"subtype": _setField_4, u"hidden": _setField_5, u"text": _setField_6, u"edited": _setField_7}
+
+    def _setField(self, name, value):
+        case = Message._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Message.slack_event_Message_ref = None
@@ -260,21 +330,35 @@ class Edited(_QObject):
     def _getClass(self):
         return u"slack.event.Edited"
 
-    def _getField(self, name):
-        if ((name) == (u"user")):
-            return (self).user
+    def _getField_0(self, name):
+        return (self).user
+
+    def _getField_1(self, name):
+        return (self).timestamp
+
+    _getField_cases = {u"user": _getField_0, u"timestamp": _getField_1}
 
-        if ((name) == (u"timestamp")):
-            return (self).timestamp
+    def _getField(self, name):
+        case = Edited._getField_cases.get(name)
+        if (case is not None):
+            return case(self, name)
 
         return None
 
-    def _setField(self, name, value):
-        if ((name) == (u"user")):
-            (self).user = _cast(value, lambda: slack.User)
+    def _setField_0(self, name, value):
+        (self).user = _cast(value, lambda: slack.User)
+        return
+
+    def _setField_1(self, name, value):
+        (self).timestamp = _cast(value, lambda: unicode)
+        return
 
-        if ((name) == (u"timestamp")):
-            (self).timestamp = _cast(value, lambda: unicode)
+    _setField_cases = {u"user": _setField_0, u"timestamp": _setField_1}
+
+    def _setField(self, name, value):
+        case = Edited._setField_cases.get(name)
+        if (case is not None):
+            return case(self, name, value)
 
 
 Edited.slack_event_Edited_ref = None
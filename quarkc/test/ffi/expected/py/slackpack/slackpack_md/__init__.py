@@ -68,6 +68,36 @@ class slack_event_SlackEvent(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.event.SlackEvent);
+        quark._encodeString(json, u"type", (obj).type);
+        quark._encodeField(json, self, 1, (obj).user);
+        quark._encodeField(json, self, 2, (obj).channel);
+        quark._encodeString(json, u"timestamp", (obj).timestamp);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.event.SlackEvent);
+        item = None;
+        item = quark._decodeItem(json, u"type")
+        if ((item) != (None)):
+            (obj).type = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"user")
+        if ((item) != (None)):
+            (obj).user = _cast(quark._decodeField(self, 1, item), lambda: slack.User)
+
+        item = quark._decodeItem(json, u"channel")
+        if ((item) != (None)):
+            (obj).channel = _cast(quark._decodeField(self, 2, item), lambda: slack.Channel)
+
+        item = quark._decodeItem(json, u"timestamp")
+        if ((item) != (None)):
+            (obj).timestamp = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -137,6 +167,46 @@ class slack_event_SlackError(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.event.SlackError);
+        quark._encodeString(json, u"type", (obj).type);
+        quark._encodeField(json, self, 1, (obj).user);
+        quark._encodeField(json, self, 2, (obj).channel);
+        quark._encodeString(json, u"timestamp", (obj).timestamp);
+        quark._encodeNumber(json, u"code", (obj).code);
+        quark._encodeString(json, u"text", (obj).text);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.event.SlackError);
+        item = None;
+        item = quark._decodeItem(json, u"type")
+        if ((item) != (None)):
+            (obj).type = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"user")
+        if ((item) != (None)):
+            (obj).user = _cast(quark._decodeField(self, 1, item), lambda: slack.User)
+
+        item = quark._decodeItem(json, u"channel")
+        if ((item) != (None)):
+            (obj).channel = _cast(quark._decodeField(self, 2, item), lambda: slack.Channel)
+
+        item = quark._decodeItem(json, u"timestamp")
+        if ((item) != (None)):
+            (obj).timestamp = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"code")
+        if ((item) != (None)):
+            (obj).code = quark._decodeInt(item)
+
+        item = quark._decodeItem(json, u"text")
+        if ((item) != (None)):
+            (obj).text = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -206,6 +276,36 @@ class slack_event_Hello(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.event.Hello);
+        quark._encodeString(json, u"type", (obj).type);
+        quark._encodeField(json, self, 1, (obj).user);
+        quark._encodeField(json, self, 2, (obj).channel);
+        quark._encodeString(json, u"timestamp", (obj).timestamp);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.event.Hello);
+        item = None;
+        item = quark._decodeItem(json, u"type")
+        if ((item) != (None)):
+            (obj).type = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"user")
+        if ((item) != (None)):
+            (obj).user = _cast(quark._decodeField(self, 1, item), lambda: slack.User)
+
+        item = quark._decodeItem(json, u"channel")
+        if ((item) != (None)):
+            (obj).channel = _cast(quark._decodeField(self, 2, item), lambda: slack.Channel)
+
+        item = quark._decodeItem(json, u"timestamp")
+        if ((item) != (None)):
+            (obj).timestamp = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -275,6 +375,56 @@ class slack_event_Message(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.event.Message);
+        quark._encodeString(json, u"type", (obj).type);
+        quark._encodeField(json, self, 1, (obj).user);
+        quark._encodeField(json, self, 2, (obj).channel);
+        quark._encodeString(json, u"timestamp", (obj).timestamp);
+        quark._encodeString(json, u"subtype", (obj).subtype);
+        quark._encodeField(json, self, 5, (obj).hidden);
+        quark._encodeString(json, u"text", (obj).text);
+        quark._encodeField(json, self, 7, (obj).edited);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.event.Message);
+        item = None;
+        item = quark._decodeItem(json, u"type")
+        if ((item) != (None)):
+            (obj).type = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"user")
+        if ((item) != (None)):
+            (obj).user = _cast(quark._decodeField(self, 1, item), lambda: slack.User)
+
+        item = quark._decodeItem(json, u"channel")
+        if ((item) != (None)):
+            (obj).channel = _cast(quark._decodeField(self, 2, item), lambda: slack.Channel)
+
+        item = quark._decodeItem(json, u"timestamp")
+        if ((item) != (None)):
+            (obj).timestamp = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"subtype")
+        if ((item) != (None)):
+            (obj).subtype = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"hidden")
+        if ((item) != (None)):
+            (obj).hidden = _cast(quark._decodeField(self, 5, item), lambda: bool)
+
+        item = quark._decodeItem(json, u"text")
+        if ((item) != (None)):
+            (obj).text = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"edited")
+        if ((item) != (None)):
+            (obj).edited = _cast(quark._decodeField(self, 7, item), lambda: slack.event.Edited)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -302,6 +452,26 @@ class slack_event_Edited(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.event.Edited);
+        quark._encodeField(json, self, 0, (obj).user);
+        quark._encodeString(json, u"timestamp", (obj).timestamp);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.event.Edited);
+        item = None;
+        item = quark._decodeItem(json, u"user")
+        if ((item) != (None)):
+            (obj).user = _cast(quark._decodeField(self, 0, item), lambda: slack.User)
+
+        item = quark._decodeItem(json, u"timestamp")
+        if ((item) != (None)):
+            (obj).timestamp = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -440,6 +610,26 @@ class slack_User(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.User);
+        quark._encodeField(json, self, 0, (obj).client);
+        quark._encodeString(json, u"user", (obj).user);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.User);
+        item = None;
+        item = quark._decodeItem(json, u"client")
+        if ((item) != (None)):
+            (obj).client = _cast(quark._decodeField(self, 0, item), lambda: slack.Client)
+
+        item = quark._decodeItem(json, u"user")
+        if ((item) != (None)):
+            (obj).user = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -488,6 +678,26 @@ class slack_Channel(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.Channel);
+        quark._encodeField(json, self, 0, (obj).client);
+        quark._encodeString(json, u"channel", (obj).channel);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.Channel);
+        item = None;
+        item = quark._decodeItem(json, u"client")
+        if ((item) != (None)):
+            (obj).client = _cast(quark._decodeField(self, 0, item), lambda: slack.Client)
+
+        item = quark._decodeItem(json, u"channel")
+        if ((item) != (None)):
+            (obj).channel = quark._decodeString(item)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -871,6 +1081,41 @@ class slack_Client(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        obj = _cast(object, lambda: slack.Client);
+        quark._encodeField(json, self, 0, (obj).runtime);
+        quark._encodeString(json, u"token", (obj).token);
+        quark._encodeField(json, self, 2, (obj).handler);
+        quark._encodeNumber(json, u"event_id", (obj).event_id);
+        quark._encodeField(json, self, 4, (obj).socket);
+        return True
+
+    def _decodeFields(self, object, json):
+        obj = _cast(object, lambda: slack.Client);
+        item = None;
+        item = quark._decodeItem(json, u"runtime")
+        if ((item) != (None)):
+            (obj).runtime = _cast(quark._decodeField(self, 0, item), lambda: quark.Runtime)
+
+        item = quark._decodeItem(json, u"token")
+        if ((item) != (None)):
+            (obj).token = quark._decodeString(item)
+
+        item = quark._decodeItem(json, u"handler")
+        if ((item) != (None)):
+            (obj).handler = _cast(quark._decodeField(self, 2, item), lambda: slack.SlackHandler)
+
+        item = quark._decodeItem(json, u"event_id")
+        if ((item) != (None)):
+            (obj).event_id = quark._decodeInt(item)
+
+        item = quark._decodeItem(json, u"socket")
+        if ((item) != (None)):
+            (obj).socket = _cast(quark._decodeField(self, 4, item), lambda: quark.WebSocket)
+
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
@@ -982,6 +1227,13 @@ class slackpack_Handler(quark.reflect.Class):
     def isAbstract(self):
         return False
 
+    def _encodeFields(self, object, json):
+        quark._encodeString(json, u"$class", (self).id);
+        return True
+
+    def _decodeFields(self, object, json):
+        return True
+
     def _getClass(self):
         return _cast(None, lambda: unicode)
 
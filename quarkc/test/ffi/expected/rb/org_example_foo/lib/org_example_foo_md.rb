@@ -3,6 +3,7 @@ def self.org_example_foo_md; OrgExampleFooMd; end
 module OrgExampleFooMd
 require 'quark' # .../reflect
 # for ('org_example_foo_md',): require_relative 'org/example/foo' # 0 ('org', 'example') ()
+require 'quark' 
 
 def self.org_example_foo_Foo_test_Method; OrgExampleFooFooTestMethod; end
 class OrgExampleFooFooTestMethod < ::Quark.quark.reflect.Method
@@ -96,6 +97,21 @@ class OrgExampleFooFoo < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
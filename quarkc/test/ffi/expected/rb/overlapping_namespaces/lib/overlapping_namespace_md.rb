@@ -3,6 +3,7 @@ def self.overlapping_namespace_md; OverlappingNamespaceMd; end
 module OverlappingNamespaceMd
 require 'quark' # .../reflect
 # for ('overlapping_namespace_md',): require_relative 'org/example/bar' # 0 ('org', 'example') ()
+require 'quark' 
 
 def self.org_example_bar_Bar_test_Method; OrgExampleBarBarTestMethod; end
 class OrgExampleBarBarTestMethod < ::Quark.quark.reflect.Method
@@ -96,6 +97,21 @@ class OrgExampleBarBar < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3,6 +3,7 @@ def self.package_md; PackageMd; end
 module PackageMd
 require 'quark' # .../reflect
 # for ('package_md',): require_relative 'test' # 0 () ()
+require 'quark' 
 # for ('package_md',): require_relative 'test/subtest' # 0 ('test',) ()
 
 def self.test_Test_go_Method; TestTestGoMethod; end
@@ -97,6 +98,29 @@ class TestTest < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.test.Test }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.test.Test }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -221,6 +245,29 @@ class TestSubtestTest < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.test.subtest.Test }
+        ::Quark.quark._encodeNumber(json, "size", (obj).size)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.test.subtest.Test }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "size")
+        if ((item) != (nil))
+            (obj).size = ::Quark.quark._decodeInt(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
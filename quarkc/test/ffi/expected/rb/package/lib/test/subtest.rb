@@ -49,7 +49,8 @@ class Test < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("size"))
+        case name
+        when "size"
             return (self).size
         end
         return nil
@@ -59,8 +60,10 @@ class Test < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("size"))
+        case name
+        when "size"
             (self).size = ::DatawireQuarkCore.cast(value) { ::Integer }
+            return
         end
 
         nil
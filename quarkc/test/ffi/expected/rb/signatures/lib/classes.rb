@@ -55,7 +55,8 @@ class Overload < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -65,8 +66,10 @@ class Overload < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -228,7 +231,8 @@ class TestSize < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
         end
         return nil
@@ -238,8 +242,10 @@ class TestSize < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -299,10 +305,10 @@ class TestStartsWith < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
-        end
-        if ((name) == ("_that"))
+        when "_that"
             return (self)._that
         end
         return nil
@@ -312,11 +318,13 @@ class TestStartsWith < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("_that"))
+            return
+        when "_that"
             (self)._that = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -377,10 +385,10 @@ class TestEndsWith < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
-        end
-        if ((name) == ("_that"))
+        when "_that"
             return (self)._that
         end
         return nil
@@ -390,11 +398,13 @@ class TestEndsWith < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("_that"))
+            return
+        when "_that"
             (self)._that = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -455,10 +465,10 @@ class TestFind < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
-        end
-        if ((name) == ("_that"))
+        when "_that"
             return (self)._that
         end
         return nil
@@ -468,11 +478,13 @@ class TestFind < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("_that"))
+            return
+        when "_that"
             (self)._that = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -533,13 +545,12 @@ class TestSubstring < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
-        end
-        if ((name) == ("start"))
+        when "start"
             return (self).start
-        end
-        if ((name) == ("end"))
+        when "end"
             return (self).end_
         end
         return nil
@@ -549,14 +560,16 @@ class TestSubstring < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("start"))
+            return
+        when "start"
             (self).start = ::DatawireQuarkCore.cast(value) { ::Integer }
-        end
-        if ((name) == ("end"))
+            return
+        when "end"
             (self).end_ = ::DatawireQuarkCore.cast(value) { ::Integer }
+            return
         end
 
         nil
@@ -618,13 +631,12 @@ class TestReplace < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
-        end
-        if ((name) == ("start"))
+        when "start"
             return (self).start
-        end
-        if ((name) == ("end"))
+        when "end"
             return (self).end_
         end
         return nil
@@ -634,14 +646,16 @@ class TestReplace < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("start"))
+            return
+        when "start"
             (self).start = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("end"))
+            return
+        when "end"
             (self).end_ = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -710,16 +724,14 @@ class TestJoin < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
-        end
-        if ((name) == ("parts"))
+        when "parts"
             return (self).parts
-        end
-        if ((name) == ("strparts"))
+        when "strparts"
             return (self).strparts
-        end
-        if ((name) == ("sep"))
+        when "sep"
             return (self).sep
         end
         return nil
@@ -729,17 +741,19 @@ class TestJoin < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("parts"))
+            return
+        when "parts"
             (self).parts = ::DatawireQuarkCore.cast(value) { ::DatawireQuarkCore::List }
-        end
-        if ((name) == ("strparts"))
+            return
+        when "strparts"
             (self).strparts = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("sep"))
+            return
+        when "sep"
             (self).sep = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -802,13 +816,12 @@ class TestSplit < ::Quark.classes.string_test
 
     def _getField(name)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             return (self).what
-        end
-        if ((name) == ("sep"))
+        when "sep"
             return (self).sep
-        end
-        if ((name) == ("altsep"))
+        when "altsep"
             return (self).altsep
         end
         return nil
@@ -818,14 +831,16 @@ class TestSplit < ::Quark.classes.string_test
 
     def _setField(name, value)
         
-        if ((name) == ("what"))
+        case name
+        when "what"
             (self).what = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("sep"))
+            return
+        when "sep"
             (self).sep = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("altsep"))
+            return
+        when "altsep"
             (self).altsep = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
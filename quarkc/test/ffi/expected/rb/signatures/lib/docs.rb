@@ -47,7 +47,8 @@ class Test < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -57,8 +58,10 @@ class Test < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -46,7 +46,8 @@ class Box < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             return (self).contents
         end
         return nil
@@ -56,8 +57,10 @@ class Box < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             (self).contents = ::DatawireQuarkCore.cast(value) { ::Quark.T }
+            return
         end
 
         nil
@@ -116,10 +119,10 @@ class Crate < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("box"))
+        case name
+        when "box"
             return (self).box
-        end
-        if ((name) == ("ibox"))
+        when "ibox"
             return (self).ibox
         end
         return nil
@@ -129,11 +132,13 @@ class Crate < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("box"))
+        case name
+        when "box"
             (self).box = ::DatawireQuarkCore.cast(value) { ::Quark.generics.Box }
-        end
-        if ((name) == ("ibox"))
+            return
+        when "ibox"
             (self).ibox = ::DatawireQuarkCore.cast(value) { ::Quark.generics.Box }
+            return
         end
 
         nil
@@ -178,7 +183,8 @@ class Sack < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("ints"))
+        case name
+        when "ints"
             return (self).ints
         end
         return nil
@@ -188,8 +194,10 @@ class Sack < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("ints"))
+        case name
+        when "ints"
             (self).ints = ::DatawireQuarkCore.cast(value) { ::Quark.generics.Box }
+            return
         end
 
         nil
@@ -250,13 +258,12 @@ class Matrix < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("width"))
+        case name
+        when "width"
             return (self).width
-        end
-        if ((name) == ("height"))
+        when "height"
             return (self).height
-        end
-        if ((name) == ("columns"))
+        when "columns"
             return (self).columns
         end
         return nil
@@ -266,14 +273,16 @@ class Matrix < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("width"))
+        case name
+        when "width"
             (self).width = ::DatawireQuarkCore.cast(value) { ::Integer }
-        end
-        if ((name) == ("height"))
+            return
+        when "height"
             (self).height = ::DatawireQuarkCore.cast(value) { ::Integer }
-        end
-        if ((name) == ("columns"))
+            return
+        when "columns"
             (self).columns = ::DatawireQuarkCore.cast(value) { ::DatawireQuarkCore::List }
+            return
         end
 
         nil
@@ -107,13 +107,12 @@ class Context < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("_global"))
+        case name
+        when "_global"
             return ::Quark.generics.ccc.Context._global
-        end
-        if ((name) == ("_current"))
+        when "_current"
             return ::Quark.generics.ccc.Context._current
-        end
-        if ((name) == ("parent"))
+        when "parent"
             return (self).parent
         end
         return nil
@@ -123,14 +122,16 @@ class Context < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("_global"))
+        case name
+        when "_global"
             ::Quark.generics.ccc.Context._global = ::DatawireQuarkCore.cast(value) { ::Quark.generics.ccc.Context }
-        end
-        if ((name) == ("_current"))
+            return
+        when "_current"
             ::Quark.generics.ccc.Context._current = ::DatawireQuarkCore.cast(value) { ::Quark.generics.ccc.TLS }
-        end
-        if ((name) == ("parent"))
+            return
+        when "parent"
             (self).parent = ::DatawireQuarkCore.cast(value) { ::Quark.generics.ccc.Context }
+            return
         end
 
         nil
@@ -212,7 +213,8 @@ class TLS < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("_value"))
+        case name
+        when "_value"
             return (self)._value
         end
         return nil
@@ -222,8 +224,10 @@ class TLS < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("_value"))
+        case name
+        when "_value"
             (self)._value = ::DatawireQuarkCore.cast(value) { ::Quark.T }
+            return
         end
 
         nil
@@ -42,7 +42,8 @@ class Box < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             return (self).contents
         end
         return nil
@@ -52,8 +53,10 @@ class Box < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             (self).contents = ::DatawireQuarkCore.cast(value) { ::Quark.T }
+            return
         end
 
         nil
@@ -134,7 +134,8 @@ class Box < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             return (self).contents
         end
         return nil
@@ -144,8 +145,10 @@ class Box < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             (self).contents = ::DatawireQuarkCore.cast(value) { ::Quark.T }
+            return
         end
 
         nil
@@ -189,7 +192,8 @@ class StringBox < ::Quark.generics.pkg.Box
 
     def _getField(name)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             return (self).contents
         end
         return nil
@@ -199,8 +203,10 @@ class StringBox < ::Quark.generics.pkg.Box
 
     def _setField(name, value)
         
-        if ((name) == ("contents"))
+        case name
+        when "contents"
             (self).contents = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
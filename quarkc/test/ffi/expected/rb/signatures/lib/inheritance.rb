@@ -37,7 +37,8 @@ class Base < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -47,8 +48,10 @@ class Base < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -93,13 +96,12 @@ class Test < ::Quark.inheritance.Base
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
-        end
-        if ((name) == ("mumble"))
+        when "mumble"
             return (self).mumble
-        end
-        if ((name) == ("later"))
+        when "later"
             return (self).later
         end
         return nil
@@ -109,14 +111,16 @@ class Test < ::Quark.inheritance.Base
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("mumble"))
+            return
+        when "mumble"
             (self).mumble = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("later"))
+            return
+        when "later"
             (self).later = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -163,7 +167,8 @@ class A < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -173,8 +178,10 @@ class A < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -225,7 +232,8 @@ class B < ::Quark.inheritance.A
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -235,8 +243,10 @@ class B < ::Quark.inheritance.A
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -287,7 +297,8 @@ class C < ::Quark.inheritance.A
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -297,8 +308,10 @@ class C < ::Quark.inheritance.A
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -398,7 +411,8 @@ class Y < ::Quark.inheritance.X
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -408,8 +422,10 @@ class Y < ::Quark.inheritance.X
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
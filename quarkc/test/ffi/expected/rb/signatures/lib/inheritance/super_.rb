@@ -42,7 +42,8 @@ class A < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -52,8 +53,10 @@ class A < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -104,7 +107,8 @@ class B < ::Quark.inheritance.super_.A
 
     def _getField(name)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             return (self).name
         end
         return nil
@@ -114,8 +118,10 @@ class B < ::Quark.inheritance.super_.A
 
     def _setField(name, value)
         
-        if ((name) == ("name"))
+        case name
+        when "name"
             (self).name = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -830,7 +830,8 @@ class Constants < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("FOO"))
+        case name
+        when "FOO"
             return ::Quark.interfaces.IConstants.FOO
         end
         return nil
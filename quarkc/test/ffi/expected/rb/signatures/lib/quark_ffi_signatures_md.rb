@@ -3,6 +3,7 @@ def self.quark_ffi_signatures_md; QuarkFfiSignaturesMd; end
 module QuarkFfiSignaturesMd
 require 'quark' # .../reflect
 # for ('quark_ffi_signatures_md',): require_relative 'generics' # 0 () ()
+require 'quark' 
 # for ('quark_ffi_signatures_md',): require_relative 'generics/constructors' # 0 ('generics',) ()
 # for ('quark_ffi_signatures_md',): require_relative 'generics/pkg' # 0 ('generics',) ()
 # for ('quark_ffi_signatures_md',): require_relative 'generics/ccc' # 0 ('generics',) ()
@@ -164,6 +165,29 @@ class GenericsBoxQuarkObject < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Box }
+        ::Quark.quark._encodeField(json, self, 0, (obj).contents)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Box }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "contents")
+        if ((item) != (nil))
+            (obj).contents = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.T }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -342,6 +366,29 @@ class GenericsBoxQuarkInt < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Box }
+        ::Quark.quark._encodeField(json, self, 0, (obj).contents)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Box }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "contents")
+        if ((item) != (nil))
+            (obj).contents = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Integer }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -520,6 +567,34 @@ class GenericsCrateQuarkObject < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Crate }
+        ::Quark.quark._encodeField(json, self, 0, (obj).box)
+        ::Quark.quark._encodeField(json, self, 1, (obj).ibox)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Crate }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "box")
+        if ((item) != (nil))
+            (obj).box = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.generics.Box }
+        end
+        item = ::Quark.quark._decodeItem(json, "ibox")
+        if ((item) != (nil))
+            (obj).ibox = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 1, item)) { ::Quark.generics.Box }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -589,6 +664,29 @@ class GenericsSack < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Sack }
+        ::Quark.quark._encodeField(json, self, 0, (obj).ints)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Sack }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "ints")
+        if ((item) != (nil))
+            (obj).ints = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.generics.Box }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -767,6 +865,39 @@ class GenericsMatrixQuarkObject < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Matrix }
+        ::Quark.quark._encodeNumber(json, "width", (obj).width)
+        ::Quark.quark._encodeNumber(json, "height", (obj).height)
+        ::Quark.quark._encodeField(json, self, 2, (obj).columns)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.Matrix }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "width")
+        if ((item) != (nil))
+            (obj).width = ::Quark.quark._decodeInt(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "height")
+        if ((item) != (nil))
+            (obj).height = ::Quark.quark._decodeInt(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "columns")
+        if ((item) != (nil))
+            (obj).columns = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 2, item)) { ::DatawireQuarkCore::List }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -890,6 +1021,29 @@ class GenericsConstructorsBoxQuarkObject < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.constructors.Box }
+        ::Quark.quark._encodeField(json, self, 0, (obj).contents)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.constructors.Box }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "contents")
+        if ((item) != (nil))
+            (obj).contents = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.T }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1244,6 +1398,21 @@ class GenericsPkgStringFoo < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1313,6 +1482,29 @@ class GenericsPkgBoxQuarkString < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.pkg.Box }
+        ::Quark.quark._encodeField(json, self, 0, (obj).contents)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.pkg.Box }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "contents")
+        if ((item) != (nil))
+            (obj).contents = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::String }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1382,6 +1574,29 @@ class GenericsPkgStringBox < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.pkg.StringBox }
+        ::Quark.quark._encodeField(json, self, 0, (obj).contents)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.pkg.StringBox }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "contents")
+        if ((item) != (nil))
+            (obj).contents = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::String }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1505,6 +1720,21 @@ class GenericsCccTLSContextInitializer < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1682,6 +1912,29 @@ class GenericsCccContext < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.ccc.Context }
+        ::Quark.quark._encodeField(json, self, 2, (obj).parent)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.generics.ccc.Context }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "parent")
+        if ((item) != (nil))
+            (obj).parent = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 2, item)) { ::Quark.generics.ccc.Context }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1928,6 +2181,21 @@ class GenericsCccTLSGenericsCccContext < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1997,6 +2265,29 @@ class InheritanceBase < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.Base }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.Base }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2066,6 +2357,39 @@ class InheritanceTest < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.Test }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        ::Quark.quark._encodeString(json, "mumble", (obj).mumble)
+        ::Quark.quark._encodeString(json, "later", (obj).later)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.Test }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "mumble")
+        if ((item) != (nil))
+            (obj).mumble = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "later")
+        if ((item) != (nil))
+            (obj).later = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2135,6 +2459,29 @@ class InheritanceA < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.A }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.A }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2259,6 +2606,29 @@ class InheritanceB < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.B }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.B }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2383,6 +2753,29 @@ class InheritanceC < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.C }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.C }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2452,6 +2845,21 @@ class InheritanceX < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2576,6 +2984,29 @@ class InheritanceY < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.Y }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.Y }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2700,6 +3131,21 @@ class InheritanceT1A < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2824,6 +3270,21 @@ class InheritanceT1B < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2948,6 +3409,21 @@ class InheritanceT1C < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3017,6 +3493,21 @@ class InheritanceT2A < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3086,6 +3577,21 @@ class InheritanceT2B < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3155,6 +3661,21 @@ class InheritanceT2XQuarkInt < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3224,6 +3745,21 @@ class InheritanceT2Y < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3472,6 +4008,21 @@ class InheritancePetsCat < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3596,6 +4147,21 @@ class InheritancePetsDog < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3719,6 +4285,21 @@ class InheritanceMessage < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -3842,6 +4423,21 @@ class InheritancePing < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -4019,6 +4615,21 @@ class InheritancePong < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -4143,6 +4754,29 @@ class InheritanceSuperA < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.super_.A }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.super_.A }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -4267,6 +4901,29 @@ class InheritanceSuperB < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.super_.B }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.super_.B }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -4391,6 +5048,21 @@ class InheritanceUseBeforeDefBar < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -4460,6 +5132,29 @@ class InheritanceUseBeforeDefFoo < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.use_before_def.Foo }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.inheritance.use_before_def.Foo }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -5066,6 +5761,21 @@ class InterfacesT1 < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -5245,6 +5955,21 @@ class InterfacesT2 < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -5424,6 +6149,21 @@ class InterfacesT3 < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -5589,16 +6329,31 @@ class InterfacesT4 < ::Quark.quark.reflect.QuarkClass
 
 
 
-    def construct(args)
+    def construct(args)
+        
+        return ::Quark.interfaces.T4.new()
+
+        nil
+    end
+
+    def isAbstract()
+        
+        return false
+
+        nil
+    end
+
+    def _encodeFields(object, json)
         
-        return ::Quark.interfaces.T4.new()
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
 
         nil
     end
 
-    def isAbstract()
+    def _decodeFields(object, json)
         
-        return false
+        return true
 
         nil
     end
@@ -5782,6 +6537,21 @@ class InterfacesT5 < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -6484,6 +7254,21 @@ class InterfacesBaz < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -7186,6 +7971,21 @@ class InterfacesBazBar < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -7420,6 +8220,21 @@ class InterfacesBazFazQuarkObject < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -7558,6 +8373,23 @@ class InterfacesConstants < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.interfaces.Constants }
+        ::Quark.quark._encodeString(json, "FOO", ::Quark.interfaces.IConstants.FOO)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -7790,6 +8622,29 @@ class ClassesOverload < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.Overload }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.Overload }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -7914,6 +8769,21 @@ class ClassesTest < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -8038,6 +8908,21 @@ class ClassesStringTest < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -8216,6 +9101,29 @@ class ClassesTestSize < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_size }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_size }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -8448,6 +9356,29 @@ class ClassesTestStartsWith < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_startsWith }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_startsWith }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -8680,6 +9611,29 @@ class ClassesTestEndsWith < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_endsWith }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_endsWith }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -8912,6 +9866,29 @@ class ClassesTestFind < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_find }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_find }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -9144,6 +10121,39 @@ class ClassesTestSubstring < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_substring }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        ::Quark.quark._encodeNumber(json, "start", (obj).start)
+        ::Quark.quark._encodeNumber(json, "end", (obj).end_)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_substring }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "start")
+        if ((item) != (nil))
+            (obj).start = ::Quark.quark._decodeInt(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "end")
+        if ((item) != (nil))
+            (obj).end_ = ::Quark.quark._decodeInt(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -9376,6 +10386,39 @@ class ClassesTestReplace < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_replace }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        ::Quark.quark._encodeString(json, "start", (obj).start)
+        ::Quark.quark._encodeString(json, "end", (obj).end_)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_replace }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "start")
+        if ((item) != (nil))
+            (obj).start = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "end")
+        if ((item) != (nil))
+            (obj).end_ = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -9662,6 +10705,44 @@ class ClassesTestJoin < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_join }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        ::Quark.quark._encodeField(json, self, 1, (obj).parts)
+        ::Quark.quark._encodeString(json, "strparts", (obj).strparts)
+        ::Quark.quark._encodeString(json, "sep", (obj).sep)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_join }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "parts")
+        if ((item) != (nil))
+            (obj).parts = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 1, item)) { ::DatawireQuarkCore::List }
+        end
+        item = ::Quark.quark._decodeItem(json, "strparts")
+        if ((item) != (nil))
+            (obj).strparts = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "sep")
+        if ((item) != (nil))
+            (obj).sep = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -9894,6 +10975,39 @@ class ClassesTestSplit < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_split }
+        ::Quark.quark._encodeString(json, "what", (obj).what)
+        ::Quark.quark._encodeString(json, "sep", (obj).sep)
+        ::Quark.quark._encodeString(json, "altsep", (obj).altsep)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.classes.test_split }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "what")
+        if ((item) != (nil))
+            (obj).what = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "sep")
+        if ((item) != (nil))
+            (obj).sep = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "altsep")
+        if ((item) != (nil))
+            (obj).altsep = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -10072,6 +11186,21 @@ class ClassesStuffTest < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -10470,6 +11599,29 @@ class StaticsFoo < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.statics.Foo }
+        ::Quark.quark._encodeNumber(json, "count", ::Quark.statics.Foo.count)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.statics.Foo }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "count")
+        if ((item) != (nil))
+            ::Quark.statics.Foo.count = ::Quark.quark._decodeInt(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -10593,6 +11745,29 @@ class DocsTest < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.docs.Test }
+        ::Quark.quark._encodeString(json, "name", (obj).name)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.docs.Test }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "name")
+        if ((item) != (nil))
+            (obj).name = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -75,7 +75,8 @@ class Foo < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("count"))
+        case name
+        when "count"
             return ::Quark.statics.Foo.count
         end
         return nil
@@ -85,8 +86,10 @@ class Foo < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("count"))
+        case name
+        when "count"
             ::Quark.statics.Foo.count = ::DatawireQuarkCore.cast(value) { ::Integer }
+            return
         end
 
         nil
@@ -97,10 +97,10 @@ class User < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("client"))
+        case name
+        when "client"
             return (self).client
-        end
-        if ((name) == ("user"))
+        when "user"
             return (self).user
         end
         return nil
@@ -110,11 +110,13 @@ class User < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("client"))
+        case name
+        when "client"
             (self).client = ::DatawireQuarkCore.cast(value) { ::Quark.slack.Client }
-        end
-        if ((name) == ("user"))
+            return
+        when "user"
             (self).user = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -173,10 +175,10 @@ class Channel < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("client"))
+        case name
+        when "client"
             return (self).client
-        end
-        if ((name) == ("channel"))
+        when "channel"
             return (self).channel
         end
         return nil
@@ -186,11 +188,13 @@ class Channel < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("client"))
+        case name
+        when "client"
             (self).client = ::DatawireQuarkCore.cast(value) { ::Quark.slack.Client }
-        end
-        if ((name) == ("channel"))
+            return
+        when "channel"
             (self).channel = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -313,19 +317,16 @@ class Client < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("runtime"))
+        case name
+        when "runtime"
             return (self).runtime
-        end
-        if ((name) == ("token"))
+        when "token"
             return (self).token
-        end
-        if ((name) == ("handler"))
+        when "handler"
             return (self).handler
-        end
-        if ((name) == ("event_id"))
+        when "event_id"
             return (self).event_id
-        end
-        if ((name) == ("socket"))
+        when "socket"
             return (self).socket
         end
         return nil
@@ -335,20 +336,22 @@ class Client < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("runtime"))
+        case name
+        when "runtime"
             (self).runtime = ::DatawireQuarkCore.cast(value) { ::Quark.quark.Runtime }
-        end
-        if ((name) == ("token"))
+            return
+        when "token"
             (self).token = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("handler"))
+            return
+        when "handler"
             (self).handler = ::DatawireQuarkCore.cast(value) { ::Quark.slack.SlackHandler }
-        end
-        if ((name) == ("event_id"))
+            return
+        when "event_id"
             (self).event_id = ::DatawireQuarkCore.cast(value) { ::Integer }
-        end
-        if ((name) == ("socket"))
+            return
+        when "socket"
             (self).socket = ::DatawireQuarkCore.cast(value) { ::Quark.quark.WebSocket }
+            return
         end
 
         nil
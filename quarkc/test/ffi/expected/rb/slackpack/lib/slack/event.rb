@@ -52,16 +52,14 @@ class SlackEvent < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             return (self).type
-        end
-        if ((name) == ("user"))
+        when "user"
             return (self).user
-        end
-        if ((name) == ("channel"))
+        when "channel"
             return (self).channel
-        end
-        if ((name) == ("timestamp"))
+        when "timestamp"
             return (self).timestamp
         end
         return nil
@@ -71,17 +69,19 @@ class SlackEvent < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             (self).type = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("user"))
+            return
+        when "user"
             (self).user = ::DatawireQuarkCore.cast(value) { ::Quark.slack.User }
-        end
-        if ((name) == ("channel"))
+            return
+        when "channel"
             (self).channel = ::DatawireQuarkCore.cast(value) { ::Quark.slack.Channel }
-        end
-        if ((name) == ("timestamp"))
+            return
+        when "timestamp"
             (self).timestamp = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -146,22 +146,18 @@ class SlackError < ::Quark.slack.event.SlackEvent
 
     def _getField(name)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             return (self).type
-        end
-        if ((name) == ("user"))
+        when "user"
             return (self).user
-        end
-        if ((name) == ("channel"))
+        when "channel"
             return (self).channel
-        end
-        if ((name) == ("timestamp"))
+        when "timestamp"
             return (self).timestamp
-        end
-        if ((name) == ("code"))
+        when "code"
             return (self).code
-        end
-        if ((name) == ("text"))
+        when "text"
             return (self).text
         end
         return nil
@@ -171,23 +167,25 @@ class SlackError < ::Quark.slack.event.SlackEvent
 
     def _setField(name, value)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             (self).type = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("user"))
+            return
+        when "user"
             (self).user = ::DatawireQuarkCore.cast(value) { ::Quark.slack.User }
-        end
-        if ((name) == ("channel"))
+            return
+        when "channel"
             (self).channel = ::DatawireQuarkCore.cast(value) { ::Quark.slack.Channel }
-        end
-        if ((name) == ("timestamp"))
+            return
+        when "timestamp"
             (self).timestamp = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("code"))
+            return
+        when "code"
             (self).code = ::DatawireQuarkCore.cast(value) { ::Integer }
-        end
-        if ((name) == ("text"))
+            return
+        when "text"
             (self).text = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -243,16 +241,14 @@ class Hello < ::Quark.slack.event.SlackEvent
 
     def _getField(name)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             return (self).type
-        end
-        if ((name) == ("user"))
+        when "user"
             return (self).user
-        end
-        if ((name) == ("channel"))
+        when "channel"
             return (self).channel
-        end
-        if ((name) == ("timestamp"))
+        when "timestamp"
             return (self).timestamp
         end
         return nil
@@ -262,17 +258,19 @@ class Hello < ::Quark.slack.event.SlackEvent
 
     def _setField(name, value)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             (self).type = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("user"))
+            return
+        when "user"
             (self).user = ::DatawireQuarkCore.cast(value) { ::Quark.slack.User }
-        end
-        if ((name) == ("channel"))
+            return
+        when "channel"
             (self).channel = ::DatawireQuarkCore.cast(value) { ::Quark.slack.Channel }
-        end
-        if ((name) == ("timestamp"))
+            return
+        when "timestamp"
             (self).timestamp = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -334,28 +332,22 @@ class Message < ::Quark.slack.event.SlackEvent
 
     def _getField(name)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             return (self).type
-        end
-        if ((name) == ("user"))
+        when "user"
             return (self).user
-        end
-        if ((name) == ("channel"))
+        when "channel"
             return (self).channel
-        end
-        if ((name) == ("timestamp"))
+        when "timestamp"
             return (self).timestamp
-        end
-        if ((name) == ("subtype"))
+        when "subtype"
             return (self).subtype
-        end
-        if ((name) == ("hidden"))
+        when "hidden"
             return (self).hidden
-        end
-        if ((name) == ("text"))
+        when "text"
             return (self).text
-        end
-        if ((name) == ("edited"))
+        when "edited"
             return (self).edited
         end
         return nil
@@ -365,29 +357,31 @@ class Message < ::Quark.slack.event.SlackEvent
 
     def _setField(name, value)
         
-        if ((name) == ("type"))
+        case name
+        when "type"
             (self).type = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("user"))
+            return
+        when "user"
             (self).user = ::DatawireQuarkCore.cast(value) { ::Quark.slack.User }
-        end
-        if ((name) == ("channel"))
+            return
+        when "channel"
             (self).channel = ::DatawireQuarkCore.cast(value) { ::Quark.slack.Channel }
-        end
-        if ((name) == ("timestamp"))
+            return
+        when "timestamp"
             (self).timestamp = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("subtype"))
+            return
+        when "subtype"
             (self).subtype = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("hidden"))
+            return
+        when "hidden"
             (self).hidden = ::DatawireQuarkCore.cast(value) { ::Object }
-        end
-        if ((name) == ("text"))
+            return
+        when "text"
             (self).text = ::DatawireQuarkCore.cast(value) { ::String }
-        end
-        if ((name) == ("edited"))
+            return
+        when "edited"
             (self).edited = ::DatawireQuarkCore.cast(value) { ::Quark.slack.event.Edited }
+            return
         end
 
         nil
@@ -438,10 +432,10 @@ class Edited < ::DatawireQuarkCore::QuarkObject
 
     def _getField(name)
         
-        if ((name) == ("user"))
+        case name
+        when "user"
             return (self).user
-        end
-        if ((name) == ("timestamp"))
+        when "timestamp"
             return (self).timestamp
         end
         return nil
@@ -451,11 +445,13 @@ class Edited < ::DatawireQuarkCore::QuarkObject
 
     def _setField(name, value)
         
-        if ((name) == ("user"))
+        case name
+        when "user"
             (self).user = ::DatawireQuarkCore.cast(value) { ::Quark.slack.User }
-        end
-        if ((name) == ("timestamp"))
+            return
+        when "timestamp"
             (self).timestamp = ::DatawireQuarkCore.cast(value) { ::String }
+            return
         end
 
         nil
@@ -154,6 +154,44 @@ class SlackEventSlackEvent < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.SlackEvent }
+        ::Quark.quark._encodeString(json, "type", (obj).type)
+        ::Quark.quark._encodeField(json, self, 1, (obj).user)
+        ::Quark.quark._encodeField(json, self, 2, (obj).channel)
+        ::Quark.quark._encodeString(json, "timestamp", (obj).timestamp)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.SlackEvent }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "type")
+        if ((item) != (nil))
+            (obj).type = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "user")
+        if ((item) != (nil))
+            (obj).user = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 1, item)) { ::Quark.slack.User }
+        end
+        item = ::Quark.quark._decodeItem(json, "channel")
+        if ((item) != (nil))
+            (obj).channel = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 2, item)) { ::Quark.slack.Channel }
+        end
+        item = ::Quark.quark._decodeItem(json, "timestamp")
+        if ((item) != (nil))
+            (obj).timestamp = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -333,6 +371,54 @@ class SlackEventSlackError < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.SlackError }
+        ::Quark.quark._encodeString(json, "type", (obj).type)
+        ::Quark.quark._encodeField(json, self, 1, (obj).user)
+        ::Quark.quark._encodeField(json, self, 2, (obj).channel)
+        ::Quark.quark._encodeString(json, "timestamp", (obj).timestamp)
+        ::Quark.quark._encodeNumber(json, "code", (obj).code)
+        ::Quark.quark._encodeString(json, "text", (obj).text)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.SlackError }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "type")
+        if ((item) != (nil))
+            (obj).type = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "user")
+        if ((item) != (nil))
+            (obj).user = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 1, item)) { ::Quark.slack.User }
+        end
+        item = ::Quark.quark._decodeItem(json, "channel")
+        if ((item) != (nil))
+            (obj).channel = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 2, item)) { ::Quark.slack.Channel }
+        end
+        item = ::Quark.quark._decodeItem(json, "timestamp")
+        if ((item) != (nil))
+            (obj).timestamp = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "code")
+        if ((item) != (nil))
+            (obj).code = ::Quark.quark._decodeInt(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "text")
+        if ((item) != (nil))
+            (obj).text = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -512,6 +598,44 @@ class SlackEventHello < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.Hello }
+        ::Quark.quark._encodeString(json, "type", (obj).type)
+        ::Quark.quark._encodeField(json, self, 1, (obj).user)
+        ::Quark.quark._encodeField(json, self, 2, (obj).channel)
+        ::Quark.quark._encodeString(json, "timestamp", (obj).timestamp)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.Hello }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "type")
+        if ((item) != (nil))
+            (obj).type = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "user")
+        if ((item) != (nil))
+            (obj).user = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 1, item)) { ::Quark.slack.User }
+        end
+        item = ::Quark.quark._decodeItem(json, "channel")
+        if ((item) != (nil))
+            (obj).channel = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 2, item)) { ::Quark.slack.Channel }
+        end
+        item = ::Quark.quark._decodeItem(json, "timestamp")
+        if ((item) != (nil))
+            (obj).timestamp = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -691,6 +815,64 @@ class SlackEventMessage < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.Message }
+        ::Quark.quark._encodeString(json, "type", (obj).type)
+        ::Quark.quark._encodeField(json, self, 1, (obj).user)
+        ::Quark.quark._encodeField(json, self, 2, (obj).channel)
+        ::Quark.quark._encodeString(json, "timestamp", (obj).timestamp)
+        ::Quark.quark._encodeString(json, "subtype", (obj).subtype)
+        ::Quark.quark._encodeField(json, self, 5, (obj).hidden)
+        ::Quark.quark._encodeString(json, "text", (obj).text)
+        ::Quark.quark._encodeField(json, self, 7, (obj).edited)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.Message }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "type")
+        if ((item) != (nil))
+            (obj).type = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "user")
+        if ((item) != (nil))
+            (obj).user = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 1, item)) { ::Quark.slack.User }
+        end
+        item = ::Quark.quark._decodeItem(json, "channel")
+        if ((item) != (nil))
+            (obj).channel = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 2, item)) { ::Quark.slack.Channel }
+        end
+        item = ::Quark.quark._decodeItem(json, "timestamp")
+        if ((item) != (nil))
+            (obj).timestamp = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "subtype")
+        if ((item) != (nil))
+            (obj).subtype = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "hidden")
+        if ((item) != (nil))
+            (obj).hidden = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 5, item)) { ::Object }
+        end
+        item = ::Quark.quark._decodeItem(json, "text")
+        if ((item) != (nil))
+            (obj).text = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "edited")
+        if ((item) != (nil))
+            (obj).edited = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 7, item)) { ::Quark.slack.event.Edited }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -760,6 +942,34 @@ class SlackEventEdited < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.Edited }
+        ::Quark.quark._encodeField(json, self, 0, (obj).user)
+        ::Quark.quark._encodeString(json, "timestamp", (obj).timestamp)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.event.Edited }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "user")
+        if ((item) != (nil))
+            (obj).user = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.slack.User }
+        end
+        item = ::Quark.quark._decodeItem(json, "timestamp")
+        if ((item) != (nil))
+            (obj).timestamp = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1118,6 +1328,34 @@ class SlackUser < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.User }
+        ::Quark.quark._encodeField(json, self, 0, (obj).client)
+        ::Quark.quark._encodeString(json, "user", (obj).user)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.User }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "client")
+        if ((item) != (nil))
+            (obj).client = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.slack.Client }
+        end
+        item = ::Quark.quark._decodeItem(json, "user")
+        if ((item) != (nil))
+            (obj).user = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -1242,6 +1480,34 @@ class SlackChannel < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.Channel }
+        ::Quark.quark._encodeField(json, self, 0, (obj).client)
+        ::Quark.quark._encodeString(json, "channel", (obj).channel)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.Channel }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "client")
+        if ((item) != (nil))
+            (obj).client = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.slack.Client }
+        end
+        item = ::Quark.quark._decodeItem(json, "channel")
+        if ((item) != (nil))
+            (obj).channel = ::Quark.quark._decodeString(item)
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2245,6 +2511,49 @@ class SlackClient < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.Client }
+        ::Quark.quark._encodeField(json, self, 0, (obj).runtime)
+        ::Quark.quark._encodeString(json, "token", (obj).token)
+        ::Quark.quark._encodeField(json, self, 2, (obj).handler)
+        ::Quark.quark._encodeNumber(json, "event_id", (obj).event_id)
+        ::Quark.quark._encodeField(json, self, 4, (obj).socket)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        obj = ::DatawireQuarkCore.cast(object) { ::Quark.slack.Client }
+        item = nil
+        item = ::Quark.quark._decodeItem(json, "runtime")
+        if ((item) != (nil))
+            (obj).runtime = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 0, item)) { ::Quark.quark.Runtime }
+        end
+        item = ::Quark.quark._decodeItem(json, "token")
+        if ((item) != (nil))
+            (obj).token = ::Quark.quark._decodeString(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "handler")
+        if ((item) != (nil))
+            (obj).handler = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 2, item)) { ::Quark.slack.SlackHandler }
+        end
+        item = ::Quark.quark._decodeItem(json, "event_id")
+        if ((item) != (nil))
+            (obj).event_id = ::Quark.quark._decodeInt(item)
+        end
+        item = ::Quark.quark._decodeItem(json, "socket")
+        if ((item) != (nil))
+            (obj).socket = ::DatawireQuarkCore.cast(::Quark.quark._decodeField(self, 4, item)) { ::Quark.quark.WebSocket }
+        end
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -2534,6 +2843,21 @@ class SlackpackHandler < ::Quark.quark.reflect.QuarkClass
         nil
     end
 
+    def _encodeFields(object, json)
+        
+        ::Quark.quark._encodeString(json, "$class", (self).id)
+        return true
+
+        nil
+    end
+
+    def _decodeFields(object, json)
+        
+        return true
+
+        nil
+    end
+
     def _getClass()
         
         return ::DatawireQuarkCore.cast(nil) { ::String }
@@ -0,0 +1,185 @@
+# Copyright 2016 datawire. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading, time
+
+import pytest
+
+pytest.importorskip("asyncio")
+
+try:
+    from httplib import HTTPConnection
+except ImportError:
+    from http.client import HTTPConnection
+
+from .test_threaded_runtime import (  # noqa: F401 (server is a fixture)
+    Task, Recorder, Servlet, WSServlet, WSClient, fetch, free_port, get, server
+)
+
+from quark_runtime import _RuntimeFactory
+import quark_asyncio_runtime
+from quark_asyncio_runtime import AsyncioRuntime, _HTTPClient, _HTTPParser
+
+
+def settle(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def runtime():
+    return AsyncioRuntime()
+
+
+def serve(runtime, servlet):
+    port = free_port()
+    runtime.serveHTTP("http://127.0.0.1:%d/" % port, servlet)
+    settle(lambda: servlet.url)
+    return port
+
+
+def test_factory_selects_asyncio(monkeypatch):
+    monkeypatch.setenv("QUARK_PYTHON_RUNTIME", "asyncio")
+    assert isinstance(_RuntimeFactory.create(), AsyncioRuntime)
+    assert _RuntimeFactory.create() is quark_asyncio_runtime.get_runtime()
+
+
+def test_schedule_fires_in_deadline_order(runtime):
+    fired = []
+    for name, delay in (("c", 0.15), ("a", 0.05), ("b", 0.1), ("now", 0.0)):
+        runtime.schedule(Task(fired, name), delay)
+    assert runtime.wait_until_idle(5)
+    assert fired == ["now", "a", "b", "c"]
+
+
+def test_handlers_run_on_the_loop_thread(runtime):
+    threads = []
+
+    class Probe(object):
+        def onExecute(self, runtime):
+            threads.append(threading.current_thread())
+
+    for i in range(10):
+        runtime.schedule(Probe(), 0.0)
+    assert runtime.wait_until_idle(5)
+    assert threads == [runtime.thread] * 10
+
+
+def test_parser_handles_chunked_and_pipelined_messages():
+    parser = _HTTPParser()
+    parser.feed(b"POST /a HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+                b"3\r\nabc\r\n2;ext\r\nde\r\n0\r\n\r\n"
+                b"GET /b HTTP/1.0\r\n\r\nGET /c HTTP/1.1\r\nContent-Le")
+    first = parser.next()
+    assert first.start == ["POST", "/a", "HTTP/1.1"]
+    assert first.body == b"abcde"
+    assert first.keep_alive
+    second = parser.next()
+    assert second.start[1] == "/b"
+    assert not second.keep_alive
+    assert parser.next() is None
+    parser.feed(b"ngth: 2\r\n\r\nhi")
+    assert parser.next().body == b"hi"
+
+
+def test_parser_reads_response_until_close():
+    parser = _HTTPParser(responses=True)
+    parser.feed(b"HTTP/1.0 200 OK\r\n\r\npartial")
+    assert parser.next() is None
+    parser.feed(b" body")
+    assert parser.finish().body == b"partial body"
+
+
+def test_request_reuses_connections(runtime, server):
+    recorder = Recorder()
+    for i in range(20):
+        get(runtime, server.url("/seq/%d" % i), recorder)
+        settle(lambda: recorder.final == i + 1)
+    assert recorder.responses == [(200, "/seq/%d" % i) for i in range(20)]
+    assert len(server.connections) == 1
+
+
+def test_request_limits_connections_per_host(runtime, server, monkeypatch):
+    monkeypatch.setattr(_HTTPClient, "max_per_host", 2)
+    recorder = Recorder()
+    for i in range(8):
+        get(runtime, server.url("/slow/%d" % i), recorder)
+    settle(lambda: recorder.final == 8)
+    assert len(recorder.responses) == 8
+    assert server.peak == 2
+    assert len(server.connections) == 2
+
+
+def test_request_status_and_redirects(runtime, server):
+    recorder = Recorder()
+    get(runtime, server.url("/missing"), recorder)
+    get(runtime, server.url("/moved"), recorder)
+    settle(lambda: recorder.final == 2)
+    assert sorted(recorder.responses) == [(200, "/target"), (404, "nope")]
+
+
+def test_request_error(runtime):
+    pytest.importorskip("quark")
+    recorder = Recorder()
+    get(runtime, "http://127.0.0.1:%d/" % free_port(), recorder)
+    settle(lambda: recorder.final == 1)
+    assert len(recorder.errors) == 1
+    assert not recorder.responses
+
+
+def test_container_keeps_connections_alive(runtime):
+    connection = HTTPConnection("127.0.0.1", serve(runtime, Servlet()))
+    for i in range(10):
+        assert fetch(connection, "/?%d" % i) == (200, ("/?%d" % i).encode("utf-8"))
+    assert fetch(connection, "/missing")[0] == 404
+    assert fetch(connection, "/") == (200, b"/")
+    connection.close()
+
+
+def test_container_slow_servlet_does_not_stall_others(runtime):
+    port = serve(runtime, Servlet())
+    results = {}
+
+    def slow():
+        results["slow"] = fetch(HTTPConnection("127.0.0.1", port), "/?slow")
+
+    thread = threading.Thread(target=slow)
+    thread.start()
+    time.sleep(0.1)
+    start = time.time()
+    assert fetch(HTTPConnection("127.0.0.1", port), "/?fast") == (200, b"/?fast")
+    assert time.time() - start < 0.3
+    thread.join()
+    assert results["slow"] == (200, b"/?slow")
+
+
+def test_container_and_client_requests_share_the_loop(runtime):
+    port = serve(runtime, Servlet())
+    recorder = Recorder()
+    for i in range(50):
+        get(runtime, "http://127.0.0.1:%d/?%d" % (port, i), recorder)
+    settle(lambda: recorder.final == 50)
+    assert sorted(recorder.responses) == sorted((200, "/?%d" % i) for i in range(50))
+
+
+def test_websocket_echo(runtime):
+    servlet = WSServlet()
+    port = free_port()
+    runtime.serveWS("ws://127.0.0.1:%d/ws" % port, servlet)
+    settle(lambda: servlet.url)
+    client = WSClient()
+    runtime.open("ws://127.0.0.1:%d/ws" % port, client)
+    settle(lambda: len(client.received) == 3)
+    assert client.received == ["hello", "again", "again"]
@@ -0,0 +1,245 @@
+# Copyright 2016 datawire. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os, time, pytest
+
+from quarkc import cache as qcache
+from quarkc.cache import CompileCache, Snapshot
+from quarkc.compiler import Compiler, build_snapshot
+
+@pytest.fixture
+def cache(tmpdir):
+    return CompileCache(str(tmpdir.join("cache")))
+
+@pytest.fixture
+def source(tmpdir):
+    path = tmpdir.join("a.q")
+    path.write("quark *;\nclass A {}\n")
+    return str(path)
+
+def compiler(cache):
+    c = Compiler()
+    c.cache = cache
+    return c
+
+@pytest.fixture
+def using(tmpdir):
+    tmpdir.join("b.q").write("quark *;\npackage b 1.0.0;\ninclude c.q;\nclass B { C c; }\n")
+    tmpdir.join("c.q").write("quark *;\nnamespace b { class C {} }\n")
+    tmpdir.join("a.q").write("quark *;\nuse b.q;\nimport b;\npackage a 1.0.0;\nclass A { B b; }\n")
+    return str(tmpdir.join("a.q")), str(tmpdir.join("b.q"))
+
+def parsing(monkeypatch):
+    parsed = []
+    parse = Compiler.parse
+    def counting(self, name, text):
+        parsed.append(os.path.basename(name))
+        return parse(self, name, text)
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    monkeypatch.setattr(Compiler, "parse", counting)
+    return parsed
+
+def test_roots_are_stored_on_their_own(cache, using, monkeypatch):
+    a, b = using
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+    # The standard library comes from the snapshot and is not stored again
+    assert sorted(n for n in os.listdir(cache.directory) if n.endswith(".qc")) == \
+        sorted(os.path.basename(c.roots[u]._artifact) for u in (a, b))
+
+    parsed = parsing(monkeypatch)
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+    assert parsed == []
+    # A refers to the class B loaded from its own artifact
+    A = c.entries[a].definitions[-1].definitions[0]
+    B = [d for d in c.entries[b].definitions[-1].definitions if d.name.text == "B"]
+    assert A.definitions[0].type.resolved.type is B[0]
+
+def test_changed_dependency_is_stale(cache, using, tmpdir, monkeypatch):
+    a, b = using
+    parsing(monkeypatch)
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+
+    tmpdir.join("c.q").write("quark *;\nnamespace b { class C { int x; } }\n")
+    parsed = parsing(monkeypatch)
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+    assert sorted(parsed) == ["a.q", "b.q", "c.q"]
+
+    tmpdir.join("a.q").write(tmpdir.join("a.q").read() + "class D {}\n")
+    parsed = parsing(monkeypatch)
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+    assert parsed == ["a.q"]
+
+def test_cache_is_shared_by_checkouts(cache, using, tmpdir, monkeypatch):
+    a, b = using
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+
+    other = tmpdir.join("other").mkdir()
+    for name in ("a.q", "b.q", "c.q"):
+        tmpdir.join(name).copy(other.join(name))
+    parsed = parsing(monkeypatch)
+    c = compiler(cache)
+    c.urlparse(str(other.join("a.q")))
+    c.compile()
+    assert parsed == []
+    root = c.roots[str(other.join("b.q"))]
+    assert [f.name for f in root.files] == [str(other.join("b.q")), str(other.join("c.q"))]
+    assert c.roots[str(other.join("a.q"))].uses.keys()[-1] == root.url
+
+def test_partial_write_is_ignored(cache, using, monkeypatch):
+    a, b = using
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+    path = c.roots[a]._artifact
+    with open(path, "rb") as fd:
+        data = fd.read()
+    with open(path, "wb") as fd:
+        fd.write(data[:len(data)//2])
+
+    parsed = parsing(monkeypatch)
+    c = compiler(cache)
+    c.urlparse(a)
+    c.compile()
+    assert parsed == ["a.q"]
+
+def test_prune_removes_least_recently_used(cache, tmpdir, monkeypatch):
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    paths = []
+    for i in range(3):
+        source = tmpdir.join("p%d.q" % i)
+        source.write("quark *;\nclass P%d {}\n" % i)
+        c = compiler(cache)
+        c.urlparse(str(source))
+        c.compile()
+        paths.append((c.roots[str(source)]._artifact, cache.index_path(c.keys[str(source)])))
+        for path in paths[-1]:
+            os.utime(path, (time.time() - 100 + i, time.time()))
+    # Loading p0 again makes p1 the least recently used.
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    c = compiler(cache)
+    c.urlparse(str(tmpdir.join("p0.q")))
+    cache.limit = sum(os.stat(p).st_size for p in paths[0] + paths[2])
+    cache.prune()
+    assert [[os.path.exists(p) for p in pair] for pair in paths] == \
+        [[True, True], [False, False], [True, True]]
+
+def test_compile_uses_cache(cache, source, monkeypatch):
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    c = compiler(cache)
+    c.urlparse(source)
+    c.compile()
+    root = c.roots[source]
+    assert root._modified
+    assert os.path.exists(root._artifact)
+    assert not os.path.exists(source + "c")
+
+    # A fresh process restoring the cache neither parses nor checks:
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    monkeypatch.setattr(Compiler, "parse", None)
+    monkeypatch.setattr(Compiler, "icompile", None)
+    c = compiler(cache)
+    c.urlparse(source)
+    c.compile()
+    root = c.roots[source]
+    assert root._compiled
+    assert not getattr(root, "_modified", False)
+    assert [d.name.text for d in c.entries[source].definitions[-1].definitions] == ["A"]
+
+@pytest.fixture(scope="module")
+def snapshot(tmpdir_factory):
+    return Snapshot(build_snapshot(str(tmpdir_factory.mktemp("snapshot").join("quark.snapshot"))))
+
+def test_snapshot_replaces_stdlib_parse(cache, source, snapshot, monkeypatch):
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    parsed = []
+    parse = Compiler.parse
+    def counting(self, name, text):
+        parsed.append(name)
+        return parse(self, name, text)
+    monkeypatch.setattr(Compiler, "parse", counting)
+    c = compiler(cache)
+    c.snapshot = snapshot
+    c.urlparse(source)
+    c.compile()
+    assert parsed == [source]
+    stdlib = [r for r in c.roots if r.url != source]
+    assert [r.url for r in stdlib] == [os.path.join(os.path.dirname(os.path.abspath(qcache.__file__)), "lib", "quark.q")]
+    assert stdlib[0]._artifact == snapshot.path
+    assert not os.path.exists(cache.path(stdlib[0]._key))
+
+def test_snapshot_of_other_compiler_is_ignored(snapshot, monkeypatch):
+    url = os.path.join(os.path.dirname(os.path.abspath(qcache.__file__)), "lib", "quark.q")
+    assert snapshot.load(url)
+    monkeypatch.setattr(qcache, "fingerprint", lambda: "other")
+    assert snapshot.load(url) is None
+
+LINKED = """quark *;
+package p 1.0.0;
+import quark.concurrent;
+namespace n {
+    class A<T> {
+        int x;
+        int f(int y) {
+            int z = y + self.x;
+            return z;
+        }
+    }
+}
+"""
+
+def links(root):
+    """Describe how every node under root links to the others by position."""
+    nodes = []
+    root.traverse(object(), visit_default=nodes.append)
+    position = dict((id(n), i) for i, n in enumerate(nodes))
+    at = lambda n: position.get(id(n))
+    # An environment is told apart by the first node that has it.
+    owners = {}
+    for i, n in enumerate(nodes):
+        owners.setdefault(id(n.env), (i, sorted(n.env)))
+    return [(n.__class__.__name__, n.id, n.index, n.count, at(n.parent), at(n.file),
+             at(n.package), at(n.clazz), at(n.callable), [at(i) for i in n.imports],
+             owners[id(n.env)], n.line, n.column) for n in nodes]
+
+def test_cached_tree_is_relinked(cache, tmpdir, monkeypatch):
+    source = tmpdir.join("linked.q")
+    source.write(LINKED)
+    source = str(source)
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    c = compiler(cache)
+    c.urlparse(source)
+    c.compile()
+    compiled = links(c.roots[source])
+
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    c = compiler(cache)
+    c.urlparse(source)
+    root = c.roots[source]
+    assert links(root) == compiled
+    assert not hasattr(root.files[0], "__dict__")
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os, pytest
+from quarkc import shell
 from quarkc.compiler import Compiler, CompileError, ParseError
 from .util import assert_file, maybe_xfail, is_excluded_file, check_file
 
@@ -62,3 +63,167 @@ def compile(path, file_filter):
         expected = base + ".err"
         computed = str(e).replace(os.path.dirname(path) + "/", "")
         assert_file(expected, computed)
+
+def tree(top):
+    result = {}
+    for dirpath, dirnames, filenames in os.walk(top):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path) as fd:
+                result[os.path.relpath(path, top)] = fd.read()
+    return result
+
+def test_parallel_emission_matches_serial(tmpdir):
+    from quarkc import backend, compiler
+    path = os.path.join(directory, "class.q")
+    outputs = []
+    for jobs in (1, 3):
+        target = str(tmpdir.join("j%d" % jobs))
+        dirs = compiler.compile(Compiler(), path, target, backend.Python, backend.Ruby, jobs=jobs)
+        assert dirs == ["quark", "class"]
+        outputs.append(tree(target))
+    assert outputs[0] and outputs[0] == outputs[1]
+
+def test_parallel_emission_aggregates_errors(tmpdir):
+    from quarkc import backend, compiler
+
+    class Broken(backend.Python):
+        def visit_Root(self, r):
+            raise CompileError("cannot emit %s" % os.path.basename(r.url))
+
+    path = os.path.join(directory, "class.q")
+    with pytest.raises(CompileError) as exc:
+        compiler.compile(Compiler(), path, str(tmpdir), Broken, jobs=2)
+    assert str(exc.value) == "cannot emit quark.q\ncannot emit class.q"
+
+@pytest.fixture
+def using(tmpdir, monkeypatch):
+    from quarkc.cache import CompileCache
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    tmpdir.join("b.q").write("quark *;\npackage b 1.0.0;\nclass B {}\n")
+    tmpdir.join("a.q").write("quark *;\nuse b.q;\nimport b;\npackage a 1.0.0;\nclass A { B b; }\n")
+    cache = CompileCache(str(tmpdir.join("cache")))
+    def compiler():
+        c = Compiler()
+        c.cache = cache
+        return c
+    return str(tmpdir.join("a.q")), compiler
+
+def name(root):
+    return os.path.splitext(os.path.basename(root.url))[0]
+
+def fake_installs(monkeypatch, fail=()):
+    import threading, time
+    from quarkc import compiler
+    events = []
+    lock = threading.Lock()
+    def install_one(c, root, backend, offline):
+        task = "%s %s" % (backend.ext, name(root))
+        with lock:
+            events.append(("start", task))
+        time.sleep(0.2)
+        with lock:
+            events.append(("end", task))
+        if task in fail:
+            raise shell.ShellError("%s failed" % task)
+    monkeypatch.setattr(compiler, "install_one", install_one)
+    return events
+
+def overlap(events):
+    running = peak = 0
+    for kind, _ in events:
+        running += 1 if kind == "start" else -1
+        peak = max(peak, running)
+    return peak
+
+@pytest.mark.parametrize("jobs", [1, 2, 4])
+def test_parallel_install_follows_use_order(using, monkeypatch, jobs):
+    from quarkc import backend, compiler
+    url, new = using
+    events = fake_installs(monkeypatch)
+    compiler.install(new(), url, False, backend.Python, backend.Ruby, jobs=jobs)
+    assert sorted(t for k, t in events if k == "end") == \
+        sorted("%s %s" % (ext, n) for ext in ("py", "rb") for n in ("quark", "b", "a"))
+    for ext in ("py", "rb"):
+        order = [e for e in events if e[1].startswith(ext + " ")]
+        assert order == [(k, "%s %s" % (ext, n)) for n in ("quark", "b", "a") for k in ("start", "end")]
+    assert overlap(events) == min(jobs, 2)
+
+def test_parallel_install_skips_dependents_of_failures(using, monkeypatch):
+    from quarkc import backend, compiler
+    url, new = using
+    events = fake_installs(monkeypatch, fail=("py b", "rb a"))
+    with pytest.raises(shell.ShellError) as exc:
+        compiler.install(new(), url, False, backend.Python, backend.Ruby, jobs=2)
+    assert sorted(str(exc.value).splitlines()) == ["py b failed", "rb a failed"]
+    assert sorted(t for k, t in events if k == "end") == ["py b", "py quark", "rb a", "rb b", "rb quark"]
+
+def test_parallel_install_runs_one_root_per_backend_at_a_time(tmpdir, monkeypatch):
+    from quarkc import backend, compiler
+    from quarkc.cache import CompileCache
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    # b and c only use the standard library, so nothing orders them
+    tmpdir.join("b.q").write("quark *;\npackage b 1.0.0;\nclass B {}\n")
+    tmpdir.join("c.q").write("quark *;\npackage c 1.0.0;\nclass C {}\n")
+    tmpdir.join("a.q").write("quark *;\nuse b.q;\nuse c.q;\npackage a 1.0.0;\nclass A {}\n")
+    c = Compiler()
+    c.cache = CompileCache(str(tmpdir.join("cache")))
+    events = fake_installs(monkeypatch)
+    compiler.install(c, str(tmpdir.join("a.q")), False, backend.Python, backend.Ruby, jobs=4)
+    assert len(events) == 16
+    for ext in ("py", "rb"):
+        assert overlap([e for e in events if e[1].startswith(ext + " ")]) == 1
+    assert overlap(events) == 2
+
+FAKE_TOOL = """#!/bin/sh
+[ "$1" = --version ] && exit 0
+echo "installing $1"
+touch "%s/$1"
+"""
+
+def test_parallel_install_labels_output_and_skips_uptodate(using, tmpdir, monkeypatch):
+    import logging
+    from quarkc import backend, compiler
+    url, new = using
+    installed = tmpdir.mkdir("installed")
+    tool = tmpdir.join("fake")
+    tool.write(FAKE_TOOL % installed)
+    tool.chmod(0755)
+    monkeypatch.setenv("QUARK_FAKE_COMMAND", str(tool))
+    monkeypatch.setitem(shell.PREREQS, "fake", ([str(tool), "--version"], "", shell.noop))
+
+    def fake(base):
+        class Fake(base):
+            def _install_target(self, pkg, ver):
+                path = installed.join("%s-%s" % (self.ext, pkg))
+                return str(path) if path.check() else None
+            def install_command(self, dir, offline):
+                shell.call("fake", "%s-%s" % (self.ext, self.packages[0].name), stage="install")
+        return Fake
+
+    class Records(logging.Handler):
+        def __init__(self):
+            logging.Handler.__init__(self)
+            self.messages = []
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+
+    records = Records()
+    log = logging.getLogger("quark.command")
+    monkeypatch.setattr(log, "level", logging.DEBUG)
+    log.addHandler(records)
+    try:
+        backends = (fake(backend.Python), fake(backend.Ruby))
+        compiler.install(new(), url, False, *backends, jobs=2)
+        output = [m for m in records.messages if "installing" in m]
+        assert sorted(m.split("\n")[1] for m in output) == sorted(
+            "  [%s %s] fake: installing %s-%s" % (ext, n, ext, n)
+            for ext in ("py", "rb") for n in ("quark", "b", "a"))
+        assert sorted(installed.listdir()) == sorted(
+            installed.join("%s-%s" % (ext, n)) for ext in ("py", "rb") for n in ("quark", "b", "a"))
+
+        del records.messages[:]
+        compiler.install(new(), url, False, *backends, jobs=2)
+        assert not [m for m in records.messages if "installing" in m]
+    finally:
+        log.removeHandler(records)
@@ -74,3 +74,60 @@ def test_dispatch(callable, arguments, expected):
     except TypeError, e:
         assert type(e) == type(expected)
         assert str(e) == str(expected)
+
+class A(object): pass
+class B(A): pass
+class C(B): pass
+class D(A): pass
+class E(C, D): pass
+
+TYPES = [object, A, B, C, D, E]
+
+def old_signatures(types):
+    if types:
+        for sig in old_signatures(types[1:]):
+            for t in types[0].__mro__:
+                yield (t,) + sig
+    else:
+        yield ()
+
+def test_lookup_order_matches_mro_product():
+    import itertools
+    from quarkc.dispatch import _Dispatcher
+    d = _Dispatcher("d")
+    registered = [sig for n in (1, 2, 3) for sig in itertools.product(TYPES, repeat=n)][::7]
+    for sig in registered:
+        d.add(sig, sig)
+    for n in (1, 2, 3):
+        for types in itertools.product(TYPES, repeat=n):
+            expected = next((s for s in old_signatures(types) if s in d.methods), None)
+            assert d.get(types) == expected, types
+
+class Base(object):
+
+    @overload(A)
+    def visit(self, node, extra=None):
+        return "Base A", extra
+
+    @overload(C)
+    def visit(self, node, extra=None):
+        return "Base C", extra
+
+class Derived(Base):
+
+    @overload(B)
+    def visit(self, node, extra=None):
+        return "Derived B", extra
+
+def test_overloads_follow_class_mro():
+    base, derived = Base(), Derived()
+    assert base.visit(E()) == ("Base C", None)
+    assert base.visit(B()) == ("Base A", None)
+    # The subclass wins even over a more specific base overload.
+    assert derived.visit(E()) == ("Derived B", None)
+    assert derived.visit(D(), 1) == ("Base A", 1)
+    assert derived.visit(D(), extra=2) == ("Base A", 2)
+    assert Derived.visit(derived, C()) == ("Derived B", None)
+    with pytest.raises(TypeError) as exc:
+        derived.visit(1)
+    assert str(exc.value) == "visit has no matching method: (int)"
@@ -0,0 +1,162 @@
+# Copyright 2016 datawire. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os, sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "lib"))
+
+from quark_runtime import _JSONObject, _JSONParser, _HTTPResponse
+
+DOCUMENT = '{"$method": "greet", "rpc": [{"name": "world"}, 2, null], "n": 1.5, "t": true}'
+
+
+@pytest.fixture
+def json():
+    return _JSONObject.parse(DOCUMENT)
+
+
+def test_types(json):
+    assert json.getType() == "object"
+    assert json.getObjectItem("rpc").getType() == "list"
+    assert json.getObjectItem("$method").getType() == "string"
+    assert json.getObjectItem("n").getType() == "number"
+    assert json.getObjectItem("rpc").getListItem(2).getType() == "null"
+    # bool is an int, so getType has always called booleans numbers.
+    assert json.getObjectItem("t").getType() == "number"
+    with pytest.raises(TypeError):
+        json.undefined().getType()
+
+
+def test_values(json):
+    values = json.getObjectItem("rpc").values()
+    assert [v.getType() for v in values] == ["object", "number", "null"]
+    assert values[0].getObjectItem("name").getString() == "world"
+    assert json.values() is None
+    assert json.getObjectItem("missing").values() is None
+
+
+def test_items(json):
+    items = json.items()
+    assert [k for k, _ in items] == ["$method", "rpc", "n", "t"]
+    assert items[0][1].getString() == "greet"
+    assert json.getObjectItem("rpc").items() is None
+
+
+def test_get_path(json):
+    assert json.getPath("rpc", 0, "name").getString() == "world"
+    assert json.getPath("rpc", 1).getNumber() == 2
+    assert json.getPath().value is json.value
+    for path in [("missing",), ("rpc", 3), ("rpc", "name"), ("$method", 0), ("rpc", 2, "x")]:
+        assert json.getPath(*path) is json.undefined()
+
+
+def test_cursor_moves_in_place(json):
+    cursor = json.cursor()
+    assert cursor.down("rpc", 0, "name").getString() == "world"
+    assert cursor.up().getType() == "object"
+    assert cursor.up(2) is cursor
+    assert cursor.keys() == ["$method", "rpc", "n", "t"]
+    assert cursor.down("missing").isUndefined()
+    assert cursor.get() is json.undefined()
+    assert cursor.up().down("n").get().getNumber() == 1.5
+
+
+def test_cursor_elements(json):
+    cursor = json.cursor().down("rpc")
+    seen = []
+    for element in cursor.elements():
+        assert element is cursor
+        seen.append(element.getType())
+    assert seen == ["object", "number", "null"]
+    assert cursor.isList()
+    assert list(json.cursor().down("n").elements()) == []
+
+
+def test_cursor_entries(json):
+    cursor = json.cursor()
+    assert [(k, c.getType()) for k, c in cursor.entries()] == \
+        [("$method", "string"), ("rpc", "list"), ("n", "number"), ("t", "number")]
+    assert cursor.isObject()
+
+
+def feed(parser, data, method, size=1):
+    # Everything method yields with data fed size bytes at a time.
+    results = []
+    for start in range(0, len(data), size):
+        parser.feed(data[start:start + size])
+        results.extend(getattr(parser, method)())
+    parser.close()
+    results.extend(getattr(parser, method)())
+    return results
+
+
+def test_parser_events():
+    events = feed(_JSONParser(), DOCUMENT.encode("utf-8"), "events")
+    assert events == [
+        ("start_map", None),
+        ("map_key", "$method"), ("string", "greet"),
+        ("map_key", "rpc"), ("start_array", None),
+        ("start_map", None), ("map_key", "name"), ("string", "world"), ("end_map", None),
+        ("number", 2), ("null", None),
+        ("end_array", None),
+        ("map_key", "n"), ("number", 1.5),
+        ("map_key", "t"), ("boolean", True),
+        ("end_map", None)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 1000])
+def test_parser_values_at_path(size):
+    body = u'{"skip": [1e+2, {"rpc": [7]}], "rpc": [{"name": "w\\u00f6rld \\"q\\""}, -1.25e-3, 12345678901234567890, "\u2603"]}'
+    values = feed(_JSONParser(["rpc"]), body.encode("utf-8"), "values", size)
+    assert [v.value for v in values] == [{"name": u"w\u00f6rld \"q\""}, -1.25e-3, 12345678901234567890, u"\u2603"]
+    assert values[0].getObjectItem("name").getString() == u"w\u00f6rld \"q\""
+    nested = feed(_JSONParser(["skip", 1, "rpc"]), body.encode("utf-8"), "values", size)
+    assert [v.value for v in nested] == [7]
+
+
+def test_parser_top_level_values():
+    values = feed(_JSONParser(), b'{"b": 1, "a": 2} [3] 4 "x" null', "values", 2)
+    assert [v.value for v in values] == [{"b": 1, "a": 2}, [3], 4, "x", None]
+    assert list(values[0].value.keys()) == ["b", "a"]
+    assert type(values[0].value) is not dict
+    unordered = feed(_JSONParser(ordered=False), b'{"b": {"c": 1}}', "values")
+    assert type(unordered[0].value) is dict
+    assert type(unordered[0].value["b"]) is dict
+
+
+def test_parse_unordered():
+    assert type(_JSONObject.parse(DOCUMENT).value) is not dict
+    json = _JSONObject.parse(DOCUMENT, ordered=False)
+    assert type(json.value) is dict
+    assert json.getPath("rpc", 0, "name").getString() == "world"
+
+
+@pytest.mark.parametrize("body", ['[1, 2', '{"a": 1', '[1,]', '{"a" 1}', '[tru]', '"abc', '[1e]', '[1 2]'])
+@pytest.mark.parametrize("method", ["events", "values"])
+def test_parser_errors(body, method):
+    with pytest.raises(ValueError):
+        feed(_JSONParser([] if method == "values" else None), body.encode("utf-8"), method)
+
+
+def test_response_body_chunks():
+    response = _HTTPResponse()
+    response._setBodyChunks([b'{"messages": [{"te', b'xt": "caf\xc3', b'\xa9"}, {"text": "b"}]}'])
+    texts = [m.getObjectItem("text").getString() for m in response.iterJSON(["messages"], ordered=False)]
+    assert texts == [u"caf\u00e9", "b"]
+    assert response.getBody() == u'{"messages": [{"text": "caf\u00e9"}, {"text": "b"}]}'
+    assert [m.value for m in response.iterJSON()] == [{"messages": [{"text": u"caf\u00e9"}, {"text": "b"}]}]
+    response.setBody("[1, 2]")
+    assert [v.value for v in response.iterJSON([])] == [1, 2]
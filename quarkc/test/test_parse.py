@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os, pytest
+from quarkc.ast import AST, line_index, walk
 from quarkc.compiler import Compiler
 from .util import assert_file, maybe_xfail, is_excluded_file
 
@@ -31,6 +32,101 @@ def test_parse(path):
 def test_parse_builtin():
     parse(os.path.join(directory, "empty-file.q"), lambda x: False)
 
+def naive_lineinfo(text, offset):
+    text = text[:offset]
+    line = text.count("\n") + 1
+    try:
+        column = len(text) - text.rindex("\n")
+    except ValueError:
+        column = len(text) or 1
+    return line, column
+
+@pytest.mark.parametrize("text", ["", "x", "\n", "ab\ncd\n\nef", "\n\nlast"])
+def test_lineinfo(text):
+    index = line_index(text)
+    for offset in range(len(text) + 1):
+        assert index.lineinfo(offset) == naive_lineinfo(text, offset)
+
+def test_lineinfo_positions():
+    path = os.path.join(directory, "fields.q")
+    c = Compiler()
+    c.urlparse(path, recurse=False)
+    package = c.roots[path].files[0].definitions[-1]
+    assert [(d.line, d.column) for d in package.definitions][1:4] == [(6, 1), (11, 1), (17, 1)]
+
+class Recorder(object):
+
+    def __init__(self, name, events):
+        self.name = name
+        self.events = events
+
+    def visit_AST(self, node):
+        self.events.append((self.name, "visit", node))
+
+    def leave_AST(self, node):
+        self.events.append((self.name, "leave", node))
+
+    def visit_Class(self, node):
+        self.events.append((self.name, "visit class", node))
+
+class ExpressionRecorder(Recorder):
+
+    def leave_Expression(self, node):
+        self.events.append((self.name, "leave expression", node))
+
+def recursive(node, visitor):
+    for cls in type(node).__mro__:
+        if hasattr(visitor, "visit_" + cls.__name__):
+            getattr(visitor, "visit_" + cls.__name__)(node)
+            break
+    for c in node.children or ():
+        if c is not None:
+            recursive(c, visitor)
+    for cls in type(node).__mro__:
+        if hasattr(visitor, "leave_" + cls.__name__):
+            getattr(visitor, "leave_" + cls.__name__)(node)
+            break
+
+def test_walk_matches_recursion():
+    c = Compiler()
+    path = os.path.join(directory, "fields.q")
+    c.urlparse(path, recurse=False)
+    file = c.roots[path].files[0]
+    expected = {}
+    for cls in Recorder, ExpressionRecorder:
+        expected[cls] = []
+        recursive(file, cls("r", expected[cls]))
+        events = []
+        file.traverse(cls("r", events))
+        assert events == expected[cls]
+    assert any(e[1] == "visit class" for e in expected[Recorder])
+    assert any(e[1] == "leave expression" for e in expected[ExpressionRecorder])
+
+    events = []
+    walk(file, (Recorder("a", events), ExpressionRecorder("b", events)))
+    assert [e for e in events if e[0] == "a"] == [("a",) + e[1:] for e in expected[Recorder]]
+    assert [e for e in events if e[0] == "b"] == [("b",) + e[1:] for e in expected[ExpressionRecorder]]
+    # Each node is seen by both visitors before the walk moves on.
+    first = file.definitions[0]
+    assert [e[0::2] for e in events[:4]] == [("a", file), ("b", file), ("a", first), ("b", first)]
+
+class Chain(AST):
+
+    def __init__(self, child):
+        self.child = child
+
+    @property
+    def children(self):
+        yield self.child
+
+def test_walk_deep_tree():
+    node = None
+    for _ in range(50000):
+        node = Chain(node)
+    events = []
+    node.traverse(Recorder("r", events))
+    assert len(events) == 100000
+
 def parse(path, file_filter):
     dir = os.path.dirname(path)
     text = open(path).read()
@@ -0,0 +1,95 @@
+# Copyright 2016 datawire. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json, time
+from StringIO import StringIO
+
+from quarkc import backend, compiler, dispatch, profiler
+from quarkc.ast import walk
+from quarkc.cache import CompileCache
+from quarkc.compiler import Compiler
+from quarkc.profiler import Profile, phase
+
+def test_nested_phases_report_their_own_time():
+    p = Profile()
+    p.start()
+    try:
+        with phase("outer", "a.q"):
+            time.sleep(0.05)
+            with phase("inner", "a.q"):
+                time.sleep(0.1)
+    finally:
+        p.stop()
+    outer = p.entries[("outer", "a.q")]
+    inner = p.entries[("inner", "a.q")]
+    assert 0.05 <= outer.seconds < 0.1
+    assert inner.seconds >= 0.1
+    assert profiler.ACTIVE is None and dispatch.STATS is None
+
+class Node(object):
+
+    def __init__(self, *children):
+        self.children = children
+
+def test_phases_count_the_nodes_they_walk():
+    tree = Node(Node(), Node(Node(), None))
+    p = Profile()
+    p.start()
+    try:
+        with phase("outer", "a.q"):
+            walk(tree, ())
+            walk(tree, ())
+            with phase("inner", "a.q"):
+                walk(tree.children[1], ())
+        with phase("idle", "a.q"):
+            pass
+    finally:
+        p.stop()
+    assert p.entries[("outer", "a.q")].nodes == 8
+    assert p.entries[("inner", "a.q")].nodes == 2
+    assert p.entries[("idle", "a.q")].nodes == 0
+    walk(tree, ())
+    assert p.visits == [10]
+
+def test_compile_profile(tmpdir, monkeypatch):
+    monkeypatch.setattr(Compiler, "CACHE", {})
+    source = tmpdir.join("a.q")
+    source.write("quark *;\nclass A { int x; int twice() { return x*2; } }\n")
+    c = Compiler()
+    c.cache = CompileCache(str(tmpdir.join("cache")))
+    c.snapshot = None
+    p = Profile()
+    p.start()
+    try:
+        compiler.compile(c, str(source), str(tmpdir.join("out")), backend.Python)
+    finally:
+        p.stop()
+
+    mine = dict((name, e) for (name, where), e in p.entries.items() if where.endswith("a.q"))
+    assert sorted(mine) == sorted([
+        "load", "parse", "Crosswire+ApplyAnnotators", "Def", "Use", "Resolver", "Check",
+        "Python.traverse", "Python.reflect", "Python.leave_Root", "Python.write"])
+    assert mine["Def"].nodes == mine["Check"].nodes > 10
+    assert mine["Use"].hits + mine["Use"].misses > 0
+    assert sum(h + m for h, m in p.dispatchers.values()) >= \
+        sum(e.hits + e.misses for e in p.entries.values())
+
+    out = StringIO()
+    p.report(out)
+    assert "Resolver" in out.getvalue() and "misses" in out.getvalue()
+    dump = tmpdir.join("profile.json")
+    p.dump(str(dump))
+    data = json.loads(dump.read())
+    assert data["phases"]["Check"]["calls"] == 2
+    assert set(data["dispatchers"]) == set(p.dispatchers)
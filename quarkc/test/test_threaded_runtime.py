@@ -0,0 +1,651 @@
+# Copyright 2016 datawire. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os, socket, sys, threading, time
+
+import pytest
+
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+    from httplib import HTTPConnection
+except ImportError:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+    from http.client import HTTPConnection
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "lib"))
+
+from quark_runtime import _HTTPRequest
+import quark_threaded_runtime
+from quark_threaded_runtime import (
+    ThreadedRuntime, _HTTPClient, _QuarkWSGIServer, _QuarkWSGIRequestHandler
+)
+
+
+class Task(object):
+
+    def __init__(self, fired, name):
+        self.fired = fired
+        self.name = name
+
+    def onExecute(self, runtime):
+        self.fired.append(self.name)
+
+
+def drain(runtime, predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    # let the event thread retire the token removal events as well
+    time.sleep(0.05)
+
+
+@pytest.fixture
+def runtime():
+    return ThreadedRuntime()
+
+
+def test_schedule_fires_in_deadline_order(runtime):
+    fired = []
+    for name, delay in (("c", 0.15), ("a", 0.05), ("b", 0.1)):
+        runtime.schedule(Task(fired, name), delay)
+    drain(runtime, lambda: len(fired) == 3)
+    assert fired == ["a", "b", "c"]
+    assert not runtime.event_thread.is_live
+
+
+def test_zero_delay_bypasses_timer(runtime):
+    fired = []
+    runtime.schedule(Task(fired, "now"), 0.0)
+    drain(runtime, lambda: fired)
+    assert fired == ["now"]
+    assert not runtime.timer.heap
+
+
+def test_schedule_does_not_spawn_threads(runtime):
+    fired = []
+    before = threading.active_count()
+    for i in range(1000):
+        runtime.schedule(Task(fired, i), 0.01 + (i % 10) * 0.01)
+    assert threading.active_count() == before
+    drain(runtime, lambda: len(fired) == 1000)
+    assert len(fired) == 1000
+
+
+def test_cancel(runtime):
+    fired = []
+    keep = Task(fired, "keep")
+    drop = Task(fired, "drop")
+    runtime.schedule(keep, 0.1)
+    runtime.schedule(drop, 0.05)
+    runtime.schedule(drop, 0.06)
+    assert runtime.cancel(drop)
+    assert not runtime.cancel(drop)
+    drain(runtime, lambda: fired)
+    assert fired == ["keep"]
+    assert not runtime.cancel(keep)
+    assert not runtime.timer.pending
+    assert not runtime.event_thread.is_live
+
+
+def test_cancel_compacts_heap(runtime):
+    fired = []
+    tasks = [Task(fired, i) for i in range(1000)]
+    for task in tasks:
+        runtime.schedule(task, 60)
+    for task in tasks[:900]:
+        runtime.cancel(task)
+    assert len(runtime.timer.heap) < 500
+    for task in tasks[900:]:
+        runtime.cancel(task)
+    drain(runtime, lambda: not runtime.event_thread.is_live)
+    assert not runtime.event_thread.is_live
+    assert fired == []
+
+
+class Chain(object):
+
+    def __init__(self, fired):
+        self.fired = fired
+
+    def onExecute(self, runtime):
+        self.fired.append("first")
+        # events queued meanwhile, such as the timer's token removal, go first
+        time.sleep(0.05)
+        runtime.schedule(Task(self.fired, "second"), 0.0)
+
+
+@pytest.mark.parametrize("delay", [0.0, 0.05])
+def test_zero_delay_from_event_thread(runtime, delay):
+    fired = []
+    runtime.schedule(Chain(fired), delay)
+    drain(runtime, lambda: len(fired) == 2)
+    assert fired == ["first", "second"]
+    assert runtime.event_thread.stats.dropped == 0
+    assert not runtime.event_thread.is_live
+
+
+class Rendezvous(object):
+
+    def __init__(self, parties):
+        self.parties = parties
+        self.arrived = 0
+        self.threads = []
+        self.condition = threading.Condition()
+
+    def onExecute(self, runtime):
+        with self.condition:
+            self.arrived += 1
+            self.threads.append(threading.current_thread().name)
+            self.condition.notify_all()
+            deadline = time.time() + 5
+            while self.arrived < self.parties and time.time() < deadline:
+                self.condition.wait(0.1)
+
+
+def test_execute_runs_tasks_in_parallel(runtime):
+    meeting = Rendezvous(3)
+    for i in range(3):
+        runtime.execute(meeting)
+    drain(runtime, lambda: not runtime.event_thread.is_live)
+    assert meeting.arrived == 3
+    assert len(set(meeting.threads)) == 3
+    assert all(name.startswith("quark-worker") for name in meeting.threads)
+
+
+def test_execute_falls_back_to_event_thread(monkeypatch):
+    monkeypatch.setattr(ThreadedRuntime, "workers", 1)
+    monkeypatch.setattr(ThreadedRuntime, "max_queued", 1)
+    runtime = ThreadedRuntime()
+    meeting = Rendezvous(2)
+    fired = []
+    runtime.execute(meeting)
+    drain(runtime, lambda: meeting.arrived)
+    runtime.execute(Task(fired, "queued"))
+    runtime.execute(meeting)
+    drain(runtime, lambda: len(fired) == 1)
+    assert meeting.arrived == 2
+    assert meeting.threads[1] == runtime.event_thread.name
+    assert fired == ["queued"]
+
+
+def test_events_are_dispatched_in_batches(runtime):
+    fired = []
+    token = runtime._add_event_source("test")
+    started, gate = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        gate.wait()
+
+    runtime.events.put((block, (), {}))
+    started.wait(5)
+    for i in range(100):
+        runtime.events.put((fired.append, (i,), {}))
+    runtime._remove_event_source(token)
+    gate.set()
+    assert runtime.event_thread.wait_until_idle(5)
+    assert fired == list(range(100))
+    stats = runtime.event_thread.stats.snapshot()
+    assert stats["events"] == 102
+    assert stats["batches"] == 2
+    assert stats["largest"] == 101
+    assert stats["handler_time"] > 0
+
+
+def test_events_without_sources_are_dropped(runtime):
+    fired = []
+    runtime.events.put((fired.append, ("dropped",), {}))
+    drain(runtime, lambda: runtime.event_thread.stats.dropped)
+    runtime.schedule(Task(fired, "kept"), 0.0)
+    drain(runtime, lambda: fired)
+    assert fired == ["kept"]
+    assert runtime.event_thread.stats.dropped == 1
+
+
+def test_idle_wakes_waiter_immediately(runtime):
+    token = runtime._add_event_source("test")
+    assert not runtime.event_thread.wait_until_idle(0.05)
+    threading.Timer(0.1, runtime._remove_event_source, (token,)).start()
+    start = time.time()
+    assert runtime.event_thread.wait_until_idle(5)
+    assert time.time() - start < 0.5
+
+
+def test_quit_stops_event_thread(runtime):
+    runtime.events.put(runtime.event_thread.QUIT)
+    runtime.event_thread.join(1)
+    assert not runtime.event_thread.is_alive()
+
+
+class StandIn(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), StandInHandler)
+        self.connections = set()
+        self.posts = []
+        self.concurrent = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def url(self, path):
+        return "http://127.0.0.1:%d%s" % (self.server_port, path)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.concurrent += 1
+            server.peak = max(server.peak, server.concurrent)
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.1)
+            if self.path.startswith("/moved"):
+                self.reply(302, b"", [("Location", "/target")])
+            elif self.path.startswith("/missing"):
+                self.reply(404, b"nope")
+            elif self.path.startswith("/hangup"):
+                # answer, then close what the client thinks is kept alive
+                self.reply(200, b"bye")
+                self.close_connection = True
+            elif self.path.startswith("/truncated"):
+                # promise more than is sent, then hang up
+                self.send_response(200)
+                self.send_header("Content-Length", "100")
+                self.end_headers()
+                self.wfile.write(b"partial")
+                self.close_connection = True
+            elif self.path.startswith("/messages"):
+                messages = ",".join('{"n": %d}' % i for i in range(1000))
+                self.reply(200, ('{"messages": [%s]}' % messages).encode("utf-8"))
+            else:
+                self.reply(200, self.path.encode("utf-8"))
+        finally:
+            with server.lock:
+                server.concurrent -= 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with self.server.lock:
+            self.server.posts.append(self.path)
+        if self.path.startswith("/drop"):
+            # processed, but the connection closes before any reply
+            self.close_connection = True
+        else:
+            self.reply(200, b"posted")
+
+    def reply(self, code, body, headers=()):
+        self.send_response(code)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class Recorder(object):
+
+    def __init__(self):
+        self.responses = []
+        self.errors = []
+        self.final = 0
+
+    def onHTTPInit(self, request):
+        pass
+
+    def onHTTPResponse(self, request, response):
+        self.responses.append((response.getCode(), response.getBody()))
+
+    def onHTTPError(self, request, error):
+        self.errors.append(error)
+
+    def onHTTPFinal(self, request):
+        self.final += 1
+
+
+@pytest.fixture
+def server():
+    server = StandIn()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(runtime, url, recorder):
+    runtime.request(_HTTPRequest(url), recorder)
+
+
+def test_request_reuses_connections(runtime, server):
+    recorder = Recorder()
+    for i in range(20):
+        get(runtime, server.url("/seq/%d" % i), recorder)
+        drain(runtime, lambda: recorder.final == i + 1)
+    assert recorder.responses == [(200, "/seq/%d" % i) for i in range(20)]
+    assert len(server.connections) == 1
+
+
+def test_request_retries_get_on_stale_connection(runtime, server):
+    recorder = Recorder()
+    get(runtime, server.url("/hangup"), recorder)
+    drain(runtime, lambda: recorder.final == 1)
+    get(runtime, server.url("/after"), recorder)
+    drain(runtime, lambda: recorder.final == 2)
+    assert recorder.responses == [(200, "bye"), (200, "/after")]
+    assert recorder.errors == []
+    assert len(server.connections) == 2
+
+
+def test_request_never_resends_post(runtime, server):
+    pytest.importorskip("quark")
+    recorder = Recorder()
+    get(runtime, server.url("/first"), recorder)
+    drain(runtime, lambda: recorder.final == 1)
+    request = _HTTPRequest(server.url("/drop"))
+    request.setMethod("POST")
+    request.setBody("payload")
+    runtime.request(request, recorder)
+    drain(runtime, lambda: recorder.final == 2)
+    assert server.posts == ["/drop"]
+    assert recorder.responses == [(200, "/first")]
+    assert len(recorder.errors) == 1
+
+
+def test_request_limits_connections_per_host(runtime, server, monkeypatch):
+    monkeypatch.setattr(_HTTPClient, "max_per_host", 2)
+    recorder = Recorder()
+    for i in range(8):
+        get(runtime, server.url("/slow/%d" % i), recorder)
+    drain(runtime, lambda: recorder.final == 8)
+    assert len(recorder.responses) == 8
+    assert server.peak == 2
+    assert len(server.connections) == 2
+
+
+def test_request_fails_fast_when_queue_is_full(monkeypatch, server):
+    pytest.importorskip("quark")
+    monkeypatch.setattr(_HTTPClient, "workers", 1)
+    monkeypatch.setattr(_HTTPClient, "max_queued", 2)
+    runtime = ThreadedRuntime()
+    recorder = Recorder()
+    for i in range(10):
+        get(runtime, server.url("/slow/%d" % i), recorder)
+    drain(runtime, lambda: recorder.final == 10)
+    assert len(recorder.errors) >= 7
+    assert len(recorder.responses) + len(recorder.errors) == 10
+    assert "outstanding" in recorder.errors[0].getMessage()
+
+
+def test_idle_connections_are_evicted(monkeypatch, server):
+    monkeypatch.setattr(_HTTPClient, "idle_timeout", 0.05)
+    runtime = ThreadedRuntime()
+    recorder = Recorder()
+    get(runtime, server.url("/first"), recorder)
+    drain(runtime, lambda: recorder.final == 1)
+    time.sleep(0.2)
+    assert not runtime.http.pool("http", "127.0.0.1", server.server_port).idle
+    get(runtime, server.url("/second"), recorder)
+    drain(runtime, lambda: recorder.final == 2)
+    assert len(server.connections) == 2
+
+
+def test_request_status_and_redirects(runtime, server):
+    recorder = Recorder()
+    get(runtime, server.url("/missing"), recorder)
+    get(runtime, server.url("/moved"), recorder)
+    drain(runtime, lambda: recorder.final == 2)
+    assert sorted(recorder.responses) == [(200, "/target"), (404, "nope")]
+
+
+def test_response_body_is_parsed_incrementally(runtime, server, monkeypatch):
+    monkeypatch.setattr(quark_threaded_runtime, "_READ_SIZE", 1000)
+    recorder = Recorder()
+    recorder.onHTTPResponse = lambda request, response: recorder.responses.append(response)
+    get(runtime, server.url("/messages"), recorder)
+    drain(runtime, lambda: recorder.final == 1)
+    response = recorder.responses[0]
+    assert len(response._chunks) > 10
+    numbers = [m.getObjectItem("n").getNumber() for m in response.iterJSON(["messages"])]
+    assert numbers == list(range(1000))
+    assert response.getBody().startswith('{"messages": [{"n": 0},')
+
+
+def test_truncated_response_body_is_an_error(runtime, server):
+    pytest.importorskip("quark")
+    recorder = Recorder()
+    get(runtime, server.url("/truncated"), recorder)
+    drain(runtime, lambda: recorder.final == 1)
+    assert recorder.responses == []
+    assert len(recorder.errors) == 1
+    # the dead connection is not handed out again
+    get(runtime, server.url("/after"), recorder)
+    drain(runtime, lambda: recorder.final == 2)
+    assert recorder.responses == [(200, "/after")]
+    assert len(server.connections) == 2
+
+
+class Respond(object):
+
+    def __init__(self, request, response):
+        self.request = request
+        self.response = response
+
+    def onExecute(self, runtime):
+        runtime.respond(self.request, self.response)
+
+
+class Servlet(object):
+
+    """Answers with the request path and query, slow queries after a delay."""
+
+    def __init__(self):
+        self.url = None
+        self.runtime = None
+
+    def onServletInit(self, url, runtime):
+        self.url = url
+        self.runtime = runtime
+
+    def onServletError(self, url, error):
+        raise AssertionError(error)
+
+    def onServletEnd(self, url):
+        pass
+
+    def onHTTPRequest(self, request, response):
+        path = request.getUrl().split(self.url.rstrip("/"), 1)[1]
+        response.setCode(200)
+        response.setBody(path)
+        self.runtime.schedule(Respond(request, response), 0.5 if "slow" in path else 0.0)
+
+
+def free_port():
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+
+def serve(runtime):
+    pytest.importorskip("quark")
+    servlet = Servlet()
+    port = free_port()
+    runtime.serveHTTP("http://127.0.0.1:%d/" % port, servlet)
+    drain(runtime, lambda: servlet.url)
+    return port
+
+
+def fetch(connection, path):
+    connection.request("GET", path)
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+def test_container_keeps_connections_alive(runtime):
+    connection = HTTPConnection("127.0.0.1", serve(runtime))
+    for i in range(10):
+        assert fetch(connection, "/?%d" % i) == (200, ("/?%d" % i).encode("utf-8"))
+    assert fetch(connection, "/") == (200, b"/")
+    connection.close()
+
+
+def test_container_slow_servlet_does_not_stall_others(runtime):
+    port = serve(runtime)
+    results = {}
+
+    def slow():
+        results["slow"] = fetch(HTTPConnection("127.0.0.1", port), "/?slow")
+
+    thread = threading.Thread(target=slow)
+    thread.start()
+    time.sleep(0.1)
+    start = time.time()
+    assert fetch(HTTPConnection("127.0.0.1", port), "/?fast") == (200, b"/?fast")
+    assert time.time() - start < 0.3
+    thread.join()
+    assert results["slow"] == (200, b"/?slow")
+
+
+class Held(Servlet):
+
+    """Holds on to the responses until it has some, then answers the last first."""
+
+    def __init__(self, count):
+        Servlet.__init__(self)
+        self.count = count
+        self.held = []
+
+    def onHTTPRequest(self, request, response):
+        path = request.getUrl().split(self.url.rstrip("/"), 1)[1]
+        if "boom" in path:
+            raise ValueError("boom")
+        if "never" in path:
+            return
+        response.setCode(200)
+        response.setBody(path)
+        self.held.append((request, response))
+        if len(self.held) == self.count:
+            while self.held:
+                self.runtime.schedule(Respond(*self.held.pop()), 0.0)
+
+
+def serve_held(runtime, count):
+    pytest.importorskip("quark")
+    servlet = Held(count)
+    port = free_port()
+    runtime.serveHTTP("http://127.0.0.1:%d/" % port, servlet)
+    drain(runtime, lambda: servlet.url)
+    return port
+
+
+def test_container_requests_complete_out_of_order(runtime):
+    port = serve_held(runtime, 8)
+    results = {}
+
+    def get(i):
+        results[i] = fetch(HTTPConnection("127.0.0.1", port), "/?%d" % i)
+
+    threads = [threading.Thread(target=get, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert results == dict((i, (200, ("/?%d" % i).encode("utf-8"))) for i in range(8))
+
+
+def test_container_servlet_failure(runtime):
+    connection = HTTPConnection("127.0.0.1", serve_held(runtime, 1))
+    status, body = fetch(connection, "/?boom")
+    assert (status, body) == (500, b"500 Internal Server Error (boom)\r\n")
+    assert fetch(connection, "/?after") == (200, b"/?after")
+    connection.close()
+
+
+def test_container_servlet_that_never_responds(runtime, monkeypatch):
+    monkeypatch.setattr(quark_threaded_runtime._QuarkConcurrentWSGIServer, "workers", 1)
+    monkeypatch.setattr(quark_threaded_runtime._QuarkWSGIApp, "response_timeout", 0.2)
+    port = serve_held(runtime, 1)
+    assert fetch(HTTPConnection("127.0.0.1", port), "/?never") == (504, b"504 Gateway Timeout\r\n")
+    # The only worker is free again
+    assert fetch(HTTPConnection("127.0.0.1", port), "/?after") == (200, b"/?after")
+
+
+def test_serial_container(monkeypatch):
+    monkeypatch.setattr(ThreadedRuntime, "server_class", _QuarkWSGIServer)
+    monkeypatch.setattr(ThreadedRuntime, "handler_class", _QuarkWSGIRequestHandler)
+    runtime = ThreadedRuntime()
+    port = serve(runtime)
+    assert fetch(HTTPConnection("127.0.0.1", port), "/?one") == (200, b"/?one")
+    assert fetch(HTTPConnection("127.0.0.1", port), "/missing")[0] == 404
+
+
+class WSEcho(object):
+
+    def onWSInit(self, ws): pass
+    def onWSConnected(self, ws): pass
+    def onWSMessage(self, ws, message): ws.send(message)
+    def onWSBinary(self, ws, message): pass
+    def onWSClosed(self, ws): pass
+    def onWSError(self, ws, error): pass
+    def onWSFinal(self, ws): pass
+
+
+class WSServlet(Servlet):
+
+    def onWSConnect(self, request):
+        return WSEcho()
+
+
+class WSClient(WSEcho):
+
+    def __init__(self):
+        self.received = []
+        self.ws = None
+
+    def onWSConnected(self, ws):
+        self.ws = ws
+        ws.send("hello")
+
+    def onWSMessage(self, ws, message):
+        self.received.append(message)
+        if len(self.received) < 3:
+            ws.send("again")
+        else:
+            ws.close()
+
+
+def test_container_websocket_upgrade(runtime):
+    pytest.importorskip("quark")
+    servlet = WSServlet()
+    port = free_port()
+    runtime.serveWS("ws://127.0.0.1:%d/ws" % port, servlet)
+    drain(runtime, lambda: servlet.url)
+    client = WSClient()
+    runtime.open("ws://127.0.0.1:%d/ws" % port, client)
+    drain(runtime, lambda: len(client.received) == 3)
+    assert client.received == ["hello", "again", "again"]
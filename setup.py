@@ -13,11 +13,14 @@
 # limitations under the License.
 
 import os
+import subprocess
+import sys
 
 ROOT_DIR = os.path.dirname(__file__)
 
 
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 metadata = {}
 with open(os.path.join(ROOT_DIR, "quarkc/_metadata.py")) as fp:
@@ -28,6 +31,21 @@ with open(os.path.join(ROOT_DIR, "install-requirements.txt")) as fp:
                             if i.strip() and not i.strip().startswith("#")]
 
 
+class build_py_with_snapshot(build_py):
+    """Also compile the standard library into quarkc/lib/quark.snapshot."""
+
+    def run(self):
+        build_py.run(self)
+        target = os.path.join(self.build_lib, "quarkc", "lib", "quark.snapshot")
+        script = "import sys; from quarkc import compiler; compiler.build_snapshot(sys.argv[1])"
+        try:
+            subprocess.check_call([sys.executable, "-c", script, os.path.abspath(target)],
+                                  cwd=self.build_lib)
+        except (OSError, subprocess.CalledProcessError):
+            # The compiler still works without it, only slower.
+            self.warn("could not build the standard library snapshot")
+
+
 setup(name=metadata["__title__"],
       version=metadata["__version__"],
       description=metadata["__summary__"],
@@ -36,11 +54,12 @@ setup(name=metadata["__title__"],
       url=metadata["__uri__"],
       license=metadata["__license__"],
       packages=['quarkc', 'quarkc.test'],
-      package_data={'': ['*.q', "lib/*.q", "lib/*.py", "lib/*.js", "lib/*.rb",
+      package_data={'': ['*.q', "lib/*.q", "lib/*.py", "lib/*.js", "lib/*.rb", "lib/quark.snapshot",
                          "lib/io/datawire/quark/netty/*.java",
                          "lib/io/datawire/quark/runtime/*.java",
                          "apidoc/*.css", "apidoc/*.html", "apidoc/*.js"]},
       include_package_data=True,
+      cmdclass={"build_py": build_py_with_snapshot},
       install_requires=install_requirements,
       entry_points={"console_scripts": ["quark = quarkc.command:call_main",
                                         "quark-grammar = quarkc.parser:rules"]},